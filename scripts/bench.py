@@ -0,0 +1,333 @@
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+import fontforge
+
+from config import (
+    BENCH_HISTORY_PATH,
+    DEFAULT_BENCH_SIZES,
+    ENGLISH_FONT_WIDTH,
+    OLD_FONT_NAME,
+    NEW_FONT_NAME,
+)
+from font_compress import compress_font_file
+from hangulify import (
+    HANGUL_RANGES,
+    OUTPUT_FORMATS,
+    TARGET_EM,
+    _collect_build_tasks,
+    generate_font_files,
+    load_preprocessed_korean_font,
+    merge_korean_glyphs,
+    process_hangul_glyphs,
+    scale_font_em_units,
+    update_font_metadata,
+)
+
+# 합성 영문 폰트의 Em 단위입니다(Meslo와 같은 값).
+SYNTHETIC_EN_EM: int = 2048
+
+# 합성 한글 폰트에서 복합(composite) 글리프가 참조하는 기본 글리프 수입니다.
+SYNTHETIC_BASE_GLYPHS: int = 64
+
+
+def _synthetic_codepoints(glyph_count: int) -> list:
+    """한글 범위(HANGUL_RANGES)에서 앞에서부터 glyph_count개의 코드포인트를 고릅니다."""
+    codepoints = [
+        codepoint
+        for start, end in HANGUL_RANGES
+        for codepoint in range(start, end + 1)
+    ]
+    return codepoints[:glyph_count]
+
+
+def _draw_box(glyph: fontforge.glyph, x: int, y: int, size: int) -> None:
+    """글리프에 정사각형 윤곽선 하나를 그립니다."""
+    pen = glyph.glyphPen(replace=False)
+    pen.moveTo((x, y))
+    pen.lineTo((x, y + size))
+    pen.lineTo((x + size, y + size))
+    pen.lineTo((x + size, y))
+    pen.closePath()
+    pen = None
+
+
+def make_synthetic_korean_font(
+    glyph_count: int, composite_ratio: float, em: int
+) -> fontforge.font:
+    """
+    한글 범위에 glyph_count개의 글리프를 가진 합성 한글 폰트를 만듭니다.
+
+    Args:
+        glyph_count: 만들 글리프 수
+        composite_ratio: 기본 글리프를 참조하는 복합 글리프의 비율 (0.0 ~ 1.0)
+        em: 폰트의 Em 단위
+    """
+    font = fontforge.font()
+    font.encoding = "UnicodeFull"
+    font.em = em
+    font.familyname = "SyntheticKo"
+    font.fontname = "SyntheticKo-Regular"
+    font.fullname = "SyntheticKo Regular"
+
+    # TARGET_EM으로 스케일링한 뒤 베어링 조정 대상 너비가 되도록 합니다.
+    width = round(ENGLISH_FONT_WIDTH * em / TARGET_EM)
+    unit = max(1, em // 10)
+
+    base_names = []
+    for i in range(SYNTHETIC_BASE_GLYPHS):
+        name = f"synthbase{i}"
+        glyph = font.createChar(-1, name)
+        _draw_box(glyph, unit + (i % 4) * unit, unit, unit * 2)
+        glyph.width = width
+        base_names.append(name)
+
+    codepoints = _synthetic_codepoints(glyph_count)
+    composite_count = int(len(codepoints) * composite_ratio)
+    for i, codepoint in enumerate(codepoints):
+        glyph = font.createChar(codepoint)
+        if i < composite_count:
+            glyph.addReference(base_names[i % len(base_names)])
+            glyph.addReference(
+                base_names[(i * 7 + 1) % len(base_names)], (1, 0, 0, 1, 0, unit * 4)
+            )
+        else:
+            _draw_box(glyph, unit, unit, unit * 3)
+            _draw_box(glyph, unit * 5, unit * 5, unit * 2)
+        glyph.width = width
+
+    return font
+
+
+def make_synthetic_english_font() -> fontforge.font:
+    """ASCII 글리프를 가진 합성 영문 폰트를 만듭니다."""
+    font = fontforge.font()
+    font.encoding = "UnicodeFull"
+    font.em = SYNTHETIC_EN_EM
+    font.familyname = f"{OLD_FONT_NAME} Synthetic"
+    font.fontname = f"{OLD_FONT_NAME}Synthetic-Regular"
+    font.fullname = f"{OLD_FONT_NAME} Synthetic Regular"
+
+    unit = SYNTHETIC_EN_EM // 10
+    for codepoint in range(0x21, 0x7F):
+        glyph = font.createChar(codepoint)
+        _draw_box(glyph, unit, 0, unit * 4)
+        glyph.width = ENGLISH_FONT_WIDTH
+
+    return font
+
+
+def _timed(func, *args, **kwargs) -> float:
+    """함수를 실행하고 걸린 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run_bench_case(glyph_count: int, composite_ratio: float, em: int) -> dict:
+    """
+    합성 폰트 한 쌍으로 각 hangulify 단계를 실행하고 단계별 시간을 측정합니다.
+
+    Returns:
+        dict: 단계 이름별 소요 시간(초)
+    """
+    ko_font = make_synthetic_korean_font(glyph_count, composite_ratio, em)
+    en_font = make_synthetic_english_font()
+
+    stages = {}
+    try:
+        stages["scale"] = _timed(scale_font_em_units, ko_font, TARGET_EM)
+        stages["bearing"] = _timed(process_hangul_glyphs, ko_font)
+        stages["merge"] = _timed(merge_korean_glyphs, en_font, ko_font)
+        stages["metadata"] = _timed(
+            update_font_metadata,
+            en_font,
+            "Regular",
+            old_name=OLD_FONT_NAME,
+            new_name=NEW_FONT_NAME,
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            outputs = generate_font_files(en_font, "Regular", output_dir=output_dir)
+            stages["generate"] = time.perf_counter() - start
+            stages["compress"] = _timed(
+                compress_font_file, outputs[0], tuple(ext for ext in OUTPUT_FORMATS if ext != "ttf")
+            )
+    finally:
+        en_font.close()
+        ko_font.close()
+
+    return stages
+
+
+def _git_commit() -> str:
+    """현재 git 커밋 해시를 반환합니다. git을 사용할 수 없으면 None을 반환합니다."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load_previous_records(history_path: str) -> dict:
+    """벤치마크 기록에서 (글리프 수, 복합 비율, Em)별 마지막 결과를 읽습니다."""
+    previous = {}
+    if not os.path.exists(history_path):
+        return previous
+
+    with open(history_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            case = (record.get("glyph_count"), record.get("composite_ratio"), record.get("em"))
+            previous[case] = record
+    return previous
+
+
+def run_bench(
+    sizes: tuple = DEFAULT_BENCH_SIZES,
+    composite_ratio: float = 0.3,
+    em: int = 1000,
+    history_path: str = BENCH_HISTORY_PATH,
+) -> list:
+    """
+    여러 글리프 수로 합성 폰트 벤치마크를 실행하고 글리프당 시간을 출력합니다.
+    history_path가 주어지면 결과를 JSONL 파일에 추가하고 직전 기록과 비교합니다.
+
+    Returns:
+        list: 글리프 수별 벤치마크 기록
+    """
+    max_count = sum(end - start + 1 for start, end in HANGUL_RANGES)
+    previous = _load_previous_records(history_path) if history_path else {}
+    commit = _git_commit()
+
+    records = []
+    for size in sizes:
+        glyph_count = min(size, max_count)
+        if glyph_count != size:
+            print(f"[WARNING] 글리프 수를 한글 범위 크기({max_count})로 제한합니다: {size}")
+
+        print(f"[INFO] 벤치마크 실행 중: 글리프 {glyph_count}개, 복합 비율 {composite_ratio}, Em {em}")
+        stages = run_bench_case(glyph_count, composite_ratio, em)
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": commit,
+            "fontforge": fontforge.version(),
+            "python": platform.python_version(),
+            "glyph_count": glyph_count,
+            "composite_ratio": composite_ratio,
+            "em": em,
+            "stages": {
+                name: {
+                    "seconds": round(seconds, 6),
+                    "us_per_glyph": round(seconds / glyph_count * 1_000_000, 3),
+                }
+                for name, seconds in stages.items()
+            },
+        }
+        records.append(record)
+
+        last = previous.get((glyph_count, composite_ratio, em))
+        print(f"{'단계':<10} {'시간(s)':>9} {'글리프당(us)':>13} {'직전 대비':>10}")
+        for name, stage in record["stages"].items():
+            change = ""
+            if last and name in last.get("stages", {}):
+                before = last["stages"][name]["us_per_glyph"]
+                if before:
+                    change = f"{(stage['us_per_glyph'] - before) / before * 100:+.1f}%"
+            print(f"{name:<10} {stage['seconds']:>9.3f} {stage['us_per_glyph']:>13.2f} {change:>10}")
+
+    if history_path:
+        os.makedirs(os.path.dirname(history_path) or ".", exist_ok=True)
+        with open(history_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"[INFO] 벤치마크 결과를 {history_path}에 추가했습니다.")
+
+    return records
+
+
+def copy_glyphs_per_codepoint(target_font: fontforge.font, source_font: fontforge.font) -> int:
+    """
+    범위 복사 이전의 merge_korean_glyphs()처럼 HANGUL_RANGES의 코드포인트마다
+    선택/복사/선택/붙여넣기를 한 번씩 실행합니다. --merge-copy의 비교 기준입니다.
+
+    Returns:
+        int: 복사한 글리프 수
+    """
+    copied_count = 0
+    for start, end in HANGUL_RANGES:
+        for codepoint in range(start, end + 1):
+            if codepoint in source_font and source_font[codepoint].isWorthOutputting():
+                source_font.selection.select(codepoint)
+                source_font.copy()
+                target_font.selection.select(codepoint)
+                target_font.paste()
+                copied_count += 1
+    return copied_count
+
+
+def run_merge_copy_bench(style: str = "Regular", repeat: int = 3) -> dict:
+    """
+    저장소의 실제 소스 폰트(기본값: Regular 조합, D2Coding + Meslo)로 한글 글리프를 코드포인트마다 복사할 때와
+    연속 구간마다 복사할 때(merge_korean_glyphs())의 시간을 repeat번씩 측정해 가장 짧은 시간을 비교합니다.
+    한글 폰트는 빌드와 같이 전처리(캐시 사용)한 뒤 측정하며, 영문 폰트는 측정마다 새로 엽니다.
+
+    Returns:
+        dict: {"style", "per_codepoint", "ranges", "glyph_count"} 기록. 두 방식의 복사 글리프 수가 다르거나
+            조합이 없으면 빈 딕셔너리입니다.
+    """
+    tasks = [task for task in _collect_build_tasks() if task["style"] == style]
+    if not tasks:
+        print(f"[ERROR] {style} 조합의 소스 폰트를 찾을 수 없습니다.")
+        return {}
+    task = tasks[0]
+    ko_font, coverage = load_preprocessed_korean_font(task["ko_font_path"])
+
+    timings = {"per_codepoint": [], "ranges": []}
+    counts = {}
+    try:
+        for _ in range(repeat):
+            for name in timings:
+                en_font = fontforge.open(task["en_font_path"])
+                try:
+                    start = time.perf_counter()
+                    if name == "per_codepoint":
+                        counts[name] = copy_glyphs_per_codepoint(en_font, ko_font)
+                    else:
+                        counts[name] = merge_korean_glyphs(en_font, ko_font, coverage)
+                    timings[name].append(time.perf_counter() - start)
+                finally:
+                    en_font.close()
+    finally:
+        ko_font.close()
+
+    if counts["per_codepoint"] != counts["ranges"]:
+        print(f"[ERROR] 복사한 글리프 수가 다릅니다: 코드포인트마다 {counts['per_codepoint']}개, 구간마다 {counts['ranges']}개")
+        return {}
+
+    per_codepoint = min(timings["per_codepoint"])
+    ranges = min(timings["ranges"])
+    print(
+        f"[INFO] {style}: {os.path.basename(task['ko_font_path'])} + {os.path.basename(task['en_font_path'])}, "
+        f"글리프 {counts['ranges']}개, 구간 {len(coverage['runs'])}개 (FontForge {fontforge.version()})"
+    )
+    print(f"{'방식':<12} {'시간(s)':>9} {'속도 향상':>10}")
+    print(f"{'코드포인트':<12} {per_codepoint:>9.3f} {1.0:>9.1f}x")
+    print(f"{'구간':<12} {ranges:>9.3f} {per_codepoint / ranges:>9.1f}x")
+    return {
+        "style": style,
+        "per_codepoint": per_codepoint,
+        "ranges": ranges,
+        "glyph_count": counts["ranges"],
+    }
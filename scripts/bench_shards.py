@@ -0,0 +1,191 @@
+"""
+한글 글리프 병합을 샤드 없이, 그리고 워커 2/4/8개로 나누어 실행해 시간을 비교합니다.
+속도 향상은 CPU 코어 수 이하의 워커 수에서만 측정합니다.
+
+- fonttools 백엔드: build_hangul_partial_sets()로 나누며, FontForge 없이 동작합니다.
+  샤드로 병합한 폰트가 샤드 없이 병합한 폰트와 바이트 단위로 같은지도 확인합니다.
+- fontforge 백엔드: hangulify.preprocess_korean_shards()로 나누며, FontForge가 필요합니다.
+  FontForge가 생성한 TTF에는 생성 시각이 들어가므로 코드포인트별 글리프 해시(glyph_index)가 같은지 확인합니다.
+"""
+
+import io
+import os
+import tempfile
+import time
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+import hangulify
+from bench_transform import make_synthetic_korean_font
+from config import ENGLISH_FONT_WIDTH
+from fonttools_backend import (
+    build_hangul_partial_sets,
+    load_preprocessed_korean_font,
+    merge_korean_glyphs,
+)
+from glyph_index import build_glyph_index
+from hangulify import HANGUL_RANGES, TARGET_EM
+
+# 비교할 샤드(워커 프로세스) 수입니다.
+SHARD_WORKERS: tuple = (2, 4, 8)
+
+
+def make_synthetic_english_font() -> bytes:
+    """ASCII 글리프만 가진 합성 영문 TTF를 만듭니다. 한글 글리프는 모두 새로 추가됩니다."""
+    glyphs = {".notdef": TTGlyphPen(None).glyph()}
+    cmap = {}
+    for codepoint in range(0x21, 0x7F):
+        pen = TTGlyphPen(None)
+        pen.moveTo((100, 0))
+        pen.lineTo((100, 700 + codepoint))
+        pen.lineTo((600, 700))
+        pen.lineTo((600, 0))
+        pen.closePath()
+        name = f"uni{codepoint:04X}"
+        glyphs[name] = pen.glyph()
+        cmap[codepoint] = name
+
+    builder = FontBuilder(TARGET_EM, isTTF=True)
+    builder.setupGlyphOrder(list(glyphs))
+    builder.setupCharacterMap(cmap)
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (ENGLISH_FONT_WIDTH, 0) for name in glyphs})
+    builder.setupHorizontalHeader(ascent=TARGET_EM, descent=0)
+    builder.setupOS2()
+    builder.setupPost()
+    builder.setupNameTable({"familyName": "SyntheticEn", "styleName": "Regular"})
+
+    buffer = io.BytesIO()
+    builder.save(buffer)
+    return buffer.getvalue()
+
+
+def run_shard_case(ko_font_path: str, en_data: bytes, shard_count: int) -> tuple:
+    """
+    한글 폰트의 전처리와 병합을 실행합니다. shard_count가 1이면 샤드 없이 한 프로세스에서 실행합니다.
+
+    Returns:
+        tuple: (소요 시간(초), 병합한 영문 폰트의 TTF 바이트)
+    """
+    en_font = TTFont(io.BytesIO(en_data), recalcTimestamp=False)
+    start = time.perf_counter()
+    if shard_count > 1:
+        partial_sets, _ = build_hangul_partial_sets(ko_font_path, False, None, shard_count)
+        merge_korean_glyphs(en_font, None, partial_sets=partial_sets)
+    else:
+        ko_font, coverage = load_preprocessed_korean_font(ko_font_path)
+        merge_korean_glyphs(en_font, ko_font, coverage)
+        ko_font.close()
+    elapsed = time.perf_counter() - start
+
+    buffer = io.BytesIO()
+    en_font.save(buffer)
+    en_font.close()
+    return elapsed, buffer.getvalue()
+
+
+def run_fontforge_shard_case(ko_font_path: str, en_font_path: str, shard_count: int) -> tuple:
+    """
+    FontForge로 한글 폰트의 전처리와 병합을 실행합니다. shard_count가 1이면 샤드 없이 한 프로세스에서 실행합니다.
+    전처리 캐시는 사용하지 않습니다.
+
+    Returns:
+        tuple: (소요 시간(초), 병합한 영문 폰트의 코드포인트별 글리프 해시)
+    """
+    en_font = hangulify.fontforge.open(en_font_path)
+    start = time.perf_counter()
+    if shard_count > 1:
+        shard_results, _ = hangulify.preprocess_korean_shards(ko_font_path, False, None, shard_count)
+        try:
+            partial_sets = [(shard["path"], shard["coverage"]) for shard in shard_results]
+            hangulify.merge_korean_glyphs(en_font, None, partial_sets=partial_sets)
+        finally:
+            hangulify.remove_hangul_shards(shard_results)
+    else:
+        ko_font, coverage = hangulify.load_preprocessed_korean_font(ko_font_path, use_cache=False)
+        hangulify.merge_korean_glyphs(en_font, ko_font, coverage)
+        ko_font.close()
+    elapsed = time.perf_counter() - start
+
+    output_path = os.path.join(os.path.dirname(en_font_path), f"Merged{shard_count}.ttf")
+    en_font.generate(output_path)
+    en_font.close()
+    return elapsed, build_glyph_index(output_path)["glyphs"]
+
+
+def run_shard_bench(
+    sizes: tuple, composite_ratio: float = 0.3, em: int = 1000, backend: str = "fonttools"
+) -> list:
+    """
+    여러 글리프 수로 샤드 없는 병합과 SHARD_WORKERS개(CPU 코어 수 이하) 샤드 병합의 시간을 측정하고 속도 향상을 출력합니다.
+    backend가 "fontforge"이면 FontForge 백엔드의 샤드 전처리와 병합을 측정합니다.
+
+    Returns:
+        list: 글리프 수별 {"glyph_count", "cpu_count", "serial", "shards": {샤드 수: 시간}, "speedups": {샤드 수: 배율}} 기록.
+            샤드로 병합한 결과가 하나라도 다르면 빈 리스트입니다.
+    """
+    # 코어보다 많은 워커는 프로세스 비용만 더하므로 코어 수 이하의 샤드 수만 측정합니다.
+    cpu_count = os.cpu_count() or 1
+    shard_workers = [count for count in SHARD_WORKERS if count <= cpu_count]
+    skipped = [str(count) for count in SHARD_WORKERS if count > cpu_count]
+    if skipped:
+        print(f"[WARNING] CPU 코어가 {cpu_count}개이므로 워커 {', '.join(skipped)}개는 측정하지 않습니다.")
+    if not shard_workers:
+        # 결과 일치 여부만 확인합니다. 이 시간은 속도 향상이 아니라 프로세스 비용을 보여 줍니다.
+        print("[WARNING] CPU 코어가 1개라 속도 향상을 측정할 수 없습니다. 워커 2개로 결과 일치 여부만 확인합니다.")
+        shard_workers = [min(SHARD_WORKERS)]
+
+    max_count = sum(end - start + 1 for start, end in HANGUL_RANGES)
+    en_data = make_synthetic_english_font()
+    records = []
+    identical = True
+    for size in sizes:
+        glyph_count = min(size, max_count)
+        print(
+            f"[INFO] 샤드 병합 벤치마크 실행 중 ({backend}): 글리프 {glyph_count}개, "
+            f"복합 비율 {composite_ratio}, Em {em}"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 워커 프로세스가 각자 여는 한글 폰트 파일입니다.
+            ko_font_path = os.path.join(temp_dir, "SyntheticKo.ttf")
+            with open(ko_font_path, "wb") as f:
+                f.write(make_synthetic_korean_font(glyph_count, composite_ratio, em))
+            if backend == "fontforge":
+                en_font_path = os.path.join(temp_dir, "SyntheticEn.ttf")
+                with open(en_font_path, "wb") as f:
+                    f.write(en_data)
+
+                def run_case(shard_count):
+                    return run_fontforge_shard_case(ko_font_path, en_font_path, shard_count)
+
+            else:
+
+                def run_case(shard_count):
+                    return run_shard_case(ko_font_path, en_data, shard_count)
+
+            serial, expected = run_case(1)
+            shards = {}
+            for shard_count in shard_workers:
+                shards[shard_count], actual = run_case(shard_count)
+                if actual != expected:
+                    print(f"[ERROR] 샤드 {shard_count}개로 병합한 결과가 샤드 없이 병합한 결과와 다릅니다.")
+                    identical = False
+
+        print(f"{'워커':<8} {'시간(s)':>10} {'속도 향상':>10}")
+        print(f"{'1':<8} {serial:>10.3f} {1.0:>9.1f}x")
+        for shard_count, elapsed in shards.items():
+            note = "" if shard_count <= cpu_count else "  (코어 부족, 속도 향상 아님)"
+            print(f"{shard_count:<8} {elapsed:>10.3f} {serial / elapsed:>9.1f}x{note}")
+        records.append(
+            {
+                "glyph_count": glyph_count,
+                "cpu_count": cpu_count,
+                "serial": serial,
+                "shards": shards,
+                "speedups": {count: serial / elapsed for count, elapsed in shards.items()},
+            }
+        )
+
+    return records if identical else []
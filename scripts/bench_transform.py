@@ -0,0 +1,164 @@
+"""
+fontTools 백엔드의 윤곽선 변환(Em 스케일링, 베어링 조정)을 글리프 단위 경로와 NumPy 경로로 각각 실행해
+시간을 비교합니다. FontForge 없이 동작하며, 두 경로의 결과(glyf, hmtx)가 같은지도 확인합니다.
+"""
+
+import io
+import time
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+from config import ENGLISH_FONT_WIDTH
+from fonttools_backend import adjust_glyph_bearing, adjust_glyph_bearings, scale_font_em_units
+from hangulify import BEARING_ADJUSTMENT, HANGUL_RANGES, TARGET_EM
+from outline_transform import numpy_available
+
+# 합성 한글 폰트에서 복합(composite) 글리프가 참조하는 기본 글리프 수입니다(bench.py와 같은 값).
+SYNTHETIC_BASE_GLYPHS: int = 64
+
+# 합성 단순 글리프 하나의 윤곽선 수입니다. 실제 한글 글리프처럼 여러 획을 가지도록 합니다.
+SYNTHETIC_CONTOURS: int = 6
+
+
+def _draw_boxes(pen: TTGlyphPen, unit: int, count: int, seed: int) -> None:
+    """서로 다른 위치에 사각형 윤곽선 count개를 그립니다."""
+    for i in range(count):
+        x = unit + ((seed + i * 3) % 7) * unit
+        y = unit + ((seed * 5 + i) % 7) * unit
+        pen.moveTo((x, y))
+        pen.lineTo((x, y + unit * 2))
+        pen.lineTo((x + unit, y + unit * 2))
+        pen.lineTo((x + unit, y))
+        pen.closePath()
+
+
+def make_synthetic_korean_font(glyph_count: int, composite_ratio: float, em: int) -> bytes:
+    """
+    한글 범위에 glyph_count개의 글리프를 가진 합성 한글 TTF를 만듭니다.
+
+    Returns:
+        bytes: TTF 파일 내용. 경로마다 같은 폰트에서 새 TTFont를 만들 수 있도록 바이트로 반환합니다.
+    """
+    codepoints = [
+        codepoint for start, end in HANGUL_RANGES for codepoint in range(start, end + 1)
+    ][:glyph_count]
+    width = round(ENGLISH_FONT_WIDTH * em / TARGET_EM)
+    unit = max(1, em // 12)
+
+    glyphs = {".notdef": TTGlyphPen(None).glyph()}
+    base_names = []
+    for i in range(SYNTHETIC_BASE_GLYPHS):
+        pen = TTGlyphPen(None)
+        _draw_boxes(pen, unit, 2, i)
+        name = f"synthbase{i}"
+        glyphs[name] = pen.glyph()
+        base_names.append(name)
+
+    cmap = {}
+    composite_count = int(len(codepoints) * composite_ratio)
+    for i, codepoint in enumerate(codepoints):
+        name = f"uni{codepoint:04X}"
+        if i < composite_count:
+            pen = TTGlyphPen(glyphs)
+            pen.addComponent(base_names[i % len(base_names)], (1, 0, 0, 1, 0, 0))
+            pen.addComponent(base_names[(i * 7 + 1) % len(base_names)], (1, 0, 0, 1, 0, unit * 4))
+        else:
+            pen = TTGlyphPen(None)
+            _draw_boxes(pen, unit, SYNTHETIC_CONTOURS, i)
+        glyphs[name] = pen.glyph()
+        cmap[codepoint] = name
+
+    builder = FontBuilder(em, isTTF=True)
+    builder.setupGlyphOrder(list(glyphs))
+    builder.setupCharacterMap(cmap)
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (width, 0) for name in glyphs})
+    builder.setupHorizontalHeader(ascent=em, descent=0)
+    builder.setupOS2()
+    builder.setupPost()
+    builder.setupNameTable({"familyName": "SyntheticKo", "styleName": "Regular"})
+
+    buffer = io.BytesIO()
+    builder.save(buffer)
+    return buffer.getvalue()
+
+
+def _bearing_targets(font: TTFont) -> list:
+    """process_hangul_glyphs()가 조정하는 글리프(복합 글리프는 참조하는 글리프)를 너비와 관계없이 모읍니다."""
+    glyf = font["glyf"]
+    names = {}
+    for name in font.getGlyphOrder():
+        glyph = glyf[name]
+        for target in [component.glyphName for component in glyph.components] if glyph.isComposite() else [name]:
+            names.setdefault(target, None)
+    return list(names)
+
+
+def run_transform_case(data: bytes, vectorized: bool) -> tuple:
+    """
+    합성 폰트 하나에 Em 스케일링과 베어링 조정을 실행합니다.
+
+    Returns:
+        tuple: (단계 이름별 소요 시간(초), 결과 glyf/hmtx 비교용 값)
+    """
+    font = TTFont(io.BytesIO(data))
+    glyf = font["glyf"]
+    glyph_order = font.getGlyphOrder()
+    # 글리프 디코딩 시간은 두 경로가 같으므로 측정에서 제외합니다.
+    for name in glyph_order:
+        glyf[name].expand(glyf)
+
+    stages = {}
+    start = time.perf_counter()
+    scale_font_em_units(font, TARGET_EM, vectorized=vectorized)
+    stages["scale"] = time.perf_counter() - start
+
+    targets = _bearing_targets(font)
+    start = time.perf_counter()
+    if vectorized:
+        adjust_glyph_bearings(font, targets, BEARING_ADJUSTMENT)
+    else:
+        for name in targets:
+            adjust_glyph_bearing(font, name, BEARING_ADJUSTMENT)
+    stages["bearing"] = time.perf_counter() - start
+
+    # 스케일링한 좌표와 구성 요소 위치는 병합할 때 반올림하므로 반올림 전의 좌표를 비교합니다.
+    result = (
+        {name: list(glyf[name].getCoordinates(glyf)[0]) for name in glyph_order},
+        dict(font["hmtx"].metrics),
+    )
+    font.close()
+    return stages, result
+
+
+def run_transform_bench(sizes: tuple, composite_ratio: float = 0.3, em: int = 1000) -> list:
+    """
+    여러 글리프 수로 두 경로의 시간을 측정하고 속도 향상을 출력합니다.
+
+    Returns:
+        list: 글리프 수별 {"glyph_count", "per_glyph", "numpy"} 기록. NumPy가 없으면 빈 리스트입니다.
+    """
+    if not numpy_available():
+        print("[ERROR] NumPy가 없어 윤곽선 변환 벤치마크를 실행할 수 없습니다. (pip install numpy)")
+        return []
+
+    max_count = sum(end - start + 1 for start, end in HANGUL_RANGES)
+    records = []
+    for size in sizes:
+        glyph_count = min(size, max_count)
+        print(f"[INFO] 윤곽선 변환 벤치마크 실행 중: 글리프 {glyph_count}개, 복합 비율 {composite_ratio}, Em {em}")
+        data = make_synthetic_korean_font(glyph_count, composite_ratio, em)
+        per_glyph, expected = run_transform_case(data, vectorized=False)
+        vectorized, actual = run_transform_case(data, vectorized=True)
+        if actual != expected:
+            print("[ERROR] NumPy 경로의 결과가 글리프 단위 경로와 다릅니다.")
+
+        print(f"{'단계':<10} {'글리프 단위(s)':>14} {'NumPy(s)':>10} {'속도 향상':>10}")
+        for name in per_glyph:
+            speedup = per_glyph[name] / vectorized[name] if vectorized[name] else 0
+            print(f"{name:<10} {per_glyph[name]:>14.3f} {vectorized[name]:>10.3f} {speedup:>9.1f}x")
+        records.append({"glyph_count": glyph_count, "per_glyph": per_glyph, "numpy": vectorized})
+
+    return records
@@ -3,12 +3,30 @@ import sys
 import shutil
 
 from config import (
+    BENCH_HISTORY_PATH,
+    BUILD_PLAN_PATH,
     BUILT_FONTS_PATH,
+    CATALOG_FONTS_PATH,
+    DEFAULT_BENCH_SIZES,
+    CACHE_PATH,
     EN_FONT_PATH,
     KO_FONT_PATH,
     EN_NERD_FONT_PATH,
 )
-from hangulify import build_fonts
+from build_matrix import DEFAULT_FORMATS, SUPPORTED_FORMATS
+from build_plan import load_build_plan, write_build_plan
+from font_cache import list_cache_entries, prune_cache
+from font_check import check_fonts
+from font_profile import PROFILES, parse_size_budgets
+from glyph_index import verify_built_fonts
+from reproducible import SOURCE_DATE_EPOCH_ENV, source_date_epoch_from_env
+from hangulify import (
+    BACKENDS,
+    _collect_build_tasks,
+    build_fonts,
+    korean_cache_key,
+    overridden_settings,
+)
 
 
 def print_usage():
@@ -16,10 +34,88 @@ def print_usage():
     print(f"python {sys.argv[0]} <subcommand>\n")
     print("subcommand:")
     print("    build  : assets 디렉터리의 폰트를 병합하고 출력합니다.")
-    print("    test   : 폰트 빌드 프로세스를 테스트합니다.")
+    print("    test   : 소스 폰트와 빌드된 폰트를 동시에 검사합니다. (--jobs N, 기본값: CPU 코어 수)")
     print("    clean  : 출력 파일을 삭제합니다.")
+    print("    cache  : 전처리 캐시를 관리합니다. (info | prune [--all])")
+    print("    bench  : 합성 폰트로 각 단계의 글리프당 처리 시간을 측정합니다.")
+    print("    watch  : 설정과 소스 폰트의 변경을 감시하며 바뀐 조합의 TTF를 다시 빌드합니다. (--backend B, --interval S)")
+    print("    merge  : 영문 폰트 디렉터리의 모든 TTF에 한글 폰트 하나를 병합합니다. (--en-dir DIR --ko FILE)")
+    print(f"    plan   : FontForge 없이 소스 TTF의 cmap/hmtx/glyf만 읽어 빌드 계획을 JSON으로 저장합니다. (--out F, 기본값: {BUILD_PLAN_PATH})")
+    print("    verify : 빌드된 TTF의 글리프 해시를 지난 릴리스의 기준 색인과 비교합니다. (--update, --jobs N)")
+    print("\nbuild options:")
+    print("    --jobs N   : N개의 워커 프로세스로 조합을 동시에 빌드합니다. (0: CPU 코어 수, 기본값: 1)")
+    print("    --no-cache : 전처리된 한글 폰트 캐시를 사용하지 않습니다.")
+    print("    --force    : 빌드 매니페스트와 관계없이 모든 조합을 다시 빌드합니다.")
+    print("    --dry-run  : 빌드하지 않고 다시 빌드할 조합과 그 이유만 출력합니다.")
+    print("    --trace F  : 단계별 시간과 메모리 사용량을 Chrome trace-event 형식으로 F에 저장합니다.")
+    print("    --web-slices : 빌드된 TTF를 유니코드 범위별 WOFF2 조각과 @font-face CSS로 나눕니다.")
+    print("    --backend B  : 빌드 백엔드를 선택합니다. (fontforge | fonttools, 기본값: fontforge)")
+    print("    --low-memory : 한글 글리프만 남긴 중간 폰트로 빌드해 조합별 최대 메모리 사용량을 줄입니다.")
+    print("    --max-rss MB : 워커 프로세스를 포함한 메모리 사용량이 MB에 가까우면 동시 빌드 수를 줄입니다.")
+    print("    --derive-nerd : Nerd Font 조합을 기본 조합(nerd_base)의 결과에 Nerd Font 아이콘만 덮어써서 만듭니다.")
+    print("    --keep-references : 한글 복합 글리프를 윤곽선으로 풀지 않고 복합 글리프로 병합해 glyf 테이블을 줄입니다.")
+    print("                        복합 글리프는 참조 위치를 따로 반올림하므로 윤곽선으로 푼 빌드와 1 unit 정도 다를 수 있습니다.")
+    print("    --profile P  : 출력 프로필을 선택합니다. (default | web, 기본값: default)")
+    print("                   web: 힌팅과 장치 메트릭 테이블을 빼고 생성하고, 출력 파일별 테이블 크기와 크기 한도를 검사합니다.")
+    print("    --budget F=SIZE,... : 형식별 출력 파일 크기 한도를 지정합니다. (예: woff2=900K,ttf=4M, 기본값: config.SIZE_BUDGETS)")
+    print("    --plan F     : build.py plan이 저장한 빌드 계획 F의 조합 목록과 한글 색인으로 빌드합니다.")
+    print("    --merge-shards N : 한글 글리프를 N개 구간으로 나누어 워커 프로세스에서 처리한 뒤 조합마다 합칩니다.")
+    print("                       (샤드도 --jobs개의 워커 프로세스 안에서 실행, FontForge 백엔드에서는 전처리 캐시가 없을 때만 나눔)")
+    print(f"    --reproducible : 출력 폰트의 시각을 {SOURCE_DATE_EPOCH_ENV}(없으면 소스 폰트의 수정 시각)로 고정해")
+    print(f"                     같은 입력이면 바이트 단위로 같은 폰트를 만듭니다. ({SOURCE_DATE_EPOCH_ENV}가 설정되어 있으면 항상 사용)")
+    print("    --ttc        : nerd_base로 이어진 조합(예: Regular와 NerdFont-Regular)을 글리프 데이터를 공유하는 TTC로 묶고,")
+    print("                   TTF를 따로 저장할 때보다 줄어든 크기를 출력합니다. (fontTools 필요)")
+
+
+def print_merge_usage():
+    """merge 서브커맨드 옵션 안내 메시지를 출력합니다."""
+    print("\nmerge options:")
+    print("    --en-dir DIR : 병합할 영문 폰트(TTF) 디렉터리 (필수)")
+    print("    --ko FILE    : 한글 폰트 파일 (필수). 한 번만 전처리해 모든 영문 폰트에 사용합니다.")
+    print(f"    --out DIR    : 출력 디렉터리 (기본값: {CATALOG_FONTS_PATH})")
+    print("    --formats F,F,... : 출력 형식 (ttf, woff2, woff 중, 기본값: ttf,woff2)")
+    print("    --jobs N     : N개의 워커 프로세스로 영문 폰트를 나누어 병합합니다. (0: CPU 코어 수, 기본값: 1)")
+    print("    --backend B  : 빌드 백엔드를 선택합니다. (fontforge | fonttools, 기본값: fontforge)")
+    print("    --no-cache   : 전처리된 한글 폰트 캐시를 사용하지 않습니다.")
+
+
+def print_bench_usage():
+    """bench 서브커맨드 옵션 안내 메시지를 출력합니다."""
+    print("\nbench options:")
+    print("    --sizes N,N,...      : 측정할 글리프 수 목록 (기본값: 1000,4000,11172)")
+    print("    --composite-ratio R  : 복합 글리프 비율 (기본값: 0.3)")
+    print("    --em N               : 합성 한글 폰트의 Em 단위 (기본값: 1000)")
+    print("    --no-history         : 결과를 기록 파일에 추가하지 않습니다.")
+    print("    --transform          : fontTools 백엔드의 Em 스케일링/베어링 조정을 글리프 단위와 NumPy로 비교합니다.")
+    print("    --merge-shards       : 한글 글리프 병합을 샤드 없이, 그리고 워커 2/4/8개로 나누어 비교합니다.")
+    print("    --backend B          : --merge-shards로 측정할 백엔드 (fonttools | fontforge, 기본값: fonttools)")
+    print("    --merge-copy         : 실제 소스 폰트(Regular 조합)로 한글 글리프를 코드포인트마다 복사할 때와 구간마다 복사할 때를 비교합니다. (FontForge 필요)")
 
 
+def get_option_value(args: list, name: str, default: str = None) -> str:
+    """
+    명령행 인자에서 `--name value` 또는 `--name=value` 형식의 옵션 값을 찾습니다.
+    """
+    for i, arg in enumerate(args):
+        if arg == name and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(f"{name}="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def parse_jobs(args: list) -> int:
+    """`--jobs` 옵션을 해석합니다. 0은 CPU 코어 수를 의미합니다."""
+    value = get_option_value(args, "--jobs", "1")
+    try:
+        jobs = int(value)
+    except ValueError:
+        print(f"[ERROR] --jobs 값이 올바르지 않습니다: {value}")
+        exit(1)
+    if jobs < 0:
+        print(f"[ERROR] --jobs 값은 0 이상이어야 합니다: {jobs}")
+        exit(1)
+    return jobs or os.cpu_count() or 1
 
 
 def check_font_directories():
@@ -50,40 +146,32 @@ def check_font_directories():
     return True
 
 
-def test_font_build():
-    """폰트 빌드 프로세스를 테스트합니다."""
+def test_font_build(jobs: int = 1):
+    """
+    폰트 빌드 프로세스를 테스트합니다.
+    모든 소스 폰트와 빌드된 TTF를 표준 라이브러리 파서로 동시에 검사합니다(font_check.check_fonts()).
+    """
     print("[INFO] 폰트 빌드 테스트 시작")
     
     if not check_font_directories():
         print("[ERROR] 필요한 폰트 디렉터리가 누락되었습니다.")
         return False
-    
+
     try:
         # FontForge 모듈 임포트 테스트
         import fontforge
         print("[INFO] FontForge 모듈 로드 성공")
-        
-        # 각 디렉터리에서 첫 번째 폰트 파일 로드 테스트
-        test_dirs = [EN_FONT_PATH, KO_FONT_PATH, EN_NERD_FONT_PATH]
-        for test_dir in test_dirs:
-            ttf_files = [f for f in os.listdir(test_dir) if f.lower().endswith('.ttf')]
-            if ttf_files:
-                test_file = os.path.join(test_dir, ttf_files[0])
-                try:
-                    font = fontforge.open(test_file)
-                    print(f"[INFO] 폰트 로드 테스트 성공: {ttf_files[0]} (Family: {font.familyname})")
-                    font.close()
-                except Exception as e:
-                    print(f"[ERROR] 폰트 로드 테스트 실패 ({ttf_files[0]}): {e}")
-                    return False
-        
+    except ImportError as e:
+        print(f"[WARNING] FontForge 모듈을 찾을 수 없습니다: {e}")
+        print("[INFO] FontForge 설치: pip install fontforge-python 또는 시스템 패키지 관리자 사용 (또는 build --backend fonttools)")
+
+    try:
+        if not check_fonts(jobs):
+            print("[ERROR] 폰트 검사에서 오류가 발견되었습니다.")
+            return False
         print("[INFO] 모든 테스트가 성공했습니다. 폰트 빌드를 진행할 수 있습니다.")
         return True
-        
-    except ImportError as e:
-        print(f"[ERROR] FontForge 모듈을 찾을 수 없습니다: {e}")
-        print("[INFO] FontForge 설치: pip install fontforge-python 또는 시스템 패키지 관리자 사용")
-        return False
+
     except Exception as e:
         print(f"[ERROR] 테스트 중 오류 발생: {e}")
         return False
@@ -101,27 +189,279 @@ def clean():
 
 
 
+def merge(args: list):
+    """영문 폰트 디렉터리의 모든 폰트에 한글 폰트를 병합합니다."""
+    en_dir = get_option_value(args, "--en-dir")
+    ko_font_path = get_option_value(args, "--ko")
+    if not en_dir or not ko_font_path:
+        print("[ERROR] --en-dir와 --ko 옵션이 필요합니다.")
+        print_merge_usage()
+        exit(1)
+    backend = get_option_value(args, "--backend", "fontforge")
+    if backend not in BACKENDS:
+        print(f"[ERROR] 알 수 없는 빌드 백엔드입니다: {backend} (선택: {', '.join(BACKENDS)})")
+        exit(1)
+    formats = tuple(get_option_value(args, "--formats", ",".join(DEFAULT_FORMATS)).split(","))
+    unsupported = [ext for ext in formats if ext not in SUPPORTED_FORMATS]
+    if unsupported or "ttf" not in formats:
+        print(f"[ERROR] --formats 값이 올바르지 않습니다: {','.join(formats)} (ttf는 필수, 선택: {', '.join(SUPPORTED_FORMATS)})")
+        exit(1)
+
+    from catalog_merge import merge_font_catalog
+
+    success = merge_font_catalog(
+        en_dir,
+        ko_font_path,
+        output_dir=get_option_value(args, "--out", CATALOG_FONTS_PATH),
+        jobs=parse_jobs(args),
+        backend=backend,
+        use_cache="--no-cache" not in args,
+        formats=formats,
+    )
+    if not success:
+        print("[ERROR] 일부 영문 폰트의 병합에 실패했습니다.")
+        exit(1)
+
+
+def bench(args: list):
+    """합성 폰트 벤치마크를 실행합니다."""
+    try:
+        sizes_value = get_option_value(args, "--sizes")
+        sizes = (
+            tuple(int(size) for size in sizes_value.split(","))
+            if sizes_value
+            else DEFAULT_BENCH_SIZES
+        )
+        composite_ratio = float(get_option_value(args, "--composite-ratio", "0.3"))
+        em = int(get_option_value(args, "--em", "1000"))
+    except ValueError as e:
+        print(f"[ERROR] bench 옵션 값이 올바르지 않습니다: {e}")
+        print_bench_usage()
+        exit(1)
+
+    if not 0.0 <= composite_ratio <= 1.0 or em <= 0 or min(sizes) <= 0:
+        print("[ERROR] bench 옵션 값의 범위가 올바르지 않습니다.")
+        print_bench_usage()
+        exit(1)
+
+    if "--transform" in args:
+        # 윤곽선 변환 벤치마크는 fontTools 합성 폰트를 사용하므로 FontForge가 필요 없습니다.
+        from bench_transform import run_transform_bench
+
+        if not run_transform_bench(sizes, composite_ratio=composite_ratio, em=em):
+            exit(1)
+        return
+
+    if "--merge-copy" in args:
+        try:
+            from bench import run_merge_copy_bench
+        except ImportError:
+            print("[ERROR] FontForge 모듈을 찾을 수 없어 --merge-copy 벤치마크를 실행할 수 없습니다.")
+            exit(1)
+
+        if not run_merge_copy_bench():
+            exit(1)
+        return
+
+    if "--merge-shards" in args:
+        from bench_shards import run_shard_bench
+        from hangulify import fontforge
+
+        backend = get_option_value(args, "--backend", "fonttools")
+        if backend not in BACKENDS:
+            print(f"[ERROR] 알 수 없는 빌드 백엔드입니다: {backend} (선택: {', '.join(BACKENDS)})")
+            exit(1)
+        if backend == "fontforge" and fontforge is None:
+            print("[ERROR] FontForge 모듈을 찾을 수 없어 --backend fontforge로 --merge-shards 벤치마크를 실행할 수 없습니다.")
+            exit(1)
+
+        if not run_shard_bench(sizes, composite_ratio=composite_ratio, em=em, backend=backend):
+            exit(1)
+        return
+
+    # 벤치마크는 FontForge로 합성 폰트를 만들므로 필요할 때만 임포트합니다.
+    from bench import run_bench
+
+    run_bench(
+        sizes=sizes,
+        composite_ratio=composite_ratio,
+        em=em,
+        history_path=None if "--no-history" in args else BENCH_HISTORY_PATH,
+    )
+
+
+def _current_cache_keys() -> set:
+    """빌드 매트릭스의 조합별 한글 폰트 파일과 설정에 해당하는 캐시 키 집합을 반환합니다."""
+    keys = set()
+    for task in _collect_build_tasks():
+        with overridden_settings(task["overrides"]):
+            for hangul_only in (False, True):
+                keys.add(korean_cache_key(task["ko_font_path"], hangul_only))
+                if task["synthetic_bold"]:
+                    keys.add(korean_cache_key(task["ko_font_path"], hangul_only, synthetic_bold=True))
+    return keys
+
+
+def cache_info():
+    """캐시 항목 목록과 전체 크기를 출력합니다."""
+    entries = list_cache_entries()
+    if not entries:
+        print(f'[INFO] "{CACHE_PATH}"에 캐시 항목이 없습니다.')
+        return
+
+    current_keys = _current_cache_keys()
+    total_size = 0
+    print(f"[INFO] 캐시 디렉터리: {CACHE_PATH}")
+    for entry in entries:
+        total_size += entry["size"]
+        state = "현재" if entry["key"] in current_keys else "오래됨"
+        source = entry["metadata"].get("source", "?")
+        print(f"  - {entry['key'][:12]}  {entry['size'] / 1024 / 1024:6.1f} MB  {state:4}  {source}")
+    print(f"[INFO] 총 {len(entries)}개 항목, {total_size / 1024 / 1024:.1f} MB")
+
+
+def cache_prune(remove_all: bool = False):
+    """현재 설정과 맞지 않는 캐시 항목을 삭제합니다. remove_all이면 모두 삭제합니다."""
+    keep_keys = None if remove_all else _current_cache_keys()
+    removed = prune_cache(keep_keys)
+    print(f"[INFO] 캐시 파일 {removed}개를 삭제했습니다.")
+
+
 def main():
     if len(sys.argv) == 1:
         print_usage()
         exit(1)
 
     subcommand = sys.argv[1]
+    args = sys.argv[2:]
 
     if subcommand == "build":
+        jobs = parse_jobs(args)
+        backend = get_option_value(args, "--backend", "fontforge")
+        if backend not in BACKENDS:
+            print(f"[ERROR] 알 수 없는 빌드 백엔드입니다: {backend} (선택: {', '.join(BACKENDS)})")
+            exit(1)
+        max_rss_mb = get_option_value(args, "--max-rss")
+        if max_rss_mb is not None:
+            try:
+                max_rss_mb = float(max_rss_mb)
+            except ValueError:
+                max_rss_mb = 0
+            if max_rss_mb <= 0:
+                print(f"[ERROR] --max-rss 값이 올바르지 않습니다: {get_option_value(args, '--max-rss')}")
+                exit(1)
+        profile = get_option_value(args, "--profile", "default")
+        if profile not in PROFILES:
+            print(f"[ERROR] 알 수 없는 출력 프로필입니다: {profile} (선택: {', '.join(PROFILES)})")
+            exit(1)
+        size_budgets = get_option_value(args, "--budget")
+        if size_budgets is not None:
+            try:
+                size_budgets = parse_size_budgets(size_budgets)
+            except ValueError as e:
+                print(f"[ERROR] --budget 값이 올바르지 않습니다: {e}")
+                exit(1)
+        try:
+            merge_shards = int(get_option_value(args, "--merge-shards", "1"))
+        except ValueError:
+            merge_shards = 0
+        if merge_shards < 1:
+            print(f"[ERROR] --merge-shards 값이 올바르지 않습니다: {get_option_value(args, '--merge-shards')}")
+            exit(1)
+        try:
+            reproducible = "--reproducible" in args or source_date_epoch_from_env() is not None
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            exit(1)
+        tasks = None
+        plan_path = get_option_value(args, "--plan")
+        if plan_path is not None:
+            try:
+                tasks = load_build_plan(plan_path, backend)
+            except ValueError as e:
+                print(f"[ERROR] {e}")
+                exit(1)
+            print(f"[INFO] 빌드 계획을 사용합니다: {plan_path} (조합 {len(tasks)}개)")
         print("[INFO] 폰트 디렉터리 확인 중")
         if check_font_directories():
             print("[INFO] 폰트 빌드 시작")
-            build_fonts()
+            success = build_fonts(
+                jobs=jobs,
+                use_cache="--no-cache" not in args,
+                force="--force" in args,
+                dry_run="--dry-run" in args,
+                trace_path=get_option_value(args, "--trace"),
+                backend=backend,
+                low_memory="--low-memory" in args,
+                max_rss_mb=max_rss_mb,
+                derive_nerd="--derive-nerd" in args,
+                keep_references="--keep-references" in args,
+                profile=profile,
+                size_budgets=size_budgets,
+                merge_shards=merge_shards,
+                tasks=tasks,
+                reproducible=reproducible,
+                collections="--ttc" in args,
+            )
+            if success and "--web-slices" in args and "--dry-run" not in args:
+                from webslice import slice_built_fonts
+
+                print("[INFO] 웹 폰트 분할 시작")
+                success = slice_built_fonts(jobs=jobs)
+            if not success:
+                print("[ERROR] 일부 폰트 조합의 빌드에 실패했습니다.")
+                exit(1)
         else:
             print("[ERROR] 폰트 빌드에 필요한 파일이 준비되지 않았습니다.")
             exit(1)
+    elif subcommand == "merge":
+        merge(args)
+    elif subcommand == "plan":
+        backend = get_option_value(args, "--backend", "fontforge")
+        if backend not in BACKENDS:
+            print(f"[ERROR] 알 수 없는 빌드 백엔드입니다: {backend} (선택: {', '.join(BACKENDS)})")
+            exit(1)
+        plan = write_build_plan(get_option_value(args, "--out", BUILD_PLAN_PATH), backend)
+        if not plan["variants"]:
+            print("[ERROR] 빌드할 폰트 조합이 없습니다.")
+            exit(1)
     elif subcommand == "test":
-        success = test_font_build()
+        success = test_font_build(parse_jobs(args + ["--jobs", "0"]))
         if not success:
             exit(1)
     elif subcommand == "clean":
         clean()
+    elif subcommand == "bench":
+        bench(args)
+    elif subcommand == "watch":
+        from watch import WATCH_INTERVAL, watch
+
+        backend = get_option_value(args, "--backend", "fontforge")
+        if backend not in BACKENDS:
+            print(f"[ERROR] 알 수 없는 빌드 백엔드입니다: {backend} (선택: {', '.join(BACKENDS)})")
+            exit(1)
+        try:
+            interval = float(get_option_value(args, "--interval", str(WATCH_INTERVAL)))
+        except ValueError:
+            print("[ERROR] --interval 값이 올바르지 않습니다.")
+            exit(1)
+        if check_font_directories():
+            watch(backend=backend, interval=interval)
+        else:
+            print("[ERROR] 폰트 빌드에 필요한 파일이 준비되지 않았습니다.")
+            exit(1)
+    elif subcommand == "verify":
+        if not verify_built_fonts(jobs=parse_jobs(args), update="--update" in args):
+            exit(1)
+    elif subcommand == "cache":
+        action = args[0] if args else "info"
+        if action == "info":
+            cache_info()
+        elif action == "prune":
+            cache_prune(remove_all="--all" in args)
+        else:
+            print_usage()
+            exit(1)
     else:
         print_usage()
         exit(1)
@@ -0,0 +1,156 @@
+"""
+빌드 단계를 의존 관계 그래프로 실행하는 스케줄러입니다.
+
+노드는 다음 키를 가진 딕셔너리입니다.
+    id: 노드 이름 (예: "preprocess:<캐시 키>", "variant:Regular", "compress:Regular")
+    deps: 먼저 끝나야 하는 노드 id 리스트
+    inputs: deps 중 결과를 인자로 받을 노드 id 리스트. func(*입력 결과, *args)로 호출합니다.
+    func, args: 실행할 함수와 인자. 워커 프로세스에서 실행하는 노드는 pickle할 수 있어야 합니다.
+    kwargs: func에 넘길 키워드 인자 (선택)
+    pool: "process"(FontForge 작업 등 CPU를 오래 쓰는 노드) 또는 "thread"(압축 등 GIL을 놓는 노드)
+    fallback: 노드 실행 중 예외가 발생했을 때 대신 사용할 결과
+
+여러 조합이 공유하는 노드(같은 한글 폰트의 전처리)는 한 번만 실행되고,
+의존 관계가 없는 노드는 동시에 실행됩니다.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from build_trace import get_process_tree_rss_mb, preserved_spans
+
+
+def check_build_graph(nodes: list) -> None:
+    """
+    중복 id, 없는 노드에 대한 의존, 순환 의존을 검사합니다.
+
+    Raises:
+        ValueError: 그래프가 올바르지 않을 때
+    """
+    ids = [node["id"] for node in nodes]
+    duplicates = sorted({node_id for node_id in ids if ids.count(node_id) > 1})
+    if duplicates:
+        raise ValueError(f"같은 id의 노드가 여러 개 있습니다: {', '.join(duplicates)}")
+
+    remaining = {node["id"]: set(node["deps"]) for node in nodes}
+    for node_id, deps in remaining.items():
+        missing = deps - remaining.keys()
+        if missing:
+            raise ValueError(f"{node_id}: 없는 노드에 의존합니다: {', '.join(sorted(missing))}")
+
+    while remaining:
+        ready = [node_id for node_id, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"순환 의존이 있습니다: {', '.join(sorted(remaining))}")
+        for node_id in ready:
+            del remaining[node_id]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _call(node: dict, results: dict):
+    return node["func"](
+        *(results[dep] for dep in node.get("inputs", ())), *node.get("args", ()), **node.get("kwargs", {})
+    )
+
+
+def _failed(node: dict, error: Exception):
+    print(f"[ERROR] {node['id']} 실행 실패: {error}")
+    return node.get("fallback")
+
+
+def _estimate_peak_rss_mb(peaks: list, current: float, running: int) -> float:
+    """다음 노드의 최대 RSS를 끝난 노드의 최대값으로, 없으면 실행 중인 노드의 평균으로 추정합니다."""
+    if peaks:
+        return max(peaks)
+    return current / (running + 1) if current else 0
+
+
+def run_build_graph(nodes: list, jobs: int = 1, max_rss_mb: float = None) -> dict:
+    """
+    의존 관계 순서대로 노드를 실행합니다.
+
+    jobs가 1이면 "process" 노드는 현재 프로세스에서 하나씩 실행하고(그 전에 기록된 구간과 추적 정보는
+    유지합니다), "thread" 노드는 그동안 스레드에서 실행합니다. jobs가 1보다 크면 "process" 노드를 최대 jobs개의 워커 프로세스에서 실행합니다.
+
+    max_rss_mb가 주어지면 "process" 노드를 시작하기 전에 빌드 프로세스와 워커들의 현재 RSS 합계를 측정하고,
+    지금까지 끝난 노드의 최대 RSS(결과의 "peak_rss_mb")를 더한 값이 한도를 넘으면
+    실행 중인 노드가 끝날 때까지 기다립니다. 실행 중인 "process" 노드가 없으면 항상 시작합니다.
+
+    Returns:
+        dict: 노드 id별 실행 결과
+    """
+    check_build_graph(nodes)
+    if max_rss_mb and jobs > 1 and get_process_tree_rss_mb() is None:
+        print("[WARNING] /proc에서 메모리 사용량을 읽을 수 없어 --max-rss를 적용하지 않습니다.")
+        max_rss_mb = None
+
+    results = {}
+    waiting = list(nodes)
+    running = {}
+    peaks = []
+
+    def record(node: dict, result) -> None:
+        results[node["id"]] = result
+        if isinstance(result, dict) and result.get("peak_rss_mb"):
+            peaks.append(result["peak_rss_mb"])
+
+    process_pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as thread_pool:
+            while waiting or running:
+                ran_inline = False
+                running_processes = sum(1 for node in running.values() if node["pool"] == "process")
+                # 압축 등 스레드 노드를 먼저 시작해야 다음 조합을 빌드하는 동안 실행됩니다.
+                for node in sorted(waiting, key=lambda node: node["pool"] != "thread"):
+                    if any(dep not in results for dep in node["deps"]):
+                        continue
+
+                    if node["pool"] == "thread":
+                        future = thread_pool.submit(_call, node, results)
+                    elif process_pool is None:
+                        waiting.remove(node)
+                        try:
+                            with preserved_spans():
+                                record(node, _call(node, results))
+                        except Exception as e:
+                            record(node, _failed(node, e))
+                        ran_inline = True
+                        break
+                    else:
+                        if running_processes >= jobs:
+                            continue
+                        if max_rss_mb and running_processes:
+                            current = get_process_tree_rss_mb()
+                            estimate = _estimate_peak_rss_mb(peaks, current, running_processes)
+                            if current + estimate > max_rss_mb:
+                                print(
+                                    f"[INFO] 메모리 사용량이 한도에 가까워 동시 빌드 수를 {running_processes}개로 줄입니다. "
+                                    f"(현재 {current:.0f}MB + 예상 {estimate:.0f}MB > {max_rss_mb:.0f}MB)"
+                                )
+                                break
+                        future = process_pool.submit(
+                            node["func"],
+                            *(results[dep] for dep in node.get("inputs", ())),
+                            *node.get("args", ()),
+                            **node.get("kwargs", {}),
+                        )
+                        running_processes += 1
+
+                    waiting.remove(node)
+                    running[future] = node
+
+                if ran_inline or not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    try:
+                        record(node, future.result())
+                    except Exception as e:
+                        record(node, _failed(node, e))
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown()
+
+    return results
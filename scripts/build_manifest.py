@@ -0,0 +1,85 @@
+import json
+import os
+
+from config import MANIFEST_PATH
+
+# 매니페스트 파일 형식 버전입니다.
+MANIFEST_VERSION: int = 1
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict:
+    """빌드 매니페스트를 읽습니다. 파일이 없거나 손상되었으면 빈 매니페스트를 반환합니다."""
+    empty = {"version": MANIFEST_VERSION, "variants": {}}
+    if not os.path.exists(path):
+        return empty
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] 빌드 매니페스트를 읽을 수 없어 무시합니다 ({path}): {e}")
+        return empty
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty
+    manifest.setdefault("variants", {})
+    return manifest
+
+
+def save_manifest(manifest: dict, path: str = MANIFEST_PATH) -> None:
+    """빌드 매니페스트를 저장합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def get_rebuild_reasons(manifest: dict, style: str, fingerprint: dict) -> list:
+    """
+    매니페스트 기록과 현재 입력 정보를 비교해 다시 빌드해야 하는 이유를 찾습니다.
+
+    Args:
+        manifest: load_manifest()로 읽은 매니페스트
+        style: 폰트 조합 스타일 (예: "Regular")
+        fingerprint: 현재 입력 파일 해시, 설정 값, 스크립트 버전
+
+    Returns:
+        list: 다시 빌드해야 하는 이유의 리스트. 비어 있으면 최신 상태입니다.
+    """
+    entry = manifest["variants"].get(style)
+    if entry is None:
+        return ["매니페스트에 기록이 없습니다"]
+
+    reasons = []
+    missing = [path for path in entry.get("outputs", []) if not os.path.exists(path)]
+    if not entry.get("outputs") or missing:
+        reasons.append(f"출력 파일이 없습니다: {', '.join(missing) or '-'}")
+    if entry.get("en_hash") != fingerprint["en_hash"]:
+        reasons.append(f"영문 폰트가 변경되었습니다: {fingerprint['en_font']}")
+    if entry.get("ko_hash") != fingerprint["ko_hash"]:
+        reasons.append(f"한글 폰트가 변경되었습니다: {fingerprint['ko_font']}")
+
+    old_constants = entry.get("constants", {})
+    changed = sorted(
+        name
+        for name in set(old_constants) | set(fingerprint["constants"])
+        if old_constants.get(name) != fingerprint["constants"].get(name)
+    )
+    if changed:
+        reasons.append(f"설정 값이 변경되었습니다: {', '.join(changed)}")
+    if entry.get("script_version") != fingerprint["script_version"]:
+        reasons.append("빌드 스크립트가 변경되었습니다")
+
+    return reasons
+
+
+def record_variant(manifest: dict, style: str, fingerprint: dict, outputs: list) -> None:
+    """빌드에 성공한 조합의 입력 정보와 출력 파일을 매니페스트에 기록합니다."""
+    manifest["variants"][style] = dict(fingerprint, outputs=sorted(outputs))
+
+
+def remove_variant(manifest: dict, style: str) -> None:
+    """빌드에 실패한 조합을 매니페스트에서 제거해 다음 빌드에서 다시 만들도록 합니다."""
+    manifest["variants"].pop(style, None)
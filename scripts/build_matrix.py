@@ -0,0 +1,204 @@
+"""
+빌드할 폰트 조합 목록(빌드 매트릭스)을 build_matrix.toml에서 읽습니다.
+
+[sources]는 소스 폰트 디렉터리에 이름을 붙이고, [defaults]는 모든 조합에 공통으로 적용할 값을,
+[[variants]]는 조합마다 스타일, 사용할 소스, 웨이트(또는 파일 이름 패턴), Nerd Font 여부,
+Nerd Font 조합을 만들 때 사용할 기본 조합(nerd_base), 합성 볼드 여부, 출력 형식, 설정 값 덮어쓰기(overrides)를 지정합니다.
+빌드 매트릭스는 build_matrix.toml 하나에만 정의하므로, 파일이 없거나 TOML 파서가 없는
+Python(3.10 이하, tomli 미설치)에서는 빌드하지 않고 오류를 보고합니다.
+"""
+
+import fnmatch
+import os
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from config import BUILD_MATRIX_PATH
+from font_compress import COMPRESSED_FORMATS
+
+# formats를 지정하지 않은 조합의 출력 형식입니다.
+DEFAULT_FORMATS: tuple = ("ttf", "woff2")
+
+# 조합 항목에 쓸 수 있는 키입니다.
+VARIANT_KEYS: tuple = (
+    "style", "en", "ko", "weight", "en_match", "ko_match", "nerd", "nerd_base", "synthetic_bold",
+    "formats", "overrides",
+)
+
+# overrides로 조합마다 바꿀 수 있는 설정 값입니다.
+OVERRIDABLE_SETTINGS: tuple = (
+    "BEARING_ADJUSTMENT",
+    "TARGET_EM",
+    "SYNTHETIC_BOLD_STROKE",
+    "KOREAN_FONT_WIDTH",
+    "ENGLISH_FONT_WIDTH",
+    "ENGLISH_FONT_NF_WIDTH",
+    "OLD_FONT_NAME",
+    "NEW_FONT_NAME",
+)
+
+# 출력할 수 있는 형식입니다. TTF는 나머지 형식의 원본이므로 항상 포함해야 합니다.
+SUPPORTED_FORMATS: tuple = ("ttf",) + COMPRESSED_FORMATS
+
+
+def load_build_matrix(path: str = BUILD_MATRIX_PATH) -> dict:
+    """
+    빌드 매트릭스를 읽고 검사합니다.
+
+    Raises:
+        ValueError: 파일이나 TOML 파서가 없을 때, TOML 문법 오류나 알 수 없는 키, 값이 있을 때
+    """
+    if not os.path.exists(path):
+        raise ValueError(f"{path} 파일이 없습니다. 저장소 루트에서 실행하세요")
+    if tomllib is None:
+        raise ValueError(f"{path}를 읽을 TOML 파서가 없습니다. Python 3.11 이상을 사용하거나 `pip install tomli`로 설치하세요")
+    try:
+        with open(path, "rb") as f:
+            matrix = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+    validate_build_matrix(matrix)
+    return matrix
+
+
+def validate_build_matrix(matrix: dict) -> None:
+    """빌드 매트릭스의 키와 값을 검사합니다. 문제가 있으면 ValueError를 발생시킵니다."""
+    unknown = set(matrix) - {"sources", "defaults", "variants"}
+    if unknown:
+        raise ValueError(f"알 수 없는 항목입니다: {', '.join(sorted(unknown))}")
+    sources = matrix.get("sources", {})
+    variants = matrix.get("variants", [])
+    if not variants:
+        raise ValueError("[[variants]] 항목이 없습니다")
+
+    defaults = matrix.get("defaults", {})
+    entries = {}
+    for variant in variants:
+        entry = dict(defaults, **variant)
+        style = entry.get("style")
+        if not style:
+            raise ValueError(f"style이 없는 조합이 있습니다: {variant}")
+        if style in entries:
+            raise ValueError(f"같은 style의 조합이 여러 개 있습니다: {style}")
+        entries[style] = entry
+
+        unknown = set(entry) - set(VARIANT_KEYS)
+        if unknown:
+            raise ValueError(f"{style}: 알 수 없는 키입니다: {', '.join(sorted(unknown))}")
+        for source in ("en", "ko"):
+            if entry.get(source) not in sources:
+                raise ValueError(f"{style}: [sources]에 없는 {source} 소스입니다: {entry.get(source)}")
+        for source in ("en", "ko"):
+            if not entry.get("weight") and not entry.get(f"{source}_match"):
+                raise ValueError(f"{style}: weight 또는 {source}_match가 필요합니다")
+
+        formats = entry.get("formats", DEFAULT_FORMATS)
+        unsupported = [ext for ext in formats if ext not in SUPPORTED_FORMATS]
+        if unsupported:
+            raise ValueError(f"{style}: 지원하지 않는 출력 형식입니다: {', '.join(unsupported)}")
+        if "ttf" not in formats:
+            raise ValueError(f"{style}: TTF는 다른 출력 형식의 원본이므로 formats에 포함해야 합니다")
+
+        overrides = dict(defaults.get("overrides", {}), **variant.get("overrides", {}))
+        unknown = set(overrides) - set(OVERRIDABLE_SETTINGS)
+        if unknown:
+            raise ValueError(f"{style}: 덮어쓸 수 없는 설정 값입니다: {', '.join(sorted(unknown))}")
+
+    for style, entry in entries.items():
+        base = entry.get("nerd_base")
+        if base is None:
+            continue
+        if not entry.get("nerd"):
+            raise ValueError(f"{style}: nerd_base는 Nerd Font 조합(nerd = true)에만 지정할 수 있습니다")
+        if base not in entries or entries[base].get("nerd"):
+            raise ValueError(f"{style}: nerd_base는 Nerd Font가 아닌 조합의 style이어야 합니다: {base}")
+
+
+def match_font_files(directory: str, pattern: str = "*.ttf") -> list:
+    """디렉터리에서 파일 이름이 패턴과 맞는(대소문자 무시) TTF 파일을 이름순으로 찾습니다."""
+    if not os.path.isdir(directory):
+        return []
+    return [
+        os.path.join(directory, filename)
+        for filename in sorted(os.listdir(directory))
+        if filename.lower().endswith(".ttf") and fnmatch.fnmatch(filename.lower(), pattern.lower())
+    ]
+
+
+# 경고 메시지에 쓰는 소스 종류 이름입니다.
+_SOURCE_LABELS: dict = {"en": "영문", "ko": "한글"}
+
+
+def _resolve_source_file(directory: str, pattern: str, style: str, source: str) -> str:
+    """
+    조합에 사용할 소스 폰트 파일 하나를 찾습니다. 없으면 None을 반환하고,
+    여러 파일이 맞으면 이름순으로 첫 파일을 사용하되 어떤 파일을 골랐는지 경고합니다.
+    """
+    label = _SOURCE_LABELS[source]
+    files = match_font_files(directory, pattern)
+    if not files:
+        print(f"[WARNING] {style}용 {label} 폰트 파일을 찾을 수 없습니다. 건너뜁니다. ({os.path.join(directory, pattern)})")
+        return None
+    if len(files) > 1:
+        names = ", ".join(os.path.basename(path) for path in files)
+        print(
+            f"[WARNING] {style}: {label} 폰트 파일이 여러 개 맞습니다 ({names}). "
+            f"{os.path.basename(files[0])}을(를) 사용합니다. build_matrix.toml의 {source}_match로 지정하세요."
+        )
+    return files[0]
+
+
+def build_tasks(matrix: dict, skipped: list = None) -> list:
+    """
+    빌드 매트릭스를 폰트 조합 목록으로 바꿉니다.
+    소스 폰트 파일을 찾을 수 없는 조합은 경고를 출력하고 제외합니다.
+
+    Args:
+        skipped: 제외한 조합의 {"style", "reason"}을 추가할 리스트
+
+    Returns:
+        list: 각 조합의 스타일, 한글/영문 폰트 경로, 너드 폰트 여부와 기본 조합, 출력 형식, 덮어쓸 설정 값을 담은 딕셔너리 리스트
+    """
+    sources = matrix["sources"]
+    defaults = matrix.get("defaults", {})
+    tasks = []
+    for variant in matrix["variants"]:
+        entry = dict(defaults, **variant)
+        entry["overrides"] = dict(defaults.get("overrides", {}), **variant.get("overrides", {}))
+        style = entry["style"]
+        weight_pattern = f"*{entry.get('weight', '')}*"
+
+        ko_pattern = entry.get("ko_match", weight_pattern)
+        ko_font_path = _resolve_source_file(sources[entry["ko"]], ko_pattern, style, "ko")
+        if ko_font_path is None:
+            if skipped is not None:
+                skipped.append({"style": style, "reason": f"한글 폰트 파일 없음 ({os.path.join(sources[entry['ko']], ko_pattern)})"})
+            continue
+        en_pattern = entry.get("en_match", weight_pattern)
+        en_font_path = _resolve_source_file(sources[entry["en"]], en_pattern, style, "en")
+        if en_font_path is None:
+            if skipped is not None:
+                skipped.append({"style": style, "reason": f"영문 폰트 파일 없음 ({os.path.join(sources[entry['en']], en_pattern)})"})
+            continue
+
+        tasks.append(
+            {
+                "style": style,
+                "ko_font_path": ko_font_path,
+                "en_font_path": en_font_path,
+                "is_nerd_font": bool(entry.get("nerd", False)),
+                "nerd_base": entry.get("nerd_base"),
+                "synthetic_bold": bool(entry.get("synthetic_bold", False)),
+                "formats": tuple(entry.get("formats", DEFAULT_FORMATS)),
+                "overrides": entry["overrides"],
+            }
+        )
+
+    return tasks
@@ -0,0 +1,195 @@
+"""
+빌드하기 전에 빌드가 무엇을 하는지 계산한 빌드 계획을 만듭니다(build.py plan).
+
+FontForge나 fontTools로 폰트를 열지 않고 표준 라이브러리 파서(ttfparse)로 소스 TTF의 cmap, hmtx 테이블과
+glyf 테이블의 글리프 헤더만 읽어, 조합마다 다음을 JSON으로 기록합니다.
+
+- 복사할 한글 글리프 수와 연속 구간, 영문 폰트에서 덮어쓸 코드포인트와 새로 추가할 글리프 수
+- 복합 글리프인 한글 글리프와 그 구성 요소(글리프 ID)
+- 소스 파일이 없거나 백엔드가 지원하지 않아 건너뛸 조합
+
+`build --plan`으로 계획을 넘기면 조합 목록과 한글 색인을 계획에서 가져오므로 빌드 매트릭스를 다시 해석하거나
+build_hangul_coverage()를 다시 실행하지 않습니다. 계획을 만든 뒤 소스 폰트나 빌드 매트릭스가 바뀌었으면
+계획을 사용하지 않습니다.
+"""
+
+import json
+import os
+import struct
+import time
+
+from config import BUILD_MATRIX_PATH
+from glyph_index import _format_runs
+from hangulify import _collect_build_tasks, _in_hangul_ranges, find_codepoint_runs
+from ttfparse import _parse_components, glyph_data, load_font
+
+# 빌드 계획 파일 형식의 버전입니다. 형식이 바뀌면 이전 계획은 사용하지 않습니다.
+PLAN_VERSION: int = 1
+
+
+def _file_stamp(path: str) -> list:
+    """계획을 만든 뒤 파일이 바뀌었는지 확인할 (수정 시각, 크기)입니다."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def korean_plan(font: dict) -> dict:
+    """
+    한글 폰트의 한글 색인과 한글 글리프의 너비 분포를 만듭니다.
+    색인은 fonttools_backend.build_hangul_coverage()와 같지만, 복합 글리프의 구성 요소를 글리프 ID로 저장합니다.
+
+    Returns:
+        dict: coverage(runs, reference_ids), composites(복합 글리프 수), advances(너비별 글리프 수)
+    """
+    cmap = font["cmap"]
+    codepoints = sorted(codepoint for codepoint in cmap if _in_hangul_ranges(codepoint))
+    reference_ids = {}
+    advances = {}
+    for codepoint in codepoints:
+        glyph_id = cmap[codepoint]
+        advance = font["metrics"][glyph_id][0]
+        advances[advance] = advances.get(advance, 0) + 1
+
+        data = glyph_data(font["tables"]["glyf"], font["loca"], glyph_id) if font["loca"] else b""
+        if data and struct.unpack_from(">h", data, 0)[0] < 0:
+            reference_ids[str(codepoint)] = [component[0] for component in _parse_components(data)]
+
+    return {
+        # TrueType에서 읽은 글리프는 모두 출력할 가치가 있으므로 codepoints는 runs를 펼친 것과 같습니다.
+        "coverage": {
+            "runs": find_codepoint_runs(codepoints),
+            "reference_ids": reference_ids,
+        },
+        "composites": len(reference_ids),
+        "advances": {str(advance): count for advance, count in sorted(advances.items())},
+    }
+
+
+def variant_plan(task: dict, ko_plan: dict, en_font: dict) -> dict:
+    """조합 하나에서 복사할 한글 글리프와, 영문 폰트에서 덮어쓰거나 새로 추가할 코드포인트를 계산합니다."""
+    codepoints = [
+        codepoint for start, end in ko_plan["coverage"]["runs"] for codepoint in range(start, end + 1)
+    ]
+    en_cmap = en_font["cmap"]
+    overwritten = [codepoint for codepoint in codepoints if codepoint in en_cmap]
+    return {
+        "task": dict(task, formats=list(task["formats"])),
+        "hangul_glyphs": len(codepoints),
+        "runs": len(ko_plan["coverage"]["runs"]),
+        "composites": ko_plan["composites"],
+        "overwritten": find_codepoint_runs(overwritten),
+        "overwritten_count": len(overwritten),
+        "added_count": len(codepoints) - len(overwritten),
+    }
+
+
+def make_build_plan(backend: str = "fontforge") -> dict:
+    """
+    빌드 매트릭스의 조합마다 빌드 계획을 만듭니다. 같은 소스 폰트는 한 번만 읽습니다.
+
+    Returns:
+        dict: version, backend, stamps(파일별 수정 시각과 크기), korean(한글 폰트별 색인),
+            variants(조합별 계획), skipped(건너뛸 조합과 이유) 항목
+    """
+    skipped = []
+    tasks = _collect_build_tasks(backend, skipped)
+
+    fonts = {}
+    korean = {}
+    variants = []
+    for task in tasks:
+        for path in (task["ko_font_path"], task["en_font_path"]):
+            if path not in fonts:
+                fonts[path] = load_font(path)
+        ko_font_path = task["ko_font_path"]
+        if ko_font_path not in korean:
+            korean[ko_font_path] = korean_plan(fonts[ko_font_path])
+        variants.append(variant_plan(task, korean[ko_font_path], fonts[task["en_font_path"]]))
+
+    stamp_paths = list(fonts) + ([BUILD_MATRIX_PATH] if os.path.exists(BUILD_MATRIX_PATH) else [])
+    return {
+        "version": PLAN_VERSION,
+        "backend": backend,
+        "stamps": {path: _file_stamp(path) for path in stamp_paths},
+        "korean": korean,
+        "variants": variants,
+        "skipped": skipped,
+    }
+
+
+def print_build_plan(plan: dict) -> None:
+    """빌드 계획을 조합별로 요약해 출력합니다."""
+    for path, ko_plan in plan["korean"].items():
+        advances = ", ".join(f"{width}({count}개)" for width, count in ko_plan["advances"].items())
+        print(f"[INFO] {os.path.basename(path)}: 한글 너비 {advances or '없음'}")
+    for variant in plan["variants"]:
+        task = variant["task"]
+        print(
+            f"[INFO] {task['style']}: {os.path.basename(task['ko_font_path'])} + "
+            f"{os.path.basename(task['en_font_path'])}, 한글 글리프 {variant['hangul_glyphs']}개 "
+            f"({variant['runs']}개 구간, 복합 글리프 {variant['composites']}개), "
+            f"덮어쓰기 {variant['overwritten_count']}개, 추가 {variant['added_count']}개"
+        )
+        if variant["overwritten"]:
+            codepoints = [
+                codepoint for start, end in variant["overwritten"] for codepoint in range(start, end + 1)
+            ]
+            print(f"    덮어쓸 영문 코드포인트: {_format_runs(codepoints)}")
+    for entry in plan["skipped"]:
+        print(f"[WARNING] {entry['style']}: 건너뜁니다. ({entry['reason']})")
+
+
+def write_build_plan(path: str, backend: str = "fontforge") -> dict:
+    """
+    빌드 계획을 만들어 JSON 파일로 저장하고 요약을 출력합니다.
+
+    Returns:
+        dict: make_build_plan()의 빌드 계획
+    """
+    start = time.perf_counter()
+    plan = make_build_plan(backend)
+    elapsed = time.perf_counter() - start
+    print_build_plan(plan)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False, indent=1)
+    print(f"[INFO] 빌드 계획을 저장했습니다: {path} (조합 {len(plan['variants'])}개, {elapsed:.2f}초)")
+    return plan
+
+
+def load_build_plan(path: str, backend: str = "fontforge") -> list:
+    """
+    저장된 빌드 계획을 읽어 build_fonts()에 넘길 조합 목록으로 바꿉니다.
+    각 조합에는 한글 색인("coverage")이 들어 있어 빌드할 때 한글 색인을 다시 만들지 않습니다.
+
+    Returns:
+        list: 조합 딕셔너리 리스트
+
+    Raises:
+        ValueError: 계획의 형식이나 백엔드가 맞지 않거나, 계획을 만든 뒤 파일이 바뀌었을 때
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            plan = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"빌드 계획을 읽을 수 없습니다: {e}")
+
+    if plan.get("version") != PLAN_VERSION:
+        raise ValueError(f"빌드 계획 형식의 버전이 다릅니다: {plan.get('version')} (현재 {PLAN_VERSION})")
+    if plan["backend"] != backend:
+        raise ValueError(f"{plan['backend']} 백엔드용 빌드 계획입니다. build.py plan --backend {backend}로 다시 만드세요.")
+    for stamp_path, stamp in plan["stamps"].items():
+        if not os.path.exists(stamp_path) or _file_stamp(stamp_path) != stamp:
+            raise ValueError(f"빌드 계획을 만든 뒤 파일이 바뀌었습니다: {stamp_path}")
+
+    return [
+        dict(
+            variant["task"],
+            formats=tuple(variant["task"]["formats"]),
+            coverage=plan["korean"][variant["task"]["ko_font_path"]]["coverage"],
+        )
+        for variant in plan["variants"]
+    ]
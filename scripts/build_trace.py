@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 현재 프로세스에서 기록된 구간(span) 이벤트 목록입니다.
+_spans: list = []
+
+# 이후 기록되는 모든 구간에 덧붙일 정보입니다(예: 폰트 조합 스타일).
+_context: dict = {}
+
+
+def _read_proc_status_value(pid: str, field: str) -> int:
+    """/proc/<pid>/status에서 정수 항목(예: VmRSS는 KB 단위)을 읽습니다. 읽을 수 없으면 None을 반환합니다."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def reset_peak_rss() -> bool:
+    """
+    현재 프로세스의 최대 RSS 기록(VmHWM)을 현재 RSS로 초기화합니다(Linux).
+    워커 프로세스가 여러 조합을 차례로 빌드해도 조합별 최대 RSS를 측정할 수 있습니다.
+
+    Returns:
+        bool: 초기화했는지 여부. 지원하지 않는 환경에서는 프로세스 전체의 최대값이 보고됩니다.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS(Resident Set Size)를 MB 단위로 반환합니다."""
+    peak_kb = _read_proc_status_value("self", "VmHWM")
+    if peak_kb is not None:
+        return peak_kb / 1024
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위로 보고합니다.
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def get_process_tree_rss_mb() -> float:
+    """
+    현재 프로세스와 자식 프로세스(워커)의 현재 RSS 합계를 MB 단위로 반환합니다.
+    /proc을 사용할 수 없으면 None을 반환합니다.
+    """
+    own_kb = _read_proc_status_value("self", "VmRSS")
+    if own_kb is None:
+        return None
+
+    parent_pid = str(os.getpid())
+    total_kb = own_kb
+    for pid in os.listdir("/proc"):
+        if pid.isdigit() and _read_proc_status_value(pid, "PPid") == int(parent_pid):
+            total_kb += _read_proc_status_value(pid, "VmRSS") or 0
+    return total_kb / 1024
+
+
+def set_trace_context(**context) -> None:
+    """이후 기록되는 구간에 덧붙일 정보를 설정합니다."""
+    _context.clear()
+    _context.update(context)
+
+
+@contextmanager
+def span(name: str, category: str = "stage", events: list = None, **args):
+    """
+    코드 블록의 벽시계 시간, CPU 시간, 최대 RSS를 Chrome trace-event 형식으로 기록합니다.
+
+    Args:
+        name: 구간 이름 (예: "merge_korean_glyphs")
+        category: 구간 분류 ("stage" 또는 "variant")
+        events: 이벤트를 기록할 리스트. 생략하면 프로세스 공용 목록에 기록합니다.
+            다른 스레드에서 실행되는 구간은 공용 목록 대신 별도 리스트를 사용합니다.
+        args: 이벤트에 함께 기록할 추가 정보
+    """
+    start_ts = time.time()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        (_spans if events is None else events).append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": int(start_ts * 1_000_000),
+                "dur": int(wall * 1_000_000),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": dict(
+                    _context,
+                    wall_s=round(wall, 4),
+                    cpu_s=round(cpu, 4),
+                    peak_rss_mb=round(get_peak_rss_mb(), 1),
+                    **args,
+                ),
+            }
+        )
+
+
+def reset_spans() -> None:
+    """기록된 구간을 모두 지웁니다."""
+    _spans.clear()
+
+
+def collect_spans() -> list:
+    """기록된 구간을 반환하고 목록을 비웁니다."""
+    spans = list(_spans)
+    _spans.clear()
+    return spans
+
+
+@contextmanager
+def preserved_spans():
+    """
+    블록 안에서 구간 목록을 비우거나 추적 정보를 바꿔도 블록이 끝나면 이전 상태로 되돌립니다.
+    조합 빌드처럼 reset_spans()/collect_spans()로 자기 구간만 모으는 함수를 워커 대신
+    현재 프로세스에서 실행할 때, 그 전에 기록된 구간(예: "(준비)")이 지워지지 않게 합니다.
+    """
+    saved_spans = list(_spans)
+    saved_context = dict(_context)
+    try:
+        yield
+    finally:
+        _spans[:] = saved_spans + _spans
+        set_trace_context(**saved_context)
+
+
+def write_chrome_trace(path: str, events: list) -> None:
+    """구간 이벤트를 Chrome trace-event JSON 파일로 저장합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"traceEvents": sorted(events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"},
+            f,
+            indent=1,
+            ensure_ascii=False,
+        )
+    print(f"[INFO] 트레이스를 저장했습니다: {path}")
+
+
+def print_trace_summary(events: list) -> None:
+    """조합 및 단계별 벽시계 시간, CPU 시간, 최대 RSS 요약 표를 출력합니다."""
+    if not events:
+        return
+
+    header = f"{'조합':<18} {'단계':<30} {'벽시계(s)':>10} {'CPU(s)':>9} {'최대 RSS(MB)':>13}"
+    print("[INFO] 빌드 단계별 요약:")
+    print(header)
+    print("-" * len(header))
+    for event in sorted(events, key=lambda e: (str(e["args"].get("variant", "")), e["ts"])):
+        args = event["args"]
+        name = event["name"] if event["cat"] == "stage" else "(전체)"
+        print(
+            f"{str(args.get('variant', '-')):<18} {name:<30} "
+            f"{args['wall_s']:>10.2f} {args['cpu_s']:>9.2f} {args['peak_rss_mb']:>13.1f}"
+        )
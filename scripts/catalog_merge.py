@@ -0,0 +1,271 @@
+"""
+한 디렉터리의 모든 영문 폰트에 같은 한글 폰트를 병합하는 카탈로그 병합입니다(build.py merge).
+
+build_matrix.toml의 조합과 달리 디렉터리에 있는 영문 폰트 파일(예: Meslo LG S/M/L/DZ의 모든 웨이트와
+이탤릭)을 모두 병합합니다. 한글 폰트는 한 번만 전처리하고, 영문 폰트는 워커 프로세스에 나누어 병합합니다.
+워커는 전처리된 한글 폰트를 메모리에 유지하므로(resident_fonts) 영문 폰트마다 다시 읽지 않습니다.
+
+- FontForge 백엔드: 전처리 결과를 캐시(SFD)에 저장하고 워커마다 한 번 엽니다.
+- fontTools 백엔드: 전처리한 폰트를 한 번 직렬화해 워커를 시작할 때 전달합니다.
+
+출력 파일 이름은 각 영문 폰트의 패밀리 이름과 get_font_style()의 스타일로 정해지며(병합 전에 이름을
+정해 겹치는 폰트들은 병합하지 않고 실패로 처리합니다), 빌드 매니페스트는 변경하지 않습니다.
+"""
+
+import io
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+try:
+    import fontforge
+except ImportError:
+    fontforge = None
+
+from config import CATALOG_FONTS_PATH, NEW_FONT_NAME, OLD_FONT_NAME
+from build_matrix import match_font_files
+from hangulify import (
+    OUTPUT_FORMATS,
+    _get_cleaned_name,
+    build_variant,
+    compress_variant_outputs,
+    get_font_style,
+    korean_resident_key,
+    preprocess_korean_font,
+    update_family_name,
+)
+from ttfparse import parse_name, read_tables
+from resident_fonts import enable_resident_fonts, put_resident, release_all, release_unused
+
+
+def catalog_tasks(
+    en_dir: str, ko_font_path: str, output_dir: str = CATALOG_FONTS_PATH, formats: tuple = OUTPUT_FORMATS
+) -> list:
+    """
+    영문 폰트 디렉터리의 TTF마다 빌드 작업을 만듭니다.
+    파일 이름에 "Nerd"가 들어간 폰트는 Nerd Font로 처리합니다(re_encode_for_nerd_font()).
+
+    Returns:
+        list: build_variant()에 전달할 작업 딕셔너리 리스트. style은 영문 폰트 파일 이름입니다.
+    """
+    return [
+        {
+            "style": os.path.splitext(os.path.basename(en_font_path))[0],
+            "en_font_path": en_font_path,
+            "ko_font_path": ko_font_path,
+            "is_nerd_font": "nerd" in os.path.basename(en_font_path).lower(),
+            "output_dir": output_dir,
+            "formats": tuple(formats),
+        }
+        for en_font_path in match_font_files(en_dir)
+    ]
+
+
+def planned_output_name(en_font_path: str, backend: str = "fontforge") -> str:
+    """
+    병합하기 전에 영문 폰트의 출력 파일 이름(확장자 제외)을 정합니다.
+    각 백엔드의 update_font_metadata()와 get_font_style()이 정하는 이름과 같습니다.
+    FontForge 백엔드는 파일 이름에 스타일이 없으면 OS/2 굵기와 이탤릭 각도를 사용합니다.
+    """
+    tables = read_tables(en_font_path)
+    names = parse_name(tables["name"]) if "name" in tables else {}
+    # fontTools의 getBestFamilyName()과 같은 순서로 패밀리 이름을 고릅니다.
+    family = names.get(21) or names.get(16) or names.get(1) or ""
+
+    font = SimpleNamespace()
+    if backend == "fontforge":
+        if "OS/2" in tables:
+            font.os2_weight = struct.unpack_from(">H", tables["OS/2"], 4)[0]
+        if "post" in tables:
+            font.italicangle = struct.unpack_from(">l", tables["post"], 4)[0] / 65536
+    style = get_font_style(font, os.path.basename(en_font_path))
+    return f"{_get_cleaned_name(update_family_name(family, OLD_FONT_NAME, NEW_FONT_NAME))}-{style}"
+
+
+def _skip_colliding_tasks(tasks: list, backend: str) -> tuple:
+    """
+    출력 파일 이름이 같은 작업을 병합 전에 찾아 제외합니다. 이름이 겹친 작업은 모두 제외하므로
+    서로의 출력을 덮어쓰지 않습니다.
+
+    Returns:
+        tuple: (병합할 작업 리스트, 제외한 작업의 실패 결과 리스트)
+    """
+    owners = {}
+    for task in tasks:
+        try:
+            name = planned_output_name(task["en_font_path"], backend)
+        except Exception as e:
+            # 읽을 수 없는 폰트는 병합 단계에서 실패로 보고됩니다.
+            print(f"[WARNING] {task['style']}의 출력 이름을 미리 알 수 없습니다: {e}")
+            name = f"?{task['style']}"
+        owners.setdefault(name, []).append(task)
+
+    merged, skipped = [], []
+    for name, owned in owners.items():
+        if len(owned) == 1:
+            merged.extend(owned)
+            continue
+        styles = ", ".join(task["style"] for task in owned)
+        print(f"[ERROR] {styles}의 출력 이름이 {name}(으)로 같아 병합하지 않습니다.")
+        skipped.extend(
+            {"style": task["style"], "success": False, "outputs": [], "elapsed": 0.0} for task in owned
+        )
+    order = [task["style"] for task in tasks]
+    merged.sort(key=lambda task: order.index(task["style"]))
+    return merged, skipped
+
+
+def _init_worker(resident: tuple = None) -> None:
+    """
+    워커 프로세스에서 폰트를 메모리에 유지하도록 설정합니다.
+    resident가 있으면 (키, 전처리된 한글 폰트 바이트, 한글 색인)을 저장해 다시 전처리하지 않게 합니다.
+    """
+    enable_resident_fonts()
+    if resident is not None:
+        from fontTools.ttLib import TTFont
+
+        key, data, coverage = resident
+        ko_font = TTFont(io.BytesIO(data))
+        put_resident(key, (ko_font, coverage), font=ko_font)
+
+
+def merge_catalog_font(task: dict, backend: str = "fontforge", use_cache: bool = True) -> dict:
+    """
+    영문 폰트 하나를 병합하고 나머지 출력 형식을 만듭니다. 워커 프로세스에서 실행됩니다.
+
+    Returns:
+        dict: build_variant() 결과에 소요 시간(elapsed)을 더한 결과
+    """
+    if backend == "fonttools":
+        from fonttools_backend import build_variant as variant_builder
+    else:
+        variant_builder = build_variant
+
+    start = time.perf_counter()
+    result = compress_variant_outputs(variant_builder(task, use_cache), task["formats"])
+    # 한글 폰트는 다음 작업에서 다시 쓰므로 남고, 이번 영문 폰트 소스만 지워집니다.
+    release_unused()
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def _preprocess_once(ko_font_path: str, backend: str, use_cache: bool, serialize: bool) -> tuple:
+    """
+    한글 폰트를 한 번 전처리합니다. 폰트를 메모리에 유지하는 중이면(워커가 하나일 때) 결과가 그대로 유지됩니다.
+
+    Args:
+        serialize: fontTools 백엔드에서 전처리한 폰트를 워커에 전달할 바이트로 만들지 여부
+
+    Returns:
+        tuple: 워커 초기화에 전달할 값 (fontTools 백엔드에서 serialize일 때만, 그 외에는 None)
+    """
+    if backend == "fonttools":
+        from fonttools_backend import load_preprocessed_korean_font
+
+        ko_font, coverage = load_preprocessed_korean_font(ko_font_path)
+        if not serialize:
+            return None
+        buffer = io.BytesIO()
+        ko_font.save(buffer)
+        ko_font.close()
+        return (korean_resident_key("fonttools", ko_font_path), buffer.getvalue(), coverage)
+
+    if use_cache:
+        preprocess_korean_font(ko_font_path)
+    return None
+
+
+def merge_font_catalog(
+    en_dir: str,
+    ko_font_path: str,
+    output_dir: str = CATALOG_FONTS_PATH,
+    jobs: int = 1,
+    backend: str = "fontforge",
+    use_cache: bool = True,
+    formats: tuple = OUTPUT_FORMATS,
+) -> bool:
+    """
+    영문 폰트 디렉터리의 모든 TTF에 한글 폰트를 병합하고 처리량을 출력합니다.
+
+    Args:
+        en_dir: 영문 폰트 디렉터리
+        ko_font_path: 한글 폰트 파일 경로
+        output_dir: 출력 디렉터리
+        jobs: 영문 폰트를 병합할 워커 프로세스 수
+        backend: 빌드 백엔드. "fontforge" 또는 "fonttools"
+        use_cache: 전처리된 한글 폰트 캐시 사용 여부(FontForge 백엔드)
+        formats: 출력 형식
+
+    Returns:
+        bool: 모든 영문 폰트의 병합이 성공했는지 여부. 출력 파일 이름이 겹친 폰트는 실패로 셉니다.
+    """
+    if backend == "fontforge" and fontforge is None:
+        print("[ERROR] FontForge 모듈을 찾을 수 없습니다. --backend fonttools를 사용하거나 FontForge를 설치하세요.")
+        return False
+    if not os.path.isfile(ko_font_path):
+        print(f"[ERROR] 한글 폰트 파일을 찾을 수 없습니다: {ko_font_path}")
+        return False
+
+    tasks = catalog_tasks(en_dir, ko_font_path, output_dir, formats)
+    if not tasks:
+        print(f"[ERROR] {en_dir}에서 병합할 TTF 파일을 찾을 수 없습니다.")
+        return False
+    tasks, skipped = _skip_colliding_tasks(tasks, backend)
+    if not tasks:
+        return False
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = max(1, min(jobs, len(tasks)))
+    start = time.perf_counter()
+    if workers == 1:
+        enable_resident_fonts()
+    try:
+        print(f"[INFO] 한글 폰트를 한 번 전처리합니다: {os.path.basename(ko_font_path)}")
+        resident = _preprocess_once(ko_font_path, backend, use_cache, serialize=workers > 1)
+        preprocess_elapsed = time.perf_counter() - start
+
+        print(f"[INFO] 영문 폰트 {len(tasks)}개를 워커 {workers}개로 병합합니다.")
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(resident,)
+            ) as executor:
+                futures = [
+                    executor.submit(merge_catalog_font, task, backend, use_cache) for task in tasks
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [merge_catalog_font(task, backend, use_cache) for task in tasks]
+    finally:
+        if workers == 1:
+            release_all()
+            enable_resident_fonts(False)
+    elapsed = time.perf_counter() - start
+
+    # 미리 정한 이름과 실제 출력 이름이 다를 때를 대비해 병합 후에도 겹친 출력을 실패로 처리합니다.
+    owners = {}
+    for index, result in enumerate(results):
+        for path in result["outputs"]:
+            owners.setdefault(path, []).append(index)
+    for path, indexes in owners.items():
+        if len(indexes) < 2:
+            continue
+        styles = ", ".join(tasks[index]["style"] for index in indexes)
+        print(f"[ERROR] {styles}의 출력 이름이 {os.path.basename(path)}(으)로 같아 서로 덮어썼습니다.")
+        for index in indexes:
+            results[index]["success"] = False
+
+    results = results + skipped
+    print("[INFO] 병합 결과:")
+    for result in results:
+        status = "성공" if result["success"] else "실패"
+        outputs = ", ".join(os.path.basename(path) for path in result["outputs"])
+        print(f"  - {result['style']}: {status} ({result['elapsed']:.1f}초) {outputs}")
+
+    succeeded = sum(1 for result in results if result["success"])
+    print(
+        f"[INFO] {succeeded}/{len(results)}개 폰트 병합 완료: {elapsed:.1f}초 "
+        f"(한글 전처리 {preprocess_elapsed:.1f}초), {succeeded / elapsed * 60:.1f} fonts/min"
+    )
+    return succeeded == len(results)
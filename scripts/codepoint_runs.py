@@ -0,0 +1,25 @@
+"""
+정렬된 코드포인트 목록을 연속 구간으로 묶는 도우미입니다.
+
+빌드 파이프라인(hangulify)과 검사 도구(glyph_index 등)가 함께 사용하며,
+다른 빌드 모듈을 불러오지 않으므로 검사 도구를 가볍게 임포트할 수 있습니다.
+"""
+
+
+def find_codepoint_runs(codepoints: list) -> list:
+    """
+    정렬된 코드포인트 목록을 연속 구간으로 묶습니다.
+
+    Args:
+        codepoints: 오름차순으로 정렬된 코드포인트 리스트
+
+    Returns:
+        list: (시작, 끝) 코드포인트 튜플의 리스트. 끝 값을 포함합니다.
+    """
+    runs = []
+    for codepoint in codepoints:
+        if runs and codepoint == runs[-1][1] + 1:
+            runs[-1][1] = codepoint
+        else:
+            runs.append([codepoint, codepoint])
+    return [tuple(run) for run in runs]
@@ -7,6 +7,20 @@ import os
 ASSETS_PATH: str = "assets"
 # 최종 폰트 파일이 저장될 디렉터리입니다.
 BUILT_FONTS_PATH: str = os.path.join(ASSETS_PATH, "built_fonts")
+# 출력 파일별 입력 정보를 기록하는 빌드 매니페스트 파일입니다.
+MANIFEST_PATH: str = os.path.join(BUILT_FONTS_PATH, "manifest.json")
+# 유니코드 범위별로 나눈 웹 폰트와 @font-face CSS가 저장될 디렉터리입니다.
+WEB_FONTS_PATH: str = os.path.join(BUILT_FONTS_PATH, "web")
+# watch 모드에서 다시 빌드한 TTF가 저장될 디렉터리입니다. 빌드 매니페스트와 별도로 관리합니다.
+WATCH_FONTS_PATH: str = os.path.join(BUILT_FONTS_PATH, "watch")
+# build.py merge가 영문 폰트 디렉터리의 모든 폰트를 병합한 결과를 저장하는 기본 디렉터리입니다.
+CATALOG_FONTS_PATH: str = os.path.join(BUILT_FONTS_PATH, "catalog")
+# 지난 릴리스 빌드 결과의 글리프 해시 색인(build.py verify 기준값)을 저장하는 디렉터리입니다.
+GLYPH_INDEX_PATH: str = os.path.join(ASSETS_PATH, "glyph_index")
+# 빌드할 폰트 조합(소스, 웨이트, 출력 형식, 조합별 설정 값)을 정의하는 빌드 매트릭스 파일입니다.
+BUILD_MATRIX_PATH: str = "build_matrix.toml"
+# build.py plan이 저장하는 빌드 계획 파일입니다. build --plan으로 빌드에 넘길 수 있습니다.
+BUILD_PLAN_PATH: str = os.path.join(ASSETS_PATH, "build_plan.json")
 # 폰트 이름 설정
 OLD_FONT_NAME: str = "Meslo"
 NEW_FONT_NAME: str = "MeD2"
@@ -27,3 +41,32 @@ EN_NERD_FONT_PATH: str = os.path.join(ASSETS_PATH, "en_nerd_font")
 KOREAN_FONT_WIDTH: int = 1000
 ENGLISH_FONT_WIDTH: int = 1200
 ENGLISH_FONT_NF_WIDTH: int = 1200
+
+# =======================================
+#  웹 폰트 분할 설정
+# =======================================
+# 한글 외 문자와 자주 쓰는 한글 음절(KS X 1001) 조각 하나에 담을 코드포인트 수
+WEB_SLICE_SIZE: int = 250
+# 드물게 쓰는 한글 음절 조각 하나에 담을 코드포인트 수
+WEB_SLICE_RARE_SIZE: int = 1000
+
+# =======================================
+#  출력 파일 크기 한도
+# =======================================
+# build --profile web(또는 --budget)에서 검사하는 확장자별 출력 파일 크기 한도(바이트)입니다.
+# 한도를 넘는 파일이 있으면 빌드가 실패합니다. --budget woff2=900K처럼 형식별로 바꿀 수 있습니다.
+SIZE_BUDGETS: dict = {
+    "ttf": 6 * 1024 * 1024,
+    "woff": 3 * 1024 * 1024,
+    "woff2": 2 * 1024 * 1024,
+}
+
+# =======================================
+#  캐시 구성
+# =======================================
+# 전처리된 한글 폰트 등 중간 결과를 저장하는 디렉터리입니다.
+CACHE_PATH: str = os.path.join(ASSETS_PATH, "cache")
+# 벤치마크 결과를 누적 기록하는 JSONL 파일입니다.
+BENCH_HISTORY_PATH: str = os.path.join("bench", "history.jsonl")
+# 벤치마크 기본 글리프 수 목록입니다.
+DEFAULT_BENCH_SIZES: tuple = (1000, 4000, 11172)
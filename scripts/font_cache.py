@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any
+
+from config import CACHE_PATH
+
+# 파일 해시 계산 시 한 번에 읽을 바이트 수입니다.
+_HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시를 계산합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_cache_key(source_path: str, params: dict) -> str:
+    """
+    소스 파일 해시와 전처리 파라미터로 캐시 키를 만듭니다.
+
+    Args:
+        source_path: 원본 폰트 파일 경로
+        params: 전처리 결과에 영향을 주는 설정 값
+
+    Returns:
+        str: 캐시 키 (SHA-256 16진수 문자열)
+    """
+    payload = json.dumps(
+        {"source": file_sha256(source_path), "params": params}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _entry_paths(key: str, cache_dir: str) -> tuple:
+    """캐시 항목의 폰트 파일과 메타데이터 파일 경로를 반환합니다."""
+    return (
+        os.path.join(cache_dir, f"{key}.sfd"),
+        os.path.join(cache_dir, f"{key}.json"),
+    )
+
+
+def lookup_cached_font(key: str, cache_dir: str = CACHE_PATH) -> str:
+    """캐시된 폰트 파일 경로를 반환합니다. 없으면 None을 반환합니다."""
+    font_path, meta_path = _entry_paths(key, cache_dir)
+    if os.path.exists(font_path) and os.path.exists(meta_path):
+        return font_path
+    return None
+
+
+def read_cache_metadata(key: str, cache_dir: str = CACHE_PATH) -> dict:
+    """캐시 항목의 메타데이터를 읽습니다. 없거나 손상되었으면 빈 딕셔너리를 반환합니다."""
+    _, meta_path = _entry_paths(key, cache_dir)
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def store_cached_font(
+    font: Any, key: str, metadata: dict, cache_dir: str = CACHE_PATH
+) -> str:
+    """
+    FontForge 폰트 객체를 SFD 형식으로 캐시에 저장합니다.
+    여러 워커가 동시에 저장해도 안전하도록 임시 파일에 쓴 뒤 교체합니다.
+
+    Returns:
+        str: 저장된 캐시 파일 경로
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    font_path, meta_path = _entry_paths(key, cache_dir)
+    tmp_font_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.tmp.sfd")
+    tmp_meta_path = os.path.join(cache_dir, f"{key}.{os.getpid()}.tmp.json")
+
+    font.save(tmp_font_path)
+    with open(tmp_meta_path, "w", encoding="utf-8") as f:
+        json.dump(dict(metadata, key=key, created=time.time()), f, indent=2)
+
+    os.replace(tmp_font_path, font_path)
+    os.replace(tmp_meta_path, meta_path)
+    return font_path
+
+
+def list_cache_entries(cache_dir: str = CACHE_PATH) -> list:
+    """
+    캐시 항목 목록을 반환합니다.
+
+    Returns:
+        list: 각 항목의 키, 크기(bytes), 메타데이터를 담은 딕셔너리 리스트
+    """
+    if not os.path.exists(cache_dir):
+        return []
+
+    entries = []
+    for filename in sorted(os.listdir(cache_dir)):
+        if not filename.endswith(".json") or ".tmp." in filename:
+            continue
+        key = filename[: -len(".json")]
+        font_path, meta_path = _entry_paths(key, cache_dir)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            metadata = {}
+        size = os.path.getsize(font_path) if os.path.exists(font_path) else 0
+        entries.append({"key": key, "size": size, "metadata": metadata})
+
+    return entries
+
+
+def prune_cache(keep_keys: set = None, cache_dir: str = CACHE_PATH) -> int:
+    """
+    캐시 항목을 삭제합니다.
+
+    Args:
+        keep_keys: 유지할 캐시 키 집합. None이면 모든 항목을 삭제합니다.
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    if not os.path.exists(cache_dir):
+        return 0
+
+    removed = 0
+    for filename in os.listdir(cache_dir):
+        key = filename.split(".", 1)[0]
+        if keep_keys is not None and key in keep_keys and ".tmp." not in filename:
+            continue
+        os.remove(os.path.join(cache_dir, filename))
+        removed += 1
+
+    return removed
@@ -0,0 +1,310 @@
+"""
+소스 폰트와 빌드된 폰트를 표준 라이브러리 파서(ttfparse)로 검사합니다(build.py test).
+
+FontForge의 전체 글리프 모델을 만들지 않고 cmap, hmtx, name 테이블만 읽으므로 모든 파일을
+워커 프로세스에서 동시에 검사할 수 있습니다. 파일마다 다음을 확인합니다.
+
+- 한글 범위(HANGUL_RANGES)의 cmap 범위: 한글 소스는 한글 음절 전체, 빌드 결과는 한글 소스가 가진 모든 코드포인트
+- 너비: 한글 음절과 ASCII 문자가 각각 한 가지 너비인지, 소스의 너비가 KOREAN_FONT_WIDTH,
+  ENGLISH_FONT_WIDTH(Nerd Font는 ENGLISH_FONT_NF_WIDTH)와 같은지(ASCII_WIDTH_EXCEPTIONS 제외),
+  빌드 결과의 한글 음절 너비가 KOREAN_FONT_WIDTH를 Em 스케일링하고 베어링을 조정한 값과 같고
+  ASCII 너비가 영문 소스와 같은 설정 값인지
+- name 테이블: 빌드 결과의 이름에 NEW_FONT_NAME이 들어가고 OLD_FONT_NAME이 남지 않았는지,
+  PostScript 이름이 파일 이름과 같은지
+- Nerd Font 재매핑(NERD_FONT_REMAP): 빌드된 Nerd Font 조합에 대상 코드포인트가 있는지
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import (
+    BUILT_FONTS_PATH,
+    EN_FONT_PATH,
+    EN_NERD_FONT_PATH,
+    ENGLISH_FONT_NF_WIDTH,
+    ENGLISH_FONT_WIDTH,
+    KO_FONT_PATH,
+    KOREAN_FONT_WIDTH,
+    NEW_FONT_NAME,
+    OLD_FONT_NAME,
+)
+from glyph_index import _format_runs
+from hangulify import (
+    BEARING_ADJUSTMENT,
+    NERD_FONT_REMAP,
+    TARGET_EM,
+    _in_hangul_ranges,
+    _is_jetbrains_font_width,
+)
+from ttfparse import load_font
+
+# 한글 소스 폰트가 모두 가져야 하는 현대 한글 음절 범위입니다.
+HANGUL_SYLLABLES: range = range(0xAC00, 0xD7A4)
+
+# 영문 글리프 너비를 확인하는 ASCII 출력 가능 문자 범위입니다.
+ASCII_PRINTABLE: range = range(0x20, 0x7F)
+
+# 설정 값 대신 허용하는 영문 폰트의 ASCII 너비입니다. (패밀리 이름에 들어가는 문자열 -> 너비)
+# Meslo는 2048 Em에서 ASCII 너비가 1233입니다. ENGLISH_FONT_WIDTH/ENGLISH_FONT_NF_WIDTH(1200)는
+# 베어링을 조정할 한글 글리프를 고르는 값(_is_jetbrains_font_width())이기도 하므로 Meslo에 맞춰 바꾸지 않습니다.
+ASCII_WIDTH_EXCEPTIONS: dict = {"Meslo": 1233}
+
+# 빌드된 폰트에서 NEW_FONT_NAME이 들어가야 하는 nameID입니다. (패밀리, 전체 이름, PostScript 이름)
+CHECKED_NAME_IDS: tuple = (1, 4, 6)
+
+# 검사할 파일 종류와 디렉터리입니다. 빌드 결과는 TTF만 검사합니다(WOFF2 등은 TTF에서 압축한 파일).
+FONT_KINDS: tuple = (
+    ("en", EN_FONT_PATH, (".ttf", ".otf")),
+    ("en_nerd", EN_NERD_FONT_PATH, (".ttf", ".otf")),
+    ("ko", KO_FONT_PATH, (".ttf", ".otf")),
+    ("built", BUILT_FONTS_PATH, (".ttf",)),
+)
+
+
+def _advances(font: dict, codepoints) -> dict:
+    """코드포인트들의 너비별 글리프 수를 셉니다. cmap에 없는 코드포인트는 건너뜁니다."""
+    cmap = font["cmap"]
+    metrics = font["metrics"]
+    counts = {}
+    for codepoint in codepoints:
+        if codepoint in cmap:
+            advance = metrics[cmap[codepoint]][0]
+            counts[advance] = counts.get(advance, 0) + 1
+    return counts
+
+
+def _check_uniform_width(counts: dict, label: str, expected: int, config_name: str, report: dict) -> int:
+    """
+    너비가 한 가지인지 확인하고, expected가 있으면 설정 값과 비교합니다.
+
+    Returns:
+        int: 한 가지인 너비. 글리프가 없거나 너비가 여러 가지이면 None
+    """
+    if not counts:
+        return None
+    if len(counts) > 1:
+        widths = ", ".join(f"{width}({count}개)" for width, count in sorted(counts.items()))
+        report["errors"].append(f"{label} 너비가 한 가지가 아닙니다: {widths}")
+        return None
+    (width,) = counts
+    report["summary"].append(f"{label} 너비 {width}")
+    if expected is not None and width != expected:
+        report["errors"].append(f"{label} 너비({width})가 {config_name} 값({expected})과 다릅니다")
+    return width
+
+
+def expected_ascii_width(family: str, nerd_font: bool) -> tuple:
+    """
+    영문 소스(또는 그 소스로 빌드한 폰트)의 ASCII 너비로 기대하는 값과 그 설정 이름을 반환합니다.
+    빌드된 폰트의 패밀리 이름은 NEW_FONT_NAME을 OLD_FONT_NAME으로 되돌려 ASCII_WIDTH_EXCEPTIONS와 비교합니다.
+    """
+    source_family = family.replace(NEW_FONT_NAME, OLD_FONT_NAME)
+    for name, width in ASCII_WIDTH_EXCEPTIONS.items():
+        if name in source_family:
+            return width, f"ASCII_WIDTH_EXCEPTIONS[{name!r}]"
+    if nerd_font:
+        return ENGLISH_FONT_NF_WIDTH, "ENGLISH_FONT_NF_WIDTH"
+    return ENGLISH_FONT_WIDTH, "ENGLISH_FONT_WIDTH"
+
+
+def expected_hangul_width(ko_units_per_em: int) -> int:
+    """
+    Em이 ko_units_per_em인 한글 소스의 KOREAN_FONT_WIDTH 너비 글리프가 빌드 후 가지는 너비입니다.
+    Em 스케일링(TARGET_EM 비율로 두 번, 너비는 소수점 이하를 버림)과 베어링 조정을 빌드와 같은 순서로 계산합니다.
+    """
+    scale_factor = TARGET_EM / ko_units_per_em
+    width = int(math.floor(KOREAN_FONT_WIDTH * scale_factor + 0.5) * scale_factor)
+    if _is_jetbrains_font_width(width):
+        width += BEARING_ADJUSTMENT // 2 * 2
+    return width
+
+
+def _check_built_names(path: str, names: dict, report: dict) -> None:
+    """빌드된 폰트의 name 테이블이 NEW_FONT_NAME과 파일 이름에 맞는지 확인합니다."""
+    for name_id in CHECKED_NAME_IDS + ((16,) if 16 in names else ()):
+        value = names.get(name_id)
+        if value is None:
+            report["errors"].append(f"name 테이블에 nameID {name_id}가 없습니다")
+        elif NEW_FONT_NAME not in value:
+            report["errors"].append(f"nameID {name_id} '{value}'에 {NEW_FONT_NAME}이(가) 없습니다")
+        elif OLD_FONT_NAME in value:
+            report["errors"].append(f"nameID {name_id} '{value}'에 {OLD_FONT_NAME}이(가) 남아 있습니다")
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if names.get(6) is not None and names[6] != stem:
+        report["errors"].append(f"PostScript 이름 '{names[6]}'이(가) 파일 이름 '{stem}'과 다릅니다")
+
+
+def check_font(path: str, kind: str) -> dict:
+    """
+    폰트 파일 하나를 검사합니다. 워커 프로세스에서 실행됩니다.
+
+    Args:
+        path: 폰트 파일 경로
+        kind: 파일 종류 ("en", "en_nerd", "ko", "built")
+
+    Returns:
+        dict: path, kind, errors, warnings, summary(요약 문자열 리스트),
+            codepoints(한글 범위와 NERD_FONT_REMAP의 코드포인트 중 cmap에 있는 것),
+            units_per_em, hangul_width(빌드 결과의 한글 음절 너비) 항목
+    """
+    report = {
+        "path": path, "kind": kind, "errors": [], "warnings": [], "summary": [], "codepoints": [],
+        "units_per_em": None, "hangul_width": None,
+    }
+    try:
+        font = load_font(path)
+    except Exception as e:
+        report["errors"].append(f"폰트를 읽을 수 없습니다: {e}")
+        return report
+
+    cmap = font["cmap"]
+    remap_codepoints = set(NERD_FONT_REMAP) | set(NERD_FONT_REMAP.values())
+    report["codepoints"] = sorted(
+        codepoint for codepoint in cmap
+        if _in_hangul_ranges(codepoint) or codepoint in remap_codepoints
+    )
+    report["summary"].append(f"글리프 {font['num_glyphs']}개")
+    report["units_per_em"] = font["head"]["units_per_em"]
+    family = font["names"].get(1, "")
+
+    if kind == "ko":
+        missing = [codepoint for codepoint in HANGUL_SYLLABLES if codepoint not in cmap]
+        if missing:
+            report["errors"].append(f"한글 음절 {len(missing)}개가 없습니다: {_format_runs(missing)}")
+        _check_uniform_width(
+            _advances(font, HANGUL_SYLLABLES), "한글 음절", KOREAN_FONT_WIDTH, "KOREAN_FONT_WIDTH", report
+        )
+    elif kind in ("en", "en_nerd"):
+        expected, config_name = expected_ascii_width(family, kind == "en_nerd")
+        _check_uniform_width(_advances(font, ASCII_PRINTABLE), "ASCII", expected, config_name, report)
+        if OLD_FONT_NAME not in family:
+            report["warnings"].append(
+                f"패밀리 이름 '{family}'에 {OLD_FONT_NAME}이(가) 없어 {NEW_FONT_NAME}(으)로 바뀌지 않습니다"
+            )
+        if kind == "en_nerd":
+            for src_codepoint, dest_codepoint in NERD_FONT_REMAP.items():
+                if src_codepoint in cmap and dest_codepoint not in cmap:
+                    report["warnings"].append(
+                        f"재매핑 대상 {hex(dest_codepoint)}이(가) 없어 {hex(src_codepoint)} 재매핑을 건너뜁니다"
+                    )
+    else:
+        # 한글 음절의 기대 너비는 한글 소스의 Em에 따라 달라지므로 _check_across_fonts()에서 비교합니다.
+        report["hangul_width"] = _check_uniform_width(
+            _advances(font, HANGUL_SYLLABLES), "한글 음절", None, None, report
+        )
+        expected, config_name = expected_ascii_width(
+            family, "NerdFont" in os.path.basename(path)
+        )
+        _check_uniform_width(_advances(font, ASCII_PRINTABLE), "ASCII", expected, config_name, report)
+        _check_built_names(path, font["names"], report)
+
+    return report
+
+
+def _font_files(directory: str, extensions: tuple) -> list:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, filename)
+        for filename in os.listdir(directory)
+        if filename.lower().endswith(extensions)
+    )
+
+
+def _check_across_fonts(reports: list) -> None:
+    """
+    파일 사이의 관계를 확인합니다. 빌드된 폰트는 모든 한글 소스가 가진 한글 범위 코드포인트를 가져야 하고,
+    한글 음절 너비가 한글 소스의 Em에서 계산한 기대 너비(expected_hangul_width()) 중 하나와 같아야 합니다.
+    빌드된 Nerd Font 조합은 모든 Nerd Font 소스에서 재매핑할 수 있는 글리프의 대상 코드포인트를 가져야 합니다.
+    """
+    ko_sets = [set(report["codepoints"]) for report in reports if report["kind"] == "ko"]
+    required = set.intersection(*ko_sets) if ko_sets else set()
+    required = {codepoint for codepoint in required if _in_hangul_ranges(codepoint)}
+    hangul_widths = {
+        expected_hangul_width(report["units_per_em"])
+        for report in reports
+        if report["kind"] == "ko" and report.get("units_per_em")
+    }
+
+    nerd_sets = [set(report["codepoints"]) for report in reports if report["kind"] == "en_nerd"]
+    remaps = {
+        src: dest
+        for src, dest in NERD_FONT_REMAP.items()
+        if nerd_sets and all(src in codepoints and dest in codepoints for codepoints in nerd_sets)
+    }
+
+    for report in reports:
+        if report["kind"] != "built":
+            continue
+        codepoints = set(report["codepoints"])
+        hangul_count = sum(1 for codepoint in codepoints if _in_hangul_ranges(codepoint))
+        report["summary"].insert(1, f"한글 {hangul_count}/{len(required)}")
+        missing = sorted(required - codepoints)
+        if missing:
+            report["errors"].append(f"한글 소스에 있는 코드포인트 {len(missing)}개가 없습니다: {_format_runs(missing)}")
+        width = report.get("hangul_width")
+        if width is not None and hangul_widths and width not in hangul_widths:
+            expected = ", ".join(str(value) for value in sorted(hangul_widths))
+            report["errors"].append(
+                f"한글 음절 너비({width})가 KOREAN_FONT_WIDTH와 TARGET_EM에서 계산한 값({expected})과 다릅니다"
+            )
+
+        if "NerdFont" not in os.path.basename(report["path"]):
+            continue
+        for src_codepoint, dest_codepoint in remaps.items():
+            if dest_codepoint not in codepoints:
+                report["errors"].append(f"Nerd Font 재매핑 대상 {hex(dest_codepoint)}이(가) 없습니다")
+            elif src_codepoint in codepoints:
+                report["errors"].append(f"재매핑한 원본 코드포인트 {hex(src_codepoint)}이(가) 남아 있습니다")
+
+
+def check_fonts(jobs: int = 1, font_kinds: tuple = FONT_KINDS) -> bool:
+    """
+    소스 폰트와 빌드된 폰트를 모두 검사하고 결과를 출력합니다.
+
+    Args:
+        jobs: 동시에 검사할 워커 프로세스 수
+        font_kinds: (종류, 디렉터리, 확장자 튜플) 목록
+
+    Returns:
+        bool: 오류가 없는지 여부 (경고는 실패로 처리하지 않습니다)
+    """
+    targets = [
+        (path, kind)
+        for kind, directory, extensions in font_kinds
+        for path in _font_files(directory, extensions)
+    ]
+    if not targets:
+        print("[ERROR] 검사할 폰트 파일을 찾을 수 없습니다.")
+        return False
+
+    start = time.perf_counter()
+    paths = [path for path, _ in targets]
+    kinds = [kind for _, kind in targets]
+    workers = min(jobs, len(targets))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(check_font, paths, kinds))
+    else:
+        reports = [check_font(path, kind) for path, kind in targets]
+    _check_across_fonts(reports)
+    elapsed = time.perf_counter() - start
+
+    if "built" not in kinds:
+        print("[INFO] 빌드된 폰트가 없어 소스 폰트만 검사했습니다.")
+
+    error_count = 0
+    for report in reports:
+        status = "실패" if report["errors"] else "통과"
+        print(f"[INFO] {report['kind']:<8} {os.path.basename(report['path'])}: {status} ({', '.join(report['summary'])})")
+        for warning in report["warnings"]:
+            print(f"[WARNING]   {warning}")
+        for error in report["errors"]:
+            print(f"[ERROR]   {error}")
+        error_count += len(report["errors"])
+
+    print(f"[INFO] 폰트 {len(reports)}개 검사 완료 ({elapsed:.2f}초, 워커 {max(workers, 1)}개): 오류 {error_count}개")
+    return error_count == 0
@@ -0,0 +1,252 @@
+"""
+관련된 조합(예: Regular와 NerdFont-Regular)의 TTF를 TrueType 컬렉션(.ttc) 하나로 묶습니다(--ttc).
+
+두 조합에는 같은 한글 글리프 약 11,000개가 들어 있으므로, 컬렉션의 모든 폰트가 같은 글리프 순서를
+쓰도록 맞춰 glyf/loca 테이블을 한 벌만 저장합니다.
+
+- 첫 폰트(기본 조합)의 글리프 순서를 그대로 두고, 나머지 폰트에서 이름과 윤곽선이 같은 글리프는
+  첫 폰트의 글리프를 사용합니다. 다른 글리프는 뒤에 추가하고, 이름이 겹치면 새 이름을 붙입니다.
+- cmap, hmtx, GSUB/GPOS 등 글리프를 가리키는 테이블은 폰트마다 따로 두고 새 글리프 순서로 다시 씁니다.
+  글리프 수가 바뀌면 맞지 않는 장치 메트릭 테이블과 FontForge 전용 테이블(TTC_DROPPED_TABLES)은 뺍니다.
+- 글리프 순서를 맞출 수 없으면(fontTools가 읽지 못하는 테이블이 글리프를 가리킬 수 있을 때 등)
+  바이트가 같은 테이블만 공유하는 컬렉션으로 만듭니다.
+"""
+
+import os
+import struct
+
+from fontTools.ttLib import TTCollection, TTFont
+from fontTools.ttLib.tables.DefaultTable import DefaultTable
+
+from hangulify import dependency_order
+
+# 글리프 순서를 맞출 때 빼는 테이블입니다.
+# hdmx/LTSH는 글리프 수에 맞춘 장치 메트릭, PfEd는 FontForge 전용 정보, DSIG는 테이블을 바꾸면 무효가 되는 서명입니다.
+TTC_DROPPED_TABLES: tuple = ("hdmx", "LTSH", "PfEd", "DSIG")
+
+# fontTools가 읽지 못해도 글리프를 가리키지 않아 그대로 둘 수 있는 테이블입니다. (FontForge 타임스탬프)
+TTC_OPAQUE_TABLES: tuple = ("FFTM",)
+
+
+def collection_groups(tasks: list) -> list:
+    """
+    nerd_base로 이어진 조합을 컬렉션으로 묶습니다.
+
+    Returns:
+        list: [기본 조합 style, Nerd Font 조합 style, ...] 리스트
+    """
+    styles = {task["style"] for task in tasks}
+    groups = {}
+    for task in tasks:
+        base = task.get("nerd_base")
+        if base in styles:
+            groups.setdefault(base, [base]).append(task["style"])
+    return list(groups.values())
+
+
+def _glyph_key(glyph, glyf, rename: dict) -> tuple:
+    """
+    글리프 ID와 관계없이 글리프 데이터를 비교할 키를 만듭니다.
+    복합 글리프는 구성 요소를 rename으로 바꾼 이름으로 비교합니다.
+    """
+    if not glyph.isComposite():
+        return ("simple", glyph.compile(glyf))
+
+    components = tuple(
+        (
+            rename.get(component.glyphName, component.glyphName),
+            getattr(component, "x", None),
+            getattr(component, "y", None),
+            getattr(component, "firstPt", None),
+            getattr(component, "secondPt", None),
+            component.flags,
+            tuple(map(tuple, component.transform)) if hasattr(component, "transform") else None,
+        )
+        for component in glyph.components
+    )
+    program = glyph.program.getBytecode() if hasattr(glyph, "program") else b""
+    return ("composite", components, program)
+
+
+def _face_renames(path: str, glyph_keys: dict, glyph_order: list, face_index: int) -> dict:
+    """
+    폰트의 글리프 이름을 컬렉션 글리프 이름으로 바꾸는 표를 만들고, 새 글리프를 glyph_order에 추가합니다.
+    이름과 데이터가 같은 글리프가 glyph_keys에 있으면 그 글리프를 공유합니다.
+
+    Returns:
+        dict: 원래 글리프 이름 -> 컬렉션 글리프 이름
+    """
+    font = TTFont(path, lazy=True)
+    glyf = font["glyf"]
+    rename = {}
+    try:
+        # 구성 요소를 먼저 처리해 복합 글리프의 키에 바뀐 이름이 들어가게 합니다.
+        for name in dependency_order(font.getGlyphOrder(), lambda name: glyf[name].getComponentNames(glyf)):
+            key = _glyph_key(glyf[name], glyf, rename)
+            if glyph_keys.get(name) == key:
+                rename[name] = name
+                continue
+            new_name = name
+            suffix = face_index
+            while new_name in glyph_keys:
+                new_name = f"{name}.ttc{suffix}"
+                suffix += 1
+            glyph_keys[new_name] = key
+            glyph_order.append(new_name)
+            rename[name] = new_name
+    finally:
+        font.close()
+    return rename
+
+
+def _check_tables(font: TTFont, path: str) -> None:
+    """
+    글리프 순서를 바꿀 수 없는 테이블이 있으면 ValueError를 발생시킵니다.
+    fontTools가 읽지 못하는 테이블은 글리프 ID를 가리킬 수 있어 다시 쓸 수 없습니다.
+    """
+    for tag in font.keys():
+        if tag not in TTC_OPAQUE_TABLES and type(font[tag]) is DefaultTable:
+            raise ValueError(f"{os.path.basename(path)}의 {tag} 테이블을 새 글리프 순서로 바꿀 수 없습니다")
+
+
+def unify_glyph_orders(paths: list) -> tuple:
+    """
+    폰트들이 같은 glyf/loca 테이블을 쓰도록 글리프 순서를 맞춥니다.
+
+    Returns:
+        tuple: (글리프 순서를 맞춘 TTFont 리스트, 공유하는 글리프 수)
+
+    Raises:
+        ValueError: 글리프 순서를 바꿀 수 없는 테이블이 있을 때
+    """
+    base = TTFont(paths[0], recalcTimestamp=False)
+    base_glyf = base["glyf"]
+    glyph_order = list(base.getGlyphOrder())
+    glyph_keys = {name: _glyph_key(base_glyf[name], base_glyf, {}) for name in glyph_order}
+
+    renames = [{name: name for name in glyph_order}]
+    for face_index, path in enumerate(paths[1:], start=1):
+        renames.append(_face_renames(path, glyph_keys, glyph_order, face_index))
+
+    fonts = [base]
+    for path, rename in zip(paths[1:], renames[1:]):
+        font = TTFont(path, recalcTimestamp=False)
+        # 테이블을 읽기 전에 이름을 바꾸면 글리프 ID로 저장된 테이블이 모두 새 이름으로 읽힙니다.
+        font.setGlyphOrder([rename[name] for name in font.getGlyphOrder()])
+        fonts.append(font)
+
+    owners = {}
+    for font, rename, path in zip(fonts, renames, paths):
+        for tag in TTC_DROPPED_TABLES:
+            if tag in font:
+                del font[tag]
+        _check_tables(font, path)
+        font.ensureDecompiled()
+        for name in rename.values():
+            owners.setdefault(name, font)
+
+    shared = sum(1 for rename in renames[1:] for old, new in rename.items() if new in renames[0])
+    for font in fonts:
+        glyf = font["glyf"]
+        hmtx = font["hmtx"]
+        for name in glyph_order:
+            if name not in glyf.glyphs:
+                owner = owners[name]
+                glyf.glyphs[name] = owner["glyf"][name]
+                hmtx[name] = owner["hmtx"][name]
+        glyf.glyphOrder = glyph_order
+        font.setGlyphOrder(glyph_order)
+    return fonts, shared
+
+
+def _shared_tables(data: bytes) -> list:
+    """TTC에서 둘 이상의 폰트가 같은 위치를 가리키는 테이블 태그를 반환합니다."""
+    num_fonts = struct.unpack_from(">L", data, 8)[0]
+    users = {}
+    for i in range(num_fonts):
+        (face_offset,) = struct.unpack_from(">L", data, 12 + i * 4)
+        (num_tables,) = struct.unpack_from(">H", data, face_offset + 4)
+        for j in range(num_tables):
+            tag, _, offset, _ = struct.unpack_from(">4sLLL", data, face_offset + 12 + j * 16)
+            users.setdefault((tag.decode("latin-1"), offset), set()).add(i)
+    return sorted({tag for (tag, _), faces in users.items() if len(faces) > 1})
+
+
+def write_font_collection(paths: list, output_path: str) -> dict:
+    """
+    TTF들을 TTC 하나로 묶어 저장하고, 따로 저장했을 때와 크기를 비교해 출력합니다.
+
+    Returns:
+        dict: separate(TTF 크기 합), size(TTC 크기), shared_glyphs(공유 글리프 수),
+            shared_tables(공유 테이블 태그), fallback(같은 테이블만 공유했는지 여부)
+    """
+    fallback = False
+    try:
+        fonts, shared_glyphs = unify_glyph_orders(paths)
+    except Exception as e:
+        print(f"[WARNING] {os.path.basename(output_path)}: 글리프 순서를 맞출 수 없어 같은 테이블만 공유합니다. ({e})")
+        fonts, shared_glyphs, fallback = [TTFont(path, recalcTimestamp=False) for path in paths], 0, True
+
+    collection = TTCollection()
+    collection.fonts = fonts
+    try:
+        collection.save(output_path, shareTables=True)
+    finally:
+        collection.close()
+
+    with open(output_path, "rb") as f:
+        shared_tables = _shared_tables(f.read())
+    separate = sum(os.path.getsize(path) for path in paths)
+    size = os.path.getsize(output_path)
+    print(
+        f"[INFO] {output_path} 내보내기 완료: {' + '.join(os.path.basename(path) for path in paths)}, "
+        f"공유 글리프 {shared_glyphs}개, 공유 테이블 {', '.join(shared_tables) or '없음'}"
+    )
+    print(
+        f"    TTF {separate:,} bytes -> TTC {size:,} bytes "
+        f"({separate - size:,} bytes, {(separate - size) / separate * 100:.1f}% 절약)"
+    )
+    return {
+        "separate": separate,
+        "size": size,
+        "shared_glyphs": shared_glyphs,
+        "shared_tables": shared_tables,
+        "fallback": fallback,
+    }
+
+
+def build_font_collections(groups: list, outputs: dict) -> bool:
+    """
+    조합 묶음마다 TTC를 만듭니다. TTC 파일 이름은 기본 조합의 TTF 이름에서 확장자만 바꾼 것입니다.
+    TTC가 모든 TTF보다 새로우면 다시 만들지 않습니다.
+
+    Args:
+        groups: collection_groups()의 조합 묶음
+        outputs: style별 출력 파일 경로 리스트
+
+    Returns:
+        bool: 모든 묶음의 TTC를 만들었는지 여부
+    """
+    success = True
+    for group in groups:
+        paths = []
+        for style in group:
+            ttf_paths = [path for path in outputs.get(style, []) if path.endswith(".ttf")]
+            if not ttf_paths or not os.path.exists(ttf_paths[0]):
+                print(f"[ERROR] {style}의 TTF가 없어 {', '.join(group)} 컬렉션을 만들 수 없습니다.")
+                success = False
+                break
+            paths.append(ttf_paths[0])
+        else:
+            output_path = os.path.splitext(paths[0])[0] + ".ttc"
+            if os.path.exists(output_path) and os.path.getmtime(output_path) >= max(
+                os.path.getmtime(path) for path in paths
+            ):
+                print(f"[INFO] {os.path.basename(output_path)}: TTF가 변경되지 않아 건너뜁니다.")
+                continue
+            try:
+                write_font_collection(paths, output_path)
+            except Exception as e:
+                print(f"[ERROR] {os.path.basename(output_path)} 생성 실패: {e}")
+                success = False
+    return success
@@ -0,0 +1,89 @@
+"""
+생성된 TTF에서 WOFF2/WOFF 웹 폰트를 만드는 압축 단계입니다.
+
+병합된 폰트를 형식마다 다시 직렬화(font.generate)하지 않고, 한 번 생성한 TTF 파일을
+압축합니다. fontTools가 있으면 TTF의 테이블 데이터를 그대로 압축하고, 없으면 FontForge로
+TTF를 다시 열어 생성합니다.
+"""
+
+import os
+
+try:
+    from fontTools.ttLib import TTFont
+    from fontTools.ttLib import woff2
+except ImportError:
+    TTFont = None
+    woff2 = None
+
+from build_trace import span
+
+# TTF에서 만들 수 있는 형식입니다.
+COMPRESSED_FORMATS: tuple = ("woff2", "woff")
+
+
+def _compress_with_fonttools(ttf_path: str, output_path: str, ext: str) -> None:
+    """fontTools로 TTF를 압축합니다. WOFF2에 필요한 brotli가 없으면 ImportError가 발생합니다."""
+    if TTFont is None:
+        raise ImportError("No module named 'fontTools'")
+
+    if ext == "woff2":
+        woff2.compress(ttf_path, output_path)
+        return
+
+    # 읽기만 한 테이블은 다시 컴파일하지 않고 원본 바이트를 그대로 압축합니다.
+    font = TTFont(ttf_path)
+    try:
+        font.flavor = ext
+        font.save(output_path)
+    finally:
+        font.close()
+
+
+def _compress_with_fontforge(ttf_path: str, output_path: str) -> None:
+    """FontForge로 TTF를 열어 출력 파일 확장자에 맞는 형식으로 생성합니다."""
+    import fontforge
+
+    font = fontforge.open(ttf_path)
+    try:
+        font.generate(output_path)
+    finally:
+        font.close()
+
+
+def compress_font_file(
+    ttf_path: str, formats: tuple, events: list = None, **trace_args
+) -> list:
+    """
+    TTF 파일에서 주어진 형식의 폰트 파일을 만듭니다. 출력 파일은 TTF와 같은 위치에 저장됩니다.
+    빌드 중인 다른 조합과 동시에 스레드에서 실행할 수 있습니다.
+
+    Args:
+        ttf_path: 생성된 TTF 파일 경로
+        formats: 만들 형식의 확장자 목록 (COMPRESSED_FORMATS 중에서)
+        events: 압축 구간의 트레이스 이벤트를 기록할 리스트
+        trace_args: 트레이스 이벤트에 함께 기록할 정보 (예: variant="Regular")
+
+    Returns:
+        list: 생성에 성공한 출력 파일 경로의 리스트.
+    """
+    output_base = os.path.splitext(ttf_path)[0]
+    font_name = os.path.basename(output_base)
+
+    outputs = []
+    for ext in formats:
+        output_path = f"{output_base}.{ext}"
+
+        try:
+            if ext not in COMPRESSED_FORMATS:
+                raise ValueError(f"지원하지 않는 형식입니다: {ext}")
+            with span(f"compress({ext})", events=events, font=font_name, **trace_args):
+                try:
+                    _compress_with_fonttools(ttf_path, output_path, ext)
+                except ImportError:
+                    _compress_with_fontforge(ttf_path, output_path)
+            outputs.append(output_path)
+            print(f"[INFO] {output_path} 내보내기 완료")
+        except Exception as e:
+            print(f"[ERROR] {font_name}에 대한 {ext.upper()} 생성 실패: {e}")
+
+    return outputs
@@ -0,0 +1,128 @@
+"""
+출력 프로필(--profile)과 출력 파일 크기 한도(--budget)를 다룹니다.
+
+web 프로필은 브라우저가 거의 사용하지 않는 TrueType 힌팅(fpgm/prep/cvt 테이블과 글리프별 명령어)과
+장치 메트릭 테이블(LTSH, VDMX, hdmx), post 테이블의 글리프 이름을 빼고 TTF를 생성합니다.
+WOFF2/WOFF는 이 TTF에서 만들므로 같은 테이블이 빠집니다.
+"""
+
+import os
+
+from config import SIZE_BUDGETS
+from ttfparse import read_table_sizes
+
+# 출력 프로필 이름입니다.
+PROFILES: tuple = ("default", "web")
+
+# web 프로필에서 제거하는 테이블입니다. (힌팅, 장치 메트릭, 디지털 서명, FontForge 타임스탬프)
+WEB_STRIPPED_TABLES: tuple = ("fpgm", "prep", "cvt ", "hdmx", "LTSH", "VDMX", "DSIG", "FFTM")
+
+# web 프로필에서 FontForge의 font.generate()에 전달하는 플래그입니다.
+# 힌팅과 TrueType 명령어, FFTM 테이블을 빼고 post 테이블에 글리프 이름을 넣지 않습니다.
+WEB_GENERATE_FLAGS: tuple = ("opentype", "no-hints", "omit-instructions", "no-FFTM-table", "short-post")
+
+# 크기 한도 값에 쓸 수 있는 단위입니다.
+SIZE_UNITS: dict = {"": 1, "K": 1024, "M": 1024 * 1024}
+
+
+def strip_for_web(font) -> int:
+    """
+    fontTools 폰트에서 WEB_STRIPPED_TABLES와 글리프별 TrueType 명령어, post 테이블의 글리프 이름을 제거합니다.
+
+    Returns:
+        int: 제거한 테이블 수
+    """
+    removed = [tag for tag in WEB_STRIPPED_TABLES if tag in font]
+    for tag in removed:
+        del font[tag]
+
+    if "glyf" in font:
+        # 펼치지 않은 글리프는 바이트 그대로 명령어만 잘라냅니다.
+        for glyph in font["glyf"].glyphs.values():
+            glyph.removeHinting()
+        # 서브셋의 hinting=False와 같이 명령어 관련 maxp 값을 초기화합니다.
+        maxp = font["maxp"]
+        if maxp.tableVersion == 0x00010000:
+            maxp.maxZones = 1
+            maxp.maxTwilightPoints = 0
+            maxp.maxStorage = 0
+            maxp.maxFunctionDefs = 0
+            maxp.maxInstructionDefs = 0
+            maxp.maxStackElements = 0
+            maxp.maxSizeOfInstructions = 0
+
+    if "post" in font:
+        font["post"].formatType = 3.0
+
+    print(f"[INFO] web 프로필: 테이블 {len(removed)}개({', '.join(tag.strip() for tag in removed) or '없음'})와 힌팅을 제거했습니다.")
+    return len(removed)
+
+
+def parse_size(value: str) -> int:
+    """'600K', '2.5M', '1048576' 형식의 크기를 바이트 수로 바꿉니다."""
+    text = value.strip().upper().removesuffix("B")
+    unit = text[-1:] if text[-1:] in SIZE_UNITS else ""
+    try:
+        size = float(text[: len(text) - len(unit)]) * SIZE_UNITS[unit]
+    except ValueError:
+        raise ValueError(f"크기를 해석할 수 없습니다: {value}")
+    if size <= 0:
+        raise ValueError(f"크기 값은 0보다 커야 합니다: {value}")
+    return int(size)
+
+
+def parse_size_budgets(value: str) -> dict:
+    """
+    `--budget` 값('woff2=600K,ttf=4M')을 형식별 크기 한도(바이트) 딕셔너리로 바꿉니다.
+    지정하지 않은 형식은 config.SIZE_BUDGETS의 값을 사용합니다.
+    """
+    budgets = dict(SIZE_BUDGETS)
+    for item in value.split(","):
+        ext, sep, size = item.partition("=")
+        ext = ext.strip().lower()
+        if not sep or not ext:
+            raise ValueError(f"'형식=크기' 형식이 아닙니다: {item}")
+        budgets[ext] = parse_size(size)
+    return budgets
+
+
+def print_table_sizes(path: str) -> int:
+    """
+    출력 파일 하나의 테이블별 크기를 큰 순서로 출력합니다.
+
+    Returns:
+        int: 파일 크기(바이트)
+    """
+    sizes = read_table_sizes(path)
+    tables = sizes["tables"]
+    note = " (테이블별 크기는 Brotli 압축 전)" if sizes["format"] == "woff2" else ""
+    print(f"[INFO] {os.path.basename(path)}: {sizes['size']:,} bytes{note}")
+
+    total = sum(tables.values()) or 1
+    for tag, length in sorted(tables.items(), key=lambda item: (-item[1], item[0])):
+        print(f"    {tag:<6} {length:>12,} {length / total * 100:6.1f}%")
+    return sizes["size"]
+
+
+def report_output_sizes(outputs: list, budgets: dict) -> list:
+    """
+    출력 파일마다 테이블별 크기를 출력하고 형식별 크기 한도를 넘는 파일을 찾습니다.
+
+    Args:
+        outputs: 출력 파일 경로 리스트
+        budgets: 확장자별 크기 한도(바이트). 없는 형식은 검사하지 않습니다.
+
+    Returns:
+        list: 한도를 넘은 파일의 오류 메시지 리스트
+    """
+    errors = []
+    for path in outputs:
+        size = print_table_sizes(path)
+        ext = os.path.splitext(path)[1].lstrip(".").lower()
+        budget = budgets.get(ext)
+        if budget is not None and size > budget:
+            errors.append(
+                f"{os.path.basename(path)}: {size:,} bytes가 {ext} 크기 한도 {budget:,} bytes를 "
+                f"{size - budget:,} bytes 넘었습니다"
+            )
+    return errors
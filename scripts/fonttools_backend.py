@@ -0,0 +1,1056 @@
+"""
+FontForge 없이 fontTools만으로 폰트를 병합하는 빌드 백엔드입니다.
+
+hangulify.py의 FontForge 파이프라인과 같은 단계(Em 스케일링, 한글 베어링 조정,
+글리프 병합, 메타데이터 갱신, Nerd Font 재매핑)를 `glyf`/`hmtx`/`cmap`/`name` 테이블에
+직접 적용합니다. 일반 pip 가상환경(`pip install fonttools brotli`)에서 실행할 수 있습니다.
+"""
+
+import copy
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fontTools import subset
+from fontTools.misc.roundTools import otRound
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
+from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates, flagOnCurve
+
+from config import BUILT_FONTS_PATH, OLD_FONT_NAME, NEW_FONT_NAME
+from font_profile import strip_for_web
+from reproducible import normalize_font_file, unique_font_id, version_string
+from build_trace import (
+    collect_spans,
+    get_peak_rss_mb,
+    reset_peak_rss,
+    reset_spans,
+    set_trace_context,
+    span,
+)
+from outline_transform import (
+    load_outlines,
+    numpy_available,
+    scale_advances,
+    scale_outlines_like_fontforge,
+    store_outlines,
+    transform_outlines,
+)
+from resident_fonts import (
+    get_resident,
+    is_resident,
+    put_resident,
+    resident_fonts_enabled,
+    source_stamp,
+)
+from hangulify import (
+    BEARING_ADJUSTMENT,
+    NERD_FONT_REMAP,
+    TARGET_EM,
+    _get_cleaned_name,
+    _in_hangul_ranges,
+    _in_nerd_ranges,
+    _is_jetbrains_font_width,
+    _unique_glyph_name,
+    coverage_from_plan,
+    dependency_order,
+    find_codepoint_runs,
+    format_style_name,
+    get_font_style,
+    korean_resident_key,
+    overridden_settings,
+    split_coverage,
+    update_family_name,
+)
+
+# name 테이블에서 갱신하는 항목입니다. (FontForge의 appendSFNTName 이름 -> nameID)
+NAME_ID_FAMILY: int = 1
+NAME_ID_SUBFAMILY: int = 2
+NAME_ID_UNIQUE_ID: int = 3
+NAME_ID_FULL_NAME: int = 4
+NAME_ID_VERSION: int = 5
+NAME_ID_POSTSCRIPT_NAME: int = 6
+NAME_ID_PREFERRED_FAMILY: int = 16
+NAME_ID_COMPATIBLE_FULL: int = 18
+
+
+def _empty_program() -> ttProgram.Program:
+    """빈 TrueType 명령어 프로그램을 만듭니다."""
+    program = ttProgram.Program()
+    program.fromBytecode(b"")
+    return program
+
+
+def _round_like_fontforge(coordinates: GlyphCoordinates, flags, end_points: list) -> list:
+    """
+    FontForge가 Em을 바꾼 뒤 윤곽선의 점을 반올림하는 순서를 재현합니다.
+    on-curve 점을 반올림할 때는 이웃한 off-curve 점을 같은 만큼 옮긴 뒤 반올림하고, 이어진 off-curve 점 사이의
+    생략된 on-curve 점에서는 그 off-curve 점을 그대로 반올림합니다. 윤곽선의 첫 점을 가장 먼저 처리합니다.
+
+    Returns:
+        list: 반올림한 (x, y) 좌표 리스트
+    """
+    rounded = [(otRound(x), otRound(y)) for x, y in coordinates]
+    deltas = [
+        (rx - x, ry - y) if flag & flagOnCurve else (0.0, 0.0)
+        for (x, y), (rx, ry), flag in zip(coordinates, rounded, flags)
+    ]
+    result = []
+    start = 0
+    for end in end_points:
+        for index in range(start, end + 1):
+            if flags[index] & flagOnCurve:
+                result.append(rounded[index])
+                continue
+            previous = end if index == start else index - 1
+            following = start if index == end else index + 1
+            first, second = deltas[previous], deltas[following]
+            if index == start or (index == end and flags[following] & flagOnCurve):
+                first, second = second, first
+            x, y = coordinates[index]
+            result.append(
+                (
+                    otRound(otRound(x + first[0]) + second[0]),
+                    otRound(otRound(y + first[1]) + second[1]),
+                )
+            )
+        start = end + 1
+    return result
+
+
+def _recalc_bounds(glyph: Glyph, glyf_table) -> None:
+    """
+    글리프의 경계 상자를 다시 계산합니다. 구성 요소 위치가 소수점인 복합 글리프는 fontTools가 경계 상자도
+    소수점으로 계산하므로 단순 글리프처럼 반올림합니다.
+    """
+    glyph.recalcBounds(glyf_table)
+    if glyph.isComposite():
+        glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax = (
+            otRound(value) for value in (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax)
+        )
+
+
+def _scale_glyph(glyph: Glyph, scale_factor: float) -> None:
+    """
+    글리프의 좌표(또는 복합 글리프의 구성 요소 위치)를 FontForge의 font.em 설정과 font.transform()처럼
+    두 번 스케일링합니다. 첫 번째 결과만 반올림하고, 두 번째 결과는 병합할 때 윤곽선으로 풀면서 반올림합니다.
+    """
+    if glyph.isComposite():
+        for component in glyph.components:
+            component.x = otRound(component.x * scale_factor) * scale_factor
+            component.y = otRound(component.y * scale_factor) * scale_factor
+    elif glyph.numberOfContours > 0:
+        coordinates = glyph.coordinates
+        coordinates.scale((scale_factor, scale_factor))
+        coordinates = GlyphCoordinates(
+            _round_like_fontforge(coordinates, glyph.flags, glyph.endPtsOfContours)
+        )
+        coordinates.scale((scale_factor, scale_factor))
+        glyph.coordinates = coordinates
+
+
+def scale_font_em_units(
+    font: TTFont, target_em: int, vectorized: bool = None, glyph_names: list = None
+) -> None:
+    """
+    폰트의 Em 단위를 조정하고 모든 글리프를 스케일링합니다.
+
+    FontForge 백엔드에서는 `font.em` 설정이 이미 폰트 전체를 새 Em으로 스케일링해 반올림하고
+    (_round_like_fontforge()), 이어지는 `font.transform()`이 같은 비율로 한 번 더 스케일링합니다
+    (좌표는 반올림하지 않고, 너비는 소수점 이하를 버림). 배포된 폰트와 같은 결과를 내도록 이 동작을 그대로
+    재현하므로, 스케일링한 좌표와 구성 요소 위치는 소수점을 가지며 병합할 때 반올림됩니다(_flattened_copy()).
+
+    Args:
+        vectorized: 단순 글리프의 좌표를 outline_transform으로 한 번에 변환할지 여부.
+                    None이면 NumPy가 있을 때 사용합니다. 결과는 글리프 단위 경로와 같습니다.
+        glyph_names: 스케일링할 글리프 이름. None이면 모든 글리프를 스케일링합니다.
+                     복합 글리프가 참조하는 글리프도 포함해야 합니다(_glyph_closure()).
+    """
+    head = font["head"]
+    if head.unitsPerEm == target_em:
+        return
+
+    scale_factor = target_em / head.unitsPerEm
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+    glyph_order = font.getGlyphOrder() if glyph_names is None else list(glyph_names)
+    if vectorized is None:
+        vectorized = numpy_available()
+
+    remaining = glyph_order
+    if vectorized:
+        outlines = load_outlines(glyf, glyph_order, contours=True)
+        scale_outlines_like_fontforge(outlines, scale_factor)
+        store_outlines(glyf, outlines)
+        simple = set(outlines["names"])
+        remaining = [name for name in glyph_order if name not in simple]
+
+    for name in remaining:
+        _scale_glyph(glyf[name], scale_factor)
+
+    # 복합 글리프의 경계 상자는 구성 요소가 모두 스케일링된 뒤에 계산합니다.
+    for name in remaining:
+        _recalc_bounds(glyf[name], glyf)
+
+    if vectorized:
+        advances = scale_advances(
+            [hmtx[name][0] for name in glyph_order], (scale_factor, scale_factor)
+        )
+    else:
+        advances = [
+            int(otRound(hmtx[name][0] * scale_factor) * scale_factor) for name in glyph_order
+        ]
+    for name, advance in zip(glyph_order, advances):
+        glyph = glyf[name]
+        hmtx[name] = (advance, glyph.xMin if glyph.numberOfContours else 0)
+
+    head.unitsPerEm = target_em
+    print(f"[INFO] 폰트 Em 단위를 {int(target_em / scale_factor)}에서 {target_em}로 조정했습니다.")
+
+
+def adjust_glyph_bearing(font: TTFont, glyph_name: str, adjustment: int) -> None:
+    """글리프의 왼쪽 및 오른쪽 사이드 베어링을 조정합니다."""
+    half = adjustment // 2
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+    glyph = glyf[glyph_name]
+
+    if glyph.isComposite():
+        for component in glyph.components:
+            component.x += half
+    elif glyph.numberOfContours > 0:
+        glyph.coordinates.translate((half, 0))
+    _recalc_bounds(glyph, glyf)
+
+    advance, lsb = hmtx[glyph_name]
+    hmtx[glyph_name] = (advance + half * 2, lsb + half)
+
+
+def adjust_glyph_bearings(font: TTFont, glyph_names: list, adjustment: int) -> None:
+    """
+    여러 글리프의 사이드 베어링을 adjust_glyph_bearing()과 같은 결과로 조정합니다.
+    단순 글리프의 좌표는 outline_transform으로 한 번에 이동하고, 나머지는 글리프 단위로 조정합니다.
+    """
+    half = adjustment // 2
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+
+    outlines = load_outlines(glyf, glyph_names)
+    transform_outlines(outlines, x_shift=half)
+    store_outlines(glyf, outlines)
+    simple = set(outlines["names"])
+
+    for name in glyph_names:
+        if name not in simple:
+            adjust_glyph_bearing(font, name, adjustment)
+            continue
+        advance, lsb = hmtx[name]
+        hmtx[name] = (advance + half * 2, lsb + half)
+
+
+def build_hangul_coverage(font: TTFont) -> dict:
+    """
+    cmap에 실제로 매핑된 한글 글리프의 색인을 만듭니다.
+    hangulify.build_hangul_coverage()와 같은 형식을 반환합니다. TrueType에서 읽은 글리프는
+    FontForge 기준으로 모두 출력할 가치가 있으므로(isWorthOutputting) 매핑된 글리프를 모두 포함합니다.
+    """
+    cmap = font.getBestCmap()
+    glyf = font["glyf"]
+
+    codepoints = sorted(cp for cp in cmap if _in_hangul_ranges(cp))
+    references = {}
+    for codepoint in codepoints:
+        glyph = glyf[cmap[codepoint]]
+        if glyph.isComposite():
+            references[codepoint] = [component.glyphName for component in glyph.components]
+
+    return {
+        "codepoints": codepoints,
+        "runs": find_codepoint_runs(codepoints),
+        "references": references,
+    }
+
+
+def process_hangul_glyphs(
+    font: TTFont, coverage: dict = None, vectorized: bool = None
+) -> TTFont:
+    """
+    한글 글리프의 베어링을 조정합니다.
+    복합 글리프는 참조하는 글리프를 조정하며, 공유되는 글리프도 한 번만 조정합니다.
+    vectorized가 None이면 NumPy가 있을 때 adjust_glyph_bearings()로 한 번에 조정합니다.
+    coverage로 split_coverage()의 구간 하나를 넘기면 그 구간의 글리프만 조정합니다(build_hangul_shard()).
+    """
+    if coverage is None:
+        coverage = build_hangul_coverage(font)
+    cmap = font.getBestCmap()
+    hmtx = font["hmtx"]
+
+    glyph_names = {}
+    for codepoint in coverage["codepoints"]:
+        for name in coverage["references"].get(codepoint) or [cmap[codepoint]]:
+            glyph_names.setdefault(name, None)
+
+    targets = [name for name in glyph_names if _is_jetbrains_font_width(int(hmtx[name][0]))]
+    if vectorized is None:
+        vectorized = numpy_available()
+    if vectorized:
+        adjust_glyph_bearings(font, targets, BEARING_ADJUSTMENT)
+    else:
+        for name in targets:
+            adjust_glyph_bearing(font, name, BEARING_ADJUSTMENT)
+
+    print(f"[INFO] 한글 글리프 {len(targets)}개의 사이드 베어링 조정을 완료했습니다.")
+    return font
+
+
+def _flattened_copy(glyph: Glyph, glyf_table) -> Glyph:
+    """
+    글리프를 참조 없는 단순 글리프로 복사하고 좌표를 반올림합니다.
+    다른 폰트에 붙여넣은 복합 글리프는 참조 대상이 없으므로 FontForge처럼 윤곽선으로 풉니다.
+    FontForge는 참조를 풀 때마다 그 윤곽선을 앞에 붙이므로, 마지막 구성 요소의 윤곽선부터 놓습니다.
+    원본 폰트의 fpgm/cvt에 의존하는 TrueType 명령어는 복사하지 않습니다.
+    """
+    new_glyph = Glyph()
+    if glyph.numberOfContours == 0:
+        return new_glyph
+
+    if glyph.isComposite():
+        glyph = copy.copy(glyph)
+        glyph.components = glyph.components[::-1]
+    coordinates, end_points, flags = glyph.getCoordinates(glyf_table)
+    new_glyph.numberOfContours = len(end_points)
+    new_glyph.coordinates = GlyphCoordinates(coordinates)
+    new_glyph.coordinates.toInt()
+    new_glyph.endPtsOfContours = list(end_points)
+    new_glyph.flags = bytearray(flag & flagOnCurve for flag in flags)
+    new_glyph.program = _empty_program()
+    new_glyph.recalcBounds(glyf_table)
+    return new_glyph
+
+
+def _set_cmap_entry(font: TTFont, codepoint: int, glyph_name: str) -> None:
+    """모든 유니코드 cmap 하위 테이블에 코드포인트 매핑을 추가합니다."""
+    for table in font["cmap"].tables:
+        if not table.isUnicode() or table.format not in (4, 12):
+            continue
+        if table.format == 4 and codepoint > 0xFFFF:
+            continue
+        table.cmap[codepoint] = glyph_name
+
+
+def _copy_glyph_keeping_components(glyph: Glyph, glyf_table, names: dict) -> Glyph:
+    """
+    글리프를 복사합니다. 복합 글리프는 구성 요소를 names로 바꾼 이름으로 참조하는 복합 글리프로,
+    단순 글리프는 _flattened_copy()처럼 TrueType 명령어 없이 복사합니다.
+    """
+    if not glyph.isComposite():
+        return _flattened_copy(glyph, glyf_table)
+
+    new_glyph = copy.deepcopy(glyph)
+    for component in new_glyph.components:
+        component.glyphName = names[component.glyphName]
+        # 스케일링한 구성 요소 위치는 소수점을 가지므로 FontForge가 TTF를 생성할 때처럼 반올림합니다.
+        component.x, component.y = otRound(component.x), otRound(component.y)
+    if hasattr(new_glyph, "program"):
+        del new_glyph.program
+    return new_glyph
+
+
+def _merge_keeping_references(target_font: TTFont, source_font: TTFont, coverage: dict) -> int:
+    """
+    merge_korean_glyphs(keep_references=True)의 구현입니다.
+    복합 글리프가 참조하는 글리프를 먼저 복사하고, 복합 글리프는 복사한 글리프를 참조하도록 만듭니다.
+    FontForge처럼 참조 대상의 윤곽선과 참조 위치를 따로 반올림하므로, 합을 반올림하는 _flattened_copy()와
+    펼친 좌표가 다를 수 있고 윤곽선 순서도 구성 요소 순서를 따릅니다.
+    코드포인트가 없는 참조 대상은 타겟 폰트에 없는 이름으로 추가합니다.
+    """
+    source_cmap = source_font.getBestCmap()
+    source_glyf = source_font["glyf"]
+    source_hmtx = source_font["hmtx"]
+    target_cmap = target_font.getBestCmap()
+    target_glyf = target_font["glyf"]
+    target_hmtx = target_font["hmtx"]
+
+    encoded = {}
+    for start, end in coverage["runs"]:
+        for codepoint in range(start, end + 1):
+            encoded.setdefault(source_cmap[codepoint], []).append(codepoint)
+
+    def get_references(name):
+        glyph = source_glyf[name]
+        return [component.glyphName for component in glyph.components] if glyph.isComposite() else []
+
+    glyph_order = list(target_font.getGlyphOrder())
+    existing = set(glyph_order)
+    names = {}
+    for name in dependency_order(list(encoded), get_references):
+        target_names = []
+        for codepoint in encoded.get(name, []):
+            target_name = target_cmap.get(codepoint)
+            if target_name is None:
+                target_name = _unique_glyph_name(f"uni{codepoint:04X}", existing)
+                existing.add(target_name)
+                glyph_order.append(target_name)
+                _set_cmap_entry(target_font, codepoint, target_name)
+            target_names.append(target_name)
+        if not target_names:
+            target_name = _unique_glyph_name(name, existing)
+            existing.add(target_name)
+            glyph_order.append(target_name)
+            target_names.append(target_name)
+        names[name] = target_names[0]
+
+        advance = source_hmtx[name][0]
+        for target_name in target_names:
+            new_glyph = _copy_glyph_keeping_components(source_glyf[name], source_glyf, names)
+            target_glyf[target_name] = new_glyph
+            new_glyph.recalcBounds(target_glyf)
+            target_hmtx[target_name] = (advance, new_glyph.xMin if new_glyph.numberOfContours else 0)
+
+    target_font.setGlyphOrder(glyph_order)
+    target_glyf.setGlyphOrder(glyph_order)
+    return sum(len(codepoints) for codepoints in encoded.values())
+
+
+def _flattened_hangul_glyphs(source_font: TTFont, coverage: dict):
+    """
+    색인의 코드포인트마다 소스 글리프를 참조 없는 단순 글리프로 복사합니다.
+
+    Yields:
+        tuple: (코드포인트, 글리프, 너비, 왼쪽 사이드 베어링)
+    """
+    source_cmap = source_font.getBestCmap()
+    source_glyf = source_font["glyf"]
+    source_hmtx = source_font["hmtx"]
+    for start, end in coverage["runs"]:
+        for codepoint in range(start, end + 1):
+            source_name = source_cmap[codepoint]
+            new_glyph = _flattened_copy(source_glyf[source_name], source_glyf)
+            lsb = new_glyph.xMin if new_glyph.numberOfContours else 0
+            yield codepoint, new_glyph, source_hmtx[source_name][0], lsb
+
+
+def merge_korean_glyphs(
+    target_font: TTFont,
+    source_font: TTFont,
+    coverage: dict = None,
+    keep_references: bool = False,
+    partial_sets: list = None,
+) -> int:
+    """
+    한국어 글리프를 소스 폰트에서 타겟 폰트로 복사합니다.
+    타겟에 같은 코드포인트의 글리프가 있으면 교체하고, 없으면 새 글리프를 추가합니다.
+    keep_references가 참이면 한글 복합 글리프를 윤곽선으로 풀지 않고 복합 글리프로 유지합니다.
+    partial_sets가 있으면 소스 폰트 대신 build_hangul_shard()가 만든 부분 글리프 집합을 구간 순서대로 붙여넣습니다.
+    붙여넣는 순서와 글리프 이름이 같으므로 결과는 소스 폰트에서 직접 복사한 것과 같습니다.
+
+    Returns:
+        int: 복사한 글리프 수
+    """
+    if partial_sets is not None:
+        glyphs = [
+            (codepoint, Glyph(data), advance, lsb)
+            for partial in partial_sets
+            for codepoint, data, advance, lsb in partial
+        ]
+        runs = find_codepoint_runs([codepoint for codepoint, *_ in glyphs])
+    else:
+        if coverage is None:
+            coverage = build_hangul_coverage(source_font)
+        if keep_references:
+            copied_count = _merge_keeping_references(target_font, source_font, coverage)
+            print(f"[INFO] {copied_count}개의 한글 글리프를 참조를 유지한 채 복사했습니다.")
+            return copied_count
+        glyphs = _flattened_hangul_glyphs(source_font, coverage)
+        runs = coverage["runs"]
+
+    target_cmap = target_font.getBestCmap()
+    target_glyf = target_font["glyf"]
+    target_hmtx = target_font["hmtx"]
+
+    glyph_order = list(target_font.getGlyphOrder())
+    existing = set(glyph_order)
+
+    copied_count = 0
+    for codepoint, new_glyph, advance, lsb in glyphs:
+        target_name = target_cmap.get(codepoint)
+        if target_name is None:
+            target_name = _unique_glyph_name(f"uni{codepoint:04X}", existing)
+            existing.add(target_name)
+            glyph_order.append(target_name)
+            _set_cmap_entry(target_font, codepoint, target_name)
+
+        target_glyf[target_name] = new_glyph
+        target_hmtx[target_name] = (advance, lsb)
+        copied_count += 1
+
+    # 새 글리프는 뒤에 추가되므로 기존 글리프의 ID는 바뀌지 않습니다.
+    target_font.setGlyphOrder(glyph_order)
+    target_glyf.setGlyphOrder(glyph_order)
+
+    print(f"[INFO] {copied_count}개의 한글 글리프를 {len(runs)}개 구간으로 복사했습니다.")
+    return copied_count
+
+
+def re_encode_for_nerd_font(font: TTFont) -> None:
+    """Nerd Font의 특정 글리프 매핑 문제를 수정합니다(예: 하트, 오른쪽 삼각형 아이콘)."""
+    glyf = font["glyf"]
+    hmtx = font["hmtx"]
+
+    for src_codepoint, dest_codepoint in NERD_FONT_REMAP.items():
+        try:
+            cmap = font.getBestCmap()
+            if src_codepoint in cmap and dest_codepoint in cmap:
+                src_name = cmap[src_codepoint]
+                dest_name = cmap[dest_codepoint]
+                if src_name != dest_name:
+                    glyf[dest_name] = copy.deepcopy(glyf[src_name])
+                    hmtx[dest_name] = hmtx[src_name]
+                    # FontForge의 clear()처럼 원본 글리프를 비우고 매핑을 제거합니다.
+                    glyf[src_name] = Glyph()
+                    hmtx[src_name] = (hmtx[src_name][0], 0)
+                for table in font["cmap"].tables:
+                    if table.isUnicode():
+                        table.cmap.pop(src_codepoint, None)
+                print(
+                    f"[INFO] 글리프 매핑을 수정했습니다: {hex(src_codepoint)} -> {hex(dest_codepoint)}"
+                )
+        except Exception as e:
+            print(
+                f"[WARNING] 글리프 매핑 수정 중 오류 발생 ({hex(src_codepoint)}): {e}"
+            )
+
+
+def _ensure_full_unicode_cmap(font: TTFont) -> None:
+    """BMP 밖의 코드포인트를 매핑할 수 있도록 format 12 유니코드 cmap 하위 테이블을 추가합니다."""
+    cmap_table = font["cmap"]
+    if any(table.isUnicode() and table.format == 12 for table in cmap_table.tables):
+        return
+    mapping = dict(font.getBestCmap())
+    for platform_id, encoding_id in ((0, 4), (3, 10)):
+        table = CmapSubtable.newSubtable(12)
+        table.platformID = platform_id
+        table.platEncID = encoding_id
+        table.language = 0
+        table.cmap = dict(mapping)
+        cmap_table.tables.append(table)
+
+
+def overlay_nerd_glyphs(target_font: TTFont, nerd_font: TTFont) -> int:
+    """
+    Nerd Font 소스에서 NERD_FONT_RANGES의 아이콘 글리프만 타겟 폰트로 복사합니다.
+    타겟에 같은 코드포인트의 글리프가 있으면 교체하고, 없으면 소스의 글리프 이름으로 새 글리프를 추가합니다.
+    한글 범위 밖에서 Nerd Font 소스에 없는 코드포인트(예: fi, fl 합자)는 전체 빌드처럼 매핑을 제거합니다.
+
+    Returns:
+        int: 복사한 글리프 수
+    """
+    source_cmap = nerd_font.getBestCmap()
+    source_glyf = nerd_font["glyf"]
+    source_hmtx = nerd_font["hmtx"]
+    codepoints = sorted(codepoint for codepoint in source_cmap if _in_nerd_ranges(codepoint))
+
+    _ensure_full_unicode_cmap(target_font)
+    target_cmap = target_font.getBestCmap()
+    target_glyf = target_font["glyf"]
+    target_hmtx = target_font["hmtx"]
+
+    glyph_order = list(target_font.getGlyphOrder())
+    existing = set(glyph_order)
+
+    for codepoint in codepoints:
+        source_name = source_cmap[codepoint]
+        new_glyph = _flattened_copy(source_glyf[source_name], source_glyf)
+
+        target_name = target_cmap.get(codepoint)
+        if target_name is None:
+            target_name = _unique_glyph_name(source_name, existing)
+            existing.add(target_name)
+            glyph_order.append(target_name)
+            _set_cmap_entry(target_font, codepoint, target_name)
+
+        target_glyf[target_name] = new_glyph
+        advance = source_hmtx[source_name][0]
+        target_hmtx[target_name] = (advance, new_glyph.xMin if new_glyph.numberOfContours else 0)
+
+    target_font.setGlyphOrder(glyph_order)
+    target_glyf.setGlyphOrder(glyph_order)
+
+    for table in target_font["cmap"].tables:
+        if table.isUnicode():
+            for codepoint in [cp for cp in table.cmap if cp not in source_cmap and not _in_hangul_ranges(cp)]:
+                del table.cmap[codepoint]
+
+    runs = find_codepoint_runs(codepoints)
+    print(f"[INFO] {len(codepoints)}개의 Nerd Font 아이콘을 {len(runs)}개 구간으로 복사했습니다.")
+    return len(codepoints)
+
+
+def update_font_metadata(
+    font: TTFont, style: str, old_name: str, new_name: str, reproducible: bool = False
+) -> str:
+    """
+    name 테이블의 패밀리 이름, 폰트 이름, 스타일을 업데이트합니다.
+    reproducible이면 버전 문자열과 고유 ID도 소스 폰트의 날짜나 이전 이름 없이 정해진 형식으로 바꿉니다.
+
+    Returns:
+        str: 새 패밀리 이름
+    """
+    name_table = font["name"]
+    new_family_name = update_family_name(name_table.getBestFamilyName(), old_name, new_name)
+    formatted_style = format_style_name(style)
+    full_name = f"{new_family_name} {formatted_style}"
+
+    names = {
+        NAME_ID_FAMILY: new_family_name,
+        NAME_ID_SUBFAMILY: formatted_style,
+        NAME_ID_FULL_NAME: full_name,
+        NAME_ID_POSTSCRIPT_NAME: f"{new_family_name}-{style}",
+        NAME_ID_PREFERRED_FAMILY: new_family_name,
+        NAME_ID_COMPATIBLE_FULL: full_name,
+    }
+    if reproducible:
+        version = version_string(name_table.getDebugName(NAME_ID_VERSION) or "1.000")
+        names[NAME_ID_VERSION] = version
+        names[NAME_ID_UNIQUE_ID] = unique_font_id(version, names[NAME_ID_POSTSCRIPT_NAME])
+    has_mac_names = any(record.platformID == 1 for record in name_table.names)
+    name_table.names = [record for record in name_table.names if record.nameID not in names]
+    for name_id, value in names.items():
+        name_table.setName(value, name_id, 3, 1, 0x409)
+        if has_mac_names:
+            name_table.setName(value, name_id, 1, 0, 0)
+
+    print(f"[INFO] 폰트 메타데이터를 '{new_family_name}'로 업데이트했습니다.")
+    return new_family_name
+
+
+def generate_font_files(
+    font: TTFont,
+    family_name: str,
+    style: str,
+    output_dir: str = BUILT_FONTS_PATH,
+    profile: str = "default",
+    source_date_epoch: int = None,
+) -> list:
+    """
+    최종 TTF 폰트 파일을 생성하고 내보냅니다.
+    나머지 OUTPUT_FORMATS는 hangulify.compress_variant_outputs()가 이 TTF에서 만듭니다.
+    profile이 "web"이면 힌팅과 장치 메트릭 테이블을 제거하고 저장합니다(font_profile.strip_for_web()).
+    source_date_epoch가 있으면 저장한 TTF의 시각을 그 값으로 고정합니다(reproducible.normalize_font_file()).
+
+    Returns:
+        list: 생성에 성공한 출력 파일 경로의 리스트.
+    """
+    output_filename_base = f"{_get_cleaned_name(family_name)}-{style}"
+    output_path = os.path.join(output_dir, f"{output_filename_base}.ttf")
+
+    try:
+        start_time = time.perf_counter()
+        if profile == "web":
+            strip_for_web(font)
+        font.save(output_path)
+        if source_date_epoch is not None:
+            normalize_font_file(output_path, source_date_epoch)
+        elapsed = time.perf_counter() - start_time
+        print(f"[INFO] {output_path} 내보내기 완료 ({os.path.getsize(output_path):,} bytes, {elapsed:.2f}초)")
+        return [output_path]
+    except Exception as e:
+        print(f"[ERROR] {output_filename_base}에 대한 TTF 생성 실패: {e}")
+        return []
+
+
+def extract_hangul_glyphs(font: TTFont, coverage: dict) -> TTFont:
+    """
+    한글 색인의 글리프와 그 글리프가 참조하는 글리프만 남긴 작은 폰트를 만들고 원본 폰트를 닫습니다.
+    병합에서 복사하지 않는 TrueType 명령어와 레이아웃 기능도 제거합니다.
+    """
+    options = subset.Options()
+    options.glyph_names = True
+    options.notdef_outline = True
+    options.layout_features = []
+    options.hinting = False
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=coverage["codepoints"])
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.save(buffer)
+    font.close()
+    print(f"[INFO] 한글 글리프만 남긴 중간 폰트를 만들었습니다: {buffer.tell():,} bytes")
+    return TTFont(io.BytesIO(buffer.getvalue()))
+
+
+def open_source_korean_font(ko_font_path: str) -> tuple:
+    """
+    전처리하기 전의 한글 폰트와 한글 색인을 엽니다.
+    watch 모드에서는 모든 테이블을 읽은 원본 폰트와 색인을 소스 파일(source_stamp)만으로 정한 키로
+    메모리에 유지하고 원본의 복사본을 반환합니다. TARGET_EM이나 베어링 같은 설정 값이 바뀌어도
+    소스 폰트를 다시 해석하지 않고 Em 스케일링과 베어링 조정만 다시 실행합니다.
+
+    Returns:
+        tuple: (수정해도 되는 한글 폰트, build_hangul_coverage() 색인)
+    """
+    if not resident_fonts_enabled():
+        with span("TTFont(ko)"):
+            ko_font = TTFont(ko_font_path)
+        with span("build_hangul_coverage"):
+            return ko_font, build_hangul_coverage(ko_font)
+
+    key = ("fonttools-source", source_stamp(ko_font_path))
+    resident = get_resident(key)
+    if resident is None:
+        with span("TTFont(ko)"):
+            source = TTFont(ko_font_path)
+            # 복사할 수 있도록 모든 테이블을 읽은 뒤 파일을 닫습니다.
+            source.ensureDecompiled()
+            source.reader.close()
+            source.reader = None
+        with span("build_hangul_coverage"):
+            resident = (source, build_hangul_coverage(source))
+        put_resident(key, resident, font=source)
+
+    source, coverage = resident
+    with span("copy_source_font(ko)"):
+        return copy.deepcopy(source), coverage
+
+
+def load_preprocessed_korean_font(
+    ko_font_path: str, hangul_only: bool = False, plan_coverage: dict = None
+) -> tuple:
+    """
+    Em 스케일링과 베어링 조정을 마친 한글 폰트와 한글 색인을 로드합니다.
+    watch 모드에서는 결과를 메모리에 유지합니다. 병합은 한글 폰트를 읽기만 하므로 복사하지 않고 공유합니다.
+    설정 값이 바뀌어 전처리를 다시 할 때는 메모리에 유지한 원본의 복사본에서 시작합니다(open_source_korean_font()).
+
+    Args:
+        ko_font_path: 한글 폰트 파일 경로
+        hangul_only: 전처리 전에 한글 글리프만 남긴 작은 폰트로 바꾸고 전체 폰트를 닫을지 여부
+        plan_coverage: 빌드 계획(build --plan)의 한글 색인. 있으면 build_hangul_coverage()를 실행하지 않습니다.
+
+    Returns:
+        tuple: (전처리된 한글 폰트, build_hangul_coverage() 색인)
+    """
+    key = korean_resident_key("fonttools", ko_font_path, hangul_only)
+    resident = get_resident(key)
+    if resident is not None:
+        print(f"[INFO] 메모리에 유지된 한글 폰트를 사용합니다: {os.path.basename(ko_font_path)}")
+        # 설정 값이 바뀔 때 다시 쓰도록 원본 소스 폰트도 유지합니다.
+        get_resident(("fonttools-source", source_stamp(ko_font_path)))
+        return resident
+
+    if plan_coverage is not None:
+        with span("TTFont(ko)"):
+            ko_font = TTFont(ko_font_path)
+        coverage = coverage_from_plan(plan_coverage, ko_font.getGlyphOrder())
+    else:
+        ko_font, coverage = open_source_korean_font(ko_font_path)
+    if hangul_only:
+        with span("extract_hangul_glyphs"):
+            ko_font = extract_hangul_glyphs(ko_font, coverage)
+        # post 테이블에 이름이 없는 폰트는 글리프 ID로 이름을 만들므로 색인을 다시 만듭니다.
+        with span("build_hangul_coverage"):
+            coverage = build_hangul_coverage(ko_font)
+    with span("scale_font_em_units"):
+        scale_font_em_units(ko_font, TARGET_EM)
+    with span("process_hangul_glyphs"):
+        process_hangul_glyphs(ko_font, coverage)
+
+    put_resident(key, (ko_font, coverage), font=ko_font)
+    return ko_font, coverage
+
+
+def _glyph_closure(glyf_table, glyph_names: list) -> list:
+    """글리프와 그 글리프가 (재귀적으로) 참조하는 글리프의 이름을 반환합니다."""
+
+    def get_references(name):
+        glyph = glyf_table[name]
+        return [component.glyphName for component in glyph.components] if glyph.isComposite() else []
+
+    return dependency_order(list(glyph_names), get_references)
+
+
+def build_hangul_shard(
+    ko_font_path: str,
+    hangul_only: bool,
+    overrides: dict,
+    index: int,
+    shard_count: int,
+    plan_coverage: dict = None,
+) -> dict:
+    """
+    한글 폰트를 따로 열어 한글 색인을 shard_count개로 나눈 구간 중 index번째 구간의 글리프만
+    Em 스케일링과 베어링 조정을 하고, 윤곽선으로 푼 부분 글리프 집합을 만듭니다. 워커 프로세스에서 실행됩니다.
+
+    Returns:
+        dict: 성공 여부, 부분 글리프 집합(glyphs: (코드포인트, 컴파일한 글리프, 너비, 왼쪽 사이드 베어링) 리스트),
+            최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과
+    """
+    result = {"success": False, "glyphs": [], "trace": []}
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=f"(한글 샤드 {index + 1}/{shard_count})")
+    try:
+        with overridden_settings(overrides):
+            with span("TTFont(ko)"):
+                ko_font = TTFont(ko_font_path)
+            if plan_coverage is not None:
+                coverage = coverage_from_plan(plan_coverage, ko_font.getGlyphOrder())
+            else:
+                with span("build_hangul_coverage"):
+                    coverage = build_hangul_coverage(ko_font)
+            shard = split_coverage(coverage, shard_count)[index]
+            if hangul_only:
+                with span("extract_hangul_glyphs"):
+                    ko_font = extract_hangul_glyphs(ko_font, shard)
+                with span("build_hangul_coverage"):
+                    shard = build_hangul_coverage(ko_font)
+
+            # 이 구간의 글리프와 참조 대상만 스케일링합니다. 나머지 글리프는 병합하지 않습니다.
+            cmap = ko_font.getBestCmap()
+            names = _glyph_closure(ko_font["glyf"], [cmap[codepoint] for codepoint in shard["codepoints"]])
+            with span("scale_font_em_units", glyphs=len(names)):
+                scale_font_em_units(ko_font, TARGET_EM, glyph_names=names)
+            with span("process_hangul_glyphs"):
+                process_hangul_glyphs(ko_font, shard)
+
+            glyf = ko_font["glyf"]
+            with span("flatten_hangul_glyphs", glyphs=len(shard["codepoints"])):
+                result["glyphs"] = [
+                    (codepoint, glyph.compile(glyf), advance, lsb)
+                    for codepoint, glyph, advance, lsb in _flattened_hangul_glyphs(ko_font, shard)
+                ]
+            ko_font.close()
+        result["success"] = True
+    except Exception as e:
+        print(f"[ERROR] 한글 샤드 {index + 1}/{shard_count} 처리 실패: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def build_hangul_partial_sets(
+    ko_font_path: str, hangul_only: bool, overrides: dict, shard_count: int, plan_coverage: dict = None
+) -> tuple:
+    """
+    build_hangul_shard()를 shard_count개의 워커 프로세스에서 실행해 부분 글리프 집합을 구간 순서대로 모읍니다.
+    plan_coverage는 빌드 계획(build --plan)의 한글 색인입니다.
+
+    Returns:
+        tuple: (merge_korean_glyphs()에 넘길 부분 글리프 집합 리스트, 워커의 트레이스 이벤트 리스트)
+
+    Raises:
+        RuntimeError: 처리에 실패한 샤드가 있을 때
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=shard_count) as executor:
+        futures = [
+            executor.submit(
+                build_hangul_shard, ko_font_path, hangul_only, overrides, index, shard_count, plan_coverage
+            )
+            for index in range(shard_count)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    failed = [str(index + 1) for index, result in enumerate(results) if not result["success"]]
+    if failed:
+        raise RuntimeError(f"한글 샤드 {', '.join(failed)}/{shard_count}의 처리에 실패했습니다")
+
+    glyph_count = sum(len(result["glyphs"]) for result in results)
+    peak = max(result["peak_rss_mb"] for result in results)
+    print(
+        f"[INFO] 한글 글리프 {glyph_count}개를 {shard_count}개 샤드로 나누어 처리했습니다. "
+        f"({elapsed:.2f}초, 샤드별 최대 RSS {peak:.1f}MB)"
+    )
+    return (
+        [result["glyphs"] for result in results],
+        [event for result in results for event in result["trace"]],
+    )
+
+
+def open_source_font(path: str) -> TTFont:
+    """
+    소스 폰트를 엽니다. watch 모드에서는 파일 내용을 메모리에 유지하고,
+    빌드마다 그 바이트에서 새 TTFont를 만들어 디스크를 다시 읽지 않습니다.
+    """
+    if not resident_fonts_enabled():
+        return TTFont(path)
+
+    key = ("source", source_stamp(path))
+    data = get_resident(key)
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+        put_resident(key, data)
+    return TTFont(io.BytesIO(data))
+
+
+def build_variant(task: dict, use_cache: bool = True, shard_results: tuple = None) -> dict:
+    """
+    fontTools로 단일 폰트 조합을 빌드합니다. hangulify.build_variant()와 같은 결과 형식을 반환합니다.
+    전처리 캐시는 FontForge SFD 형식이므로 이 백엔드에서는 use_cache를 사용하지 않습니다.
+
+    shard_results가 있으면 빌드 그래프의 샤드 노드가 만든 build_hangul_shard() 결과를 구간 순서대로 병합합니다.
+    없고 task의 merge_shards가 1보다 크면 한글 글리프를 그 수의 워커 프로세스로 나누어 직접 처리한 뒤 합칩니다.
+    """
+    style = task["style"]
+    ko_font_path = task["ko_font_path"]
+    en_font_path = task["en_font_path"]
+    output_dir = task.get("output_dir", BUILT_FONTS_PATH)
+    result = {"style": style, "success": False, "outputs": [], "trace": []}
+    shard_trace = []
+
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=style)
+    try:
+        with span(style, category="variant"), overridden_settings(task.get("overrides")):
+            print(f"[INFO] {style} 폰트 처리 중 (fonttools): {os.path.basename(ko_font_path)} + {os.path.basename(en_font_path)}")
+
+            shard_count = task.get("merge_shards", 1)
+            if shard_count > 1 and task.get("keep_references", False):
+                print("[WARNING] --keep-references 병합은 샤드로 나누지 않고 한 프로세스에서 실행합니다.")
+                shard_count = 1
+            if shard_results is not None:
+                failed = [str(index + 1) for index, shard in enumerate(shard_results) if not shard["success"]]
+                if failed:
+                    raise RuntimeError(
+                        f"한글 샤드 {', '.join(failed)}/{len(shard_results)}의 처리에 실패했습니다"
+                    )
+                # 샤드 노드의 트레이스는 빌드 그래프를 실행한 쪽에서 한 번만 기록합니다.
+                partial_sets = [shard["glyphs"] for shard in shard_results]
+                ko_font = coverage = None
+            elif shard_count > 1:
+                with span("build_hangul_partial_sets", shards=shard_count):
+                    partial_sets, shard_trace = build_hangul_partial_sets(
+                        ko_font_path,
+                        task.get("low_memory", False),
+                        task.get("overrides"),
+                        shard_count,
+                        task.get("coverage"),
+                    )
+                ko_font = coverage = None
+            else:
+                ko_font, coverage = load_preprocessed_korean_font(
+                    ko_font_path, task.get("low_memory", False), task.get("coverage")
+                )
+                partial_sets = None
+
+            with span("TTFont(en)"):
+                en_font = open_source_font(en_font_path)
+            if task["is_nerd_font"]:
+                with span("re_encode_for_nerd_font"):
+                    re_encode_for_nerd_font(en_font)
+            with span("merge_korean_glyphs"):
+                merge_korean_glyphs(
+                    en_font, ko_font, coverage, task.get("keep_references", False), partial_sets
+                )
+
+            font_style = get_font_style(en_font, os.path.basename(en_font_path))
+            with span("update_font_metadata"):
+                family_name = update_font_metadata(
+                    en_font,
+                    font_style,
+                    old_name=OLD_FONT_NAME,
+                    new_name=NEW_FONT_NAME,
+                    reproducible=task.get("source_date_epoch") is not None,
+                )
+            with span("generate_font_files"):
+                outputs = generate_font_files(
+                    en_font,
+                    family_name,
+                    font_style,
+                    output_dir,
+                    task.get("profile", "default"),
+                    task.get("source_date_epoch"),
+                )
+
+            en_font.close()
+            if ko_font is not None and not is_resident(ko_font):
+                ko_font.close()
+
+        result["outputs"] = outputs
+        result["success"] = bool(outputs)
+
+    except Exception as e:
+        print(f"[ERROR] {style} 폰트 처리 중 오류 발생: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans() + shard_trace
+    return result
+
+
+def build_variant_from_shards(*shard_results: dict, task: dict, use_cache: bool = True) -> dict:
+    """빌드 그래프에서 샤드 노드의 결과를 입력으로 받아 build_variant()를 실행합니다."""
+    return build_variant(task, use_cache, shard_results=shard_results)
+
+
+def derive_nerd_variant(base_result: dict, task: dict) -> dict:
+    """
+    fontTools로 병합된 기본 조합의 TTF에 Nerd Font 아이콘만 덮어써서 Nerd Font 조합을 만듭니다.
+    hangulify.derive_nerd_variant()와 같은 결과 형식을 반환합니다.
+    """
+    style = task["style"]
+    en_font_path = task["en_font_path"]
+    output_dir = task.get("output_dir", BUILT_FONTS_PATH)
+    result = {"style": style, "success": False, "outputs": [], "trace": []}
+
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=style)
+    try:
+        base_ttf_paths = [path for path in base_result["outputs"] if path.endswith(".ttf")]
+        if not base_result["success"] or not base_ttf_paths:
+            raise RuntimeError(f"기본 조합 {task['derive_from']}의 TTF가 없습니다")
+
+        with span(style, category="variant"), overridden_settings(task.get("overrides")):
+            print(f"[INFO] {style} 폰트 처리 중 (fonttools): {os.path.basename(base_ttf_paths[0])} + {os.path.basename(en_font_path)} 아이콘")
+            with span("TTFont(base)"):
+                font = TTFont(base_ttf_paths[0])
+            with span("TTFont(en)"):
+                nerd_font = open_source_font(en_font_path)
+            with span("overlay_nerd_glyphs"):
+                overlay_nerd_glyphs(font, nerd_font)
+
+            # 세로 메트릭과 이름은 전체 빌드처럼 Nerd Font 소스의 것을 사용합니다.
+            font["OS/2"] = copy.deepcopy(nerd_font["OS/2"])
+            for attribute in ("ascent", "descent", "lineGap"):
+                setattr(font["hhea"], attribute, getattr(nerd_font["hhea"], attribute))
+            font["name"] = copy.deepcopy(nerd_font["name"])
+
+            with span("re_encode_for_nerd_font"):
+                re_encode_for_nerd_font(font)
+            font_style = get_font_style(nerd_font, os.path.basename(en_font_path))
+            with span("update_font_metadata"):
+                family_name = update_font_metadata(
+                    font,
+                    font_style,
+                    old_name=OLD_FONT_NAME,
+                    new_name=NEW_FONT_NAME,
+                    reproducible=task.get("source_date_epoch") is not None,
+                )
+            with span("generate_font_files"):
+                outputs = generate_font_files(
+                    font,
+                    family_name,
+                    font_style,
+                    output_dir,
+                    task.get("profile", "default"),
+                    task.get("source_date_epoch"),
+                )
+
+            nerd_font.close()
+            font.close()
+
+        result["outputs"] = outputs
+        result["success"] = bool(outputs)
+
+    except Exception as e:
+        print(f"[ERROR] {style} 폰트 처리 중 오류 발생: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
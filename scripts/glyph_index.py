@@ -0,0 +1,224 @@
+"""
+빌드된 폰트의 글리프 해시 색인을 만들고 지난 릴리스의 색인과 비교합니다.
+
+코드포인트마다 윤곽선(복합 글리프는 펼친 결과), 너비, cmap 매핑을 정규화해 해시하므로
+글리프 이름이나 글리프 ID, TrueType 명령어가 바뀌어도 모양이 같으면 같은 해시가 됩니다.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import BUILT_FONTS_PATH, GLYPH_INDEX_PATH
+from codepoint_runs import find_codepoint_runs
+from ttfparse import glyph_contours, load_font
+
+GLYPH_INDEX_VERSION: int = 1
+
+# 해시 문자열 길이(16진수 자릿수)입니다.
+GLYPH_HASH_LENGTH: int = 16
+
+# 차이 보고에서 종류별로 출력할 최대 구간 수입니다.
+MAX_REPORTED_RUNS: int = 50
+
+
+def glyph_hash(advance: int, contours: list) -> str:
+    """글리프의 너비와 윤곽선을 정규화한 해시를 계산합니다."""
+    values = [advance, len(contours)]
+    for contour in contours:
+        values.append(len(contour))
+        for x, y, on_curve in contour:
+            values.extend((x, y, on_curve))
+    digest = hashlib.blake2b(struct.pack(f"<{len(values)}i", *values), digest_size=8)
+    return digest.hexdigest()[:GLYPH_HASH_LENGTH]
+
+
+def hash_codepoints(font_path: str, codepoints: list) -> dict:
+    """
+    폰트에서 주어진 코드포인트의 글리프 해시를 계산합니다.
+    워커 프로세스에서 실행되며, 샤드마다 폰트 파일을 직접 읽습니다.
+
+    Returns:
+        dict: 코드포인트별 글리프 해시
+    """
+    font = load_font(font_path)
+    glyf = font["tables"]["glyf"]
+    loca = font["loca"]
+    cmap = font["cmap"]
+    metrics = font["metrics"]
+
+    hashes = {}
+    for codepoint in codepoints:
+        glyph_id = cmap[codepoint]
+        hashes[codepoint] = glyph_hash(
+            metrics[glyph_id][0], glyph_contours(glyf, loca, glyph_id)
+        )
+    return hashes
+
+
+def build_glyph_index(font_path: str, jobs: int = 1) -> dict:
+    """
+    폰트의 모든 cmap 코드포인트에 대한 글리프 해시 색인을 만듭니다.
+    jobs가 1보다 크면 코드포인트를 샤드로 나누어 여러 프로세스에서 해시합니다.
+    """
+    font = load_font(font_path)
+    if font["loca"] is None:
+        raise ValueError(f"TrueType 윤곽선(glyf)이 없는 폰트입니다: {font_path}")
+    codepoints = sorted(font["cmap"])
+
+    if jobs > 1 and len(codepoints) > 1:
+        shard_size = -(-len(codepoints) // jobs)
+        shards = [
+            codepoints[i : i + shard_size] for i in range(0, len(codepoints), shard_size)
+        ]
+        hashes = {}
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            for shard_hashes in executor.map(
+                hash_codepoints, [font_path] * len(shards), shards
+            ):
+                hashes.update(shard_hashes)
+    else:
+        hashes = hash_codepoints(font_path, codepoints)
+
+    return {
+        "version": GLYPH_INDEX_VERSION,
+        "font": os.path.basename(font_path),
+        "units_per_em": font["head"]["units_per_em"],
+        "glyphs": {f"{codepoint:04X}": hashes[codepoint] for codepoint in codepoints},
+    }
+
+
+def glyph_index_path(font_path: str, index_dir: str = GLYPH_INDEX_PATH) -> str:
+    """폰트 파일에 대응하는 색인 파일 경로를 반환합니다."""
+    return os.path.join(index_dir, os.path.splitext(os.path.basename(font_path))[0] + ".json")
+
+
+def load_glyph_index(path: str) -> dict:
+    """색인 파일을 읽습니다. 없거나 형식이 다르면 None을 반환합니다."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != GLYPH_INDEX_VERSION:
+        return None
+    return index
+
+
+def save_glyph_index(index: dict, path: str) -> None:
+    """색인을 코드포인트 한 줄에 하나씩 저장해 git diff로도 변경을 볼 수 있게 합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def compare_glyph_indexes(baseline: dict, current: dict) -> dict:
+    """
+    두 색인을 비교합니다.
+
+    Returns:
+        dict: changed(해시가 바뀐), added(새로 매핑된), removed(매핑이 사라진) 코드포인트 리스트
+    """
+    before = baseline["glyphs"]
+    after = current["glyphs"]
+    return {
+        "changed": sorted(int(key, 16) for key in before.keys() & after.keys() if before[key] != after[key]),
+        "added": sorted(int(key, 16) for key in after.keys() - before.keys()),
+        "removed": sorted(int(key, 16) for key in before.keys() - after.keys()),
+    }
+
+
+def _format_runs(codepoints: list) -> str:
+    """코드포인트 리스트를 'U+AC00-AC0F, U+AC12' 형식의 구간 문자열로 바꿉니다."""
+    runs = find_codepoint_runs(codepoints)
+    parts = [
+        f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}"
+        for start, end in runs[:MAX_REPORTED_RUNS]
+    ]
+    if len(runs) > MAX_REPORTED_RUNS:
+        parts.append(f"... 외 {len(runs) - MAX_REPORTED_RUNS}개 구간")
+    return ", ".join(parts)
+
+
+def verify_built_fonts(
+    jobs: int = 1,
+    update: bool = False,
+    font_dir: str = BUILT_FONTS_PATH,
+    index_dir: str = GLYPH_INDEX_PATH,
+) -> bool:
+    """
+    빌드된 TTF의 글리프 해시 색인을 지난 릴리스의 색인과 비교하고 차이를 출력합니다.
+
+    Args:
+        jobs: 해시 계산에 사용할 워커 프로세스 수
+        update: 비교하지 않고 현재 빌드 결과로 기준 색인을 갱신할지 여부
+        font_dir: 빌드된 TTF가 있는 디렉터리
+        index_dir: 기준 색인을 저장하는 디렉터리
+
+    Returns:
+        bool: 기준 색인이 있는 모든 폰트가 일치하는지(update이면 저장에 성공했는지) 여부.
+            기준 색인이 없는 폰트는 경고와 함께 건너뜁니다.
+    """
+    ttf_paths = sorted(
+        os.path.join(font_dir, filename)
+        for filename in os.listdir(font_dir)
+        if filename.lower().endswith(".ttf")
+    ) if os.path.isdir(font_dir) else []
+    if not ttf_paths:
+        print(f"[ERROR] {font_dir}에서 검사할 TTF 파일을 찾을 수 없습니다.")
+        return False
+
+    success = True
+    verified = 0
+    for ttf_path in ttf_paths:
+        font_name = os.path.basename(ttf_path)
+        index_path = glyph_index_path(ttf_path, index_dir)
+
+        baseline = None
+        if not update:
+            baseline = load_glyph_index(index_path)
+            if baseline is None:
+                print(
+                    f"[WARNING] {font_name}의 기준 색인이 없어 건너뜁니다. "
+                    "`build.py verify --update`로 만드세요."
+                )
+                continue
+
+        start = time.perf_counter()
+        try:
+            index = build_glyph_index(ttf_path, jobs)
+        except Exception as e:
+            print(f"[ERROR] {font_name} 글리프 해시 계산 실패: {e}")
+            success = False
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"[INFO] {font_name}: 글리프 {len(index['glyphs'])}개 해시 계산 ({elapsed:.2f}초)")
+
+        if update:
+            save_glyph_index(index, index_path)
+            print(f"[INFO] 기준 색인을 저장했습니다: {index_path}")
+            continue
+
+        verified += 1
+        differences = compare_glyph_indexes(baseline, index)
+        if baseline["units_per_em"] != index["units_per_em"]:
+            print(f"[WARNING] {font_name}: Em 단위가 바뀌었습니다: {baseline['units_per_em']} -> {index['units_per_em']}")
+            success = False
+        if not any(differences.values()):
+            print(f"[INFO] {font_name}: 기준 색인과 일치합니다.")
+            continue
+
+        success = False
+        for kind, label in (("changed", "변경"), ("added", "추가"), ("removed", "삭제")):
+            codepoints = differences[kind]
+            if codepoints:
+                print(f"[WARNING] {font_name}: {label}된 글리프 {len(codepoints)}개: {_format_runs(codepoints)}")
+
+    if not update and not verified and success:
+        print(f"[ERROR] {index_dir}에 {font_dir}의 폰트와 맞는 기준 색인이 없습니다.")
+        return False
+    return success
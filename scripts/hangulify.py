@@ -1,17 +1,68 @@
+from __future__ import annotations
+
+import json
 import os
+import sys
+from contextlib import contextmanager
 from typing import Any
 import re
-import fontforge
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import fontforge
+except ImportError:
+    # fontTools 백엔드(--backend fonttools)는 FontForge 없이 동작합니다.
+    fontforge = None
 
 from config import (
     BUILT_FONTS_PATH,
-    EN_FONT_PATH,
-    KO_FONT_PATH,
-    EN_NERD_FONT_PATH,
+    CACHE_PATH,
     ENGLISH_FONT_NF_WIDTH,
     ENGLISH_FONT_WIDTH,
+    KOREAN_FONT_WIDTH,
     OLD_FONT_NAME,
     NEW_FONT_NAME,
+    SIZE_BUDGETS,
+)
+from build_graph import run_build_graph
+from codepoint_runs import find_codepoint_runs
+from build_manifest import (
+    get_rebuild_reasons,
+    load_manifest,
+    record_variant,
+    remove_variant,
+    save_manifest,
+)
+from build_matrix import DEFAULT_FORMATS, build_tasks, load_build_matrix, match_font_files
+from build_trace import (
+    collect_spans,
+    get_peak_rss_mb,
+    print_trace_summary,
+    reset_peak_rss,
+    reset_spans,
+    set_trace_context,
+    span,
+    write_chrome_trace,
+)
+from font_cache import (
+    compute_cache_key,
+    file_sha256,
+    lookup_cached_font,
+    read_cache_metadata,
+    store_cached_font,
+)
+from font_compress import compress_font_file
+from font_profile import WEB_GENERATE_FLAGS, report_output_sizes
+from reproducible import normalize_font_file, source_date_epoch, unique_font_id, version_string
+from resident_fonts import (
+    get_resident,
+    is_resident,
+    put_resident,
+    resident_fonts_enabled,
+    source_stamp,
 )
 
 # 글리프의 사이드 베어링을 조정하는 값입니다.
@@ -20,6 +71,108 @@ BEARING_ADJUSTMENT: int = 200
 # TARGET em 단위, 키울수록 D2Coding 폰트(기본 1000)가 더 커집니다.
 TARGET_EM: int = 1400
 
+# 합성 볼드에서 한글 글리프의 획에 더할 두께(TARGET_EM 기준 font unit)입니다.
+# Bold 한글 폰트 파일이 없을 때 build_matrix.toml에서 synthetic_bold = true인 조합에 사용합니다.
+SYNTHETIC_BOLD_STROKE: int = 50
+
+# 한글 글리프를 복사할 유니코드 범위입니다.
+HANGUL_RANGES: tuple = (
+    (0x1100, 0x11FF),
+    (0x3130, 0x318F),
+    (0xA960, 0xA97F),
+    (0xAC00, 0xD7AF),
+    (0xD7B0, 0xD7FF),
+)
+
+# Nerd Font에서 다시 매핑할 글리프입니다. (원본 코드포인트 -> 대상 코드포인트)
+NERD_FONT_REMAP: dict = {
+    0xF08D0: 0x2665,  # heart
+    0x25BA: 0x22B2,  # tringled right
+}
+
+# Nerd Font 아이콘 코드포인트 범위입니다. --derive-nerd는 이 범위의 글리프만 Nerd Font 소스에서 가져옵니다.
+NERD_FONT_RANGES: tuple = (
+    (0x23FB, 0x23FE),  # IEC Power Symbols
+    (0x2630, 0x2630),
+    (0x2665, 0x2665),  # Octicons
+    (0x26A1, 0x26A1),  # Octicons
+    (0x2B58, 0x2B58),  # IEC Power Symbols
+    (0xE000, 0xE00A),  # Pomicons
+    (0xE0A0, 0xE0D7),  # Powerline, Powerline Extra
+    (0xE200, 0xE2A9),  # Font Awesome Extension
+    (0xE300, 0xE3E3),  # Weather Icons
+    (0xE5FA, 0xE6B8),  # Seti-UI, Custom
+    (0xE700, 0xE8EF),  # Devicons
+    (0xEA60, 0xEC1E),  # Codicons
+    (0xED00, 0xF381),  # Font Awesome, Font Logos
+    (0xF400, 0xF533),  # Octicons
+    (0xF0001, 0xF1AF0),  # Material Design Icons
+)
+
+# Nerd Font 패처가 바꾸는 세로 메트릭입니다. --derive-nerd에서 Nerd Font 소스의 값을 사용합니다.
+NERD_FONT_METRICS: tuple = (
+    "os2_version",
+    "os2_use_typo_metrics",
+    "os2_typoascent",
+    "os2_typoascent_add",
+    "os2_typodescent",
+    "os2_typodescent_add",
+    "os2_typolinegap",
+    "os2_winascent",
+    "os2_winascent_add",
+    "os2_windescent",
+    "os2_windescent_add",
+    "hhea_ascent",
+    "hhea_ascent_add",
+    "hhea_descent",
+    "hhea_descent_add",
+    "hhea_linegap",
+)
+
+# 빌드 백엔드 이름입니다.
+BACKENDS: tuple = ("fontforge", "fonttools")
+
+# 빌드 결과에 영향을 주는 스크립트 파일입니다. 매니페스트의 스크립트 버전 계산에 사용합니다.
+PIPELINE_SCRIPTS: tuple = (
+    "hangulify.py",
+    "codepoint_runs.py",
+    "outline_transform.py",
+    "fonttools_backend.py",
+    "font_compress.py",
+    "font_profile.py",
+    "reproducible.py",
+)
+
+# 스타일마다 생성하는 기본 출력 파일 형식입니다. build_matrix.toml의 formats로 조합마다 바꿀 수 있습니다.
+OUTPUT_FORMATS: tuple = DEFAULT_FORMATS
+
+# overridden_settings()가 설정 값을 바꾸는 빌드 모듈입니다.
+_SETTINGS_MODULES: tuple = (__name__, "fonttools_backend")
+
+
+@contextmanager
+def overridden_settings(overrides: dict = None):
+    """
+    build_matrix.toml의 조합별 overrides를 적용하는 동안 빌드 모듈의 설정 값을 바꾸고, 끝나면 되돌립니다.
+    전처리 캐시 키와 매니페스트 설정 값도 바뀐 값으로 계산되므로 조합별 설정이 섞이지 않습니다.
+    """
+    modules = [
+        sys.modules[name] for name in _SETTINGS_MODULES if name in sys.modules
+    ] if overrides else []
+    saved = [
+        (module, name, getattr(module, name))
+        for module in modules
+        for name in overrides
+        if hasattr(module, name)
+    ]
+    try:
+        for module, name, _ in saved:
+            setattr(module, name, overrides[name])
+        yield
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
+
 
 def _get_cleaned_name(name: str) -> str:
     """이름에서 공백을 제거합니다."""
@@ -60,37 +213,407 @@ def _is_jetbrains_font_width(width: int) -> bool:
     return width in (ENGLISH_FONT_WIDTH, ENGLISH_FONT_NF_WIDTH)
 
 
-def _process_and_adjust_glyph(font: fontforge.font, glyph_id: int) -> None:
+def _in_hangul_ranges(codepoint: int) -> bool:
+    """코드포인트가 HANGUL_RANGES에 포함되는지 확인합니다."""
+    return any(start <= codepoint <= end for start, end in HANGUL_RANGES)
+
+
+def _in_nerd_ranges(codepoint: int) -> bool:
+    """코드포인트가 NERD_FONT_RANGES에 포함되는지 확인합니다."""
+    return any(start <= codepoint <= end for start, end in NERD_FONT_RANGES)
+
+
+def build_hangul_coverage(font: fontforge.font) -> dict:
+    """
+    폰트에 실제로 존재하는 한글 글리프의 색인을 만듭니다.
+    빈 코드포인트를 하나씩 확인하지 않도록 폰트의 글리프를 한 번만 순회합니다.
+
+    Returns:
+        dict: 다음 항목을 담은 색인
+            - codepoints: HANGUL_RANGES에 존재하는 코드포인트 (정렬)
+            - runs: 출력할 가치가 있는(isWorthOutputting) 글리프의 연속 구간
+            - references: 복합 글리프 코드포인트별 참조하는 글리프 이름 리스트
+    """
+    codepoints = set()
+    outputtable = set()
+    references = {}
+
+    for glyph in font.glyphs():
+        glyph_codepoints = [glyph.unicode]
+        glyph_codepoints += [uni for uni, variation, _ in glyph.altuni or () if variation == -1]
+        glyph_codepoints = [cp for cp in glyph_codepoints if cp >= 0 and _in_hangul_ranges(cp)]
+        if not glyph_codepoints:
+            continue
+
+        worth_outputting = glyph.isWorthOutputting()
+        ref_names = [ref[0] for ref in glyph.references]
+        for codepoint in glyph_codepoints:
+            codepoints.add(codepoint)
+            if worth_outputting:
+                outputtable.add(codepoint)
+            if ref_names:
+                references[codepoint] = ref_names
+
+    return {
+        "codepoints": sorted(codepoints),
+        "runs": find_codepoint_runs(sorted(outputtable)),
+        "references": references,
+    }
+
+
+def coverage_from_json(data: dict) -> dict:
+    """JSON으로 저장된 한글 색인을 build_hangul_coverage()의 형식으로 되돌립니다."""
+    return {
+        "codepoints": list(data["codepoints"]),
+        "runs": [tuple(run) for run in data["runs"]],
+        "references": {int(cp): list(names) for cp, names in data["references"].items()},
+    }
+
+
+def coverage_from_plan(data: dict, glyph_names) -> dict:
+    """
+    빌드 계획(build.py plan)에 저장된 한글 색인을 build_hangul_coverage()의 형식으로 바꿉니다.
+    계획은 글리프 이름 없이 cmap과 glyf 테이블만 읽으므로 복합 글리프의 구성 요소가 글리프 ID로 저장되며,
+    cmap에 매핑된 글리프를 모두 복사하므로 코드포인트는 구간을 펼친 것과 같습니다.
+
+    Args:
+        data: 계획의 한글 색인 ("runs", "reference_ids")
+        glyph_names: 글리프 ID로 이름을 찾을 수 있는 리스트 또는 딕셔너리
+    """
+    return {
+        "codepoints": [codepoint for start, end in data["runs"] for codepoint in range(start, end + 1)],
+        "runs": [tuple(run) for run in data["runs"]],
+        "references": {
+            int(cp): [glyph_names[glyph_id] for glyph_id in glyph_ids]
+            for cp, glyph_ids in data["reference_ids"].items()
+        },
+    }
+
+
+def _hangul_glyph_names(font: fontforge.font, coverage: dict) -> list:
+    """한글 글리프(복합 글리프는 참조하는 글리프)의 이름을 중복 없이 색인 순서대로 모읍니다."""
+    glyph_names = {}
+    for codepoint in coverage["codepoints"]:
+        ref_names = coverage["references"].get(codepoint)
+        for name in ref_names or [font[codepoint].glyphname]:
+            glyph_names.setdefault(name, None)
+    return list(glyph_names)
+
+
+def process_hangul_glyphs(font: fontforge.font, coverage: dict = None) -> fontforge.font:
     """
-    단일 글리프 또는 참조 글리프의 베어링을 조정합니다.
+    한글 글리프를 선택하고 베어링을 조정합니다.
+    복합 글리프는 참조하는 글리프를 조정하며, 여러 복합 글리프가 공유하는 글리프도 한 번만 조정합니다.
+
+    Args:
+        font: 한글 폰트
+        coverage: build_hangul_coverage()로 만든 색인. 없으면 새로 만듭니다.
     """
-    glyph = font[glyph_id]
+    if coverage is None:
+        coverage = build_hangul_coverage(font)
 
-    if not glyph.references:
-        # 일반 글리프 처리
+    adjusted_count = 0
+    for name in _hangul_glyph_names(font, coverage):
+        glyph = font[name]
         if _is_jetbrains_font_width(int(glyph.width)):
             adjust_glyph_bearing(glyph, BEARING_ADJUSTMENT)
-    else:
-        # 참조(composite) 글리프 처리
-        for ref in glyph.references:
-            ref_glyph_id = ref[0]
-            ref_glyph = font[ref_glyph_id]
-            if _is_jetbrains_font_width(int(ref_glyph.width)):
-                adjust_glyph_bearing(ref_glyph, BEARING_ADJUSTMENT)
+            adjusted_count += 1
 
+    print(f"[INFO] 한글 글리프 {adjusted_count}개의 사이드 베어링 조정을 완료했습니다.")
+    return font
 
-def process_hangul_glyphs(font: fontforge.font) -> fontforge.font:
-    """한글 글리프를 선택하고 베어링을 조정합니다."""
-    hangul_range_start = 0x3131
-    hangul_range_end = 0xD7A3
 
-    # 폰트의 한글 범위 글리프들을 순회합니다.
-    for glyph_id in range(hangul_range_start, hangul_range_end + 1):
-        if glyph_id in font:
-            _process_and_adjust_glyph(font, glyph_id)
+def synthetic_bold_targets(font: fontforge.font, coverage: dict) -> list:
+    """
+    합성 볼드로 두껍게 만들 글리프 이름을 반환합니다.
+    한글 글리프(복합 글리프는 참조하는 글리프)와, 참조 외에 자체 윤곽선도 가진 복합 글리프입니다.
+    """
+    names = _hangul_glyph_names(font, coverage)
+    for codepoint in coverage["references"]:
+        glyph = font[codepoint]
+        if len(glyph.foreground) and glyph.glyphname not in names:
+            names.append(glyph.glyphname)
+    return sorted(names)
 
-    print("[INFO] 한글 글리프의 사이드 베어링 조정을 완료했습니다.")
-    return font
+
+def embolden_glyphs(font: fontforge.font, glyph_names: list) -> int:
+    """
+    글리프의 획을 SYNTHETIC_BOLD_STROKE만큼 두껍게 만듭니다. 고정폭을 유지하도록 너비는 되돌립니다.
+    자체 윤곽선을 가진 복합 글리프는 참조하는 글리프를 두껍게 만들기 전에 먼저 참조를 풀어
+    어떤 글리프를 먼저 처리하든 같은 결과가 되게 합니다.
+
+    Returns:
+        int: 두껍게 만든 글리프 수
+    """
+    glyphs = [font[name] for name in glyph_names]
+    for glyph in glyphs:
+        if glyph.references and len(glyph.foreground):
+            glyph.unlinkRef()
+
+    emboldened = 0
+    for glyph in glyphs:
+        if not len(glyph.foreground):
+            continue
+        width = glyph.width
+        glyph.changeWeight(SYNTHETIC_BOLD_STROKE, "CJK", 0, 0, "squish")
+        glyph.width = width
+        emboldened += 1
+    return emboldened
+
+
+def korean_preprocess_params(hangul_only: bool = False, synthetic_bold: bool = False) -> dict:
+    """
+    한글 폰트 전처리(Em 스케일링, 베어링 조정) 결과에 영향을 주는 설정 값을 반환합니다.
+    hangul_only이면 한글 글리프만 남긴 중간 결과(--low-memory)임을, synthetic_bold이면
+    합성 볼드를 적용한 결과임을 함께 기록합니다.
+    """
+    params = {
+        "TARGET_EM": TARGET_EM,
+        "BEARING_ADJUSTMENT": BEARING_ADJUSTMENT,
+        "KOREAN_FONT_WIDTH": KOREAN_FONT_WIDTH,
+        "ENGLISH_FONT_WIDTH": ENGLISH_FONT_WIDTH,
+        "ENGLISH_FONT_NF_WIDTH": ENGLISH_FONT_NF_WIDTH,
+        "HANGUL_RANGES": HANGUL_RANGES,
+    }
+    if hangul_only:
+        params["HANGUL_ONLY"] = True
+    if synthetic_bold:
+        params["SYNTHETIC_BOLD_STROKE"] = SYNTHETIC_BOLD_STROKE
+    return params
+
+
+def build_constants(backend: str = "fontforge") -> dict:
+    """출력 결과에 영향을 주는 config.py 및 hangulify.py 설정 값과 빌드 백엔드를 반환합니다."""
+    constants = dict(
+        korean_preprocess_params(),
+        OLD_FONT_NAME=OLD_FONT_NAME,
+        NEW_FONT_NAME=NEW_FONT_NAME,
+        NERD_FONT_REMAP=NERD_FONT_REMAP,
+        OUTPUT_FORMATS=OUTPUT_FORMATS,
+        BACKEND=backend,
+    )
+    # 매니페스트에 저장된 값과 비교할 수 있도록 JSON 표현으로 정규화합니다.
+    return json.loads(json.dumps(constants))
+
+
+def korean_cache_key(
+    ko_font_path: str, hangul_only: bool = False, synthetic_bold: bool = False
+) -> str:
+    """한글 폰트 파일과 현재 설정에 대한 전처리 캐시 키를 반환합니다."""
+    return compute_cache_key(ko_font_path, korean_preprocess_params(hangul_only, synthetic_bold))
+
+
+def korean_resident_key(
+    backend: str, ko_font_path: str, hangul_only: bool = False, synthetic_bold: bool = False
+) -> tuple:
+    """watch 모드에서 메모리에 유지하는 전처리된 한글 폰트의 키를 반환합니다."""
+    return (
+        backend,
+        source_stamp(ko_font_path),
+        json.dumps(korean_preprocess_params(hangul_only, synthetic_bold)),
+    )
+
+
+def extract_hangul_glyphs(font: fontforge.font, coverage: dict) -> int:
+    """
+    한글 색인의 글리프와 그 글리프가 참조하는 글리프만 남기고 나머지 글리프를 삭제합니다.
+
+    Returns:
+        int: 삭제한 글리프 수
+    """
+    codepoints = set(coverage["codepoints"])
+    keep = {".notdef"}
+    for glyph in font.glyphs():
+        unicodes = [glyph.unicode] + [
+            uni for uni, variation, _ in glyph.altuni or () if variation == -1
+        ]
+        if any(codepoint in codepoints for codepoint in unicodes):
+            keep.add(glyph.glyphname)
+
+    # 참조의 참조까지 남깁니다.
+    pending = list(keep)
+    while pending:
+        name = pending.pop()
+        if name not in font:
+            continue
+        for ref in font[name].references:
+            if ref[0] not in keep:
+                keep.add(ref[0])
+                pending.append(ref[0])
+
+    removed = [glyph.glyphname for glyph in font.glyphs() if glyph.glyphname not in keep]
+    for name in removed:
+        font.removeGlyph(name)
+    return len(removed)
+
+
+def _reopen_font(font: fontforge.font, path: str = None) -> fontforge.font:
+    """
+    폰트를 닫고 SFD 파일에서 다시 엽니다. 삭제한 글리프가 차지하던 메모리를 돌려받기 위해 사용합니다.
+    path가 없으면 임시 파일에 저장한 뒤 엽니다.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if path is None:
+            path = os.path.join(tmp_dir, "hangul.sfd")
+            font.save(path)
+        font.close()
+        with span("fontforge.open(hangul)"):
+            return fontforge.open(path)
+
+
+# watch 모드에서 소스 폰트의 SFD를 저장할 디렉터리입니다. 메모리 파일 시스템이 있으면 사용합니다.
+RESIDENT_SOURCE_DIR: str = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class _ResidentSource:
+    """watch 모드에서 메모리에 유지하는 소스 폰트입니다. 처음 연 폰트를 SFD로 저장하고 색인을 함께 둡니다."""
+
+    def __init__(self, path: str, coverage: bool = False):
+        self._tmp_dir = tempfile.mkdtemp(prefix="med2-source-", dir=RESIDENT_SOURCE_DIR)
+        self.path = os.path.join(self._tmp_dir, f"{os.path.basename(path)}.sfd")
+        self.coverage = None
+        font = fontforge.open(path)
+        try:
+            if coverage:
+                with span("build_hangul_coverage"):
+                    self.coverage = build_hangul_coverage(font)
+            font.save(self.path)
+        finally:
+            font.close()
+
+    def close(self) -> None:
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+
+def _resident_source(path: str, coverage: bool = False) -> _ResidentSource:
+    """
+    소스 파일(source_stamp)만으로 정한 키로 메모리에 유지한 소스 폰트를 반환합니다.
+    watch 모드가 아니면 None을 반환합니다.
+    """
+    if not resident_fonts_enabled():
+        return None
+    key = ("fontforge-source", source_stamp(path))
+    source = get_resident(key)
+    if source is None or (coverage and source.coverage is None):
+        with span("resident_source"):
+            source = _ResidentSource(path, coverage)
+        put_resident(key, source, font=source)
+    return source
+
+
+def open_source_font(path: str) -> fontforge.font:
+    """
+    수정할 소스 폰트를 엽니다. watch 모드에서는 처음 연 폰트를 SFD로 메모리 파일 시스템에 유지하고
+    빌드마다 그 SFD에서 새 폰트를 열어, 설정 값이 바뀌어도 TTF 소스를 다시 변환하지 않습니다.
+    """
+    source = _resident_source(path)
+    return fontforge.open(source.path if source is not None else path)
+
+
+def open_source_korean_font(ko_font_path: str) -> tuple:
+    """
+    전처리하기 전의 한글 폰트와 한글 색인을 엽니다. watch 모드에서는 색인도 소스 파일 기준으로 유지하므로
+    TARGET_EM이나 베어링 같은 설정 값이 바뀌면 Em 스케일링과 베어링 조정만 다시 실행합니다.
+
+    Returns:
+        tuple: (수정해도 되는 한글 폰트, build_hangul_coverage() 색인)
+    """
+    source = _resident_source(ko_font_path, coverage=True)
+    if source is not None:
+        with span("fontforge.open(ko)"):
+            return fontforge.open(source.path), source.coverage
+
+    with span("fontforge.open(ko)"):
+        ko_font = fontforge.open(ko_font_path)
+    with span("build_hangul_coverage"):
+        return ko_font, build_hangul_coverage(ko_font)
+
+
+def load_preprocessed_korean_font(
+    ko_font_path: str,
+    use_cache: bool = True,
+    hangul_only: bool = False,
+    synthetic_bold: bool = False,
+    plan_coverage: dict = None,
+) -> tuple:
+    """
+    Em 스케일링과 베어링 조정을 마친 한글 폰트와 한글 색인을 로드합니다.
+    캐시에 같은 소스와 설정으로 전처리된 폰트가 있으면 그것을 사용하고,
+    없으면 전처리한 뒤 결과를 캐시에 저장합니다. 한글 색인은 캐시 메타데이터에 함께 저장됩니다.
+    watch 모드에서는 전처리된 폰트를 메모리에 유지하므로, 반환된 폰트가 is_resident()이면 닫지 않습니다.
+    설정 값이 바뀌어 전처리를 다시 할 때는 메모리에 유지한 원본에서 시작합니다(open_source_korean_font()).
+
+    Args:
+        ko_font_path: 한글 폰트 파일 경로
+        use_cache: 전처리 캐시 사용 여부
+        hangul_only: 한글 글리프만 남긴 작은 중간 폰트를 만들고, 전체 한글 폰트는 반환하기 전에 닫을지 여부
+        synthetic_bold: 한글 글리프에 합성 볼드를 적용할지 여부. 빌드 그래프에서는 조합보다 먼저
+            여러 워커가 나누어 적용한 결과를 캐시에 저장하므로, 여기서는 캐시가 없을 때만 직접 적용합니다.
+        plan_coverage: 빌드 계획(build --plan)의 한글 색인. 있으면 build_hangul_coverage()를 실행하지 않습니다.
+
+    Returns:
+        tuple: (전처리된 한글 폰트, build_hangul_coverage() 색인)
+    """
+    resident_key = korean_resident_key("fontforge", ko_font_path, hangul_only, synthetic_bold)
+    resident = get_resident(resident_key)
+    if resident is not None:
+        print(f"[INFO] 메모리에 유지된 한글 폰트를 사용합니다: {os.path.basename(ko_font_path)}")
+        # 설정 값이 바뀔 때 다시 쓰도록 원본 소스 폰트도 유지합니다.
+        get_resident(("fontforge-source", source_stamp(ko_font_path)))
+        return resident
+
+    key = korean_cache_key(ko_font_path, hangul_only, synthetic_bold) if use_cache else None
+    if use_cache:
+        cached_path = lookup_cached_font(key)
+        metadata = read_cache_metadata(key) if cached_path else {}
+        if cached_path and "coverage" in metadata:
+            print(f"[INFO] 캐시된 한글 폰트를 사용합니다: {os.path.basename(cached_path)}")
+            with span("fontforge.open(cache)"):
+                ko_font = fontforge.open(cached_path)
+            coverage = coverage_from_json(metadata["coverage"])
+            put_resident(resident_key, (ko_font, coverage), font=ko_font)
+            return ko_font, coverage
+
+    if plan_coverage is not None:
+        with span("fontforge.open(ko)"):
+            ko_font = fontforge.open(ko_font_path)
+        glyph_names = {glyph.originalgid: glyph.glyphname for glyph in ko_font.glyphs()}
+        coverage = coverage_from_plan(plan_coverage, glyph_names)
+    else:
+        ko_font, coverage = open_source_korean_font(ko_font_path)
+    if hangul_only:
+        with span("extract_hangul_glyphs"):
+            removed = extract_hangul_glyphs(ko_font, coverage)
+        print(f"[INFO] 한글 외 글리프 {removed}개를 제거했습니다.")
+    with span("scale_font_em_units"):
+        scale_font_em_units(ko_font, TARGET_EM)
+    with span("process_hangul_glyphs"):
+        process_hangul_glyphs(ko_font, coverage)
+    if synthetic_bold:
+        with span("embolden_glyphs"):
+            emboldened = embolden_glyphs(ko_font, synthetic_bold_targets(ko_font, coverage))
+        print(f"[INFO] 한글 글리프 {emboldened}개에 합성 볼드를 적용했습니다.")
+
+    cached_path = None
+    if use_cache:
+        try:
+            metadata = {
+                "source": os.path.basename(ko_font_path),
+                "params": korean_preprocess_params(hangul_only, synthetic_bold),
+                "coverage": coverage,
+            }
+            with span("store_cached_font"):
+                cached_path = store_cached_font(ko_font, key, metadata)
+            print(f"[INFO] 전처리된 한글 폰트를 캐시에 저장했습니다: {os.path.basename(cached_path)}")
+        except Exception as e:
+            print(f"[WARNING] 한글 폰트 캐시 저장 실패: {e}")
+            cached_path = None
+
+    if hangul_only:
+        ko_font = _reopen_font(ko_font, cached_path)
+
+    put_resident(resident_key, (ko_font, coverage), font=ko_font)
+    return ko_font, coverage
 
 
 def get_font_style(font: fontforge.font, original_filename: str = None) -> str:
@@ -143,10 +666,11 @@ def format_style_name(style: str) -> str:
 
 
 def update_font_metadata(
-    font: fontforge.font, style: str, old_name: str, new_name: str
+    font: fontforge.font, style: str, old_name: str, new_name: str, reproducible: bool = False
 ) -> None:
     """
     폰트의 메타데이터(패밀리 이름, 폰트 이름, 스타일 등)를 업데이트합니다.
+    reproducible이면 버전 문자열과 고유 ID도 소스 폰트의 날짜나 이전 이름 없이 정해진 형식으로 바꿉니다.
     """
     new_family_name = update_family_name(font.familyname, old_name, new_name)
 
@@ -160,18 +684,18 @@ def update_font_metadata(
     font.appendSFNTName("English (US)", "Family", new_family_name)
     font.appendSFNTName("English (US)", "Compatible Full", font.fullname)
     font.appendSFNTName("English (US)", "SubFamily", formatted_style)
+    if reproducible:
+        names = {name_id: value for language, name_id, value in font.sfnt_names if language == "English (US)"}
+        version = version_string(names.get("Version") or font.version or "1.000")
+        font.appendSFNTName("English (US)", "Version", version)
+        font.appendSFNTName("English (US)", "UniqueID", unique_font_id(version, font.fontname))
 
     print(f"[INFO] 폰트 메타데이터를 '{new_family_name}'로 업데이트했습니다.")
 
 
 def re_encode_for_nerd_font(font: fontforge.font) -> None:
     """Nerd Font의 특정 글리프 매핑 문제를 수정합니다(예: 하트, 오른쪽 삼각형 아이콘)."""
-    mappings = {
-        0xF08D0: 0x2665,  # heart
-        0x25BA: 0x22B2,  # tringled right
-    }
-
-    for src_codepoint, dest_codepoint in mappings.items():
+    for src_codepoint, dest_codepoint in NERD_FONT_REMAP.items():
         try:
             if src_codepoint in font and dest_codepoint in font:
                 font.selection.select(src_codepoint)
@@ -206,18 +730,41 @@ def fix_omega_naming_issue(font: fontforge.font) -> None:
             )
 
 
-def generate_font_files(font: fontforge.font, style: str) -> None:
-    """최종 TTF 및 WOFF2 폰트 파일을 생성하고 내보냅니다."""
-    output_filename_base = f"{_get_cleaned_name(font.familyname)}-{style}"
+def generate_font_files(
+    font: fontforge.font,
+    style: str,
+    output_dir: str = BUILT_FONTS_PATH,
+    profile: str = "default",
+    source_date_epoch: int = None,
+) -> list:
+    """
+    최종 TTF 폰트 파일을 생성하고 내보냅니다.
+    WOFF2 등 나머지 OUTPUT_FORMATS는 폰트를 다시 직렬화하지 않고
+    font_compress.compress_font_file()이 이 TTF에서 만듭니다.
+    profile이 "web"이면 힌팅과 TrueType 명령어를 빼는 WEB_GENERATE_FLAGS로 생성합니다.
+    source_date_epoch가 있으면 생성한 TTF의 시각을 그 값으로 고정하고 FFTM 테이블을 제거합니다
+    (reproducible.normalize_font_file()).
 
-    for ext in ["ttf", "woff2"]:
-        output_path = os.path.join(BUILT_FONTS_PATH, f"{output_filename_base}.{ext}")
+    Returns:
+        list: 생성에 성공한 출력 파일 경로의 리스트.
+    """
+    output_filename_base = f"{_get_cleaned_name(font.familyname)}-{style}"
+    output_path = os.path.join(output_dir, f"{output_filename_base}.ttf")
 
-        try:
+    try:
+        start_time = time.perf_counter()
+        if profile == "web":
+            font.generate(output_path, flags=WEB_GENERATE_FLAGS)
+        else:
             font.generate(output_path)
-            print(f"[INFO] {output_path} 내보내기 완료")
-        except Exception as e:
-            print(f"[ERROR] {font.fontname}에 대한 {ext.upper()} 생성 실패: {e}")
+        if source_date_epoch is not None:
+            normalize_font_file(output_path, source_date_epoch)
+        elapsed = time.perf_counter() - start_time
+        print(f"[INFO] {output_path} 내보내기 완료 ({os.path.getsize(output_path):,} bytes, {elapsed:.2f}초)")
+        return [output_path]
+    except Exception as e:
+        print(f"[ERROR] {font.fontname}에 대한 TTF 생성 실패: {e}")
+        return []
 
 
 def scale_font_em_units(font: fontforge.font, target_em: int) -> None:
@@ -238,149 +785,1323 @@ def scale_font_em_units(font: fontforge.font, target_em: int) -> None:
     )
 
 
+def split_coverage(coverage: dict, shard_count: int) -> list:
+    """
+    한글 색인을 코드포인트 순서대로 shard_count개의 연속 구간으로 나눕니다.
+    각 구간은 build_hangul_coverage()와 같은 형식이며, 구간을 순서대로 이으면 원래 색인이 됩니다.
+
+    Returns:
+        list: shard_count개의 색인 딕셔너리 리스트. 코드포인트가 적으면 뒤쪽 구간은 비어 있습니다.
+    """
+    codepoints = coverage["codepoints"]
+    shard_size = max(1, -(-len(codepoints) // shard_count))
+    shards = []
+    for index in range(shard_count):
+        part = codepoints[index * shard_size : (index + 1) * shard_size]
+        shards.append(
+            {
+                "codepoints": part,
+                "runs": find_codepoint_runs(part),
+                "references": {
+                    codepoint: coverage["references"][codepoint]
+                    for codepoint in part
+                    if codepoint in coverage["references"]
+                },
+            }
+        )
+    return shards
+
+
+def _unique_glyph_name(name: str, existing: set) -> str:
+    """폰트에 없는 글리프 이름을 만듭니다."""
+    candidate = name
+    suffix = 1
+    while candidate in existing:
+        candidate = f"{name}.{suffix}"
+        suffix += 1
+    return candidate
+
+
+def dependency_order(glyph_names: list, get_references) -> list:
+    """
+    글리프와 그 글리프가 (재귀적으로) 참조하는 글리프를, 참조되는 글리프가 먼저 오도록 정렬합니다.
+
+    Args:
+        glyph_names: 시작 글리프 이름 리스트
+        get_references: 글리프 이름을 받아 참조하는 글리프 이름 리스트를 반환하는 함수
+
+    Returns:
+        list: 중복 없는 글리프 이름 리스트
+    """
+    order = []
+    visited = set()
+    for root in glyph_names:
+        stack = [(root, False)]
+        while stack:
+            name, references_done = stack.pop()
+            if references_done:
+                order.append(name)
+                continue
+            if name in visited:
+                continue
+            visited.add(name)
+            stack.append((name, True))
+            for ref_name in reversed(get_references(name)):
+                if ref_name not in visited:
+                    stack.append((ref_name, False))
+    return order
+
+
+def _merge_keeping_references(
+    target_font: fontforge.font, source_font: fontforge.font, coverage: dict
+) -> int:
+    """
+    merge_korean_glyphs(keep_references=True)의 구현입니다.
+    복합 글리프가 참조하는 글리프를 먼저 복사하고, 복합 글리프는 복사한 글리프를 참조하도록 만듭니다.
+    코드포인트가 없는 참조 대상은 타겟 폰트에 없는 이름으로 추가합니다.
+    """
+    encoded = {}
+    for start, end in coverage["runs"]:
+        for codepoint in range(start, end + 1):
+            encoded.setdefault(source_font[codepoint].glyphname, []).append(codepoint)
+
+    order = dependency_order(
+        list(encoded), lambda name: [ref[0] for ref in source_font[name].references]
+    )
+    existing = {glyph.glyphname for glyph in target_font.glyphs()}
+    names = {}
+    for name in order:
+        source_glyph = source_font[name]
+        if name in encoded:
+            target_glyphs = [target_font.createChar(codepoint) for codepoint in encoded[name]]
+        else:
+            target_name = _unique_glyph_name(name, existing)
+            existing.add(target_name)
+            target_glyphs = [target_font.createChar(-1, target_name)]
+        names[name] = target_glyphs[0].glyphname
+
+        for target_glyph in target_glyphs:
+            target_glyph.clear()
+            target_glyph.foreground = source_glyph.foreground
+            target_glyph.references = tuple(
+                (names[ref[0]], ref[1]) for ref in source_glyph.references
+            )
+            target_glyph.width = source_glyph.width
+
+    return sum(len(codepoints) for codepoints in encoded.values())
+
+
+def _paste_runs(target_font: fontforge.font, source_font: fontforge.font, runs: list) -> int:
+    """코드포인트 구간마다 한 번씩 범위 선택으로 복사/붙여넣기하고 복사한 글리프 수를 반환합니다."""
+    copied_count = 0
+    for start, end in runs:
+        source_font.selection.select(("ranges",), start, end)
+        source_font.copy()
+        target_font.selection.select(("ranges",), start, end)
+        target_font.paste()
+        copied_count += end - start + 1
+    return copied_count
+
+
 def merge_korean_glyphs(
-    target_font: fontforge.font, source_font: fontforge.font
-) -> None:
+    target_font: fontforge.font,
+    source_font: fontforge.font,
+    coverage: dict = None,
+    keep_references: bool = False,
+    partial_sets: list = None,
+) -> int:
     """
     한국어 글리프를 소스 폰트에서 타겟 폰트로 복사합니다.
-    """
-    try:
-        # 한글 범위의 글리프들을 복사
-        hangul_ranges = [
-            (0x1100, 0x11FF),
-            (0x3130, 0x318F),
-            (0xA960, 0xA97F),
-            (0xAC00, 0xD7AF),
-            (0xD7B0, 0xD7FF),
-        ]
+    한글 색인의 연속 구간마다 한 번씩 범위 선택으로 복사/붙여넣기합니다.
+    타겟 폰트에 없는 글리프를 참조하는 복합 글리프는 붙여넣을 때 윤곽선으로 풀립니다.
+    partial_sets가 있으면 소스 폰트 대신 preprocess_korean_shard()가 저장한 샤드 폰트에서 구간 순서대로 붙여넣습니다.
 
-        copied_count = 0
-        for start, end in hangul_ranges:
-            for codepoint in range(start, end + 1):
-                if codepoint in source_font:
-                    source_glyph = source_font[codepoint]
-                    if source_glyph.isWorthOutputting():
-                        source_font.selection.select(codepoint)
-                        source_font.copy()
-                        target_font.selection.select(codepoint)
-                        target_font.paste()
-                        copied_count += 1
+    Args:
+        target_font: 글리프를 붙여넣을 폰트
+        source_font: 한글 글리프를 복사할 폰트 (partial_sets가 있으면 None)
+        coverage: build_hangul_coverage()로 만든 소스 폰트의 색인. 없으면 새로 만듭니다.
+        keep_references: 참조 대상 글리프를 먼저 복사해 복합 글리프를 복합 글리프로 유지할지 여부(--keep-references)
+        partial_sets: (샤드 SFD 경로, 구간의 한글 색인) 리스트
 
-        print(f"[INFO] {copied_count}개의 한글 글리프를 복사했습니다.")
+    Returns:
+        int: 복사한 글리프 수
+    """
+    copied_count = 0
+    try:
+        start_time = time.perf_counter()
+
+        if partial_sets is not None:
+            runs = []
+            for shard_path, shard_coverage in partial_sets:
+                with span("fontforge.open(shard)"):
+                    shard_font = fontforge.open(shard_path)
+                copied_count += _paste_runs(target_font, shard_font, shard_coverage["runs"])
+                shard_font.close()
+                runs.extend(shard_coverage["runs"])
+        else:
+            if coverage is None:
+                coverage = build_hangul_coverage(source_font)
+            runs = coverage["runs"]
+
+            if keep_references:
+                copied_count = _merge_keeping_references(target_font, source_font, coverage)
+            else:
+                copied_count = _paste_runs(target_font, source_font, runs)
+
+        elapsed = time.perf_counter() - start_time
+        print(
+            f"[INFO] {copied_count}개의 한글 글리프를 {len(runs)}개 구간으로 복사했습니다. ({elapsed:.2f}초)"
+        )
 
     except Exception as e:
         print(f"[ERROR] 한글 글리프 병합 중 오류 발생: {e}")
 
+    return copied_count
+
 
 def process_font_file(
     en_font: fontforge.font,
     ko_font: fontforge.font,
     is_nerd_font: bool,
     font_filename: str,
-) -> None:
+    coverage: dict = None,
+    output_dir: str = BUILT_FONTS_PATH,
+    keep_references: bool = False,
+    profile: str = "default",
+    source_date_epoch: int = None,
+    partial_sets: list = None,
+) -> list:
     """
     단일 폰트 파일을 처리하여 한글 글리프를 병합하고 메타데이터를 업데이트합니다.
+    source_date_epoch가 있으면 재현 가능한 빌드로 생성합니다(reproducible).
+    partial_sets가 있으면 한글 폰트 대신 샤드 폰트에서 병합합니다(merge_korean_glyphs()).
+
+    Returns:
+        list: 생성된 출력 파일 경로의 리스트.
     """
     if is_nerd_font:
-        re_encode_for_nerd_font(en_font)
+        with span("re_encode_for_nerd_font"):
+            re_encode_for_nerd_font(en_font)
 
-    merge_korean_glyphs(en_font, ko_font)
+    with span("merge_korean_glyphs"):
+        merge_korean_glyphs(en_font, ko_font, coverage, keep_references, partial_sets)
 
     style = get_font_style(en_font, font_filename)
-    update_font_metadata(en_font, style, old_name=OLD_FONT_NAME, new_name=NEW_FONT_NAME)
+    with span("update_font_metadata"):
+        update_font_metadata(
+            en_font,
+            style,
+            old_name=OLD_FONT_NAME,
+            new_name=NEW_FONT_NAME,
+            reproducible=source_date_epoch is not None,
+        )
+        fix_omega_naming_issue(en_font)
 
-    fix_omega_naming_issue(en_font)
-    generate_font_files(en_font, style)
+    with span("generate_font_files"):
+        return generate_font_files(en_font, style, output_dir, profile, source_date_epoch)
 
 
 def find_font_files(directory: str, weight: str = None) -> list:
     """
-    지정된 디렉터리에서 폰트 파일을 찾습니다.
+    지정된 디렉터리에서 폰트 파일을 이름순으로 찾습니다.
     
     Args:
         directory: 폰트 파일을 찾을 디렉터리
-        weight: 찾을 폰트 웨이트 ("Regular" 또는 "Bold")
+        weight: 파일 이름에 포함된 폰트 웨이트 (예: "Regular", "Bold")
         
     Returns:
         폰트 파일 경로의 리스트
     """
-    if not os.path.exists(directory):
-        return []
-    
-    font_files = []
-    for filename in os.listdir(directory):
-        if filename.lower().endswith(".ttf"):
-            if weight is None:
-                font_files.append(os.path.join(directory, filename))
-            elif weight.lower() in filename.lower():
-                font_files.append(os.path.join(directory, filename))
-    
-    return font_files
+    return match_font_files(directory, f"*{weight}*" if weight else "*")
 
 
-def build_fonts() -> None:
+def _collect_build_tasks(backend: str = "fontforge", skipped: list = None) -> list:
     """
-    메인 폰트 빌드 프로세스입니다.
-    새로운 디렉터리 구조에서 Regular와 Bold 폰트를 로드하고 병합합니다.
+    build_matrix.toml에서 빌드할 폰트 조합 목록을 만듭니다.
+    필요한 한글 또는 영문 폰트 파일이 없는 조합과, 백엔드가 지원하지 않는
+    합성 볼드 조합(fontTools)은 경고를 출력하고 제외합니다.
+
+    Args:
+        backend: 빌드 백엔드 이름
+        skipped: 제외한 조합의 {"style", "reason"}을 추가할 리스트(build.py plan)
+
+    Returns:
+        list: 각 조합의 스타일, 한글/영문 폰트 경로, 너드 폰트 여부, 출력 형식, 덮어쓸 설정 값을 담은 딕셔너리 리스트
     """
-    os.makedirs(BUILT_FONTS_PATH, exist_ok=True)
+    try:
+        matrix = load_build_matrix()
+    except ValueError as e:
+        print(f"[ERROR] 빌드 매트릭스가 올바르지 않습니다: {e}")
+        return []
 
-    # 한글 폰트 로드
-    ko_regular_files = find_font_files(KO_FONT_PATH, "regular")
-    ko_bold_files = find_font_files(KO_FONT_PATH, "bold")
-    
-    if not ko_regular_files:
-        print(f"[ERROR] {KO_FONT_PATH}에서 Regular 한글 폰트를 찾을 수 없습니다.")
-        return
-    
-    # 영문 폰트 로드
-    en_regular_files = find_font_files(EN_FONT_PATH, "regular")
-    en_bold_files = find_font_files(EN_FONT_PATH, "bold")
-    
-    # 너드 폰트 로드
-    nerd_regular_files = find_font_files(EN_NERD_FONT_PATH, "regular")
-    nerd_bold_files = find_font_files(EN_NERD_FONT_PATH, "bold")
-    
-    # 폰트 조합 정의
-    font_combinations = [
-        ("Regular", ko_regular_files, en_regular_files, False),
-        ("Bold", ko_bold_files, en_bold_files, False),
-        ("NerdFont-Regular", ko_regular_files, nerd_regular_files, True),
-        ("NerdFont-Bold", ko_bold_files, nerd_bold_files, True),
-    ]
-    
-    for style, ko_files, en_files, is_nerd_font in font_combinations:
-        if not ko_files:
-            print(f"[WARNING] {style}용 한글 폰트 파일을 찾을 수 없습니다. 건너뜁니다.")
-            continue
-        if not en_files:
-            print(f"[WARNING] {style}용 영문 폰트 파일을 찾을 수 없습니다. 건너뜁니다.")
+    tasks = []
+    for task in build_tasks(matrix, skipped):
+        if task["synthetic_bold"] and backend != "fontforge":
+            print(f"[WARNING] {task['style']}: {backend} 백엔드는 합성 볼드를 지원하지 않습니다. 건너뜁니다.")
+            if skipped is not None:
+                skipped.append({"style": task["style"], "reason": f"{backend} 백엔드는 합성 볼드를 지원하지 않음"})
             continue
-            
-        # 첫 번째 파일 사용 (여러 파일이 있을 경우)
-        ko_font_path = ko_files[0]
-        en_font_path = en_files[0]
-        
-        try:
+        tasks.append(task)
+    return tasks
+
+
+def build_variant(task: dict, use_cache: bool = True, shard_results: tuple = None) -> dict:
+    """
+    단일 폰트 조합을 빌드합니다.
+    FontForge 상태는 프로세스마다 독립적이므로 워커 프로세스에서 그대로 실행할 수 있습니다.
+
+    shard_results가 있으면 빌드 그래프의 샤드 노드가 만든 preprocess_korean_shard() 결과를 구간 순서대로 병합합니다.
+    없고 task의 merge_shards가 1보다 크면 한글 글리프를 그 수의 워커 프로세스로 나누어 직접 처리한 뒤 합칩니다.
+    전처리된 한글 폰트가 이미 캐시에 있으면 나누지 않고 캐시를 사용합니다.
+
+    Args:
+        task: _collect_build_tasks()가 만든 폰트 조합 정보.
+            "output_dir" 항목이 있으면 BUILT_FONTS_PATH 대신 그 디렉터리에 출력하고,
+            "low_memory" 항목이 참이면 한글 글리프만 남긴 중간 폰트를 사용합니다.
+            "synthetic_bold" 항목이 참이면 합성 볼드를 적용한 한글 글리프를 사용합니다.
+            "keep_references" 항목이 참이면 한글 복합 글리프를 복합 글리프로 유지합니다.
+            "profile" 항목이 "web"이면 힌팅과 장치 메트릭 테이블을 빼고 생성합니다.
+        use_cache: 전처리된 한글 폰트 캐시 사용 여부
+
+    Returns:
+        dict: 스타일, 성공 여부, 생성된 TTF 경로, 최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과.
+            나머지 출력 형식은 build_fonts()가 compress_variant_outputs()로 만듭니다.
+    """
+    style = task["style"]
+    ko_font_path = task["ko_font_path"]
+    en_font_path = task["en_font_path"]
+    result = {"style": style, "success": False, "outputs": [], "trace": []}
+    shard_trace = []
+    owned_shards = []
+
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=style)
+    try:
+        with span(style, category="variant"), overridden_settings(task.get("overrides")):
             print(f"[INFO] {style} 폰트 처리 중: {os.path.basename(ko_font_path)} + {os.path.basename(en_font_path)}")
-            
+
             # 한글 폰트 로드 및 처리
-            ko_font = fontforge.open(ko_font_path)
-            scale_font_em_units(ko_font, TARGET_EM)
-            process_hangul_glyphs(ko_font)
-            
+            ko_font = coverage = partial_sets = None
+            shard_count = task.get("merge_shards", 1)
+            if shard_count > 1 and task.get("keep_references", False):
+                print("[WARNING] --keep-references 병합은 샤드로 나누지 않고 한 프로세스에서 실행합니다.")
+                shard_count = 1
+            if shard_count > 1 and use_cache and lookup_cached_font(_preprocessed_cache_key(task)):
+                # 전처리된 한글 폰트가 이미 캐시에 있으면 샤드로 다시 처리하지 않고 캐시를 엽니다.
+                shard_count = 1
+            if shard_results is not None:
+                failed = [str(index + 1) for index, shard in enumerate(shard_results) if not shard["success"]]
+                if failed:
+                    raise RuntimeError(
+                        f"한글 샤드 {', '.join(failed)}/{len(shard_results)}의 처리에 실패했습니다"
+                    )
+                # 샤드 파일과 트레이스는 빌드 그래프를 실행한 쪽에서 정리하고 기록합니다.
+                partial_sets = [(shard["path"], shard["coverage"]) for shard in shard_results]
+            elif shard_count > 1:
+                with span("preprocess_korean_shards", shards=shard_count):
+                    owned_shards, shard_trace = preprocess_korean_shards(
+                        ko_font_path,
+                        task.get("low_memory", False),
+                        task.get("overrides"),
+                        shard_count,
+                        task.get("coverage"),
+                        task.get("synthetic_bold", False),
+                    )
+                partial_sets = [(shard["path"], shard["coverage"]) for shard in owned_shards]
+            else:
+                ko_font, coverage = load_preprocessed_korean_font(
+                    ko_font_path,
+                    use_cache,
+                    task.get("low_memory", False),
+                    task.get("synthetic_bold", False),
+                    task.get("coverage"),
+                )
+
             # 영문 폰트 로드 및 처리
-            en_font = fontforge.open(en_font_path)
-            process_font_file(en_font, ko_font, is_nerd_font, os.path.basename(en_font_path))
-            
+            with span("fontforge.open(en)"):
+                en_font = open_source_font(en_font_path)
+            outputs = process_font_file(
+                en_font,
+                ko_font,
+                task["is_nerd_font"],
+                os.path.basename(en_font_path),
+                coverage,
+                task.get("output_dir", BUILT_FONTS_PATH),
+                task.get("keep_references", False),
+                task.get("profile", "default"),
+                task.get("source_date_epoch"),
+                partial_sets,
+            )
+
             # 폰트 닫기
             en_font.close()
+            if ko_font is not None and not is_resident(ko_font):
+                ko_font.close()
+
+        result["outputs"] = outputs
+        result["success"] = bool(outputs)
+
+    except Exception as e:
+        print(f"[ERROR] {style} 폰트 처리 중 오류 발생: {e}")
+    finally:
+        remove_hangul_shards(owned_shards)
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans() + shard_trace
+    return result
+
+
+def build_variant_from_shards(*shard_results: dict, task: dict, use_cache: bool = True) -> dict:
+    """빌드 그래프에서 샤드 노드의 결과를 입력으로 받아 build_variant()를 실행합니다."""
+    return build_variant(task, use_cache, shard_results=shard_results)
+
+
+def overlay_nerd_glyphs(target_font: fontforge.font, nerd_font: fontforge.font) -> int:
+    """
+    Nerd Font 소스에서 NERD_FONT_RANGES의 아이콘 글리프만 타겟 폰트로 복사합니다.
+    연속 구간마다 한 번씩 범위 선택으로 복사/붙여넣기하며, 타겟에 없는 글리프를 참조하지 않도록
+    소스의 참조는 윤곽선으로 풉니다.
+    한글 범위 밖에서 Nerd Font 소스에 없는 코드포인트(예: fi, fl 합자)는 전체 빌드처럼 매핑을 제거합니다.
+
+    Returns:
+        int: 복사한 글리프 수
+    """
+    codepoints = sorted(
+        glyph.unicode
+        for glyph in nerd_font.glyphs()
+        if glyph.unicode >= 0 and _in_nerd_ranges(glyph.unicode)
+    )
+    runs = find_codepoint_runs(codepoints)
+
+    # BMP 밖의 Material Design Icons를 붙여넣을 수 있도록 전체 유니코드 인코딩을 사용합니다.
+    nerd_font.encoding = "UnicodeFull"
+    target_font.encoding = "UnicodeFull"
+    for start, end in runs:
+        nerd_font.selection.select(("ranges",), start, end)
+        nerd_font.unlinkReferences()
+        nerd_font.copy()
+        target_font.selection.select(("ranges",), start, end)
+        target_font.paste()
+
+    nerd_codepoints = {glyph.unicode for glyph in nerd_font.glyphs() if glyph.unicode >= 0}
+    for glyph in target_font.glyphs():
+        if glyph.unicode >= 0 and glyph.unicode not in nerd_codepoints and not _in_hangul_ranges(glyph.unicode):
+            glyph.unicode = -1
+
+    print(f"[INFO] {len(codepoints)}개의 Nerd Font 아이콘을 {len(runs)}개 구간으로 복사했습니다.")
+    return len(codepoints)
+
+
+def derive_nerd_variant(base_result: dict, task: dict) -> dict:
+    """
+    이미 병합된 기본 조합(예: Regular)의 TTF에 Nerd Font 아이콘 구간만 덮어써서 Nerd Font 조합을 만듭니다(--derive-nerd).
+    한글 폰트 전처리와 병합을 다시 하지 않으므로 한글 글리프는 기본 조합과 같습니다.
+    아이콘 범위 밖의 영문 글리프와 OpenType 테이블은 기본 조합의 것을 사용하고,
+    세로 메트릭과 이름은 Nerd Font 소스에서 가져옵니다.
+
+    Args:
+        base_result: 기본 조합의 build_variant() 결과
+        task: Nerd Font 조합 정보. "derive_from"에 기본 조합의 스타일이 있습니다.
+
+    Returns:
+        dict: build_variant()와 같은 형식의 결과
+    """
+    style = task["style"]
+    en_font_path = task["en_font_path"]
+    result = {"style": style, "success": False, "outputs": [], "trace": []}
+
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=style)
+    try:
+        base_ttf_paths = [path for path in base_result["outputs"] if path.endswith(".ttf")]
+        if not base_result["success"] or not base_ttf_paths:
+            raise RuntimeError(f"기본 조합 {task['derive_from']}의 TTF가 없습니다")
+
+        with span(style, category="variant"), overridden_settings(task.get("overrides")):
+            print(f"[INFO] {style} 폰트 처리 중: {os.path.basename(base_ttf_paths[0])} + {os.path.basename(en_font_path)} 아이콘")
+            with span("fontforge.open(base)"):
+                font = fontforge.open(base_ttf_paths[0])
+            with span("fontforge.open(en)"):
+                nerd_font = open_source_font(en_font_path)
+            with span("overlay_nerd_glyphs"):
+                overlay_nerd_glyphs(font, nerd_font)
+
+            for attribute in NERD_FONT_METRICS:
+                setattr(font, attribute, getattr(nerd_font, attribute))
+            # 이름은 Nerd Font 소스에서 가져와 전체 빌드와 같은 규칙으로 바꿉니다.
+            font.familyname = nerd_font.familyname
+            font.fontname = nerd_font.fontname
+            font.fullname = nerd_font.fullname
+            font.sfnt_names = nerd_font.sfnt_names
+            nerd_font.close()
+
+            with span("re_encode_for_nerd_font"):
+                re_encode_for_nerd_font(font)
+            font_style = get_font_style(font, os.path.basename(en_font_path))
+            with span("update_font_metadata"):
+                update_font_metadata(
+                    font,
+                    font_style,
+                    old_name=OLD_FONT_NAME,
+                    new_name=NEW_FONT_NAME,
+                    reproducible=task.get("source_date_epoch") is not None,
+                )
+            with span("generate_font_files"):
+                outputs = generate_font_files(
+                    font,
+                    font_style,
+                    task.get("output_dir", BUILT_FONTS_PATH),
+                    task.get("profile", "default"),
+                    task.get("source_date_epoch"),
+                )
+            font.close()
+
+        result["outputs"] = outputs
+        result["success"] = bool(outputs)
+
+    except Exception as e:
+        print(f"[ERROR] {style} 폰트 처리 중 오류 발생: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def compress_variant_outputs(result: dict, formats: tuple = OUTPUT_FORMATS) -> dict:
+    """
+    build_variant() 결과의 TTF에서 나머지 출력 형식 파일을 만들어 결과에 추가합니다.
+    다음 조합을 빌드하는 동안 스레드에서 실행할 수 있도록 결과의 복사본을 반환합니다.
+    """
+    result = dict(result, outputs=list(result["outputs"]), trace=list(result["trace"]))
+    ttf_paths = [path for path in result["outputs"] if path.endswith(".ttf")]
+    if not result["success"] or not ttf_paths:
+        return result
+
+    result["outputs"].extend(
+        compress_font_file(
+            ttf_paths[0],
+            tuple(ext for ext in formats if ext != "ttf"),
+            events=result["trace"],
+            variant=result["style"],
+        )
+    )
+    result["success"] = len(result["outputs"]) == len(formats)
+    return result
+
+
+def variant_fingerprint(
+    task: dict, hashes: dict = None, backend: str = "fontforge"
+) -> dict:
+    """
+    폰트 조합의 입력 정보(입력 파일 해시, 설정 값, 스크립트 버전)를 계산합니다.
+    설정 값은 조합의 overrides와 출력 형식을 적용한 값입니다.
+
+    Args:
+        task: 폰트 조합 정보
+        hashes: 파일 경로별 해시 캐시. 같은 파일을 여러 번 해시하지 않도록 공유합니다.
+        backend: 빌드 백엔드 이름
+    """
+    if hashes is None:
+        hashes = {}
+    script_paths = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        for filename in PIPELINE_SCRIPTS
+    ]
+    for path in [task["en_font_path"], task["ko_font_path"]] + script_paths:
+        if path not in hashes:
+            hashes[path] = file_sha256(path)
+
+    with overridden_settings(task.get("overrides")):
+        constants = build_constants(backend)
+        if task.get("synthetic_bold"):
+            constants["SYNTHETIC_BOLD_STROKE"] = SYNTHETIC_BOLD_STROKE
+    constants["OUTPUT_FORMATS"] = list(task.get("formats", OUTPUT_FORMATS))
+    if task.get("keep_references"):
+        constants["KEEP_REFERENCES"] = True
+    if task.get("profile", "default") != "default":
+        constants["PROFILE"] = task["profile"]
+    if task.get("source_date_epoch") is not None:
+        constants["SOURCE_DATE_EPOCH"] = task["source_date_epoch"]
+    if task.get("derive_from"):
+        base_en_font_path = task["base_en_font_path"]
+        if base_en_font_path not in hashes:
+            hashes[base_en_font_path] = file_sha256(base_en_font_path)
+        constants["DERIVE_NERD"] = json.loads(
+            json.dumps(
+                {
+                    "base": task["derive_from"],
+                    "base_en_hash": hashes[base_en_font_path],
+                    "ranges": NERD_FONT_RANGES,
+                }
+            )
+        )
+
+    return {
+        "en_font": os.path.basename(task["en_font_path"]),
+        "ko_font": os.path.basename(task["ko_font_path"]),
+        "en_hash": hashes[task["en_font_path"]],
+        "ko_hash": hashes[task["ko_font_path"]],
+        "constants": constants,
+        "script_version": "-".join(hashes[path][:16] for path in script_paths),
+    }
+
+
+def preprocess_korean_font(
+    ko_font_path: str, hangul_only: bool = False, overrides: dict = None, plan_coverage: dict = None
+) -> dict:
+    """
+    한글 폰트를 전처리해 캐시에 저장합니다. 같은 한글 폰트와 설정을 쓰는 여러 조합이
+    각자 전처리하지 않도록 빌드 그래프에서 조합보다 먼저 한 번 실행합니다.
+
+    Returns:
+        dict: 성공 여부, 최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과
+    """
+    result = {"success": False, "trace": []}
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant="(한글 전처리)")
+    try:
+        with overridden_settings(overrides):
+            ko_font = load_preprocessed_korean_font(
+                ko_font_path, hangul_only=hangul_only, plan_coverage=plan_coverage
+            )[0]
+        if not is_resident(ko_font):
             ko_font.close()
-            
-        except Exception as e:
-            print(f"[ERROR] {style} 폰트 처리 중 오류 발생: {e}")
+        result["success"] = True
+    except Exception as e:
+        print(f"[WARNING] 한글 폰트 캐시 준비 실패 ({os.path.basename(ko_font_path)}): {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def _synthetic_bold_shard_path(bold_key: str, index: int) -> str:
+    """합성 볼드 샤드 결과를 저장할 임시 파일 경로입니다. cache prune이 남은 파일을 지웁니다."""
+    return os.path.join(CACHE_PATH, f"{bold_key}.shard{index}.tmp.sfd")
+
+
+def embolden_korean_shard(
+    ko_font_path: str, hangul_only: bool, overrides: dict, index: int, shard_count: int
+) -> dict:
+    """
+    캐시된 전처리 한글 폰트에서 합성 볼드 대상 글리프를 shard_count개로 나눈 구간 중
+    index번째 구간만 두껍게 만들어, 그 글리프만 남긴 SFD로 저장합니다.
+
+    Returns:
+        dict: 성공 여부, 최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과
+    """
+    result = {"success": False, "trace": []}
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=f"(합성 볼드 {index + 1}/{shard_count})")
+    try:
+        with overridden_settings(overrides):
+            key = korean_cache_key(ko_font_path, hangul_only)
+            bold_key = korean_cache_key(ko_font_path, hangul_only, synthetic_bold=True)
+            cached_path = lookup_cached_font(key)
+            if cached_path is None:
+                raise FileNotFoundError("전처리된 한글 폰트 캐시가 없습니다")
+            coverage = coverage_from_json(read_cache_metadata(key)["coverage"])
+
+            with span("fontforge.open(cache)"):
+                font = fontforge.open(cached_path)
+            targets = synthetic_bold_targets(font, coverage)
+            shard_size = -(-len(targets) // shard_count)
+            names = targets[index * shard_size : (index + 1) * shard_size]
+            with span("embolden_glyphs", glyphs=len(names)):
+                embolden_glyphs(font, names)
+
+            # 샤드를 합치는 쪽에서 읽는 시간을 줄이도록 두껍게 만든 글리프만 남깁니다.
+            keep = set(names)
+            for name in [glyph.glyphname for glyph in font.glyphs() if glyph.glyphname not in keep]:
+                font.removeGlyph(name)
+            with span("save(shard)"):
+                font.save(_synthetic_bold_shard_path(bold_key, index))
+            font.close()
+        result["success"] = True
+    except Exception as e:
+        print(f"[ERROR] 합성 볼드 샤드 {index + 1}/{shard_count} 처리 실패: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def combine_synthetic_bold_shards(
+    ko_font_path: str, hangul_only: bool, overrides: dict, shard_count: int
+) -> dict:
+    """
+    embolden_korean_shard()가 만든 샤드의 글리프를 전처리된 한글 폰트에 옮겨
+    합성 볼드 한글 폰트로 캐시에 저장합니다. 샤드 파일은 성공 여부와 관계없이 지웁니다.
+
+    Returns:
+        dict: 성공 여부, 최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과
+    """
+    result = {"success": False, "trace": []}
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant="(합성 볼드)")
+    with overridden_settings(overrides):
+        key = korean_cache_key(ko_font_path, hangul_only)
+        bold_key = korean_cache_key(ko_font_path, hangul_only, synthetic_bold=True)
+    shard_paths = [_synthetic_bold_shard_path(bold_key, index) for index in range(shard_count)]
+    try:
+        missing = [path for path in shard_paths if not os.path.exists(path)]
+        if missing:
+            raise FileNotFoundError(f"합성 볼드 샤드가 없습니다: {', '.join(missing)}")
+        metadata = read_cache_metadata(key)
+
+        with span("fontforge.open(cache)"):
+            font = fontforge.open(lookup_cached_font(key))
+        emboldened = 0
+        with span("combine_synthetic_bold_shards"):
+            for shard_path in shard_paths:
+                shard = fontforge.open(shard_path)
+                for glyph in shard.glyphs():
+                    target = font[glyph.glyphname]
+                    target.references = ()
+                    target.foreground = glyph.foreground
+                    target.width = glyph.width
+                    emboldened += 1
+                shard.close()
+        print(f"[INFO] 한글 글리프 {emboldened}개에 합성 볼드를 적용했습니다. ({shard_count}개 샤드)")
+
+        with overridden_settings(overrides):
+            metadata = dict(metadata, params=korean_preprocess_params(hangul_only, synthetic_bold=True))
+        with span("store_cached_font"):
+            store_cached_font(font, bold_key, metadata)
+        font.close()
+        result["success"] = True
+    except Exception as e:
+        print(f"[WARNING] 합성 볼드 결과를 캐시에 저장하지 못했습니다. 조합마다 직접 적용합니다: {e}")
+    finally:
+        for path in shard_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def _preprocessed_cache_key(task: dict) -> str:
+    """조합의 전처리된 한글 폰트(합성 볼드 조합이면 합성 볼드 결과)의 캐시 키입니다."""
+    with overridden_settings(task.get("overrides")):
+        return korean_cache_key(
+            task["ko_font_path"], task.get("low_memory", False), task.get("synthetic_bold", False)
+        )
+
+
+def _hangul_shard_path(key: str, index: int, shard_count: int) -> str:
+    """한글 샤드 결과를 저장할 임시 파일 경로입니다. cache prune이 남은 파일을 지웁니다."""
+    return os.path.join(CACHE_PATH, f"{key}.hangul{index + 1}of{shard_count}.tmp.sfd")
+
+
+def preprocess_korean_shard(
+    ko_font_path: str,
+    hangul_only: bool,
+    overrides: dict,
+    index: int,
+    shard_count: int,
+    plan_coverage: dict = None,
+    synthetic_bold: bool = False,
+) -> dict:
+    """
+    한글 폰트를 따로 열어 한글 색인을 shard_count개로 나눈 구간 중 index번째 구간의 글리프와 그 참조 대상만 남기고,
+    Em 스케일링과 베어링 조정(synthetic_bold이면 합성 볼드까지)을 한 뒤 SFD로 저장합니다. 워커 프로세스에서 실행됩니다.
+    fonttools_backend.build_hangul_shard()의 FontForge 버전이며, 글리프마다 전체 폰트를 전처리할 때와 같은 결과가 됩니다.
+
+    Returns:
+        dict: 성공 여부, 샤드 SFD 경로(path), 구간의 한글 색인(coverage), 최대 RSS(MB), 단계별 트레이스 이벤트를 담은 결과
+    """
+    result = {"success": False, "path": None, "coverage": None, "trace": []}
+    reset_peak_rss()
+    reset_spans()
+    set_trace_context(variant=f"(한글 샤드 {index + 1}/{shard_count})")
+    try:
+        with overridden_settings(overrides):
+            key = korean_cache_key(ko_font_path, hangul_only, synthetic_bold)
+            with span("fontforge.open(ko)"):
+                font = fontforge.open(ko_font_path)
+            if plan_coverage is not None:
+                glyph_names = {glyph.originalgid: glyph.glyphname for glyph in font.glyphs()}
+                coverage = coverage_from_plan(plan_coverage, glyph_names)
+            else:
+                with span("build_hangul_coverage"):
+                    coverage = build_hangul_coverage(font)
+            shard = split_coverage(coverage, shard_count)[index]
+
+            # 이 구간의 글리프와 참조 대상만 남겨 스케일링합니다. 나머지 글리프는 병합하지 않습니다.
+            with span("extract_hangul_glyphs"):
+                extract_hangul_glyphs(font, shard)
+            with span("scale_font_em_units"):
+                scale_font_em_units(font, TARGET_EM)
+            with span("process_hangul_glyphs"):
+                process_hangul_glyphs(font, shard)
+            if synthetic_bold:
+                with span("embolden_glyphs"):
+                    embolden_glyphs(font, synthetic_bold_targets(font, shard))
+
+            path = _hangul_shard_path(key, index, shard_count)
+            os.makedirs(CACHE_PATH, exist_ok=True)
+            with span("save(shard)"):
+                font.save(path)
+            font.close()
+        result.update(success=True, path=path, coverage=shard)
+    except Exception as e:
+        print(f"[ERROR] 한글 샤드 {index + 1}/{shard_count} 처리 실패: {e}")
+
+    result["peak_rss_mb"] = round(get_peak_rss_mb(), 1)
+    result["trace"] = collect_spans()
+    return result
+
+
+def preprocess_korean_shards(
+    ko_font_path: str,
+    hangul_only: bool,
+    overrides: dict,
+    shard_count: int,
+    plan_coverage: dict = None,
+    synthetic_bold: bool = False,
+) -> tuple:
+    """
+    preprocess_korean_shard()를 shard_count개의 워커 프로세스에서 실행해 샤드 결과를 구간 순서대로 모읍니다.
+    샤드 파일은 호출한 쪽에서 remove_hangul_shards()로 지웁니다.
+
+    Returns:
+        tuple: (샤드 결과 리스트, 워커의 트레이스 이벤트 리스트)
+
+    Raises:
+        RuntimeError: 처리에 실패한 샤드가 있을 때 (만들어진 샤드 파일은 지웁니다)
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=shard_count) as executor:
+        futures = [
+            executor.submit(
+                preprocess_korean_shard,
+                ko_font_path,
+                hangul_only,
+                overrides,
+                index,
+                shard_count,
+                plan_coverage,
+                synthetic_bold,
+            )
+            for index in range(shard_count)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    failed = [str(index + 1) for index, result in enumerate(results) if not result["success"]]
+    if failed:
+        remove_hangul_shards(results)
+        raise RuntimeError(f"한글 샤드 {', '.join(failed)}/{shard_count}의 처리에 실패했습니다")
+
+    glyph_count = sum(len(result["coverage"]["codepoints"]) for result in results)
+    peak = max(result["peak_rss_mb"] for result in results)
+    print(
+        f"[INFO] 한글 글리프 {glyph_count}개를 {shard_count}개 샤드로 나누어 처리했습니다. "
+        f"({elapsed:.2f}초, 샤드별 최대 RSS {peak:.1f}MB)"
+    )
+    return results, [event for result in results for event in result["trace"]]
+
+
+def remove_hangul_shards(shard_results: list) -> None:
+    """preprocess_korean_shard()가 저장한 샤드 파일을 지웁니다."""
+    for shard in shard_results:
+        path = shard.get("path")
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def _failed_result(style: str) -> dict:
+    """워커 프로세스가 결과를 돌려주지 못한 조합의 결과입니다."""
+    return {"style": style, "success": False, "outputs": [], "trace": [], "peak_rss_mb": None}
+
+
+def _preprocess_nodes(tasks: list, shards: int) -> tuple:
+    """
+    조합보다 먼저 실행할 한글 폰트 전처리 노드를 만듭니다.
+
+    - 일반 전처리: 캐시 키가 같은 조합이 둘 이상이거나 합성 볼드에 필요하고, 아직 캐시에 없을 때
+    - 합성 볼드: 아직 캐시에 없을 때 shards개의 샤드 노드와 이를 합치는 노드
+
+    Returns:
+        tuple: (노드 리스트, 스타일별 조합이 기다릴 노드 id)
+    """
+    keys = {}
+    users = {}
+    for task in tasks:
+        with overridden_settings(task.get("overrides")):
+            hangul_only = task.get("low_memory", False)
+            key = korean_cache_key(task["ko_font_path"], hangul_only)
+            bold_key = (
+                korean_cache_key(task["ko_font_path"], hangul_only, synthetic_bold=True)
+                if task.get("synthetic_bold")
+                else None
+            )
+        keys[task["style"]] = (key, bold_key)
+        users.setdefault(bold_key or key, []).append(task)
+
+    # 아직 캐시에 없는 합성 볼드 결과와, 이를 만들 때 필요한 일반 전처리 결과입니다.
+    bold_pending = {
+        keys[task["style"]][1]: task
+        for task in tasks
+        if task.get("synthetic_bold") and not lookup_cached_font(keys[task["style"]][1])
+    }
+    bold_sources = {keys[task["style"]][0] for task in bold_pending.values()}
+
+    nodes = []
+    waits_for = {}
+    regular_ids = {}
+    for task in tasks:
+        key = keys[task["style"]][0]
+        if key in regular_ids or lookup_cached_font(key):
             continue
+        if key not in bold_sources and len(users.get(key, [])) < 2:
+            continue
+        regular_ids[key] = f"preprocess:{key[:12]}"
+        nodes.append(
+            {
+                "id": regular_ids[key],
+                "deps": [],
+                "func": preprocess_korean_font,
+                "args": (
+                    task["ko_font_path"],
+                    task.get("low_memory", False),
+                    task.get("overrides"),
+                    task.get("coverage"),
+                ),
+                "pool": "process",
+                "fallback": {"success": False, "trace": []},
+            }
+        )
+
+    for bold_key, task in bold_pending.items():
+        key = keys[task["style"]][0]
+        args = (task["ko_font_path"], task.get("low_memory", False), task.get("overrides"))
+        shard_ids = [f"preprocess:{bold_key[:12]}:shard{index}" for index in range(shards)]
+        for index, shard_id in enumerate(shard_ids):
+            nodes.append(
+                {
+                    "id": shard_id,
+                    "deps": [regular_ids[key]] if key in regular_ids else [],
+                    "func": embolden_korean_shard,
+                    "args": args + (index, shards),
+                    "pool": "process",
+                    "fallback": {"success": False, "trace": []},
+                }
+            )
+        nodes.append(
+            {
+                "id": f"preprocess:{bold_key[:12]}",
+                "deps": shard_ids,
+                "func": combine_synthetic_bold_shards,
+                "args": args + (shards,),
+                "pool": "process",
+                "fallback": {"success": False, "trace": []},
+            }
+        )
+
+    node_ids = {node["id"] for node in nodes}
+    for style, (key, bold_key) in keys.items():
+        node_id = f"preprocess:{(bold_key or key)[:12]}"
+        if node_id in node_ids:
+            waits_for[style] = node_id
+    return nodes, waits_for
+
+
+def _hangul_shard_nodes(tasks: list, backend: str = "fontforge", use_cache: bool = True) -> tuple:
+    """
+    merge_shards가 1보다 큰 조합의 한글 글리프 샤드 노드를 만듭니다.
+    fontTools 백엔드는 build_hangul_shard()가 글리프 데이터를, FontForge 백엔드는 preprocess_korean_shard()가
+    샤드 SFD 경로를 돌려줍니다. FontForge 백엔드에서 전처리된 한글 폰트가 이미 캐시에 있는 조합은 나누지 않습니다.
+    한글 폰트와 설정이 같은 조합(예: Regular와 NerdFont-Regular)은 같은 샤드 노드의 결과를 병합합니다.
+
+    Returns:
+        tuple: (노드 리스트, 스타일별 병합할 샤드 노드 id 리스트)
+    """
+    if backend == "fonttools":
+        from fonttools_backend import build_hangul_shard as shard_builder
+    else:
+        shard_builder = preprocess_korean_shard
+
+    nodes = []
+    shard_ids = {}
+    node_ids = {}
+    for task in tasks:
+        shard_count = task.get("merge_shards", 1)
+        if shard_count < 2 or task.get("keep_references", False):
+            continue
+        key = _preprocessed_cache_key(task)
+        if backend == "fontforge" and use_cache and lookup_cached_font(key):
+            continue
+        key = (key, shard_count)
+        if key not in node_ids:
+            node_ids[key] = [
+                f"preprocess:{key[0][:12]}:hangul{index}" for index in range(shard_count)
+            ]
+            for index, node_id in enumerate(node_ids[key]):
+                node = {
+                    "id": node_id,
+                    "deps": [],
+                    "func": shard_builder,
+                    "args": (
+                        task["ko_font_path"],
+                        task.get("low_memory", False),
+                        task.get("overrides"),
+                        index,
+                        shard_count,
+                        task.get("coverage"),
+                    ),
+                    "pool": "process",
+                    "fallback": {"success": False, "glyphs": [], "trace": []},
+                }
+                if backend == "fontforge":
+                    node["kwargs"] = {"synthetic_bold": task.get("synthetic_bold", False)}
+                    node["fallback"] = {"success": False, "path": None, "trace": []}
+                nodes.append(node)
+        shard_ids[task["style"]] = node_ids[key]
+    return nodes, shard_ids
+
+
+def _derive_nerd_tasks(tasks: list) -> list:
+    """
+    --derive-nerd: nerd_base가 지정된 Nerd Font 조합을 기본 조합에서 파생하도록 표시합니다("derive_from").
+    한글 폰트, 합성 볼드 여부, 덮어쓸 설정 값이 기본 조합과 같아야 한글 글리프가 같으므로,
+    다르거나 기본 조합을 빌드할 수 없으면 경고하고 전체 파이프라인으로 빌드합니다.
+    """
+    by_style = {task["style"]: task for task in tasks}
+    result = []
+    for task in tasks:
+        base_style = task.get("nerd_base")
+        if base_style is None:
+            result.append(task)
+            continue
+
+        base = by_style.get(base_style)
+        if base is None or any(
+            base[key] != task[key] for key in ("ko_font_path", "synthetic_bold", "overrides")
+        ):
+            print(
+                f"[WARNING] {task['style']}: 기본 조합 {base_style}와(과) 한글 폰트나 설정이 달라 "
+                "전체 파이프라인으로 빌드합니다."
+            )
+            result.append(task)
+            continue
+
+        result.append(dict(task, derive_from=base_style, base_en_font_path=base["en_font_path"]))
+    return result
+
+
+def plan_build_graph(
+    tasks: list,
+    variant_builder,
+    use_cache: bool = True,
+    backend: str = "fontforge",
+    shards: int = 1,
+) -> list:
+    """
+    폰트 조합 목록을 빌드 그래프(build_graph.run_build_graph()의 노드 리스트)로 바꿉니다.
+
+    한글 폰트 전처리 -> (합성 볼드 샤드 -> 합치기) -> 조합 빌드(병합, 메타데이터, TTF 생성) -> 압축 순서로 의존합니다.
+    병합부터 TTF 생성까지는 한 프로세스의 FontForge 폰트 객체를 이어서 쓰므로 하나의 노드입니다.
+    전처리 결과는 캐시로 전달되므로, 캐시를 사용할 수 없는 경우(--no-cache, fontTools 백엔드)에는
+    각 조합이 직접 전처리(와 합성 볼드)를 합니다.
+    merge_shards가 1보다 큰 조합은 한글 글리프 샤드 노드(_hangul_shard_nodes())의 결과를 입력으로 받아
+    병합합니다. 샤드도 빌드 그래프의 노드이므로 워커 프로세스 수는 jobs를 넘지 않습니다.
+
+    기본 조합에서 파생하는 Nerd Font 조합("derive_from")은 전처리 없이 기본 조합의 노드에 의존합니다.
+    기본 조합을 이번에 다시 빌드하지 않으면 조합의 "base_outputs"(매니페스트에 기록된 출력)를 사용합니다.
+
+    Args:
+        shards: 합성 볼드를 나누어 실행할 샤드 수
+    """
+    if backend == "fonttools":
+        from fonttools_backend import build_variant_from_shards as shard_variant_builder
+        from fonttools_backend import derive_nerd_variant as nerd_builder
+    else:
+        shard_variant_builder = build_variant_from_shards
+        nerd_builder = derive_nerd_variant
+
+    full_tasks = [task for task in tasks if not task.get("derive_from")]
+    nodes, hangul_shards = _hangul_shard_nodes(full_tasks, backend, use_cache)
+    waits_for = {}
+    if use_cache and backend == "fontforge":
+        # 한글 샤드로 처리하는 조합은 전처리 결과를 캐시로 전달받지 않습니다.
+        preprocess_nodes, waits_for = _preprocess_nodes(
+            [task for task in full_tasks if task["style"] not in hangul_shards], max(1, shards)
+        )
+        nodes = preprocess_nodes + nodes
+
+    styles = {task["style"] for task in tasks}
+    for task in tasks:
+        style = task["style"]
+        variant_id = f"variant:{style}"
+        base_style = task.get("derive_from")
+        if style in hangul_shards:
+            node = {
+                "deps": hangul_shards[style],
+                "inputs": hangul_shards[style],
+                "func": shard_variant_builder,
+                "kwargs": {"task": task, "use_cache": use_cache},
+            }
+        elif base_style is None:
+            node = {
+                "deps": [waits_for[style]] if style in waits_for else [],
+                "func": variant_builder,
+                "args": (task, use_cache),
+            }
+        elif base_style in styles:
+            node = {
+                "deps": [f"variant:{base_style}"],
+                "inputs": [f"variant:{base_style}"],
+                "func": nerd_builder,
+                "args": (task,),
+            }
+        else:
+            base_result = {"style": base_style, "success": True, "outputs": task["base_outputs"]}
+            node = {"deps": [], "func": nerd_builder, "args": (base_result, task)}
+        nodes.append(
+            dict(node, id=variant_id, pool="process", fallback=_failed_result(style))
+        )
+        nodes.append(
+            {
+                "id": f"compress:{style}",
+                "deps": [variant_id],
+                "inputs": [variant_id],
+                "func": compress_variant_outputs,
+                "args": (task.get("formats", OUTPUT_FORMATS),),
+                "pool": "thread",
+                "fallback": _failed_result(style),
+            }
+        )
+
+    return nodes
+
+
+def _check_size_budgets(style: str, outputs: list, size_budgets: dict) -> bool:
+    """조합의 출력 파일별 테이블 크기를 출력하고, 모든 파일이 크기 한도 안에 있는지 반환합니다."""
+    print(f"[INFO] {style} 출력 파일 크기:")
+    errors = report_output_sizes(outputs, size_budgets)
+    for error in errors:
+        print(f"[ERROR] {style}: {error}")
+    return not errors
+
+
+def _write_collections(tasks: list, manifest: dict) -> bool:
+    """
+    매니페스트에 기록된 조합의 TTF를 nerd_base 묶음마다 TTC로 묶습니다(font_collection.build_font_collections()).
+
+    Returns:
+        bool: 모든 묶음의 TTC를 만들었는지 여부
+    """
+    try:
+        from font_collection import build_font_collections, collection_groups
+    except ImportError:
+        print("[ERROR] fontTools 모듈을 찾을 수 없어 TTC를 만들 수 없습니다.")
+        return False
+
+    groups = collection_groups(tasks)
+    if not groups:
+        print("[WARNING] nerd_base로 이어진 조합이 없어 만들 TTC가 없습니다.")
+        return True
+    outputs = {style: entry["outputs"] for style, entry in manifest["variants"].items()}
+    return build_font_collections(groups, outputs)
+
+
+def build_fonts(
+    jobs: int = 1,
+    use_cache: bool = True,
+    force: bool = False,
+    dry_run: bool = False,
+    trace_path: str = None,
+    backend: str = "fontforge",
+    low_memory: bool = False,
+    max_rss_mb: float = None,
+    derive_nerd: bool = False,
+    keep_references: bool = False,
+    profile: str = "default",
+    size_budgets: dict = None,
+    merge_shards: int = 1,
+    tasks: list = None,
+    reproducible: bool = False,
+    collections: bool = False,
+) -> bool:
+    """
+    메인 폰트 빌드 프로세스입니다.
+    build_matrix.toml의 폰트 조합을 빌드 그래프(plan_build_graph())로 바꾸어 실행합니다.
+    빌드 매니페스트와 입력 정보가 같은 조합은 건너뜁니다.
+
+    Args:
+        jobs: 동시에 실행할 전처리/조합 노드의 수. 1보다 크면 노드마다 별도의 워커 프로세스를 사용합니다.
+        use_cache: 전처리된 한글 폰트 캐시 사용 여부
+        force: 매니페스트와 관계없이 모든 조합을 다시 빌드할지 여부
+        dry_run: 빌드하지 않고 다시 빌드할 조합과 그 이유만 출력할지 여부
+        trace_path: 단계별 시간과 메모리 사용량을 Chrome trace-event 형식으로 저장할 경로
+        backend: 빌드 백엔드. "fontforge" 또는 FontForge 없이 동작하는 "fonttools"
+        low_memory: 한글 글리프만 남긴 중간 폰트를 사용하고, 전체 한글 폰트는 영문 폰트를 열기 전에 닫을지 여부
+        max_rss_mb: 워커 프로세스를 포함한 메모리 사용량 한도(MB). 한도에 가까우면 동시 빌드 수를 줄입니다.
+        derive_nerd: nerd_base가 지정된 Nerd Font 조합을 기본 조합의 결과에 Nerd Font 아이콘만 덮어써서 만들지 여부
+        keep_references: 한글 복합 글리프를 윤곽선으로 풀지 않고 복합 글리프로 병합할지 여부
+        profile: 출력 프로필. "web"이면 힌팅과 장치 메트릭 테이블을 빼고 생성합니다(font_profile.PROFILES).
+        size_budgets: 확장자별 출력 파일 크기 한도(바이트). 지정하거나 profile이 "web"이면
+            모든 출력 파일의 테이블별 크기를 출력하고, 한도를 넘는 조합은 실패로 처리합니다.
+            profile이 "web"이고 지정하지 않으면 config.SIZE_BUDGETS를 사용합니다.
+        merge_shards: 1보다 크면 한글 글리프를 그 수의 코드포인트 구간으로 나누어 빌드 그래프의 샤드 노드에서
+            처리한 뒤 조합마다 합칩니다. FontForge 백엔드에서는 샤드마다 한글 폰트를 따로 열어 스케일링과 베어링
+            조정을 하고 그 구간의 글리프만 SFD로 저장하며, 전처리된 한글 폰트가 캐시에 있으면 나누지 않습니다. 샤드 노드도 jobs개의
+            워커 프로세스에서 실행되며, 결과 폰트는 나누지 않은 빌드와 같습니다.
+        tasks: 빌드 계획(build_plan.load_build_plan())에서 가져온 조합 목록. None이면 build_matrix.toml에서 만듭니다.
+        reproducible: 같은 입력이면 바이트 단위로 같은 폰트를 만들지 여부. 출력 폰트의 시각을
+            SOURCE_DATE_EPOCH(없으면 소스 폰트의 수정 시각)로 고정합니다(reproducible.py).
+        collections: nerd_base로 이어진 조합(예: Regular와 NerdFont-Regular)의 TTF를 글리프 데이터를 공유하는
+            TTC 하나로 묶고 따로 저장했을 때보다 줄어든 크기를 출력할지 여부(font_collection.py)
+
+    Returns:
+        bool: 모든 조합의 빌드가 성공했고 모든 출력 파일이 크기 한도 안에 있는지 여부
+    """
+    if backend == "fonttools":
+        from fonttools_backend import build_variant as variant_builder
+    elif fontforge is None:
+        print("[ERROR] FontForge 모듈을 찾을 수 없습니다. --backend fonttools를 사용하거나 FontForge를 설치하세요.")
+        return False
+    else:
+        variant_builder = build_variant
+
+    os.makedirs(BUILT_FONTS_PATH, exist_ok=True)
+
+    if tasks is None:
+        tasks = _collect_build_tasks(backend)
+    if not tasks:
+        return False
+    if derive_nerd:
+        tasks = _derive_nerd_tasks(tasks)
+    if keep_references:
+        tasks = [dict(task, keep_references=True) for task in tasks]
+    if profile != "default":
+        tasks = [dict(task, profile=profile) for task in tasks]
+    if merge_shards > 1:
+        if merge_shards > jobs:
+            print(f"[WARNING] 워커 프로세스가 {jobs}개이므로 한글 샤드 {merge_shards}개 중 최대 {jobs}개만 동시에 실행됩니다.")
+        tasks = [dict(task, merge_shards=merge_shards) for task in tasks]
+    if reproducible:
+        tasks = [
+            dict(
+                task,
+                source_date_epoch=source_date_epoch(
+                    [task["en_font_path"], task["ko_font_path"]]
+                    + ([task["base_en_font_path"]] if task.get("derive_from") else [])
+                ),
+            )
+            for task in tasks
+        ]
+    if size_budgets is None and profile == "web":
+        size_budgets = SIZE_BUDGETS
+
+    manifest = load_manifest()
+    hashes = {}
+    fingerprints = {}
+    pending = []
+    for task in tasks:
+        style = task["style"]
+        fingerprints[style] = variant_fingerprint(task, hashes, backend)
+        if force:
+            reasons = ["--force 옵션이 지정되었습니다"]
+        else:
+            reasons = get_rebuild_reasons(manifest, style, fingerprints[style])
+
+        if reasons:
+            pending.append(dict(task, low_memory=low_memory))
+            print(f"[INFO] {style}: 다시 빌드합니다.")
+            for reason in reasons:
+                print(f"  - {reason}")
+        else:
+            print(f"[INFO] {style}: 입력이 변경되지 않아 건너뜁니다.")
+
+    if dry_run:
+        return True
+
+    pending_styles = {task["style"] for task in pending}
+    # 건너뛴 조합의 출력 파일도 검사해 크기 한도만 바꾼 경우에도 결과가 같습니다.
+    within_budget = True
+    if size_budgets is not None:
+        for task in tasks:
+            if task["style"] not in pending_styles:
+                outputs = manifest["variants"][task["style"]]["outputs"]
+                within_budget &= _check_size_budgets(task["style"], outputs, size_budgets)
+    if not pending:
+        if collections:
+            within_budget = _write_collections(tasks, manifest) and within_budget
+        return within_budget
+
+    for task in pending:
+        base_style = task.get("derive_from")
+        if base_style and base_style not in pending_styles:
+            task["base_outputs"] = manifest["variants"][base_style]["outputs"]
+
+    reset_spans()
+    set_trace_context(variant="(준비)")
+    nodes = plan_build_graph(pending, variant_builder, use_cache, backend, shards=jobs)
+    preprocess_ids = [node["id"] for node in nodes if node["id"].startswith("preprocess:")]
+    shard_count = sum(1 for node_id in preprocess_ids if ":shard" in node_id)
+    hangul_shard_count = sum(1 for node_id in preprocess_ids if ":hangul" in node_id)
+    workers = min(jobs, max(len(pending), shard_count, hangul_shard_count))
+    if workers > 1:
+        print(f"[INFO] {len(pending)}개 조합을 최대 {workers}개 워커 프로세스로 빌드합니다.")
+    if len(preprocess_ids) > shard_count + hangul_shard_count:
+        print(f"[INFO] 한글 폰트 전처리 {len(preprocess_ids) - shard_count - hangul_shard_count}개를 한 번씩만 실행해 조합들이 공유합니다.")
+    if shard_count:
+        print(f"[INFO] 합성 볼드를 {shard_count}개 샤드로 나누어 적용합니다.")
+    if hangul_shard_count:
+        print(f"[INFO] 한글 글리프를 샤드 {hangul_shard_count}개로 나누어 처리하고, 한글 폰트가 같은 조합들이 공유합니다.")
+    derived = [task["style"] for task in pending if task.get("derive_from")]
+    if derived:
+        print(f"[INFO] {', '.join(derived)}: 기본 조합의 결과에 Nerd Font 아이콘만 덮어써서 만듭니다.")
+    # TTF가 생성된 조합은 다음 조합을 빌드하는 동안 스레드에서 WOFF2 등으로 압축합니다.
+    graph_results = run_build_graph(nodes, workers, max_rss_mb)
+    results = [graph_results[f"compress:{task['style']}"] for task in pending]
+    # FontForge 한글 샤드 노드가 저장한 SFD는 모든 조합이 병합한 뒤에 지웁니다.
+    remove_hangul_shards([graph_results[node_id] for node_id in preprocess_ids if ":hangul" in node_id])
+
+    if size_budgets is not None:
+        for result in results:
+            if result["success"] and not _check_size_budgets(
+                result["style"], result["outputs"], size_budgets
+            ):
+                # 매니페스트에 기록하지 않아 다음 빌드에서도 다시 빌드하고 검사합니다.
+                result["success"] = False
+
+    print("[INFO] 빌드 결과:")
+    for result in results:
+        style = result["style"]
+        if result["success"]:
+            record_variant(manifest, style, fingerprints[style], result["outputs"])
+        else:
+            remove_variant(manifest, style)
+        status = "성공" if result["success"] else "실패"
+        peak = result.get("peak_rss_mb")
+        print(f"  - {style}: {status}" + (f" (최대 RSS {peak:.1f}MB)" if peak else ""))
+    save_manifest(manifest)
+
+    if trace_path:
+        events = collect_spans()
+        for node_id in preprocess_ids:
+            events.extend(graph_results[node_id]["trace"])
+        for result in results:
+            events.extend(result["trace"])
+        write_chrome_trace(trace_path, events)
+        print_trace_summary(events)
+
+    success = within_budget and all(result["success"] for result in results)
+    if collections:
+        success = _write_collections(tasks, manifest) and success
+    return success
 
 
 if __name__ == "__main__":
-    build_fonts()
\ No newline at end of file
+    if not build_fonts():
+        exit(1)
@@ -0,0 +1,158 @@
+"""
+fontTools 백엔드의 윤곽선 변환(Em 스케일링, 베어링 이동)을 NumPy 배열 연산으로 한 번에 처리합니다.
+
+여러 단순 글리프의 좌표를 하나의 연속된 (N, 2) 배열로 모으고 글리프별 시작 위치(offsets)를 기록한 뒤,
+배율과 x 이동을 배열 전체에 한 번에 적용하고, 경계 상자는 글리프 구간별 최소/최대값으로,
+너비는 너비 배열 하나로 한 번에 계산합니다. Em 스케일링은 FontForge의 반올림 순서를
+윤곽선의 이웃 점 인덱스 배열로 재현합니다(scale_outlines_like_fontforge()).
+복합 글리프와 빈 글리프는 좌표가 없으므로 호출하는 쪽에서 글리프 단위로 처리합니다.
+
+NumPy가 없으면 numpy_available()이 False를 반환하고, fontTools 백엔드는 글리프 단위 경로를 사용합니다.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def numpy_available() -> bool:
+    """NumPy를 사용할 수 있는지 확인합니다."""
+    return np is not None
+
+
+def load_outlines(glyf, glyph_names: list, contours: bool = False) -> dict:
+    """
+    단순 글리프(복합 글리프가 아니고 윤곽선이 있는 글리프)의 좌표를 하나의 배열로 모읍니다.
+
+    Args:
+        glyf: fontTools glyf 테이블
+        glyph_names: 모을 글리프 이름 리스트. 복합 글리프와 빈 글리프는 건너뜁니다.
+        contours: 윤곽선 정보(on_curve, contour_ends)도 모을지 여부
+
+    Returns:
+        dict: names(모은 글리프 이름), points((N, 2) float64 좌표 배열),
+              offsets(글리프별 시작 위치. 길이는 len(names) + 1).
+              contours이면 on_curve((N,) bool 배열)와 contour_ends(윤곽선별 마지막 점의 위치 배열)도 담습니다.
+    """
+    names = []
+    views = []
+    flags = []
+    ends = []
+    for name in glyph_names:
+        glyph = glyf[name]
+        if glyph.isComposite() or glyph.numberOfContours <= 0 or not len(glyph.coordinates):
+            continue
+        names.append(name)
+        views.append(np.frombuffer(glyph.coordinates.array, dtype=np.float64))
+        if contours:
+            flags.append(np.frombuffer(glyph.flags, dtype=np.uint8))
+            ends.append(np.asarray(glyph.endPtsOfContours, dtype=np.int64))
+
+    offsets = np.zeros(len(views) + 1, dtype=np.int64)
+    np.cumsum([len(view) // 2 for view in views], out=offsets[1:])
+    points = np.concatenate(views).reshape(-1, 2) if views else np.zeros((0, 2))
+    outlines = {"names": names, "points": points, "offsets": offsets}
+    if contours:
+        # 플래그의 가장 낮은 비트가 on-curve 여부입니다(glyf flagOnCurve).
+        outlines["on_curve"] = (
+            (np.concatenate(flags) & 1).astype(bool) if flags else np.zeros(0, dtype=bool)
+        )
+        outlines["contour_ends"] = (
+            np.concatenate([end + offset for end, offset in zip(ends, offsets[:-1])])
+            if ends
+            else np.zeros(0, dtype=np.int64)
+        )
+    return outlines
+
+
+def scale_outlines_like_fontforge(outlines: dict, scale_factor: float) -> None:
+    """
+    모은 좌표에 FontForge의 Em 변경(font.em 설정)과 이어지는 font.transform()을 적용합니다.
+    Em 변경의 반올림은 fonttools_backend._round_like_fontforge()와 같은 결과를 배열 연산으로 계산하고,
+    transform()의 결과는 반올림하지 않습니다. load_outlines(contours=True)로 모은 좌표가 필요합니다.
+    """
+    points = outlines["points"]
+    points *= scale_factor
+    if not len(points):
+        return
+
+    on_curve = outlines["on_curve"]
+    ends = outlines["contour_ends"]
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    previous = np.arange(len(points)) - 1
+    previous[starts] = ends
+    following = np.arange(len(points)) + 1
+    following[ends] = starts
+
+    # off-curve 점은 이웃한 on-curve 점이 반올림으로 움직인 만큼 옮겨 반올림합니다. 보통은 이전 점이 먼저이지만,
+    # 윤곽선의 첫 점을 가장 먼저 처리하므로 첫 점과 마지막 점 옆의 off-curve 점은 다음 점이 먼저입니다.
+    rounded = np.floor(points + 0.5)
+    deltas = np.where(on_curve[:, None], rounded - points, 0.0)
+    following_first = np.zeros(len(points), dtype=bool)
+    following_first[ends] = on_curve[starts]
+    following_first[starts] = True
+    following_first = following_first[:, None]
+    first = np.where(following_first, deltas[following], deltas[previous])
+    second = np.where(following_first, deltas[previous], deltas[following])
+    moved = np.floor(np.floor(points + first + 0.5) + second + 0.5)
+
+    points[:] = np.where(on_curve[:, None], rounded, moved)
+    points *= scale_factor
+
+
+def transform_outlines(outlines: dict, scales: tuple = (), x_shift=0) -> None:
+    """
+    모은 좌표 전체에 배율과 x 이동을 적용합니다. 좌표는 반올림하지 않습니다(GlyphCoordinates.translate()와 같음).
+
+    Args:
+        scales: 차례로 곱할 배율. GlyphCoordinates.scale()을 같은 순서로 호출한 것과 같은 부동소수점 결과를 냅니다.
+        x_shift: 모든 글리프에 더할 x 이동 값, 또는 names와 같은 순서의 글리프별 이동 값 배열
+    """
+    points = outlines["points"]
+    for factor in scales:
+        points *= factor
+    if np.ndim(x_shift):
+        points[:, 0] += np.repeat(np.asarray(x_shift, dtype=np.float64), np.diff(outlines["offsets"]))
+    elif x_shift:
+        points[:, 0] += x_shift
+
+
+def outline_bounds(outlines: dict):
+    """
+    글리프별 경계 상자를 계산합니다. 소수점 좌표는 Glyph.recalcBounds()처럼 반올림(otRound)합니다.
+
+    Returns:
+        numpy.ndarray: names와 같은 순서의 (xMin, yMin, xMax, yMax) 정수 배열
+    """
+    if not outlines["names"]:
+        return np.zeros((0, 4), dtype=np.int64)
+    points = outlines["points"]
+    starts = outlines["offsets"][:-1]
+    mins = np.minimum.reduceat(points, starts, axis=0)
+    maxs = np.maximum.reduceat(points, starts, axis=0)
+    return np.floor(np.hstack([mins, maxs]) + 0.5).astype(np.int64)
+
+
+def store_outlines(glyf, outlines: dict) -> None:
+    """변환한 좌표를 각 글리프의 좌표 배열에 다시 쓰고 경계 상자를 갱신합니다."""
+    flat = outlines["points"].reshape(-1)
+    offsets = (outlines["offsets"] * 2).tolist()
+    bounds = outline_bounds(outlines).tolist()
+    for index, name in enumerate(outlines["names"]):
+        glyph = glyf[name]
+        np.frombuffer(glyph.coordinates.array, dtype=np.float64)[:] = flat[
+            offsets[index] : offsets[index + 1]
+        ]
+        glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax = bounds[index]
+
+
+def scale_advances(advances: list, scales: tuple) -> list:
+    """
+    너비 목록에 배율을 차례로 적용합니다. 마지막 배율을 제외한 단계는 반올림(otRound)하고,
+    마지막 단계는 소수점 이하를 버립니다(FontForge의 font.em 설정 후 font.transform()과 같은 결과).
+    """
+    values = np.asarray(advances, dtype=np.float64)
+    for factor in scales[:-1]:
+        values = np.floor(values * factor + 0.5)
+    return np.trunc(values * scales[-1]).astype(np.int64).tolist()
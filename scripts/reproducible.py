@@ -0,0 +1,133 @@
+"""
+같은 입력으로 빌드하면 바이트 단위로 같은 폰트가 나오도록 하는 재현 가능한 빌드 모드입니다(--reproducible).
+
+FontForge와 fontTools는 폰트를 저장할 때 head 테이블의 생성/수정 시각을 현재 시각으로 기록하고,
+FontForge는 생성 시각을 담은 FFTM 테이블을 추가합니다. 재현 가능한 빌드에서는 TTF를 저장한 뒤
+normalize_font_file()로 다음을 고정합니다.
+
+- head의 생성/수정 시각: SOURCE_DATE_EPOCH 환경 변수(https://reproducible-builds.org/specs/source-date-epoch/),
+  없으면 소스 폰트의 head 수정 시각 중 가장 늦은 시각
+- 빌드 시각을 담은 테이블(REPRODUCIBLE_STRIPPED_TABLES) 제거
+- 테이블 디렉터리와 테이블 데이터를 태그 순서로 다시 배치하고 체크섬을 다시 계산
+
+버전 문자열과 고유 ID(nameID 5, 3)는 update_font_metadata()가 version_string()과 unique_font_id()로 정합니다.
+"""
+
+import os
+import re
+import struct
+
+from ttfparse import parse_head, read_table_directory, read_tables
+
+# 재현 가능한 빌드의 기준 시각을 지정하는 환경 변수입니다.
+SOURCE_DATE_EPOCH_ENV: str = "SOURCE_DATE_EPOCH"
+
+# head 테이블의 시각(1904-01-01 기준 초)과 유닉스 시각(1970-01-01 기준 초)의 차이입니다.
+OPENTYPE_EPOCH_OFFSET: int = 2082844800
+
+# 빌드 시각을 담고 있어 재현 가능한 빌드에서 제거하는 테이블입니다.
+# FFTM은 FontForge의 생성 시각, DSIG는 head를 바꾸면 무효가 되는 서명입니다.
+REPRODUCIBLE_STRIPPED_TABLES: tuple = ("FFTM", "DSIG")
+
+# head 테이블에서 checkSumAdjustment와 생성/수정 시각의 오프셋입니다.
+HEAD_CHECKSUM_ADJUSTMENT_OFFSET: int = 8
+HEAD_CREATED_OFFSET: int = 20
+
+# sfnt 파일 전체의 체크섬이 이 값이 되도록 head의 checkSumAdjustment를 정합니다.
+SFNT_CHECKSUM_MAGIC: int = 0xB1B0AFBA
+
+
+def source_date_epoch_from_env() -> int:
+    """
+    SOURCE_DATE_EPOCH 환경 변수의 유닉스 시각을 읽습니다. 설정되지 않았으면 None입니다.
+
+    Raises:
+        ValueError: 값이 0 이상의 정수가 아닐 때
+    """
+    value = os.environ.get(SOURCE_DATE_EPOCH_ENV, "").strip()
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ValueError(f"{SOURCE_DATE_EPOCH_ENV}는 0 이상의 정수(유닉스 시각)여야 합니다: {value}")
+    return int(value)
+
+
+def source_date_epoch(source_paths: list) -> int:
+    """
+    빌드 결과에 기록할 유닉스 시각을 정합니다.
+    SOURCE_DATE_EPOCH가 있으면 그 값을, 없으면 소스 폰트의 head 수정 시각 중 가장 늦은 시각을 사용합니다.
+    """
+    epoch = source_date_epoch_from_env()
+    if epoch is not None:
+        return epoch
+    modified = [parse_head(read_tables(path)["head"])["modified"] for path in source_paths]
+    return max(0, max(modified) - OPENTYPE_EPOCH_OFFSET)
+
+
+def version_string(version: str) -> str:
+    """
+    nameID 5를 OpenType 명세의 "Version <major>.<minor>" 형식으로 맞춥니다.
+    숫자 뒤의 설명(예: ";Nerd Fonts 3.4.0")은 유지합니다.
+    """
+    return "Version " + re.sub(r"^version\s+", "", version.strip(), flags=re.IGNORECASE)
+
+
+def unique_font_id(version: str, postscript_name: str) -> str:
+    """
+    nameID 3(고유 ID)을 "<버전 번호>;<PostScript 이름>" 형식으로 만듭니다.
+    소스 폰트의 고유 ID에 들어 있는 날짜와 이전 패밀리 이름을 남기지 않습니다.
+    """
+    match = re.search(r"\d+(?:\.\d+)?", version)
+    return f"{match.group(0) if match else '1.000'};{postscript_name}"
+
+
+def _table_checksum(data: bytes) -> int:
+    """sfnt 테이블 체크섬(4바이트 단위 합)을 계산합니다."""
+    padded = data + b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(padded) // 4}L", padded)) & 0xFFFFFFFF
+
+
+def normalize_font_file(path: str, epoch: int) -> None:
+    """
+    TTF 파일의 head 시각을 epoch(유닉스 시각)로 고정하고, 빌드 시각을 담은 테이블을 제거한 뒤
+    테이블을 태그 순서로 다시 써서 같은 내용이면 같은 바이트가 되게 합니다.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    tables = {
+        tag: data[offset:offset + length]
+        for tag, (offset, length) in read_table_directory(data).items()
+        if tag not in REPRODUCIBLE_STRIPPED_TABLES
+    }
+    if "head" in tables:
+        head = bytearray(tables["head"])
+        timestamp = epoch + OPENTYPE_EPOCH_OFFSET
+        struct.pack_into(">L", head, HEAD_CHECKSUM_ADJUSTMENT_OFFSET, 0)
+        struct.pack_into(">qq", head, HEAD_CREATED_OFFSET, timestamp, timestamp)
+        tables["head"] = bytes(head)
+
+    tags = sorted(tables)
+    entry_selector = len(tags).bit_length() - 1
+    search_range = (1 << entry_selector) * 16
+    output = bytearray(
+        struct.pack(">4sHHHH", data[:4], len(tags), search_range, entry_selector, len(tags) * 16 - search_range)
+    )
+    offset = 12 + 16 * len(tags)
+    head_offset = None
+    for tag in tags:
+        table = tables[tag]
+        if tag == "head":
+            head_offset = offset
+        output += struct.pack(">4sLLL", tag.encode("latin-1"), _table_checksum(table), offset, len(table))
+        offset += len(table) + (-len(table) % 4)
+    for tag in tags:
+        table = tables[tag]
+        output += table + b"\0" * (-len(table) % 4)
+
+    if head_offset is not None:
+        adjustment = (SFNT_CHECKSUM_MAGIC - _table_checksum(bytes(output))) & 0xFFFFFFFF
+        struct.pack_into(">L", output, head_offset + HEAD_CHECKSUM_ADJUSTMENT_OFFSET, adjustment)
+
+    with open(path, "wb") as f:
+        f.write(output)
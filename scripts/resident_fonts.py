@@ -0,0 +1,93 @@
+"""
+watch 모드에서 빌드 사이에 폰트를 메모리에 유지하는 저장소입니다.
+
+설정이나 빌드 스크립트가 바뀌면 watch 모드는 hangulify 등을 다시 불러오지만(reload),
+이 모듈은 다시 불러오지 않으므로 저장된 폰트가 유지됩니다. 키에는 입력 파일의 수정 시각과
+크기, 설정 값이 포함되므로, 입력이 바뀐 항목은 새 키로 저장되고 이전 항목은 release_unused()로 닫힙니다.
+"""
+
+import os
+
+# 키 -> {"value": 저장한 값, "font": 닫아야 할 폰트 객체 또는 None}
+_entries: dict = {}
+
+# 마지막 release_unused() 이후 사용된 키입니다.
+_used: set = set()
+
+_enabled: bool = False
+
+
+def source_stamp(path: str) -> tuple:
+    """파일을 읽지 않고 내용이 바뀌었는지 구분할 수 있도록 (경로, 수정 시각, 크기)를 반환합니다."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def enable_resident_fonts(enabled: bool = True) -> None:
+    """폰트를 메모리에 유지할지 설정합니다. 기본값은 사용하지 않음입니다."""
+    global _enabled
+    _enabled = enabled
+
+
+def resident_fonts_enabled() -> bool:
+    """폰트를 메모리에 유지하는 중인지 확인합니다."""
+    return _enabled
+
+
+def get_resident(key: tuple):
+    """저장된 값을 반환합니다. 없으면 None을 반환합니다."""
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    _used.add(key)
+    return entry["value"]
+
+
+def put_resident(key: tuple, value, font=None) -> None:
+    """
+    값을 저장합니다. 사용하지 않음 상태이면 아무것도 하지 않습니다.
+
+    Args:
+        key: 입력 파일 해시와 설정 값을 포함하는 키
+        value: 저장할 값
+        font: 항목을 지울 때 close()를 호출할 폰트 객체
+    """
+    if not _enabled:
+        return
+    _entries[key] = {"value": value, "font": font}
+    _used.add(key)
+
+
+def is_resident(font) -> bool:
+    """폰트 객체가 저장소에 있는지 확인합니다. 저장된 폰트는 호출한 쪽에서 닫지 않습니다."""
+    return font is not None and any(entry["font"] is font for entry in _entries.values())
+
+
+def _close(entry: dict) -> None:
+    if entry["font"] is not None:
+        try:
+            entry["font"].close()
+        except Exception as e:
+            print(f"[WARNING] 메모리에 유지한 폰트를 닫는 중 오류 발생: {e}")
+
+
+def release_unused() -> int:
+    """
+    마지막 호출 이후 사용되지 않은 항목을 지웁니다.
+
+    Returns:
+        int: 지운 항목 수
+    """
+    unused = [key for key in _entries if key not in _used]
+    for key in unused:
+        _close(_entries.pop(key))
+    _used.clear()
+    return len(unused)
+
+
+def release_all() -> None:
+    """모든 항목을 지웁니다."""
+    for entry in _entries.values():
+        _close(entry)
+    _entries.clear()
+    _used.clear()
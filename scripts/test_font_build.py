@@ -6,13 +6,16 @@
 """
 
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 # 현재 스크립트 디렉터리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
 from config import (
+    ENGLISH_FONT_NF_WIDTH,
     EN_FONT_PATH,
     KO_FONT_PATH,
     EN_NERD_FONT_PATH,
@@ -181,6 +184,1454 @@ class TestFontBuildProcess(unittest.TestCase):
             self.fail(f"출력 디렉터리 생성 테스트 실패: {e}")
 
 
+class TestGlyphRuns(unittest.TestCase):
+    """코드포인트 구간 계산 테스트 클래스"""
+
+    def test_find_codepoint_runs(self):
+        """연속된 코드포인트가 하나의 구간으로 묶이는지 테스트"""
+        from codepoint_runs import find_codepoint_runs
+
+        codepoints = [0xAC00, 0xAC01, 0xAC02, 0xAC05, 0x3131, 0x3132]
+        runs = find_codepoint_runs(sorted(codepoints))
+        self.assertEqual(runs, [(0x3131, 0x3132), (0xAC00, 0xAC02), (0xAC05, 0xAC05)])
+        self.assertEqual(sum(end - start + 1 for start, end in runs), len(codepoints))
+        self.assertEqual(find_codepoint_runs([]), [])
+
+    def test_split_coverage(self):
+        """색인을 나눈 구간을 순서대로 이으면 원래 색인이 되는지 테스트"""
+        from hangulify import find_codepoint_runs, split_coverage
+
+        codepoints = [0x3131, 0x3132, 0xAC00, 0xAC01, 0xAC02, 0xAC05, 0xAC06]
+        coverage = {
+            "codepoints": codepoints,
+            "runs": find_codepoint_runs(codepoints),
+            "references": {0xAC01: ["ㄱ", "ㅏ"], 0xAC06: ["ㄱ"]},
+        }
+        shards = split_coverage(coverage, 3)
+        self.assertEqual(len(shards), 3)
+        self.assertEqual([cp for shard in shards for cp in shard["codepoints"]], codepoints)
+        self.assertEqual(
+            {cp: refs for shard in shards for cp, refs in shard["references"].items()},
+            coverage["references"],
+        )
+        for shard in shards:
+            self.assertEqual(shard["runs"], find_codepoint_runs(shard["codepoints"]))
+
+        shards = split_coverage(coverage, 10)
+        self.assertEqual(len(shards), 10)
+        self.assertEqual(shards[-1]["codepoints"], [])
+
+    def test_dependency_order(self):
+        """참조되는 글리프가 참조하는 글리프보다 먼저 오고, 공유되는 글리프는 한 번만 나오는지 테스트"""
+        from hangulify import dependency_order
+
+        references = {"가": ["ㄱ", "ㅏ"], "각": ["가", "ㄱ"], "ㄱ": ["획"], "ㅏ": ["획"], "획": []}
+        order = dependency_order(["각", "가"], lambda name: references[name])
+        self.assertEqual(sorted(order), sorted(references))
+        for name, ref_names in references.items():
+            for ref_name in ref_names:
+                self.assertLess(order.index(ref_name), order.index(name))
+
+
+class _FakeGlyph:
+    """build_hangul_coverage() 테스트용 글리프"""
+
+    def __init__(self, name, unicode, width, references=()):
+        self.glyphname = name
+        self.unicode = unicode
+        self.altuni = None
+        self.width = width
+        self.references = tuple((ref, (1, 0, 0, 1, 0, 0)) for ref in references)
+        self.left_side_bearing = 0
+        self.right_side_bearing = 0
+
+    def isWorthOutputting(self):
+        return True
+
+
+class _FakeFont:
+    """build_hangul_coverage() 테스트용 폰트"""
+
+    def __init__(self, glyphs):
+        self._glyphs = glyphs
+
+    def glyphs(self):
+        return iter(self._glyphs)
+
+    def __getitem__(self, key):
+        for glyph in self._glyphs:
+            if key in (glyph.unicode, glyph.glyphname):
+                return glyph
+        raise KeyError(key)
+
+
+class TestHangulCoverage(unittest.TestCase):
+    """한글 색인 테스트 클래스"""
+
+    def test_shared_reference_adjusted_once(self):
+        """여러 복합 글리프가 공유하는 글리프의 베어링이 한 번만 조정되는지 테스트"""
+        from config import ENGLISH_FONT_WIDTH
+        from hangulify import BEARING_ADJUSTMENT, build_hangul_coverage, process_hangul_glyphs
+
+        font = _FakeFont(
+            [
+                _FakeGlyph("base", -1, ENGLISH_FONT_WIDTH),
+                _FakeGlyph("uniAC00", 0xAC00, ENGLISH_FONT_WIDTH, ["base"]),
+                _FakeGlyph("uniAC01", 0xAC01, ENGLISH_FONT_WIDTH, ["base"]),
+                _FakeGlyph("uniAC03", 0xAC03, ENGLISH_FONT_WIDTH),
+                _FakeGlyph("A", 0x41, ENGLISH_FONT_WIDTH),
+            ]
+        )
+
+        coverage = build_hangul_coverage(font)
+        self.assertEqual(coverage["codepoints"], [0xAC00, 0xAC01, 0xAC03])
+        self.assertEqual(coverage["runs"], [(0xAC00, 0xAC01), (0xAC03, 0xAC03)])
+        self.assertEqual(coverage["references"], {0xAC00: ["base"], 0xAC01: ["base"]})
+
+        process_hangul_glyphs(font, coverage)
+        half = BEARING_ADJUSTMENT // 2
+        self.assertEqual(font["base"].left_side_bearing, half)
+        self.assertEqual(font["uniAC03"].left_side_bearing, half)
+        self.assertEqual(font["uniAC00"].left_side_bearing, 0)
+        self.assertEqual(font["A"].left_side_bearing, 0)
+
+
+class TestWebSlicing(unittest.TestCase):
+    """웹 폰트 분할 테스트 클래스"""
+
+    def test_plan_slices_orders_by_frequency(self):
+        """한글 외 문자, 자주 쓰는 음절, 나머지 음절 순서로 조각이 나뉘는지 테스트"""
+        from webslice import format_unicode_range, plan_slices
+
+        codepoints = list(range(0x20, 0x7F)) + list(range(0xAC00, 0xD7A4))
+        slices = plan_slices(codepoints, slice_size=500, rare_slice_size=5000)
+
+        self.assertEqual(sorted(cp for part in slices for cp in part), codepoints)
+        self.assertEqual(slices[0], list(range(0x20, 0x7F)))
+        # KS X 1001 완성형 2,350자는 500자씩 5개 조각으로 나뉩니다.
+        self.assertEqual([len(part) for part in slices[1:6]], [500, 500, 500, 500, 350])
+        self.assertIn(0xAC00, slices[1])  # '가'
+        self.assertEqual(sum(len(part) for part in slices[6:]), 11172 - 2350)
+
+        self.assertEqual(format_unicode_range([0xAC00, 0xAC01, 0xAC02, 0xAC05]), "U+AC00-AC02, U+AC05")
+
+    def test_slices_built_font(self):
+        """빌드된 폰트를 나눈 조각들의 cmap이 계획한 코드포인트와 같고 CSS가 조각마다 만들어지는지 테스트"""
+        try:
+            from fontTools.ttLib import TTFont
+            import brotli  # noqa: F401
+        except ImportError:
+            self.skipTest("fontTools 또는 brotli 모듈이 없어 WOFF2 조각 생성 테스트를 건너뜁니다")
+        from webslice import plan_slices, slice_font_for_web
+
+        ttf_path = os.path.join(BUILT_FONTS_PATH, "MeD2LGM-Regular.ttf")
+        if not os.path.exists(ttf_path):
+            self.skipTest("나눌 빌드된 Regular 폰트가 없습니다")
+
+        source = TTFont(ttf_path)
+        source_cmap = source.getBestCmap()
+        slices = plan_slices(list(source_cmap))
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            outputs = slice_font_for_web(ttf_path, jobs=2, output_dir=output_dir)
+            self.assertEqual(len(outputs), len(slices) + 1)
+
+            for path, codepoints in zip(outputs, slices):
+                font = TTFont(path)
+                self.assertEqual(font.flavor, "woff2")
+                cmap = font.getBestCmap()
+                self.assertEqual(sorted(cmap), codepoints)
+                self.assertTrue(all(cmap[cp] == source_cmap[cp] for cp in codepoints))
+                self.assertIn(".notdef", font.getGlyphOrder())
+
+            with open(outputs[-1], encoding="utf-8") as f:
+                css = f.read()
+            self.assertEqual(css.count("@font-face"), len(slices))
+            self.assertIn("font-family: 'MeD2LGM';", css)
+            self.assertIn("font-weight: 400;", css)
+
+
+class TestFontCache(unittest.TestCase):
+    """전처리 캐시 테스트 클래스"""
+
+    def test_cache_key_depends_on_source_and_params(self):
+        """캐시 키가 소스 파일과 설정 값에 따라 달라지는지 테스트"""
+        from font_cache import compute_cache_key
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_path = os.path.join(tmp_dir, "source.ttf")
+            with open(source_path, "wb") as f:
+                f.write(b"font-data")
+
+            params = {"TARGET_EM": 1400, "BEARING_ADJUSTMENT": 200}
+            key = compute_cache_key(source_path, params)
+            self.assertEqual(key, compute_cache_key(source_path, dict(params)))
+            self.assertNotEqual(
+                key, compute_cache_key(source_path, dict(params, TARGET_EM=1500))
+            )
+
+            with open(source_path, "wb") as f:
+                f.write(b"changed-font-data")
+            self.assertNotEqual(key, compute_cache_key(source_path, params))
+
+    def test_prune_keeps_current_entries(self):
+        """prune이 유지할 키를 제외한 항목만 삭제하는지 테스트"""
+        from font_cache import list_cache_entries, prune_cache
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for key in ("current", "stale"):
+                for ext in ("sfd", "json"):
+                    with open(os.path.join(tmp_dir, f"{key}.{ext}"), "w") as f:
+                        f.write("{}")
+
+            self.assertEqual(len(list_cache_entries(tmp_dir)), 2)
+            self.assertEqual(prune_cache({"current"}, tmp_dir), 2)
+            entries = list_cache_entries(tmp_dir)
+            self.assertEqual([entry["key"] for entry in entries], ["current"])
+            self.assertEqual(prune_cache(None, tmp_dir), 2)
+
+
+class TestBuildManifest(unittest.TestCase):
+    """빌드 매니페스트 테스트 클래스"""
+
+    def _fingerprint(self, **overrides):
+        fingerprint = {
+            "en_font": "Meslo-Regular.ttf",
+            "ko_font": "D2Coding-Regular.ttf",
+            "en_hash": "en",
+            "ko_hash": "ko",
+            "constants": {"TARGET_EM": 1400, "BEARING_ADJUSTMENT": 200},
+            "script_version": "v1",
+        }
+        fingerprint.update(overrides)
+        return fingerprint
+
+    def test_rebuild_reasons(self):
+        """입력이 같으면 건너뛰고, 바뀌면 이유를 보고하는지 테스트"""
+        from build_manifest import (
+            get_rebuild_reasons,
+            load_manifest,
+            record_variant,
+            save_manifest,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "MeD2-Regular.ttf")
+            with open(output_path, "wb") as f:
+                f.write(b"ttf")
+            manifest_path = os.path.join(tmp_dir, "manifest.json")
+
+            manifest = load_manifest(manifest_path)
+            self.assertEqual(len(get_rebuild_reasons(manifest, "Regular", self._fingerprint())), 1)
+
+            record_variant(manifest, "Regular", self._fingerprint(), [output_path])
+            save_manifest(manifest, manifest_path)
+            manifest = load_manifest(manifest_path)
+            self.assertEqual(get_rebuild_reasons(manifest, "Regular", self._fingerprint()), [])
+
+            changed = self._fingerprint(
+                ko_hash="ko2", constants={"TARGET_EM": 1500, "BEARING_ADJUSTMENT": 200}
+            )
+            reasons = get_rebuild_reasons(manifest, "Regular", changed)
+            self.assertEqual(len(reasons), 2)
+            self.assertIn("TARGET_EM", reasons[1])
+
+            os.remove(output_path)
+            self.assertEqual(len(get_rebuild_reasons(manifest, "Regular", self._fingerprint())), 1)
+
+
+class TestBuildTrace(unittest.TestCase):
+    """빌드 트레이스 테스트 클래스"""
+
+    def test_spans_written_as_chrome_trace(self):
+        """구간이 Chrome trace-event 형식으로 저장되는지 테스트"""
+        import json
+        from build_trace import collect_spans, reset_spans, set_trace_context, span, write_chrome_trace
+
+        reset_spans()
+        set_trace_context(variant="Regular")
+        with span("Regular", category="variant"):
+            with span("merge_korean_glyphs"):
+                sum(range(1000))
+        events = collect_spans()
+
+        self.assertEqual([event["name"] for event in events], ["merge_korean_glyphs", "Regular"])
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertEqual(event["args"]["variant"], "Regular")
+            self.assertGreaterEqual(event["dur"], 0)
+            self.assertIn("cpu_s", event["args"])
+            self.assertIn("peak_rss_mb", event["args"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = os.path.join(tmp_dir, "trace.json")
+            write_chrome_trace(trace_path, events)
+            with open(trace_path, encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)["traceEvents"]), 2)
+
+    def test_peak_rss_measurement(self):
+        """최대 RSS를 초기화 후 측정하고 프로세스 트리 RSS를 읽는지 테스트"""
+        from build_trace import get_peak_rss_mb, get_process_tree_rss_mb, reset_peak_rss
+
+        if not os.path.exists("/proc/self/status"):
+            self.skipTest("/proc이 없어 RSS 측정 테스트를 건너뜁니다")
+
+        reset_peak_rss()
+        self.assertGreater(get_peak_rss_mb(), 0)
+        tree_rss = get_process_tree_rss_mb()
+        self.assertIsNotNone(tree_rss)
+        self.assertGreater(tree_rss, 0)
+
+
+class TestBuildMatrix(unittest.TestCase):
+    """빌드 매트릭스 테스트 클래스"""
+
+    def test_repository_matrix_loads(self):
+        """저장소의 build_matrix.toml을 읽을 수 있고, 파일이 없으면 기본값 없이 오류가 나는지 테스트"""
+        import build_matrix
+
+        if build_matrix.tomllib is None:
+            self.skipTest("TOML 파서가 없어 빌드 매트릭스 테스트를 건너뜁니다")
+        from config import BUILD_MATRIX_PATH
+
+        matrix = build_matrix.load_build_matrix(BUILD_MATRIX_PATH)
+        self.assertEqual(
+            [variant["style"] for variant in matrix["variants"]],
+            ["Regular", "Bold", "NerdFont-Regular", "NerdFont-Bold"],
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                build_matrix.load_build_matrix(os.path.join(tmp_dir, "build_matrix.toml"))
+
+    def test_invalid_matrix_rejected(self):
+        """알 수 없는 키, 설정 값, 출력 형식, 중복 스타일과 잘못된 nerd_base를 거부하는지 테스트"""
+        from build_matrix import validate_build_matrix
+
+        base = {"sources": {"en": "en", "ko": "ko"}, "defaults": {"en": "en", "ko": "ko"}}
+        invalid_variants = [
+            [{"style": "Regular", "weight": "Regular", "color": "red"}],
+            [{"style": "Regular", "weight": "Regular", "overrides": {"HANGUL_RANGES": []}}],
+            [{"style": "Regular", "weight": "Regular", "formats": ["woff2"]}],
+            [{"style": "Regular", "weight": "Regular"}, {"style": "Regular", "weight": "Bold"}],
+            [{"style": "Regular"}],
+            [{"style": "Nerd", "weight": "Regular", "nerd": True, "nerd_base": "Regular"}],
+            [
+                {"style": "Regular", "weight": "Regular"},
+                {"style": "Nerd", "weight": "Regular", "nerd_base": "Regular"},
+            ],
+        ]
+        for variants in invalid_variants:
+            with self.assertRaises(ValueError):
+                validate_build_matrix(dict(base, variants=variants))
+        validate_build_matrix(dict(base, variants=[{"style": "Regular", "weight": "Regular"}]))
+
+    def test_multiple_matches_use_first_sorted_file(self):
+        """여러 파일이 맞으면 이름순 첫 파일을 쓰고, 패턴과 overrides가 조합에 적용되는지 테스트"""
+        from build_matrix import build_tasks
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for filename in ("MesloLGS-Regular.ttf", "MesloLGM-Regular.ttf", "D2Coding-Regular.ttf"):
+                open(os.path.join(tmp_dir, filename), "wb").close()
+            matrix = {
+                "sources": {"en": tmp_dir, "ko": tmp_dir},
+                "defaults": {"en": "en", "ko": "ko", "ko_match": "D2Coding*"},
+                "variants": [
+                    {"style": "Regular", "weight": "Regular"},
+                    {
+                        "style": "LGS-Regular",
+                        "en_match": "*lgs-regular.ttf",
+                        "formats": ["ttf"],
+                        "overrides": {"NEW_FONT_NAME": "MeD2S"},
+                    },
+                    {"style": "Bold", "weight": "Bold"},
+                ],
+            }
+            tasks = build_tasks(matrix)
+
+        self.assertEqual([task["style"] for task in tasks], ["Regular", "LGS-Regular"])
+        self.assertEqual(os.path.basename(tasks[0]["en_font_path"]), "D2Coding-Regular.ttf")
+        self.assertEqual(os.path.basename(tasks[1]["en_font_path"]), "MesloLGS-Regular.ttf")
+        self.assertEqual(tasks[1]["formats"], ("ttf",))
+        self.assertEqual(tasks[1]["overrides"], {"NEW_FONT_NAME": "MeD2S"})
+
+    def test_overridden_settings_restored(self):
+        """조합별 설정 값이 빌드 중에만 적용되고 캐시 키에 반영되는지 테스트"""
+        import hangulify
+
+        original = hangulify.TARGET_EM
+        with hangulify.overridden_settings({"TARGET_EM": original + 100}):
+            self.assertEqual(hangulify.TARGET_EM, original + 100)
+            self.assertEqual(hangulify.korean_preprocess_params()["TARGET_EM"], original + 100)
+        self.assertEqual(hangulify.TARGET_EM, original)
+
+
+class TestSyntheticBold(unittest.TestCase):
+    """합성 볼드 테스트 클래스"""
+
+    def test_bold_variants_planned_as_shards(self):
+        """합성 볼드 조합이 샤드 노드와 합치기 노드를 거쳐 빌드되도록 계획되는지 테스트"""
+        import hangulify
+        from font_cache import lookup_cached_font
+
+        tasks = [task for task in hangulify._collect_build_tasks() if task["synthetic_bold"]]
+        if not tasks:
+            self.skipTest("합성 볼드 조합이 없습니다")
+        ko_font_path = tasks[0]["ko_font_path"]
+        bold_key = hangulify.korean_cache_key(ko_font_path, synthetic_bold=True)
+        self.assertNotEqual(bold_key, hangulify.korean_cache_key(ko_font_path))
+        if lookup_cached_font(bold_key):
+            self.skipTest("합성 볼드 결과가 이미 캐시에 있습니다")
+
+        nodes = {
+            node["id"]: node
+            for node in hangulify.plan_build_graph(tasks, hangulify.build_variant, shards=3)
+        }
+        combine_id = f"preprocess:{bold_key[:12]}"
+        self.assertEqual(len(nodes[combine_id]["deps"]), 3)
+        for shard_id in nodes[combine_id]["deps"]:
+            self.assertIs(nodes[shard_id]["func"], hangulify.embolden_korean_shard)
+        for task in tasks:
+            self.assertEqual(nodes[f"variant:{task['style']}"]["deps"], [combine_id])
+
+    def test_fonttools_backend_skips_synthetic_bold(self):
+        """fontTools 백엔드에서는 합성 볼드 조합을 제외하는지 테스트"""
+        from hangulify import _collect_build_tasks
+
+        self.assertFalse(any(task["synthetic_bold"] for task in _collect_build_tasks("fonttools")))
+
+    def test_embolden_keeps_advance_width(self):
+        """합성 볼드가 너비를 유지하면서 획을 두껍게 만드는지 테스트"""
+        try:
+            import fontforge
+            from hangulify import embolden_glyphs
+        except ImportError:
+            self.skipTest("FontForge 모듈이 없어 합성 볼드 테스트를 건너뜁니다")
+
+        font = fontforge.font()
+        glyph = font.createChar(0xAC00)
+        pen = glyph.glyphPen()
+        pen.moveTo((300, 100))
+        pen.lineTo((300, 700))
+        pen.lineTo((400, 700))
+        pen.lineTo((400, 100))
+        pen.closePath()
+        glyph.width = 1000
+        before = glyph.boundingBox()
+
+        self.assertEqual(embolden_glyphs(font, [glyph.glyphname]), 1)
+        after = glyph.boundingBox()
+        self.assertEqual(glyph.width, 1000)
+        self.assertGreater(after[2] - after[0], before[2] - before[0])
+        font.close()
+
+
+def _graph_traced_variant(style):
+    from build_trace import collect_spans, reset_spans, set_trace_context, span
+
+    reset_spans()
+    set_trace_context(variant=style)
+    with span(style, category="variant"):
+        pass
+    return {"trace": collect_spans()}
+
+
+def _graph_record(calls, name, *inputs):
+    calls.append(name)
+    return name + "".join(f"<{value}>" for value in inputs)
+
+
+class TestBuildGraph(unittest.TestCase):
+    """빌드 그래프 스케줄러 테스트 클래스"""
+
+    def test_shared_node_runs_once_before_dependents(self):
+        """공유 노드가 한 번만, 의존하는 노드보다 먼저 실행되고 입력 결과가 전달되는지 테스트"""
+        from build_graph import run_build_graph
+
+        calls = []
+        nodes = [
+            {"id": "preprocess", "deps": [], "func": _graph_record, "args": (calls, "ko"), "pool": "process"},
+        ]
+        for style in ("Regular", "NerdFont-Regular"):
+            nodes.append(
+                {"id": style, "deps": ["preprocess"], "func": _graph_record, "args": (calls, style), "pool": "process"}
+            )
+            nodes.append(
+                {
+                    "id": f"compress:{style}",
+                    "deps": [style],
+                    "inputs": [style],
+                    "func": lambda ttf: ttf + ".woff2",
+                    "pool": "thread",
+                }
+            )
+
+        results = run_build_graph(nodes, jobs=1)
+        self.assertEqual(calls.count("ko"), 1)
+        self.assertEqual(calls[0], "ko")
+        self.assertEqual(results["compress:Regular"], "Regular.woff2")
+
+    def test_invalid_graph_rejected(self):
+        """순환 의존과 없는 노드에 대한 의존을 거부하는지 테스트"""
+        from build_graph import check_build_graph
+
+        with self.assertRaises(ValueError):
+            check_build_graph([{"id": "a", "deps": ["b"]}, {"id": "b", "deps": ["a"]}])
+        with self.assertRaises(ValueError):
+            check_build_graph([{"id": "a", "deps": ["missing"]}])
+
+    def test_failed_node_uses_fallback(self):
+        """실행 중 예외가 발생한 노드는 fallback 결과를 사용하는지 테스트"""
+        from build_graph import run_build_graph
+
+        nodes = [{"id": "a", "deps": [], "func": int, "args": ("x",), "pool": "process", "fallback": -1}]
+        self.assertEqual(run_build_graph(nodes)["a"], -1)
+
+    def test_inline_node_keeps_main_spans(self):
+        """jobs가 1일 때 현재 프로세스에서 실행한 노드가 빌드 프로세스의 구간을 지우지 않는지 테스트"""
+        from build_graph import run_build_graph
+        from build_trace import collect_spans, reset_spans, set_trace_context, span
+
+        reset_spans()
+        set_trace_context(variant="(준비)")
+        with span("plan_build_graph"):
+            pass
+        nodes = [{"id": "Regular", "deps": [], "func": _graph_traced_variant, "args": ("Regular",), "pool": "process"}]
+        result = run_build_graph(nodes, jobs=1)["Regular"]
+
+        with span("save_manifest"):
+            pass
+        events = collect_spans()
+        self.assertEqual([event["name"] for event in result["trace"]], ["Regular"])
+        self.assertEqual([event["name"] for event in events], ["plan_build_graph", "save_manifest"])
+        self.assertEqual({event["args"]["variant"] for event in events}, {"(준비)"})
+
+
+class TestFontCompress(unittest.TestCase):
+    """TTF에서 웹 폰트 형식을 만드는 압축 단계 테스트 클래스"""
+
+    def test_compress_from_ttf(self):
+        """압축한 WOFF2/WOFF가 원본 TTF와 같은 테이블을 가지는지 테스트"""
+        try:
+            from fontTools.ttLib import TTFont
+            from font_compress import compress_font_file
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 압축 테스트를 건너뜁니다")
+
+        source_path = os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf")
+        if not os.path.exists(source_path):
+            self.skipTest("압축할 영문 폰트가 없습니다")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ttf_path = os.path.join(tmp_dir, "Sample-Regular.ttf")
+            with open(source_path, "rb") as src, open(ttf_path, "wb") as dst:
+                dst.write(src.read())
+
+            events = []
+            outputs = compress_font_file(
+                ttf_path, ("woff2", "woff", "otf"), events=events, variant="Regular"
+            )
+            self.assertEqual(
+                [os.path.basename(path) for path in outputs],
+                ["Sample-Regular.woff2", "Sample-Regular.woff"],
+            )
+            self.assertEqual([event["args"]["variant"] for event in events], ["Regular"] * 2)
+
+            source = TTFont(ttf_path)
+            for path, flavor in zip(outputs, ("woff2", "woff")):
+                compressed = TTFont(path)
+                self.assertEqual(compressed.flavor, flavor)
+                self.assertLess(os.path.getsize(path), os.path.getsize(ttf_path))
+                self.assertEqual(set(compressed.keys()), set(source.keys()))
+                self.assertEqual(compressed.getBestCmap(), source.getBestCmap())
+
+
+class TestTtfParse(unittest.TestCase):
+    """표준 라이브러리 TrueType 파서 테스트 클래스"""
+
+    def test_matches_fonttools(self):
+        """cmap, 너비, 윤곽선을 fontTools와 같게 읽는지 테스트"""
+        try:
+            from fontTools.ttLib import TTFont
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 파서 비교 테스트를 건너뜁니다")
+        from ttfparse import glyph_contours, load_font
+
+        font_path = os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf")
+        font = load_font(font_path)
+        reference = TTFont(font_path)
+        glyph_order = reference.getGlyphOrder()
+
+        self.assertEqual(font["num_glyphs"], len(glyph_order))
+        self.assertEqual(font["head"]["units_per_em"], reference["head"].unitsPerEm)
+        self.assertEqual(
+            {cp: glyph_order[gid] for cp, gid in font["cmap"].items()}, reference.getBestCmap()
+        )
+
+        glyf = reference["glyf"]
+        for glyph_id, name in enumerate(glyph_order):
+            self.assertEqual(tuple(font["metrics"][glyph_id]), tuple(reference["hmtx"][name]))
+            coordinates, _, flags = glyf[name].getCoordinates(glyf)
+            points = [
+                point for contour in glyph_contours(font["tables"]["glyf"], font["loca"], glyph_id)
+                for point in contour
+            ]
+            self.assertEqual(
+                points, [(x, y, flag & 1) for (x, y), flag in zip(coordinates, flags)], name
+            )
+
+    def test_table_sizes_of_compressed_outputs(self):
+        """WOFF/WOFF2 테이블 디렉터리에서 원본 TTF와 같은 테이블 크기를 읽는지 테스트"""
+        import font_compress
+        from font_compress import compress_font_file
+        # fontTools가 없어도 font_compress는 FontForge로 대체하므로 임포트만으로는 알 수 없습니다.
+        if font_compress.TTFont is None:
+            self.skipTest("fontTools 모듈이 없어 테이블 크기 테스트를 건너뜁니다")
+        from ttfparse import read_table_sizes
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ttf_path = os.path.join(tmp_dir, "Sample-Regular.ttf")
+            with open(os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf"), "rb") as src, open(ttf_path, "wb") as dst:
+                dst.write(src.read())
+            outputs = compress_font_file(ttf_path, ("woff2", "woff"))
+            self.assertEqual(len(outputs), 2)
+
+            source = read_table_sizes(ttf_path)
+            self.assertEqual(source["format"], "sfnt")
+            self.assertEqual(source["size"], os.path.getsize(ttf_path))
+            for path, font_format in zip(outputs, ("woff2", "woff")):
+                sizes = read_table_sizes(path)
+                self.assertEqual(sizes["format"], font_format)
+                self.assertEqual(sizes["size"], os.path.getsize(path))
+                self.assertEqual(set(sizes["tables"]), set(source["tables"]))
+                # WOFF2는 glyf를 글리프마다 4바이트로 맞춘 길이로 기록하고 loca는 glyf에서 다시 만듭니다.
+                for tag in source["tables"]:
+                    if font_format == "woff2" and tag in ("glyf", "loca"):
+                        continue
+                    self.assertEqual(sizes["orig_tables"][tag], source["tables"][tag], tag)
+                self.assertLess(sizes["tables"]["glyf"], source["tables"]["glyf"])
+
+
+class TestGlyphIndex(unittest.TestCase):
+    """글리프 해시 색인 테스트 클래스"""
+
+    def test_sharded_index_matches_serial(self):
+        """샤드로 나누어 계산한 색인이 단일 프로세스 결과와 같은지 테스트"""
+        from glyph_index import build_glyph_index
+
+        font_path = os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf")
+        index = build_glyph_index(font_path)
+        self.assertEqual(index["units_per_em"], 2048)
+        self.assertIn("0041", index["glyphs"])
+        self.assertEqual(build_glyph_index(font_path, jobs=3), index)
+
+    def test_compare_reports_codepoints(self):
+        """변경, 추가, 삭제된 코드포인트를 구분해 보고하는지 테스트"""
+        from glyph_index import compare_glyph_indexes, glyph_hash
+
+        square = [[(0, 0, 1), (0, 100, 1), (100, 100, 1), (100, 0, 1)]]
+        self.assertEqual(glyph_hash(1233, square), glyph_hash(1233, [list(square[0])]))
+        self.assertNotEqual(glyph_hash(1233, square), glyph_hash(1959, square))
+
+        baseline = {"glyphs": {"0041": "a", "AC00": "b", "AC01": "c"}}
+        current = {"glyphs": {"0041": "a", "AC00": "x", "AC02": "d"}}
+        self.assertEqual(
+            compare_glyph_indexes(baseline, current),
+            {"changed": [0xAC00], "added": [0xAC02], "removed": [0xAC01]},
+        )
+
+    def test_verify_skips_fonts_without_baseline(self):
+        """기준 색인이 없는 폰트는 건너뛰고, 기준 색인이 하나도 없으면 실패하는지 테스트"""
+        from glyph_index import glyph_index_path, verify_built_fonts
+
+        with tempfile.TemporaryDirectory() as font_dir, tempfile.TemporaryDirectory() as index_dir:
+            for filename in ("Meslo-Regular.ttf", "Meslo-Bold.ttf"):
+                shutil.copy(os.path.join(EN_FONT_PATH, filename), font_dir)
+            self.assertFalse(verify_built_fonts(font_dir=font_dir, index_dir=index_dir))
+
+            regular_path = os.path.join(font_dir, "Meslo-Regular.ttf")
+            self.assertTrue(verify_built_fonts(update=True, font_dir=font_dir, index_dir=index_dir))
+            os.remove(glyph_index_path(os.path.join(font_dir, "Meslo-Bold.ttf"), index_dir))
+            self.assertTrue(os.path.exists(glyph_index_path(regular_path, index_dir)))
+            self.assertTrue(verify_built_fonts(font_dir=font_dir, index_dir=index_dir))
+
+
+class TestFontCheck(unittest.TestCase):
+    """build.py test의 폰트 검사 테스트 클래스"""
+
+    def test_sources_and_built_fonts_pass(self):
+        """저장소의 소스 폰트와 빌드된 폰트가 오류 없이 검사를 통과하는지 테스트"""
+        from font_check import FONT_KINDS, check_fonts
+
+        self.assertTrue(check_fonts(jobs=2))
+        sources = tuple(kind for kind in FONT_KINDS if kind[0] != "built")
+        self.assertTrue(check_fonts(jobs=1, font_kinds=sources))
+
+    def test_reports_errors(self):
+        """이름이 바뀌지 않은 폰트와 한글이 없는 폰트를 오류로 보고하는지 테스트"""
+        from font_check import _check_across_fonts, check_font
+
+        en_path = os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf")
+        as_built = check_font(en_path, "built")
+        self.assertTrue(any("MeD2" in error for error in as_built["errors"]))
+        self.assertTrue(any("PostScript" in error for error in as_built["errors"]))
+
+        as_korean = check_font(en_path, "ko")
+        self.assertTrue(any("한글 음절 11172개" in error for error in as_korean["errors"]))
+
+        ko_report = {"kind": "ko", "codepoints": [0xAC00, 0xAC01], "errors": []}
+        built_report = {
+            "kind": "built", "path": "MeD2NerdFont-Regular.ttf", "codepoints": [0xAC00],
+            "errors": [], "summary": [],
+        }
+        _check_across_fonts([ko_report, built_report])
+        self.assertEqual(len(built_report["errors"]), 1)
+        self.assertIn("U+AC01", built_report["errors"][0])
+
+    def test_reports_width_mismatch(self):
+        """설정 값에서 계산한 너비와 다른 한글/ASCII 너비를 오류로 보고하는지 테스트"""
+        from font_check import (
+            _check_across_fonts,
+            _check_uniform_width,
+            expected_ascii_width,
+            expected_hangul_width,
+        )
+
+        # D2Coding(Em 1000)의 한글 음절은 Em 스케일링 후 1959가 됩니다.
+        self.assertEqual(expected_hangul_width(1000), 1959)
+        self.assertEqual(expected_ascii_width("Meslo LG M", False)[0], 1233)
+        self.assertEqual(expected_ascii_width("MeD2LGM", True)[0], 1233)
+        self.assertEqual(expected_ascii_width("Other Mono", True)[0], ENGLISH_FONT_NF_WIDTH)
+
+        report = {"errors": [], "summary": []}
+        self.assertEqual(_check_uniform_width({1200: 95}, "ASCII", 1233, "ASCII_WIDTH_EXCEPTIONS", report), 1200)
+        self.assertEqual(len(report["errors"]), 1)
+
+        ko_report = {"kind": "ko", "codepoints": [0xAC00], "errors": [], "units_per_em": 1000}
+        built_report = {
+            "kind": "built", "path": "MeD2LGM-Regular.ttf", "codepoints": [0xAC00],
+            "errors": [], "summary": [], "hangul_width": 1400,
+        }
+        _check_across_fonts([ko_report, built_report])
+        self.assertEqual(len(built_report["errors"]), 1)
+        self.assertIn("1959", built_report["errors"][0])
+
+    def test_name_table_matches_fonttools(self):
+        """ttfparse.parse_name()이 fontTools와 같은 이름을 읽는지 테스트"""
+        try:
+            from fontTools.ttLib import TTFont
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 name 테이블 비교 테스트를 건너뜁니다")
+        from ttfparse import load_font
+
+        for directory in (EN_FONT_PATH, KO_FONT_PATH):
+            for filename in sorted(os.listdir(directory)):
+                if filename.lower().endswith(".ttf"):
+                    path = os.path.join(directory, filename)
+                    names = load_font(path)["names"]
+                    reference = TTFont(path)["name"]
+                    self.assertTrue(names)
+                    for name_id, value in names.items():
+                        self.assertEqual(value, reference.getDebugName(name_id), (filename, name_id))
+
+
+class TestBuildPlan(unittest.TestCase):
+    """빌드 계획(build.py plan) 테스트 클래스"""
+
+    def _plan(self):
+        from build_plan import make_build_plan
+
+        plan = make_build_plan("fonttools")
+        if not plan["variants"]:
+            self.skipTest("빌드할 폰트 조합이 없어 빌드 계획 테스트를 건너뜁니다")
+        return plan
+
+    def test_plan_coverage_matches_fonttools(self):
+        """표준 라이브러리 파서로 만든 한글 색인이 fontTools 백엔드의 색인과 같은지 테스트"""
+        try:
+            from fontTools.ttLib import TTFont
+            from fonttools_backend import build_hangul_coverage
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 빌드 계획 색인 비교 테스트를 건너뜁니다")
+        from hangulify import coverage_from_plan
+
+        plan = self._plan()
+        for path, ko_plan in plan["korean"].items():
+            font = TTFont(path)
+            coverage = coverage_from_plan(ko_plan["coverage"], font.getGlyphOrder())
+            self.assertEqual(coverage, build_hangul_coverage(font))
+            self.assertEqual(ko_plan["composites"], len(coverage["references"]))
+
+        for variant in plan["variants"]:
+            self.assertEqual(
+                variant["overwritten_count"] + variant["added_count"], variant["hangul_glyphs"]
+            )
+
+    def test_stale_plan_is_rejected(self):
+        """계획을 만든 뒤 소스가 바뀌었거나 백엔드가 다르면 계획을 사용하지 않는지 테스트"""
+        import json
+        from build_plan import load_build_plan
+
+        plan = self._plan()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "plan.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(plan, f)
+            tasks = load_build_plan(path, "fonttools")
+            self.assertEqual(
+                [task["style"] for task in tasks],
+                [variant["task"]["style"] for variant in plan["variants"]],
+            )
+            self.assertIn("reference_ids", tasks[0]["coverage"])
+            with self.assertRaises(ValueError):
+                load_build_plan(path, "fontforge")
+
+            stamp_path = tasks[0]["ko_font_path"]
+            plan["stamps"][stamp_path][1] += 1
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(plan, f)
+            with self.assertRaises(ValueError):
+                load_build_plan(path, "fonttools")
+
+
+class TestReproducibleBuild(unittest.TestCase):
+    """재현 가능한 빌드 모드 테스트 클래스"""
+
+    EPOCH = 1700000000
+
+    def test_normalize_ignores_build_time(self):
+        """저장 시각만 다른 두 TTF가 정규화 후 같은 바이트가 되고 체크섬이 올바른지 테스트"""
+        import struct
+        from reproducible import (
+            OPENTYPE_EPOCH_OFFSET,
+            REPRODUCIBLE_STRIPPED_TABLES,
+            SFNT_CHECKSUM_MAGIC,
+            _table_checksum,
+            normalize_font_file,
+        )
+        from ttfparse import parse_head, read_table_directory, read_tables
+
+        with open(os.path.join(EN_FONT_PATH, "Meslo-Regular.ttf"), "rb") as f:
+            data = f.read()
+        head_offset = read_table_directory(data)["head"][0]
+
+        contents = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index, modified in enumerate((OPENTYPE_EPOCH_OFFSET, OPENTYPE_EPOCH_OFFSET + 86400)):
+                path = os.path.join(temp_dir, f"Sample{index}.ttf")
+                font_data = bytearray(data)
+                struct.pack_into(">q", font_data, head_offset + 28, modified)
+                with open(path, "wb") as f:
+                    f.write(font_data)
+                normalize_font_file(path, self.EPOCH)
+                with open(path, "rb") as f:
+                    contents.append(f.read())
+
+            self.assertEqual(contents[0], contents[1])
+            self.assertEqual(_table_checksum(contents[0]), SFNT_CHECKSUM_MAGIC)
+            tables = read_tables(path)
+            # FontForge로 만든 소스 폰트의 FFTM 테이블도 제거됩니다.
+            self.assertEqual(
+                list(tables),
+                sorted(tag for tag in read_table_directory(data) if tag not in REPRODUCIBLE_STRIPPED_TABLES),
+            )
+            head = parse_head(tables["head"])
+            self.assertEqual(head["created"], self.EPOCH + OPENTYPE_EPOCH_OFFSET)
+            self.assertEqual(head["modified"], self.EPOCH + OPENTYPE_EPOCH_OFFSET)
+
+    def test_build_twice_same_hashes(self):
+        """같은 입력으로 두 번 빌드한 출력 파일의 해시가 같은지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 재현 가능한 빌드 테스트를 건너뜁니다")
+        from font_cache import file_sha256
+        from hangulify import _collect_build_tasks, compress_variant_outputs
+
+        tasks = [task for task in _collect_build_tasks("fonttools") if task["style"] == "Regular"]
+        if not tasks:
+            self.skipTest("Regular 폰트 조합이 없어 재현 가능한 빌드 테스트를 건너뜁니다")
+
+        hashes = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(2):
+                output_dir = os.path.join(temp_dir, str(index))
+                os.makedirs(output_dir)
+                task = dict(tasks[0], output_dir=output_dir, source_date_epoch=self.EPOCH)
+                result = compress_variant_outputs(fonttools_backend.build_variant(task), task["formats"])
+                self.assertTrue(result["success"])
+                hashes.append({os.path.basename(path): file_sha256(path) for path in result["outputs"]})
+
+        self.assertEqual(hashes[0], hashes[1])
+
+
+class TestFontCollection(unittest.TestCase):
+    """TTC 출력 테스트 클래스"""
+
+    def _write_faces(self, temp_dir, extra_table=None):
+        """글리프 하나만 윤곽선이 다른 합성 폰트 두 개를 저장합니다."""
+        import io
+        from fontTools.ttLib import TTFont, newTable
+        from bench_shards import make_synthetic_english_font
+
+        data = make_synthetic_english_font()
+        paths = []
+        for index in range(2):
+            font = TTFont(io.BytesIO(data))
+            if index:
+                glyph = font["glyf"]["uni0041"]
+                glyph.coordinates[1] = (100, 900)
+                if extra_table:
+                    table = newTable(extra_table)
+                    table.data = b"\0\0\0\0"
+                    font[extra_table] = table
+            paths.append(os.path.join(temp_dir, f"Face{index}.ttf"))
+            font.save(paths[-1])
+        return paths
+
+    def _assertSameOutlines(self, paths, collection_path):
+        from fontTools.pens.recordingPen import RecordingPen
+        from fontTools.ttLib import TTFont
+
+        for index, path in enumerate(paths):
+            expected, actual = TTFont(path), TTFont(collection_path, fontNumber=index)
+            expected_cmap, actual_cmap = expected.getBestCmap(), actual.getBestCmap()
+            self.assertEqual(set(expected_cmap), set(actual_cmap))
+            expected_glyphs, actual_glyphs = expected.getGlyphSet(), actual.getGlyphSet()
+            for codepoint, name in expected_cmap.items():
+                expected_pen, actual_pen = RecordingPen(), RecordingPen()
+                expected_glyphs[name].draw(expected_pen)
+                actual_glyphs[actual_cmap[codepoint]].draw(actual_pen)
+                self.assertEqual(expected_pen.value, actual_pen.value, hex(codepoint))
+                self.assertEqual(expected_glyphs[name].width, actual_glyphs[actual_cmap[codepoint]].width)
+
+    def test_collection_groups(self):
+        """nerd_base로 이어진 조합만 묶이는지 테스트"""
+        try:
+            from font_collection import collection_groups
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 TTC 테스트를 건너뜁니다")
+
+        tasks = [
+            {"style": "Regular", "nerd_base": None},
+            {"style": "Bold", "nerd_base": None},
+            {"style": "NerdFont-Regular", "nerd_base": "Regular"},
+            {"style": "NerdFont-Bold", "nerd_base": "Bold"},
+            {"style": "NerdFont-Light", "nerd_base": "Light"},
+        ]
+        self.assertEqual(
+            collection_groups(tasks), [["Regular", "NerdFont-Regular"], ["Bold", "NerdFont-Bold"]]
+        )
+
+    def test_collection_shares_glyph_data(self):
+        """글리프 데이터를 공유한 TTC의 각 폰트가 원래 TTF와 같은 윤곽선을 갖는지 테스트"""
+        try:
+            from font_collection import write_font_collection
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 TTC 테스트를 건너뜁니다")
+        from fontTools.ttLib import TTFont
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_faces(temp_dir)
+            collection_path = os.path.join(temp_dir, "Face.ttc")
+            result = write_font_collection(paths, collection_path)
+
+            self.assertFalse(result["fallback"])
+            self.assertEqual(result["shared_glyphs"], len(TTFont(paths[0]).getGlyphOrder()) - 1)
+            self.assertIn("glyf", result["shared_tables"])
+            self.assertIn("loca", result["shared_tables"])
+            self.assertLess(result["size"], result["separate"])
+            self._assertSameOutlines(paths, collection_path)
+
+    def test_unknown_table_falls_back_to_table_sharing(self):
+        """글리프 순서를 바꿀 수 없는 테이블이 있으면 같은 테이블만 공유하는지 테스트"""
+        try:
+            from font_collection import write_font_collection
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 TTC 테스트를 건너뜁니다")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_faces(temp_dir, extra_table="zzzz")
+            collection_path = os.path.join(temp_dir, "Face.ttc")
+            result = write_font_collection(paths, collection_path)
+
+            self.assertTrue(result["fallback"])
+            self.assertNotIn("glyf", result["shared_tables"])
+            self.assertIn("cmap", result["shared_tables"])
+            self._assertSameOutlines(paths, collection_path)
+
+
+class TestWatchMode(unittest.TestCase):
+    """watch 모드의 변경 감지와 폰트 유지 테스트 클래스"""
+
+    def test_snapshot_detects_changes(self):
+        """파일 변경, 추가, 삭제를 감지하는지 테스트"""
+        from watch import changed_paths, take_snapshot
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            script_path = os.path.join(tmp_dir, "config.py")
+            font_dir = os.path.join(tmp_dir, "fonts")
+            os.makedirs(font_dir)
+            with open(script_path, "w") as f:
+                f.write("TARGET_EM = 1400\n")
+
+            before = take_snapshot([script_path], [font_dir])
+            self.assertEqual(changed_paths(before, take_snapshot([script_path], [font_dir])), [])
+
+            font_path = os.path.join(font_dir, "New-Regular.ttf")
+            with open(font_path, "wb") as f:
+                f.write(b"\0")
+            with open(script_path, "w") as f:
+                f.write("TARGET_EM = 1500\n")
+            after = take_snapshot([script_path], [font_dir])
+            self.assertEqual(changed_paths(before, after), sorted([script_path, font_path]))
+
+            os.remove(font_path)
+            self.assertEqual(changed_paths(after, take_snapshot([script_path], [font_dir])), [font_path])
+
+    def test_watches_build_matrix(self):
+        """조합별 overrides를 바꾸면 다시 빌드하도록 빌드 매트릭스 파일을 감시하는지 테스트"""
+        from config import BUILD_MATRIX_PATH
+        from watch import _script_paths
+
+        self.assertIn(os.path.abspath(BUILD_MATRIX_PATH), _script_paths())
+
+    def test_resident_fonts_release_unused(self):
+        """사용하지 않은 항목만 닫고, 사용하지 않음 상태에서는 저장하지 않는지 테스트"""
+        import resident_fonts
+
+        class _Font:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        old_font, new_font = _Font(), _Font()
+        try:
+            resident_fonts.put_resident(("ko", 1), "ignored", font=old_font)
+            self.assertIsNone(resident_fonts.get_resident(("ko", 1)))
+
+            resident_fonts.enable_resident_fonts()
+            resident_fonts.put_resident(("ko", 1), "old", font=old_font)
+            resident_fonts.release_unused()
+            resident_fonts.put_resident(("ko", 2), "new", font=new_font)
+            self.assertTrue(resident_fonts.is_resident(new_font))
+
+            self.assertEqual(resident_fonts.release_unused(), 1)
+            self.assertTrue(old_font.closed)
+            self.assertFalse(new_font.closed)
+            self.assertEqual(resident_fonts.get_resident(("ko", 2)), "new")
+        finally:
+            resident_fonts.release_all()
+            resident_fonts.enable_resident_fonts(False)
+        self.assertTrue(new_font.closed)
+
+    def test_setting_change_reuses_resident_source(self):
+        """설정 값이 바뀌면 메모리에 유지한 원본 한글 폰트의 복사본에서 다시 전처리하는지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 원본 폰트 유지 테스트를 건너뜁니다")
+        import resident_fonts
+        from build_trace import collect_spans, reset_spans
+        from hangulify import overridden_settings
+
+        ko_font_path = os.path.join(KO_FONT_PATH, os.listdir(KO_FONT_PATH)[0])
+        fresh, _ = fonttools_backend.load_preprocessed_korean_font(ko_font_path)
+
+        reset_spans()
+        resident_fonts.enable_resident_fonts()
+        try:
+            fonttools_backend.load_preprocessed_korean_font(ko_font_path)
+            resident_fonts.release_unused()
+            self.assertEqual([event["name"] for event in collect_spans()].count("TTFont(ko)"), 1)
+
+            with overridden_settings({"TARGET_EM": fonttools_backend.TARGET_EM + 100}):
+                fonttools_backend.load_preprocessed_korean_font(ko_font_path)
+            resident_fonts.release_unused()
+            # 이전 설정의 전처리 결과는 지워졌으므로 원래 설정으로 돌아가면 다시 전처리합니다.
+            changed, _ = fonttools_backend.load_preprocessed_korean_font(ko_font_path)
+            names = [event["name"] for event in collect_spans()]
+            self.assertNotIn("TTFont(ko)", names)
+            self.assertEqual(names.count("copy_source_font(ko)"), 2)
+
+            # 원본은 이전 전처리에 바뀌지 않았으므로 새로 연 폰트의 전처리와 결과가 같습니다.
+            for glyph_name in ("uniAC00", "uniD7A3"):
+                self.assertEqual(
+                    changed["glyf"][glyph_name].getCoordinates(changed["glyf"])[0],
+                    fresh["glyf"][glyph_name].getCoordinates(fresh["glyf"])[0],
+                )
+        finally:
+            resident_fonts.release_all()
+            resident_fonts.enable_resident_fonts(False)
+
+
+class TestOutlineTransform(unittest.TestCase):
+    """NumPy 윤곽선 변환이 글리프 단위 경로와 같은 결과를 내는지 테스트하는 클래스"""
+
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+            import fonttools_backend  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy 또는 fontTools 모듈이 없어 윤곽선 변환 테스트를 건너뜁니다")
+
+    def test_synthetic_font_matches_per_glyph(self):
+        """합성 폰트(단순/복합 글리프)의 스케일링과 베어링 조정 결과가 같은지 테스트"""
+        from bench_transform import make_synthetic_korean_font, run_transform_case
+
+        for em in (1000, 2048):
+            with self.subTest(em=em):
+                data = make_synthetic_korean_font(500, 0.3, em)
+                _, expected = run_transform_case(data, vectorized=False)
+                _, actual = run_transform_case(data, vectorized=True)
+                self.assertEqual(expected[1], actual[1])
+                self.assertEqual(expected[0], actual[0])
+
+    def test_korean_font_scaling_matches_per_glyph(self):
+        """실제 한글 폰트의 Em 스케일링 결과가 같은지 테스트"""
+        from fontTools.ttLib import TTFont
+        from fonttools_backend import scale_font_em_units
+        from hangulify import TARGET_EM
+
+        ko_files = [f for f in os.listdir(KO_FONT_PATH) if f.lower().endswith(".ttf")]
+        if not ko_files:
+            self.skipTest("한글 폰트 파일이 없어 윤곽선 변환 테스트를 건너뜁니다")
+
+        results = []
+        for vectorized in (False, True):
+            font = TTFont(os.path.join(KO_FONT_PATH, sorted(ko_files)[0]))
+            scale_font_em_units(font, TARGET_EM, vectorized=vectorized)
+            glyf = font["glyf"]
+            # 스케일링한 좌표는 반올림 전의 소수점 값까지 같아야 합니다.
+            results.append(
+                (
+                    {name: list(glyf[name].getCoordinates(glyf)[0]) for name in font.getGlyphOrder()},
+                    dict(font["hmtx"].metrics),
+                )
+            )
+        self.assertEqual(results[0][1], results[1][1])
+        self.assertEqual(results[0][0], results[1][0])
+
+
+class TestFontToolsBackend(unittest.TestCase):
+    """fontTools 백엔드가 FontForge 빌드와 같은 글리프를 만드는지 테스트하는 클래스"""
+
+    def _regular_task(self):
+        from hangulify import _collect_build_tasks
+
+        tasks = [task for task in _collect_build_tasks() if task["style"] == "Regular"]
+        if not tasks:
+            self.skipTest("Regular 폰트 조합이 없어 백엔드 비교 테스트를 건너뜁니다")
+        return tasks[0]
+
+    def _build_with_fonttools(self, output_dir):
+        import fonttools_backend
+
+        result = fonttools_backend.build_variant(dict(self._regular_task(), output_dir=output_dir))
+        ttf_paths = [path for path in result["outputs"] if path.endswith(".ttf")]
+        self.assertTrue(ttf_paths, "fontTools 백엔드가 TTF를 생성하지 못했습니다")
+        return ttf_paths[0]
+
+    def assertSameGlyphs(self, expected_path, actual_path):
+        """두 폰트의 Em 단위, 이름, 코드포인트별 글리프 해시 색인(glyph_index)이 모두 같은지 확인합니다."""
+        from fontTools.ttLib import TTFont
+        from glyph_index import build_glyph_index, compare_glyph_indexes
+
+        expected_index, actual_index = build_glyph_index(expected_path), build_glyph_index(actual_path)
+        self.assertEqual(expected_index["units_per_em"], actual_index["units_per_em"])
+        differences = compare_glyph_indexes(expected_index, actual_index)
+        self.assertEqual(differences, {"changed": [], "added": [], "removed": []})
+
+        expected_names, actual_names = TTFont(expected_path)["name"], TTFont(actual_path)["name"]
+        for name_id in (1, 2, 4, 6):
+            self.assertEqual(expected_names.getDebugName(name_id), actual_names.getDebugName(name_id))
+
+    def test_matches_committed_build(self):
+        """fontTools 백엔드 출력이 저장소의 FontForge 빌드 결과와 일치하는지 테스트"""
+        try:
+            import fonttools_backend  # noqa: F401
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 백엔드 비교 테스트를 건너뜁니다")
+
+        reference_path = os.path.join(BUILT_FONTS_PATH, "MeD2LGM-Regular.ttf")
+        if not os.path.exists(reference_path):
+            self.skipTest("비교할 빌드된 Regular 폰트가 없습니다")
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.assertSameGlyphs(reference_path, self._build_with_fonttools(output_dir))
+
+    def test_catalog_merge_matches_committed_build(self):
+        """build.py merge로 디렉터리의 영문 폰트를 병합한 결과가 저장소의 빌드 결과와 일치하는지 테스트"""
+        try:
+            import fonttools_backend  # noqa: F401
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 카탈로그 병합 테스트를 건너뜁니다")
+        from catalog_merge import merge_font_catalog, planned_output_name
+        from resident_fonts import resident_fonts_enabled
+
+        reference_path = os.path.join(BUILT_FONTS_PATH, "MeD2LGM-Regular.ttf")
+        if not os.path.exists(reference_path):
+            self.skipTest("비교할 빌드된 Regular 폰트가 없습니다")
+        task = self._regular_task()
+
+        with tempfile.TemporaryDirectory() as en_dir, tempfile.TemporaryDirectory() as output_dir:
+            en_path = os.path.join(en_dir, os.path.basename(task["en_font_path"]))
+            with open(task["en_font_path"], "rb") as src, open(en_path, "wb") as dst:
+                dst.write(src.read())
+
+            self.assertTrue(
+                merge_font_catalog(
+                    en_dir, task["ko_font_path"], output_dir, backend="fonttools", formats=("ttf",)
+                )
+            )
+            self.assertFalse(resident_fonts_enabled())
+            self.assertEqual(os.listdir(output_dir), ["MeD2LGM-Regular.ttf"])
+            self.assertSameGlyphs(reference_path, os.path.join(output_dir, "MeD2LGM-Regular.ttf"))
+
+            # 출력 이름이 같은 영문 폰트가 둘이면 병합 전에 실패로 처리하고 기존 출력을 덮어쓰지 않아야 합니다.
+            output_path = os.path.join(output_dir, "MeD2LGM-Regular.ttf")
+            before = os.stat(output_path).st_mtime_ns
+            shutil.copy(en_path, os.path.join(en_dir, "Copy-Regular.ttf"))
+            self.assertEqual(planned_output_name(os.path.join(en_dir, "Copy-Regular.ttf")), "MeD2LGM-Regular")
+            self.assertFalse(
+                merge_font_catalog(
+                    en_dir, task["ko_font_path"], output_dir, backend="fonttools", formats=("ttf",)
+                )
+            )
+            self.assertEqual(os.stat(output_path).st_mtime_ns, before)
+
+    def test_low_memory_matches_normal_build(self):
+        """--low-memory 빌드가 일반 빌드와 같은 글리프를 만드는지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 저메모리 빌드 테스트를 건너뜁니다")
+        from glyph_index import build_glyph_index, compare_glyph_indexes
+
+        indexes = []
+        with tempfile.TemporaryDirectory() as output_dir:
+            for low_memory in (False, True):
+                task = dict(self._regular_task(), output_dir=output_dir, low_memory=low_memory)
+                result = fonttools_backend.build_variant(task)
+                self.assertTrue(result["success"])
+                self.assertGreater(result["peak_rss_mb"], 0)
+                indexes.append(build_glyph_index(result["outputs"][0]))
+
+        differences = compare_glyph_indexes(*indexes)
+        self.assertFalse(any(differences.values()), differences)
+
+    def test_keep_references_differs_only_in_composites(self):
+        """
+        --keep-references 빌드가 복합 글리프만 복합 글리프로 유지하고 더 작은 TTF를 만드는지 테스트.
+        복합 글리프는 참조 대상과 참조 위치를 따로 반올림하므로(FontForge와 같음) 윤곽선으로 푼 빌드와의
+        해시 차이는 소스 폰트에서 복합 글리프인 코드포인트에만 있어야 합니다.
+        """
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 참조 유지 병합 테스트를 건너뜁니다")
+        from fontTools.ttLib import TTFont
+        from glyph_index import build_glyph_index, compare_glyph_indexes
+        from hangulify import _in_hangul_ranges
+
+        indexes, sizes, composites = [], [], []
+        with tempfile.TemporaryDirectory() as output_dir:
+            for keep_references in (False, True):
+                task = dict(
+                    self._regular_task(), output_dir=output_dir, keep_references=keep_references
+                )
+                result = fonttools_backend.build_variant(task)
+                self.assertTrue(result["success"])
+                path = result["outputs"][0]
+                indexes.append(build_glyph_index(path))
+                sizes.append(os.path.getsize(path))
+                font = TTFont(path)
+                composites.append(
+                    sum(1 for name in font.getGlyphOrder() if font["glyf"][name].isComposite())
+                )
+
+        source = TTFont(self._regular_task()["ko_font_path"])
+        source_cmap = source.getBestCmap()
+        composite_codepoints = [
+            codepoint
+            for codepoint in (int(key, 16) for key in indexes[0]["glyphs"])
+            if _in_hangul_ranges(codepoint)
+            and codepoint in source_cmap
+            and source["glyf"][source_cmap[codepoint]].isComposite()
+        ]
+        self.assertTrue(composite_codepoints)
+        differences = compare_glyph_indexes(*indexes)
+        self.assertEqual(differences, {"changed": sorted(composite_codepoints), "added": [], "removed": []})
+        self.assertGreater(composites[1], composites[0])
+        self.assertLess(sizes[1], sizes[0])
+
+    def test_sharded_merge_matches_serial_build(self):
+        """한글 글리프를 샤드로 나누어 병합한 TTF가 나누지 않은 빌드와 테이블 단위로 같은지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 샤드 병합 테스트를 건너뜁니다")
+        from fontTools.ttLib import TTFont
+
+        from build_graph import run_build_graph
+        from hangulify import plan_build_graph
+
+        fonts = []
+        with tempfile.TemporaryDirectory() as output_dir:
+            for merge_shards in (1, 3):
+                task = dict(self._regular_task(), output_dir=output_dir, merge_shards=merge_shards)
+                result = fonttools_backend.build_variant(task)
+                self.assertTrue(result["success"])
+                fonts.append(TTFont(result["outputs"][0]))
+
+            # build_fonts()처럼 샤드를 빌드 그래프의 노드로 실행합니다.
+            task = dict(self._regular_task(), output_dir=output_dir, merge_shards=2, formats=())
+            nodes = plan_build_graph([task], fonttools_backend.build_variant, backend="fonttools")
+            self.assertEqual(sum(1 for node in nodes if ":hangul" in node["id"]), 2)
+            result = run_build_graph(nodes, jobs=1)["variant:Regular"]
+            self.assertTrue(result["success"])
+            fonts.append(TTFont(result["outputs"][0]))
+
+            serial = fonts[0]
+            for sharded in fonts[1:]:
+                self.assertEqual(sorted(serial.reader.keys()), sorted(sharded.reader.keys()))
+                # head 테이블은 수정 시각만 다를 수 있습니다.
+                for tag in serial.reader.keys():
+                    if tag != "head":
+                        self.assertEqual(serial.reader[tag], sharded.reader[tag], tag)
+
+    def test_shard_nodes_shared_between_variants(self):
+        """한글 폰트가 같은 조합들이 한글 샤드 노드를 한 번만 만들고 공유하는지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 샤드 병합 테스트를 건너뜁니다")
+        from hangulify import plan_build_graph
+
+        task = self._regular_task()
+        tasks = [
+            dict(task, merge_shards=4),
+            dict(task, style="NerdFont-Regular", merge_shards=4),
+        ]
+        nodes = plan_build_graph(tasks, fonttools_backend.build_variant, backend="fonttools")
+        shard_ids = [node["id"] for node in nodes if ":hangul" in node["id"]]
+        self.assertEqual(len(shard_ids), 4)
+        variants = {node["id"]: node for node in nodes if node["id"].startswith("variant:")}
+        for variant in variants.values():
+            self.assertEqual(variant["inputs"], shard_ids)
+
+    def test_fontforge_shard_nodes(self):
+        """FontForge 백엔드에서도 한글 샤드 노드를 만들고 조합이 그 결과를 병합하는지 테스트"""
+        from hangulify import build_variant, build_variant_from_shards, plan_build_graph, preprocess_korean_shard
+
+        task = dict(self._regular_task(), merge_shards=3, synthetic_bold=True)
+        nodes = plan_build_graph([task], build_variant, use_cache=False)
+        shard_nodes = [node for node in nodes if ":hangul" in node["id"]]
+        self.assertEqual(len(shard_nodes), 3)
+        for index, node in enumerate(shard_nodes):
+            self.assertIs(node["func"], preprocess_korean_shard)
+            self.assertEqual(node["args"][3:5], (index, 3))
+            self.assertEqual(node["kwargs"], {"synthetic_bold": True})
+        variant = next(node for node in nodes if node["id"] == "variant:Regular")
+        self.assertIs(variant["func"], build_variant_from_shards)
+        self.assertEqual(variant["inputs"], [node["id"] for node in shard_nodes])
+
+    def test_web_profile_strips_hinting(self):
+        """web 프로필이 같은 윤곽선을 유지하면서 힌팅과 장치 메트릭 테이블을 빼는지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 web 프로필 테스트를 건너뜁니다")
+        from fontTools.ttLib import TTFont
+        from font_profile import WEB_STRIPPED_TABLES, report_output_sizes
+        from glyph_index import build_glyph_index, compare_glyph_indexes
+
+        indexes, sizes = [], []
+        with tempfile.TemporaryDirectory() as output_dir:
+            for profile in ("default", "web"):
+                task = dict(self._regular_task(), output_dir=output_dir, profile=profile)
+                result = fonttools_backend.build_variant(task)
+                self.assertTrue(result["success"])
+                path = result["outputs"][0]
+                indexes.append(build_glyph_index(path))
+                sizes.append(os.path.getsize(path))
+
+            font = TTFont(path)
+            self.assertFalse(set(WEB_STRIPPED_TABLES) & set(font.keys()))
+            glyf = font["glyf"]
+            self.assertFalse(
+                any(
+                    hasattr(glyf[name], "program") and glyf[name].program.getBytecode()
+                    for name in font.getGlyphOrder()
+                )
+            )
+            self.assertEqual(report_output_sizes([path], {"ttf": sizes[1]}), [])
+            self.assertEqual(len(report_output_sizes([path], {"ttf": sizes[1] - 1})), 1)
+
+        differences = compare_glyph_indexes(*indexes)
+        self.assertFalse(any(differences.values()), differences)
+        self.assertLess(sizes[1], sizes[0])
+
+    def test_derived_nerd_matches_full_build(self):
+        """--derive-nerd로 만든 Nerd Font 조합이 전체 빌드와 같은 글리프를 만드는지 테스트"""
+        try:
+            import fonttools_backend
+        except ImportError:
+            self.skipTest("fontTools 모듈이 없어 Nerd Font 파생 빌드 테스트를 건너뜁니다")
+        from glyph_index import build_glyph_index, compare_glyph_indexes
+        from hangulify import _collect_build_tasks, _derive_nerd_tasks, _in_hangul_ranges
+
+        tasks = _derive_nerd_tasks(_collect_build_tasks("fonttools"))
+        derived = [task for task in tasks if task["style"] == "NerdFont-Regular"]
+        if not derived or derived[0].get("derive_from") != "Regular":
+            self.skipTest("NerdFont-Regular 조합이 없어 Nerd Font 파생 빌드 테스트를 건너뜁니다")
+        nerd_task = derived[0]
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            regular_result = fonttools_backend.build_variant(
+                dict(self._regular_task(), output_dir=output_dir)
+            )
+            self.assertTrue(regular_result["success"])
+            derived_result = fonttools_backend.derive_nerd_variant(
+                regular_result, dict(nerd_task, output_dir=output_dir)
+            )
+            self.assertTrue(derived_result["success"])
+            regular_index = build_glyph_index(regular_result["outputs"][0])
+            derived_index = build_glyph_index(derived_result["outputs"][0])
+
+            with tempfile.TemporaryDirectory() as full_dir:
+                full_result = fonttools_backend.build_variant(dict(nerd_task, output_dir=full_dir))
+                self.assertTrue(full_result["success"])
+                full_index = build_glyph_index(full_result["outputs"][0])
+                self.assertSameGlyphs(full_result["outputs"][0], derived_result["outputs"][0])
+
+        differences = compare_glyph_indexes(full_index, derived_index)
+        self.assertFalse(any(differences.values()), differences)
+        hangul = {
+            key: value
+            for key, value in regular_index["glyphs"].items()
+            if _in_hangul_ranges(int(key, 16))
+        }
+        self.assertTrue(hangul)
+        for key, value in hangul.items():
+            self.assertEqual(value, derived_index["glyphs"].get(key), key)
+
+    def test_matches_fontforge_backend(self):
+        """같은 소스로 두 백엔드를 실행한 결과가 글리프 단위로 일치하는지 테스트"""
+        try:
+            import fontforge  # noqa: F401
+            import fonttools_backend  # noqa: F401
+            from hangulify import build_variant
+        except ImportError:
+            self.skipTest("FontForge 또는 fontTools 모듈이 없어 백엔드 비교 테스트를 건너뜁니다")
+
+        with tempfile.TemporaryDirectory() as ff_dir, tempfile.TemporaryDirectory() as ft_dir:
+            result = build_variant(dict(self._regular_task(), output_dir=ff_dir), use_cache=False)
+            ff_ttf = [path for path in result["outputs"] if path.endswith(".ttf")]
+            self.assertTrue(ff_ttf, "FontForge 백엔드가 TTF를 생성하지 못했습니다")
+            self.assertSameGlyphs(ff_ttf[0], self._build_with_fonttools(ft_dir))
+
+
 def run_detailed_analysis():
     """상세한 폰트 분석 정보 출력"""
     print("\n" + "="*60)
@@ -0,0 +1,455 @@
+"""
+표준 라이브러리만으로 TrueType(sfnt) 폰트의 주요 테이블을 읽는 파서입니다.
+
+FontForge나 fontTools 없이 빌드 결과를 빠르게 검사할 수 있도록 head, hhea, maxp, hmtx,
+cmap(형식 4, 12), name, loca, glyf 테이블을 읽습니다.
+WOFF/WOFF2 파일은 테이블별 크기를 확인할 수 있도록 테이블 디렉터리만 읽습니다.
+"""
+
+import math
+import struct
+
+# 단순 글리프의 점 플래그입니다.
+FLAG_ON_CURVE: int = 0x01
+FLAG_X_SHORT: int = 0x02
+FLAG_Y_SHORT: int = 0x04
+FLAG_REPEAT: int = 0x08
+FLAG_X_SAME_OR_POSITIVE: int = 0x10
+FLAG_Y_SAME_OR_POSITIVE: int = 0x20
+
+# 복합 글리프의 구성 요소 플래그입니다.
+ARG_1_AND_2_ARE_WORDS: int = 0x0001
+ARGS_ARE_XY_VALUES: int = 0x0002
+WE_HAVE_A_SCALE: int = 0x0008
+MORE_COMPONENTS: int = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE: int = 0x0040
+WE_HAVE_A_TWO_BY_TWO: int = 0x0080
+
+# 복합 글리프를 펼칠 때 허용하는 최대 중첩 깊이입니다.
+MAX_COMPONENT_DEPTH: int = 16
+
+# 유니코드 cmap 하위 테이블 선택 우선순위입니다. (platformID, encodingID)
+CMAP_PREFERENCE: tuple = ((3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0))
+
+# WOFF2 테이블 디렉터리에서 플래그의 하위 6비트로 나타내는 태그입니다. (WOFF2 명세 5.1절)
+WOFF2_KNOWN_TAGS: tuple = (
+    "cmap", "head", "hhea", "hmtx", "maxp", "name", "OS/2", "post", "cvt ", "fpgm", "glyf",
+    "loca", "prep", "CFF ", "VORG", "EBDT", "EBLC", "gasp", "hdmx", "kern", "LTSH", "PCLT",
+    "VDMX", "vhea", "vmtx", "BASE", "GDEF", "GPOS", "GSUB", "EBSC", "JSTF", "MATH", "CBDT",
+    "CBLC", "COLR", "CPAL", "SVG ", "sbix", "acnt", "avar", "bdat", "bloc", "bsln", "cvar",
+    "fdsc", "feat", "fmtx", "fvar", "gvar", "hsty", "just", "lcar", "mort", "morx", "opbd",
+    "prop", "trak", "Zapf", "Silf", "Glat", "Gloc", "Feat", "Sill",
+)
+
+
+def read_table_directory(data: bytes) -> dict:
+    """sfnt 테이블 디렉터리를 읽어 태그별 (오프셋, 길이)를 반환합니다."""
+    sfnt_version, num_tables = struct.unpack_from(">4sH", data, 0)
+    if sfnt_version not in (b"\x00\x01\x00\x00", b"true", b"OTTO"):
+        raise ValueError(f"sfnt 폰트가 아닙니다: {sfnt_version!r}")
+
+    tables = {}
+    for i in range(num_tables):
+        tag, _, offset, length = struct.unpack_from(">4sLLL", data, 12 + i * 16)
+        tables[tag.decode("latin-1")] = (offset, length)
+    return tables
+
+
+def _read_uint_base128(data: bytes, offset: int) -> tuple:
+    """WOFF2의 UIntBase128 값을 읽어 (값, 다음 오프셋)을 반환합니다."""
+    value = 0
+    for i in range(5):
+        byte = data[offset + i]
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, offset + i + 1
+    raise ValueError("UIntBase128 값이 5바이트를 넘습니다")
+
+
+def _read_woff_table_sizes(data: bytes) -> dict:
+    """WOFF 테이블 디렉터리를 읽어 태그별 (압축된 길이, 원래 길이)를 반환합니다."""
+    (num_tables,) = struct.unpack_from(">H", data, 12)
+    sizes = {}
+    for i in range(num_tables):
+        tag, _, comp_length, orig_length, _ = struct.unpack_from(">4sLLLL", data, 44 + i * 20)
+        sizes[tag.decode("latin-1")] = (comp_length, orig_length)
+    return sizes
+
+
+def _read_woff2_table_sizes(data: bytes) -> dict:
+    """
+    WOFF2 테이블 디렉터리를 읽어 태그별 (변환 후 길이, 원래 길이)를 반환합니다.
+    WOFF2는 모든 테이블을 하나의 Brotli 스트림으로 압축하므로 테이블별 압축 크기는 없습니다.
+    """
+    (num_tables,) = struct.unpack_from(">H", data, 12)
+    offset = 48
+    sizes = {}
+    for _ in range(num_tables):
+        flags = data[offset]
+        offset += 1
+        if flags & 0x3F == 0x3F:
+            tag = data[offset : offset + 4].decode("latin-1")
+            offset += 4
+        else:
+            tag = WOFF2_KNOWN_TAGS[flags & 0x3F]
+        orig_length, offset = _read_uint_base128(data, offset)
+        # glyf/loca는 변환 버전 0이, 나머지 테이블은 0이 아닌 버전이 변환된 테이블입니다.
+        version = flags >> 6
+        transformed = version == 0 if tag in ("glyf", "loca") else version != 0
+        length = orig_length
+        if transformed:
+            length, offset = _read_uint_base128(data, offset)
+        sizes[tag] = (length, orig_length)
+    return sizes
+
+
+def read_table_sizes(path: str) -> dict:
+    """
+    TTF/OTF, WOFF, WOFF2 파일의 테이블별 크기를 읽습니다.
+
+    Returns:
+        dict: format("sfnt", "woff", "woff2"), size(파일 크기),
+            tables(태그별 파일 안의 바이트 수. WOFF는 압축된 크기, WOFF2는 Brotli 압축 전 변환된 크기),
+            orig_tables(태그별 sfnt 테이블 원래 크기) 항목
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    signature = data[:4]
+    if signature == b"wOFF":
+        font_format, sizes = "woff", _read_woff_table_sizes(data)
+    elif signature == b"wOF2":
+        font_format, sizes = "woff2", _read_woff2_table_sizes(data)
+    else:
+        font_format = "sfnt"
+        sizes = {
+            tag: (length, length) for tag, (_, length) in read_table_directory(data).items()
+        }
+
+    return {
+        "format": font_format,
+        "size": len(data),
+        "tables": {tag: length for tag, (length, _) in sizes.items()},
+        "orig_tables": {tag: orig_length for tag, (_, orig_length) in sizes.items()},
+    }
+
+
+def read_tables(path: str) -> dict:
+    """폰트 파일을 읽어 태그별 테이블 데이터(bytes)를 반환합니다."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return {
+        tag: data[offset : offset + length]
+        for tag, (offset, length) in read_table_directory(data).items()
+    }
+
+
+def parse_head(data: bytes) -> dict:
+    """head 테이블을 읽습니다."""
+    (
+        _, font_revision, checksum_adjustment, magic, flags, units_per_em,
+        created, modified, x_min, y_min, x_max, y_max,
+        mac_style, lowest_rec_ppem, _, index_to_loc_format, _,
+    ) = struct.unpack_from(">LlLLHHqqhhhhHHhhh", data, 0)
+    return {
+        "font_revision": font_revision / 65536,
+        "checksum_adjustment": checksum_adjustment,
+        "flags": flags,
+        "units_per_em": units_per_em,
+        "created": created,
+        "modified": modified,
+        "bounds": (x_min, y_min, x_max, y_max),
+        "mac_style": mac_style,
+        "index_to_loc_format": index_to_loc_format,
+    }
+
+
+def parse_hhea(data: bytes) -> dict:
+    """hhea 테이블을 읽습니다."""
+    ascent, descent, line_gap, advance_width_max = struct.unpack_from(">hhhH", data, 4)
+    (number_of_hmetrics,) = struct.unpack_from(">H", data, 34)
+    return {
+        "ascent": ascent,
+        "descent": descent,
+        "line_gap": line_gap,
+        "advance_width_max": advance_width_max,
+        "number_of_hmetrics": number_of_hmetrics,
+    }
+
+
+def parse_maxp(data: bytes) -> dict:
+    """maxp 테이블에서 글리프 수를 읽습니다."""
+    (num_glyphs,) = struct.unpack_from(">H", data, 4)
+    return {"num_glyphs": num_glyphs}
+
+
+def parse_hmtx(data: bytes, num_glyphs: int, number_of_hmetrics: int) -> list:
+    """hmtx 테이블을 읽어 글리프 ID별 (너비, 왼쪽 사이드 베어링) 리스트를 반환합니다."""
+    metrics = [
+        struct.unpack_from(">Hh", data, i * 4) for i in range(number_of_hmetrics)
+    ]
+    last_advance = metrics[-1][0] if metrics else 0
+    offset = number_of_hmetrics * 4
+    for i in range(num_glyphs - number_of_hmetrics):
+        (lsb,) = struct.unpack_from(">h", data, offset + i * 2)
+        metrics.append((last_advance, lsb))
+    return metrics
+
+
+def parse_name(data: bytes) -> dict:
+    """
+    name 테이블을 읽어 nameID별 문자열을 반환합니다.
+    Windows 유니코드(플랫폼 3, 인코딩 1 또는 10) 영어(미국) 레코드를 우선 사용하고,
+    없으면 Mac Roman(플랫폼 1, 인코딩 0) 레코드를 사용합니다.
+    """
+    count, string_offset = struct.unpack_from(">HH", data, 2)
+    names = {}
+    priorities = {}
+    for i in range(count):
+        platform_id, encoding_id, language_id, name_id, length, offset = struct.unpack_from(
+            ">HHHHHH", data, 6 + i * 12
+        )
+        raw = data[string_offset + offset : string_offset + offset + length]
+        if platform_id == 3 and encoding_id in (1, 10):
+            priority = 0 if language_id == 0x409 else 1
+            text = raw.decode("utf-16-be", errors="replace")
+        elif platform_id == 1 and encoding_id == 0:
+            priority = 2
+            text = raw.decode("mac-roman", errors="replace")
+        else:
+            continue
+        if priority < priorities.get(name_id, 3):
+            names[name_id] = text
+            priorities[name_id] = priority
+    return names
+
+
+def _parse_cmap_format_4(data: bytes, offset: int) -> dict:
+    seg_count = struct.unpack_from(">H", data, offset + 6)[0] // 2
+    ends_offset = offset + 14
+    starts_offset = ends_offset + seg_count * 2 + 2
+    deltas_offset = starts_offset + seg_count * 2
+    range_offsets_offset = deltas_offset + seg_count * 2
+
+    end_codes = struct.unpack_from(f">{seg_count}H", data, ends_offset)
+    start_codes = struct.unpack_from(f">{seg_count}H", data, starts_offset)
+    deltas = struct.unpack_from(f">{seg_count}h", data, deltas_offset)
+    range_offsets = struct.unpack_from(f">{seg_count}H", data, range_offsets_offset)
+
+    mapping = {}
+    for i in range(seg_count):
+        start, end, delta, range_offset = start_codes[i], end_codes[i], deltas[i], range_offsets[i]
+        if start == 0xFFFF:
+            continue
+        for codepoint in range(start, end + 1):
+            if range_offset == 0:
+                glyph_id = (codepoint + delta) & 0xFFFF
+            else:
+                glyph_offset = (
+                    range_offsets_offset + i * 2 + range_offset + (codepoint - start) * 2
+                )
+                (glyph_id,) = struct.unpack_from(">H", data, glyph_offset)
+                if glyph_id:
+                    glyph_id = (glyph_id + delta) & 0xFFFF
+            if glyph_id:
+                mapping[codepoint] = glyph_id
+    return mapping
+
+
+def _parse_cmap_format_12(data: bytes, offset: int) -> dict:
+    (num_groups,) = struct.unpack_from(">L", data, offset + 12)
+    mapping = {}
+    for i in range(num_groups):
+        start, end, start_glyph = struct.unpack_from(">LLL", data, offset + 16 + i * 12)
+        for codepoint in range(start, end + 1):
+            mapping[codepoint] = start_glyph + codepoint - start
+    return mapping
+
+
+def parse_cmap(data: bytes) -> dict:
+    """
+    cmap 테이블에서 가장 적합한 유니코드 하위 테이블을 골라 코드포인트별 글리프 ID를 반환합니다.
+    fontTools의 getBestCmap()과 같은 우선순위를 사용합니다.
+    """
+    _, num_tables = struct.unpack_from(">HH", data, 0)
+    subtables = {}
+    for i in range(num_tables):
+        platform_id, encoding_id, offset = struct.unpack_from(">HHL", data, 4 + i * 8)
+        (table_format,) = struct.unpack_from(">H", data, offset)
+        subtables.setdefault((platform_id, encoding_id), (table_format, offset))
+
+    for key in CMAP_PREFERENCE:
+        if key not in subtables:
+            continue
+        table_format, offset = subtables[key]
+        if table_format == 4:
+            return _parse_cmap_format_4(data, offset)
+        if table_format == 12:
+            return _parse_cmap_format_12(data, offset)
+    return {}
+
+
+def parse_loca(data: bytes, num_glyphs: int, index_to_loc_format: int) -> list:
+    """loca 테이블을 읽어 글리프 ID별 glyf 오프셋 리스트(글리프 수 + 1개)를 반환합니다."""
+    if index_to_loc_format == 0:
+        return [offset * 2 for offset in struct.unpack_from(f">{num_glyphs + 1}H", data, 0)]
+    return list(struct.unpack_from(f">{num_glyphs + 1}L", data, 0))
+
+
+def _parse_simple_glyph(data: bytes, number_of_contours: int) -> list:
+    """단순 글리프의 윤곽선을 [(x, y, on_curve), ...]의 리스트로 읽습니다."""
+    offset = 10
+    end_points = struct.unpack_from(f">{number_of_contours}H", data, offset)
+    offset += number_of_contours * 2
+    (instruction_length,) = struct.unpack_from(">H", data, offset)
+    offset += 2 + instruction_length
+
+    num_points = end_points[-1] + 1 if end_points else 0
+    flags = []
+    while len(flags) < num_points:
+        flag = data[offset]
+        offset += 1
+        flags.append(flag)
+        if flag & FLAG_REPEAT:
+            flags.extend([flag] * data[offset])
+            offset += 1
+
+    coordinates = []
+    for short_flag, same_flag in (
+        (FLAG_X_SHORT, FLAG_X_SAME_OR_POSITIVE),
+        (FLAG_Y_SHORT, FLAG_Y_SAME_OR_POSITIVE),
+    ):
+        values = []
+        value = 0
+        for flag in flags[:num_points]:
+            if flag & short_flag:
+                delta = data[offset]
+                offset += 1
+                value += delta if flag & same_flag else -delta
+            elif not flag & same_flag:
+                value += struct.unpack_from(">h", data, offset)[0]
+                offset += 2
+            values.append(value)
+        coordinates.append(values)
+
+    contours = []
+    start = 0
+    for end in end_points:
+        contours.append(
+            [
+                (coordinates[0][i], coordinates[1][i], flags[i] & FLAG_ON_CURVE)
+                for i in range(start, end + 1)
+            ]
+        )
+        start = end + 1
+    return contours
+
+
+def _parse_components(data: bytes) -> list:
+    """복합 글리프의 구성 요소를 (글리프 ID, (xx, xy, yx, yy, dx, dy), 위치 지정 방식) 리스트로 읽습니다."""
+    components = []
+    offset = 10
+    flags = MORE_COMPONENTS
+    while flags & MORE_COMPONENTS:
+        flags, glyph_id = struct.unpack_from(">HH", data, offset)
+        offset += 4
+
+        xy_values = bool(flags & ARGS_ARE_XY_VALUES)
+        if flags & ARG_1_AND_2_ARE_WORDS:
+            arg1, arg2 = struct.unpack_from(">hh" if xy_values else ">HH", data, offset)
+            offset += 4
+        else:
+            arg1, arg2 = struct.unpack_from(">bb" if xy_values else ">BB", data, offset)
+            offset += 2
+
+        xx, xy, yx, yy = 1.0, 0.0, 0.0, 1.0
+        if flags & WE_HAVE_A_SCALE:
+            (scale,) = struct.unpack_from(">h", data, offset)
+            xx = yy = scale / 16384
+            offset += 2
+        elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+            x_scale, y_scale = struct.unpack_from(">hh", data, offset)
+            xx, yy = x_scale / 16384, y_scale / 16384
+            offset += 4
+        elif flags & WE_HAVE_A_TWO_BY_TWO:
+            values = struct.unpack_from(">hhhh", data, offset)
+            xx, xy, yx, yy = (value / 16384 for value in values)
+            offset += 8
+
+        # 점 맞춤(point matching) 방식의 구성 요소는 위치를 0으로 두고 인자를 함께 기록합니다.
+        if xy_values:
+            components.append((glyph_id, (xx, xy, yx, yy, arg1, arg2), None))
+        else:
+            components.append((glyph_id, (xx, xy, yx, yy, 0, 0), (arg1, arg2)))
+    return components
+
+
+def glyph_data(glyf: bytes, loca: list, glyph_id: int) -> bytes:
+    """glyf 테이블에서 글리프 하나의 데이터를 잘라 반환합니다. 빈 글리프는 b""입니다."""
+    return glyf[loca[glyph_id] : loca[glyph_id + 1]]
+
+
+def glyph_contours(glyf: bytes, loca: list, glyph_id: int, depth: int = 0) -> list:
+    """
+    글리프의 윤곽선을 반환합니다. 복합 글리프는 구성 요소의 변환을 적용해 펼치므로
+    참조로 저장된 글리프와 윤곽선으로 저장된 글리프를 같은 방식으로 비교할 수 있습니다.
+
+    Returns:
+        list: 윤곽선별 [(x, y, on_curve), ...] 리스트의 리스트
+    """
+    data = glyph_data(glyf, loca, glyph_id)
+    if not data:
+        return []
+
+    (number_of_contours,) = struct.unpack_from(">h", data, 0)
+    if number_of_contours >= 0:
+        return _parse_simple_glyph(data, number_of_contours)
+    if depth >= MAX_COMPONENT_DEPTH:
+        raise ValueError(f"복합 글리프 중첩이 너무 깊습니다: 글리프 ID {glyph_id}")
+
+    contours = []
+    for component_id, (xx, xy, yx, yy, dx, dy), _ in _parse_components(data):
+        identity = (xx, xy, yx, yy) == (1.0, 0.0, 0.0, 1.0)
+        for contour in glyph_contours(glyf, loca, component_id, depth + 1):
+            if identity:
+                contours.append([(x + dx, y + dy, on_curve) for x, y, on_curve in contour])
+            else:
+                contours.append(
+                    [
+                        (
+                            math.floor(x * xx + y * yx + dx + 0.5),
+                            math.floor(x * xy + y * yy + dy + 0.5),
+                            on_curve,
+                        )
+                        for x, y, on_curve in contour
+                    ]
+                )
+    return contours
+
+
+def load_font(path: str) -> dict:
+    """
+    폰트 파일을 읽어 자주 쓰는 정보를 담은 딕셔너리를 반환합니다.
+
+    Returns:
+        dict: tables(태그별 bytes), head, hhea, num_glyphs, metrics(글리프 ID별 (너비, LSB)),
+            cmap(코드포인트별 글리프 ID), names(nameID별 문자열), loca(TrueType 윤곽선이 있을 때) 항목
+    """
+    tables = read_tables(path)
+    head = parse_head(tables["head"])
+    hhea = parse_hhea(tables["hhea"])
+    num_glyphs = parse_maxp(tables["maxp"])["num_glyphs"]
+
+    font = {
+        "tables": tables,
+        "head": head,
+        "hhea": hhea,
+        "num_glyphs": num_glyphs,
+        "metrics": parse_hmtx(tables["hmtx"], num_glyphs, hhea["number_of_hmetrics"]),
+        "cmap": parse_cmap(tables["cmap"]) if "cmap" in tables else {},
+        "names": parse_name(tables["name"]) if "name" in tables else {},
+        "loca": None,
+    }
+    if "loca" in tables and "glyf" in tables:
+        font["loca"] = parse_loca(tables["loca"], num_glyphs, head["index_to_loc_format"])
+    return font
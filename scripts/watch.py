@@ -0,0 +1,165 @@
+"""
+설정과 소스 폰트의 변경을 감시하고 영향을 받는 폰트 조합만 다시 빌드하는 watch 모드입니다.
+
+프로세스를 유지하면서 소스 폰트(파일 기준)와 전처리된 한글 폰트(설정 값 기준)를 메모리에 유지하므로,
+BEARING_ADJUSTMENT나 너비 설정을 바꿀 때마다 Python과 FontForge를 새로 시작하거나 소스 폰트를
+다시 해석하지 않고 유지한 원본에서 Em 스케일링과 베어링 조정만 다시 실행합니다.
+결과는 TTF만 WATCH_FONTS_PATH에 저장하며 빌드 매니페스트는 변경하지 않습니다.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import config
+import hangulify
+from resident_fonts import enable_resident_fonts, release_all, release_unused
+
+# 변경을 확인하는 간격(초)입니다.
+WATCH_INTERVAL: float = 1.0
+
+# 변경되면 다시 불러올 빌드 모듈입니다. 의존하는 순서대로 나열합니다.
+RELOADED_MODULES: tuple = (
+    "config", "codepoint_runs", "hangulify", "outline_transform", "fonttools_backend"
+)
+
+
+def _script_paths() -> list:
+    """감시할 설정, 빌드 매트릭스(조합별 overrides 포함), 빌드 스크립트 파일 경로를 반환합니다."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return [os.path.join(script_dir, "config.py"), os.path.abspath(config.BUILD_MATRIX_PATH)] + [
+        os.path.join(script_dir, filename) for filename in hangulify.PIPELINE_SCRIPTS
+    ]
+
+
+def _font_directories() -> list:
+    """감시할 소스 폰트 디렉터리를 반환합니다."""
+    return [config.EN_FONT_PATH, config.KO_FONT_PATH, config.EN_NERD_FONT_PATH]
+
+
+def take_snapshot(paths: list, directories: list) -> dict:
+    """파일과 디렉터리 안 파일들의 (수정 시각, 크기)를 기록합니다. 파일이 추가/삭제되어도 달라집니다."""
+    snapshot = {}
+    for directory in directories:
+        if os.path.isdir(directory):
+            paths = paths + [
+                os.path.join(directory, filename) for filename in sorted(os.listdir(directory))
+            ]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            continue
+    return snapshot
+
+
+def changed_paths(before: dict, after: dict) -> list:
+    """두 기록 사이에 추가, 삭제, 변경된 파일 경로를 반환합니다."""
+    return sorted(
+        path for path in before.keys() | after.keys() if before.get(path) != after.get(path)
+    )
+
+
+def reload_build_modules() -> bool:
+    """
+    설정과 빌드 모듈을 다시 불러옵니다. 편집 중인 파일에 오류가 있으면 이전 모듈을 그대로 사용합니다.
+
+    Returns:
+        bool: 다시 불러오기에 성공했는지 여부
+    """
+    try:
+        for name in RELOADED_MODULES:
+            if name in sys.modules:
+                importlib.reload(sys.modules[name])
+    except Exception as e:
+        print(f"[ERROR] 빌드 모듈을 다시 불러오지 못했습니다: {e}")
+        return False
+    print("[INFO] 설정과 빌드 모듈을 다시 불러왔습니다.")
+    return True
+
+
+def rebuild_changed_variants(
+    built: dict, backend: str = "fontforge", output_dir: str = None
+) -> dict:
+    """
+    입력 정보(소스 폰트, 설정 값, 스크립트)가 마지막 빌드와 달라진 조합만 다시 빌드합니다.
+
+    Args:
+        built: 스타일별 마지막으로 빌드에 성공한 입력 정보
+        backend: 빌드 백엔드
+        output_dir: TTF를 저장할 디렉터리 (기본값: WATCH_FONTS_PATH)
+
+    Returns:
+        dict: 갱신된 스타일별 입력 정보
+    """
+    if backend == "fonttools":
+        from fonttools_backend import build_variant as variant_builder
+    else:
+        variant_builder = hangulify.build_variant
+    output_dir = output_dir or config.WATCH_FONTS_PATH
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    built = dict(built)
+    hashes = {}
+    rebuilt = []
+    for task in hangulify._collect_build_tasks(backend):
+        style = task["style"]
+        fingerprint = hangulify.variant_fingerprint(task, hashes, backend)
+        if built.get(style) == fingerprint:
+            continue
+
+        variant_start = time.perf_counter()
+        result = variant_builder(dict(task, output_dir=output_dir), use_cache=True)
+        elapsed = time.perf_counter() - variant_start
+        if result["success"]:
+            built[style] = fingerprint
+        else:
+            built.pop(style, None)
+        rebuilt.append((style, result["success"], elapsed))
+
+    if not rebuilt:
+        print("[INFO] 입력이 바뀐 조합이 없어 다시 빌드하지 않았습니다.")
+        return built
+    # 아무것도 다시 빌드하지 않았으면 사용된 항목이 없으므로, 다시 빌드한 뒤에만 지웁니다.
+    release_unused()
+
+    print("[INFO] 다시 빌드한 조합:")
+    for style, success, elapsed in rebuilt:
+        print(f"  - {style}: {'성공' if success else '실패'} ({elapsed:.2f}초)")
+    print(f"[INFO] 다시 빌드 완료: {time.perf_counter() - start:.2f}초")
+    return built
+
+
+def watch(backend: str = "fontforge", interval: float = WATCH_INTERVAL) -> None:
+    """
+    설정 파일, 빌드 매트릭스, 빌드 스크립트, 소스 폰트 디렉터리를 감시하며 변경될 때마다 다시 빌드합니다.
+    Ctrl+C로 종료합니다.
+    """
+    enable_resident_fonts()
+    built = {}
+    try:
+        snapshot = take_snapshot(_script_paths(), _font_directories())
+        built = rebuild_changed_variants(built, backend)
+        print(f"[INFO] 변경을 감시합니다. ({interval}초 간격, 종료: Ctrl+C)")
+
+        while True:
+            time.sleep(interval)
+            current = take_snapshot(_script_paths(), _font_directories())
+            changes = changed_paths(snapshot, current)
+            if not changes:
+                continue
+            snapshot = current
+
+            print(f"[INFO] 변경 감지: {', '.join(os.path.relpath(path) for path in changes)}")
+            scripts = set(_script_paths())
+            if any(path in scripts for path in changes) and not reload_build_modules():
+                continue
+            built = rebuild_changed_variants(built, backend)
+    except KeyboardInterrupt:
+        print("\n[INFO] watch 모드를 종료합니다.")
+    finally:
+        release_all()
+        enable_resident_fonts(False)
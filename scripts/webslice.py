@@ -0,0 +1,290 @@
+"""
+빌드된 TTF를 유니코드 범위별 WOFF2 조각과 @font-face CSS로 나누는 웹 폰트 분할입니다.
+
+fontTools가 있으면 fontTools.subset으로 조각을 만들고, 없으면(또는 WOFF2에 필요한 brotli가 없으면)
+FontForge로 TTF를 열어 남길 글리프만 생성합니다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = None
+    TTFont = None
+
+from build_manifest import load_manifest
+from codepoint_runs import find_codepoint_runs
+from config import WEB_FONTS_PATH, WEB_SLICE_RARE_SIZE, WEB_SLICE_SIZE
+from hangulify import _get_cleaned_name
+
+# 한글 음절 범위입니다.
+HANGUL_SYLLABLES_START: int = 0xAC00
+HANGUL_SYLLABLES_END: int = 0xD7A3
+
+
+def _is_common_syllable(codepoint: int) -> bool:
+    """KS X 1001 완성형 2,350자에 포함되는 자주 쓰는 한글 음절인지 확인합니다."""
+    try:
+        return len(chr(codepoint).encode("euc_kr")) == 2
+    except UnicodeEncodeError:
+        return False
+
+
+def plan_slices(
+    codepoints: list,
+    slice_size: int = WEB_SLICE_SIZE,
+    rare_slice_size: int = WEB_SLICE_RARE_SIZE,
+) -> list:
+    """
+    폰트의 코드포인트를 사용 빈도 순서의 조각으로 나눕니다.
+    한글 외 문자, 자주 쓰는 한글 음절(KS X 1001), 나머지 한글 음절 순서로 배치하므로
+    일반적인 한국어 페이지는 앞쪽 조각만 내려받습니다.
+
+    Args:
+        codepoints: 폰트에 매핑된 코드포인트 리스트
+        slice_size: 한글 외 문자와 자주 쓰는 한글 음절 조각의 크기
+        rare_slice_size: 나머지 한글 음절 조각의 크기
+
+    Returns:
+        list: 조각별 코드포인트 리스트(각각 오름차순)의 리스트
+    """
+    others, common, rare = [], [], []
+    for codepoint in sorted(set(codepoints)):
+        if not HANGUL_SYLLABLES_START <= codepoint <= HANGUL_SYLLABLES_END:
+            others.append(codepoint)
+        elif _is_common_syllable(codepoint):
+            common.append(codepoint)
+        else:
+            rare.append(codepoint)
+
+    slices = []
+    for group, size in ((others, slice_size), (common, slice_size), (rare, rare_slice_size)):
+        for i in range(0, len(group), size):
+            slices.append(group[i : i + size])
+    return slices
+
+
+def format_unicode_range(codepoints: list) -> str:
+    """코드포인트 리스트를 CSS unicode-range 값으로 변환합니다(예: 'U+AC00-AC0F, U+AC12')."""
+    parts = []
+    for start, end in find_codepoint_runs(sorted(codepoints)):
+        if start == end:
+            parts.append(f"U+{start:X}")
+        else:
+            parts.append(f"U+{start:X}-{end:X}")
+    return ", ".join(parts)
+
+
+def build_font_face_css(
+    family: str, weight: int, italic: bool, slice_files: list, slices: list
+) -> str:
+    """
+    조각마다 unicode-range를 지정한 @font-face 규칙을 만듭니다.
+
+    Args:
+        family: CSS font-family 이름
+        weight: CSS font-weight 값
+        italic: 이탤릭 여부
+        slice_files: CSS 파일 기준 상대 경로로 표시한 조각 WOFF2 파일 리스트
+        slices: slice_files와 같은 순서의 조각별 코드포인트 리스트
+    """
+    rules = []
+    for index, (slice_file, codepoints) in enumerate(zip(slice_files, slices)):
+        rules.append(
+            f"/* [{index}] */\n"
+            "@font-face {\n"
+            f"  font-family: '{family}';\n"
+            f"  font-style: {'italic' if italic else 'normal'};\n"
+            f"  font-weight: {weight};\n"
+            "  font-display: swap;\n"
+            f"  src: url('{slice_file}') format('woff2');\n"
+            f"  unicode-range: {format_unicode_range(codepoints)};\n"
+            "}\n"
+        )
+    return "\n".join(rules)
+
+
+def _font_info_with_fonttools(ttf_path: str) -> tuple:
+    """fontTools로 폰트의 (패밀리 이름, 굵기, 이탤릭 여부, 매핑된 코드포인트)를 읽습니다."""
+    if TTFont is None:
+        raise ImportError("No module named 'fontTools'")
+
+    font = TTFont(ttf_path, lazy=True)
+    try:
+        name_table = font["name"]
+        family = name_table.getDebugName(16) or name_table.getDebugName(1)
+        weight = font["OS/2"].usWeightClass or 400
+        italic = font["post"].italicAngle != 0
+        codepoints = sorted(
+            {
+                codepoint
+                for table in font["cmap"].tables
+                if table.isUnicode()
+                for codepoint in table.cmap
+            }
+        )
+    finally:
+        font.close()
+    return family, weight, italic, codepoints
+
+
+def _font_info_with_fontforge(ttf_path: str) -> tuple:
+    """FontForge로 폰트의 (패밀리 이름, 굵기, 이탤릭 여부, 매핑된 코드포인트)를 읽습니다."""
+    import fontforge
+
+    font = fontforge.open(ttf_path)
+    try:
+        codepoints = set()
+        for glyph in font.glyphs():
+            if glyph.unicode >= 0:
+                codepoints.add(glyph.unicode)
+            for uni, variation, _ in glyph.altuni or ():
+                if variation == -1:
+                    codepoints.add(uni)
+        return font.familyname, font.os2_weight or 400, font.italicangle != 0, sorted(codepoints)
+    finally:
+        font.close()
+
+
+def _generate_slice_with_fonttools(ttf_path: str, codepoints: list, output_path: str) -> None:
+    """fontTools.subset으로 주어진 코드포인트만 남긴 WOFF2 조각을 만듭니다. brotli가 없으면 ImportError가 발생합니다."""
+    if subset is None:
+        raise ImportError("No module named 'fontTools'")
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    # 원본의 이름, 오픈타입 기능, 글리프 이름을 그대로 유지합니다.
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    options.layout_features = ["*"]
+    options.glyph_names = True
+    options.notdef_outline = True
+
+    font = subset.load_font(ttf_path, options)
+    try:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        subset.save_font(font, output_path, options)
+    finally:
+        font.close()
+
+
+def _generate_slice_with_fontforge(ttf_path: str, codepoints: list, output_path: str) -> None:
+    """FontForge로 TTF를 열어 주어진 코드포인트 외의 글리프를 지우고 WOFF2 조각을 생성합니다."""
+    import fontforge
+
+    font = fontforge.open(ttf_path)
+    try:
+        font.selection.none()
+        for start, end in find_codepoint_runs(codepoints):
+            font.selection.select(("more", "ranges", "unicode"), start, end)
+
+        # 남길 글리프가 지워질 글리프를 참조하지 않도록 참조를 윤곽선으로 풉니다.
+        font.unlinkReferences()
+
+        font.selection.invert()
+        if ".notdef" in font:
+            font.selection.select(("less",), ".notdef")
+        font.clear()
+
+        font.generate(output_path)
+    finally:
+        font.close()
+
+
+def _generate_slice(ttf_path: str, codepoints: list, output_path: str) -> str:
+    """
+    폰트에서 주어진 코드포인트만 남긴 WOFF2 조각을 생성합니다.
+    워커 프로세스에서 실행되며, 조각마다 원본 TTF를 새로 엽니다.
+    """
+    try:
+        _generate_slice_with_fonttools(ttf_path, codepoints, output_path)
+    except ImportError:
+        _generate_slice_with_fontforge(ttf_path, codepoints, output_path)
+    return output_path
+
+
+def slice_font_for_web(
+    ttf_path: str, jobs: int = 1, output_dir: str = WEB_FONTS_PATH
+) -> list:
+    """
+    빌드된 TTF를 유니코드 범위별 WOFF2 조각으로 나누고 @font-face CSS를 생성합니다.
+
+    Args:
+        ttf_path: 빌드된 TTF 파일 경로
+        jobs: 조각을 동시에 생성할 워커 프로세스 수
+        output_dir: 조각과 CSS를 저장할 디렉터리
+
+    Returns:
+        list: 생성된 조각 파일과 CSS 파일 경로의 리스트
+    """
+    try:
+        family, weight, italic, codepoints = _font_info_with_fonttools(ttf_path)
+    except ImportError:
+        family, weight, italic, codepoints = _font_info_with_fontforge(ttf_path)
+    family = _get_cleaned_name(family)
+
+    base_name = os.path.splitext(os.path.basename(ttf_path))[0]
+    slice_dir = os.path.join(output_dir, base_name)
+    os.makedirs(slice_dir, exist_ok=True)
+
+    slices = plan_slices(codepoints)
+    output_paths = [
+        os.path.join(slice_dir, f"{base_name}.{index}.woff2") for index in range(len(slices))
+    ]
+    print(f"[INFO] {base_name}: {len(codepoints)}개 코드포인트를 {len(slices)}개 조각으로 나눕니다.")
+
+    if jobs > 1 and len(slices) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(slices))) as executor:
+            futures = [
+                executor.submit(_generate_slice, ttf_path, codepoints, output_path)
+                for codepoints, output_path in zip(slices, output_paths)
+            ]
+            generated = [future.result() for future in futures]
+    else:
+        generated = [
+            _generate_slice(ttf_path, codepoints, output_path)
+            for codepoints, output_path in zip(slices, output_paths)
+        ]
+
+    css_path = os.path.join(output_dir, f"{base_name}.css")
+    slice_files = [
+        os.path.relpath(path, output_dir).replace(os.sep, "/") for path in generated
+    ]
+    with open(css_path, "w", encoding="utf-8") as f:
+        f.write(build_font_face_css(family, weight, italic, slice_files, slices))
+    print(f"[INFO] {css_path} 내보내기 완료")
+
+    return generated + [css_path]
+
+
+def slice_built_fonts(jobs: int = 1) -> bool:
+    """
+    빌드 매니페스트에 기록된 모든 TTF 출력을 웹용 조각으로 나눕니다.
+
+    Returns:
+        bool: 모든 폰트의 분할이 성공했는지 여부
+    """
+    manifest = load_manifest()
+    ttf_paths = sorted(
+        path
+        for entry in manifest["variants"].values()
+        for path in entry.get("outputs", [])
+        if path.endswith(".ttf") and os.path.exists(path)
+    )
+    if not ttf_paths:
+        print("[WARNING] 웹 폰트로 나눌 빌드된 TTF 파일이 없습니다.")
+        return False
+
+    success = True
+    for ttf_path in ttf_paths:
+        try:
+            slice_font_for_web(ttf_path, jobs)
+        except Exception as e:
+            print(f"[ERROR] {os.path.basename(ttf_path)} 웹 폰트 분할 실패: {e}")
+            success = False
+    return success